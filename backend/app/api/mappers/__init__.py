@@ -7,6 +7,7 @@ from .alert_mapper import AlertMapper
 from .animal_mapper import AnimalMapper
 from .auth_mapper import AuthMapper
 from .farm_mapper import FarmMapper
+from .report_mapper import ReportMapper
 from .role_mapper import RoleMapper
 from .sync_mapper import SyncMapper
 from .user_mapper import UserMapper
@@ -17,6 +18,7 @@ __all__ = [
     "AnimalMapper",
     "AuthMapper",
     "FarmMapper",
+    "ReportMapper",
     "RoleMapper",
     "SyncMapper",
     "UserMapper",
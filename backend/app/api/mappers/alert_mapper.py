@@ -8,6 +8,7 @@ from ...schemas.alert_schemas import (
     AlertCreateRequest,
     AlertResponse,
     AlertUpdateRequest,
+    HerdAlertsCreateRequest,
 )
 
 
@@ -116,6 +117,35 @@ class AlertMapper:
             "location": location,
         }
 
+    @staticmethod
+    def herd_request_to_params(request: HerdAlertsCreateRequest) -> dict:
+        """
+        Convierte HerdAlertsCreateRequest a parámetros para GenerateHerdAlertsUseCase.
+
+        Args:
+            request: HerdAlertsCreateRequest DTO
+
+        Returns:
+            Dict con parámetros para use case
+        """
+        return {
+            "user_id": request.user_id,
+            "farm_id": request.farm_id,
+            "type": request.type.value,
+            "title": request.title,
+            "message": request.message,
+            "scheduled_at": request.scheduled_at,
+            "recurrence": request.recurrence.value,
+            "recurrence_end": request.recurrence_end,
+            "reminder_before_days": request.reminder_before_days,
+            "breed": request.breed.value if request.breed else None,
+            "age_category": request.age_category.value
+            if request.age_category
+            else None,
+            "gender": request.gender,
+            "last_weighed_before_days": request.last_weighed_before_days,
+        }
+
     @staticmethod
     def update_request_to_params(
         request: AlertUpdateRequest,
@@ -0,0 +1,48 @@
+"""
+Report Mapper - API Layer
+Mapper para conversión entre trabajos de reportes y DTOs
+"""
+
+from ...core.config import settings
+from ...core.utils.report_jobs import ReportJob, ReportJobStatus
+from ...schemas.report_schemas import ReportJobResponse
+
+
+class ReportMapper:
+    """
+    Mapper para reportes.
+
+    Single Responsibility: Convertir ReportJob a DTOs de respuesta.
+    """
+
+    @staticmethod
+    def to_job_response(job: ReportJob) -> ReportJobResponse:
+        """
+        Convierte ReportJob a ReportJobResponse.
+
+        Args:
+            job: Trabajo de reporte
+
+        Returns:
+            ReportJobResponse para API
+        """
+        download_url = None
+        if job.status == ReportJobStatus.COMPLETED:
+            download_url = f"{settings.API_V1_PREFIX}/reports/jobs/{job.id}/download"
+
+        return ReportJobResponse(
+            id=job.id,
+            report_type=job.report_type,
+            format=job.format,
+            status=job.status.value,
+            progress=job.progress,
+            stage=job.stage,
+            filename=job.filename,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            expires_at=job.expires_at,
+            file_size_bytes=job.file_size_bytes,
+            error=job.error,
+            download_url=download_url,
+        )
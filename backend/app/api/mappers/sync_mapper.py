@@ -4,6 +4,7 @@ Mapper para conversión entre DTOs (Schemas) y Entities (Domain)
 """
 
 from datetime import datetime
+from typing import Any
 
 from ...domain.entities.sync_result import (
     SyncBatchResult,
@@ -14,6 +15,7 @@ from ...schemas.sync_schemas import (
     CattleSyncBatchResponse,
     CattleSyncItemResponse,
     HealthCheckResponse,
+    SyncMetricsResponse,
     SyncStatus,
     WeightEstimationSyncBatchResponse,
     WeightEstimationSyncItemResponse,
@@ -79,7 +81,7 @@ class SyncMapper:
         )
 
     @staticmethod
-    def to_health_check_response(health_data: dict[str, str]) -> HealthCheckResponse:
+    def to_health_check_response(health_data: dict[str, Any]) -> HealthCheckResponse:
         """
         Convierte dict de health a HealthCheckResponse.
 
@@ -92,8 +94,14 @@ class SyncMapper:
         return HealthCheckResponse(
             status=health_data["status"],
             database=health_data["database"],
+            database_latency_ms=health_data.get("database_latency_ms"),
             timestamp=datetime.fromisoformat(health_data["timestamp"]),
             version=health_data.get("version", "1.0.0"),
+            metrics=(
+                SyncMetricsResponse.model_validate(health_data["metrics"])
+                if health_data.get("metrics")
+                else None
+            ),
         )
 
     @staticmethod
@@ -5,6 +5,7 @@ Convierte entre Weight Estimation DTOs y Entities
 
 from uuid import UUID
 
+from ...core.utils.image_storage import image_storage_service
 from ...domain.entities.animal import Animal
 from ...domain.entities.weight_estimation import WeightEstimation
 from ...domain.shared.constants import BreedType
@@ -66,9 +67,13 @@ class WeightEstimationMapper:
             method=estimation.method,
             ml_model_version=estimation.ml_model_version,
             processing_time_ms=estimation.processing_time_ms,
+            stage_timings_ms=estimation.stage_timings_ms,
             latitude=estimation.latitude,
             longitude=estimation.longitude,
             frame_image_path=estimation.frame_image_path or "",
+            frame_image_variants=image_storage_service.get_variants(
+                estimation.frame_image_path
+            ),
             timestamp=estimation.timestamp,
             created_at=estimation.timestamp,  # Usar timestamp como created_at
         )
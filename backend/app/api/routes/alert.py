@@ -12,6 +12,7 @@ from fastapi import APIRouter, Depends, Query, status
 from ...core.dependencies import (
     get_create_alert_usecase,
     get_delete_alert_usecase,
+    get_generate_herd_alerts_usecase,
     get_get_alert_by_id_usecase,
     get_get_animals_by_filter_criteria_usecase,
     get_get_pending_alerts_usecase,
@@ -26,6 +27,7 @@ from ...core.dependencies import (
 from ...domain.usecases.alerts import (
     CreateAlertUseCase,
     DeleteAlertUseCase,
+    GenerateHerdAlertsUseCase,
     GetAlertByIdUseCase,
     GetPendingAlertsUseCase,
     GetScheduledAlertsUseCase,
@@ -42,6 +44,8 @@ from ...schemas.alert_schemas import (
     AlertResponse,
     AlertsListResponse,
     AlertUpdateRequest,
+    HerdAlertsCreateRequest,
+    HerdAlertsResponse,
 )
 from ...schemas.animal_schemas import AnimalResponse
 from ..mappers import AlertMapper, AnimalMapper
@@ -70,6 +74,29 @@ async def create_alert(
     return AlertMapper.to_response(alert)
 
 
+@alert_router.post("/herd", response_model=HerdAlertsResponse, status_code=201)
+@handle_domain_exceptions
+async def generate_herd_alerts(
+    request: HerdAlertsCreateRequest,
+    generate_usecase: Annotated[
+        GenerateHerdAlertsUseCase, Depends(get_generate_herd_alerts_usecase)
+    ],
+) -> HerdAlertsResponse:
+    """
+    Genera una alerta por animal para todos los animales que cumplen una regla.
+
+    **Ejemplos de uso**:
+    - Campaña de vacunación: todas las hembras Nelore de la finca
+    - Pesaje programado: terneros sin pesaje en los últimos 30 días
+
+    Los animales que ya tienen una alerta pendiente del mismo tipo se omiten,
+    por lo que repetir la solicitud no duplica alertas.
+    """
+    params = AlertMapper.herd_request_to_params(request)
+    result = await generate_usecase.execute(**params)
+    return HerdAlertsResponse(**result)
+
+
 @alert_router.get("", response_model=AlertsListResponse)
 @handle_domain_exceptions
 async def list_alerts(
@@ -51,6 +51,7 @@ router = APIRouter(
     **Errores**:
     - 401: Credenciales inválidas
     - 400: Request inválido
+    - 429: Demasiados inicios de sesión simultáneos (ver Retry-After)
     """,
 )
 @handle_domain_exceptions
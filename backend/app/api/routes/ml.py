@@ -18,10 +18,13 @@ from fastapi import (
     status,
 )
 
+from ...core.dependencies import get_current_superuser
 from ...core.dependencies.weight_estimations import (
     get_estimate_weight_from_image_usecase,
 )
-from ...core.utils.ml_inference import get_ml_models_status
+from ...core.utils.image_storage import image_storage_service
+from ...core.utils.ml_inference import get_ml_models_status, reload_ml_models
+from ...domain.entities.user import User
 from ...domain.shared.constants import BreedType
 from ...domain.usecases.weight_estimations import EstimateWeightFromImageUseCase
 from ..mappers import WeightEstimationMapper
@@ -53,6 +56,10 @@ router = APIRouter(
     5. Valida métricas (confidence ≥80%, tiempo <3s)
     6. Retorna peso estimado + confidence (NO guarda en BD)
 
+    **Tiempos por etapa** (`stage_timings_ms`, también en el header
+    `Server-Timing`): decode, preprocess, queue_wait, invoke, detect,
+    post_correction
+
     **US-002**: Estimación de Peso por Raza con IA
 
     **Métricas objetivo**:
@@ -109,6 +116,7 @@ async def predict_weight(
         "confidence": estimation.confidence,
         "confidence_level": estimation.get_confidence_level(),
         "processing_time_ms": estimation.processing_time_ms,
+        "stage_timings_ms": estimation.stage_timings_ms,
         "ml_model_version": estimation.ml_model_version,
         "method": "strategy_based",
         "meets_quality_criteria": estimation.meets_quality_criteria(),
@@ -127,6 +135,7 @@ async def predict_weight(
     - Total de modelos cargados
     - Razas con modelos disponibles
     - Razas faltantes
+    - Versión, variante y archivo de cada modelo activo (`models`)
 
     **Útil para**:
     - Verificar que los 7 modelos TFLite estén cargados
@@ -145,6 +154,31 @@ async def get_models_status():
     }
 
 
+@router.post(
+    "/models/reload",
+    status_code=status.HTTP_200_OK,
+    summary="Recargar modelos ML",
+    description="""
+    Recarga los modelos desde el registry (`ML_REGISTRY_PATH/manifest.json`)
+    o `ML_DEFAULT_MODEL` sin reiniciar el servidor. Solo superusuarios.
+
+    El conjunto nuevo se carga completo antes de reemplazar al actual: los
+    requests en curso terminan con el modelo anterior y, si la carga falla,
+    se conserva el conjunto actual (HTTP 500).
+
+    Recarga solo este proceso; los demás workers detectan el cambio del
+    manifest en `ML_REGISTRY_POLL_S` segundos.
+    """,
+)
+@handle_domain_exceptions
+async def reload_models(
+    current_user: Annotated[User, Depends(get_current_superuser)],
+):
+    """Recarga modelos ML (hot swap)."""
+    status_info = await reload_ml_models()
+    return {"status": "reloaded", **status_info}
+
+
 @router.post(
     "/estimate",
     status_code=status.HTTP_200_OK,
@@ -202,15 +236,10 @@ async def estimate_weight_from_web(
     # 2. Leer bytes de imagen
     image_bytes = await image.read()
 
-    # 3. Guardar imagen en backend/uploads
-    from ...core.utils.image_storage import save_estimation_frame
-
-    breed_value = breed.value if hasattr(breed, "value") else str(breed)
-    saved_image_path = save_estimation_frame(
-        image_bytes=image_bytes,
-        animal_id=animal_id,
-        breed=breed_value,
-    )
+    # 3. Guardar imagen en backend/uploads (por contenido, fuera del event loop;
+    #    miniatura y vista previa se generan en segundo plano)
+    stored_image = await image_storage_service.store(image_bytes)
+    saved_image_path = stored_image.relative_path
 
     # 4. Ejecutar caso de uso (inferencia + guardado)
     saved_estimation = await estimate_usecase.execute(
@@ -238,7 +267,9 @@ async def estimate_weight_from_web(
         "breed_confidence": response.confidence,
         "ml_model_version": response.ml_model_version,
         "processing_time_ms": response.processing_time_ms,
+        "stage_timings_ms": response.stage_timings_ms,
         "image_path": saved_estimation.frame_image_path,
+        "image_variants": image_storage_service.variant_paths(saved_image_path),
         "method": response.method,
         "meets_quality_criteria": saved_estimation.meets_quality_criteria(),
         "timestamp": response.timestamp.isoformat(),
@@ -3,32 +3,58 @@ Reports Routes - API Endpoints
 Endpoints REST para generación de reportes
 """
 
+import contextlib
+import os
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.types import Receive, Scope, Send
 
+from ...core.config import settings
 from ...core.dependencies import (
+    get_export_inventory_usecase,
+    get_export_weighings_usecase,
     get_generate_growth_report_usecase,
     get_generate_inventory_report_usecase,
     get_generate_movements_report_usecase,
     get_generate_traceability_report_usecase,
 )
-from ...core.utils import ReportGenerator
+from ...core.utils.excel_stream import (
+    INVENTORY_EXPORT_COLUMNS,
+    WEIGHINGS_EXPORT_COLUMNS,
+    build_excel_export,
+)
+from ...core.utils.report_cache import report_cache
+from ...core.utils.report_jobs import (
+    REPORT_EXTENSIONS,
+    REPORT_MEDIA_TYPES,
+    ReportJobStatus,
+    report_jobs,
+)
 from ...domain.usecases.reports import (
+    ExportInventoryUseCase,
+    ExportWeighingsUseCase,
     GenerateGrowthReportUseCase,
     GenerateInventoryReportUseCase,
     GenerateMovementsReportUseCase,
     GenerateTraceabilityReportUseCase,
 )
 from ...schemas.report_schemas import (
+    ExportInventoryRequest,
+    ExportWeighingsRequest,
     GenerateGrowthReportRequest,
     GenerateInventoryReportRequest,
     GenerateMovementsReportRequest,
     GenerateTraceabilityReportRequest,
     ReportFormat,
+    ReportJobResponse,
 )
+from ..mappers.report_mapper import ReportMapper
 from ..utils.exception_handlers import handle_domain_exceptions
 
 # Router con prefijo /api/v1/reports
@@ -43,6 +69,54 @@ router = APIRouter(
 )
 
 
+def _report_filename(basename: str, report_format: ReportFormat) -> str:
+    """Nombre de archivo con la extensión del formato."""
+    return f"{basename}.{REPORT_EXTENSIONS[report_format.value]}"
+
+
+def _file_response(
+    file_content: bytes, report_format: ReportFormat, basename: str
+) -> StreamingResponse:
+    """Construye la respuesta de descarga para un reporte ya renderizado."""
+    filename = _report_filename(basename, report_format)
+    return StreamingResponse(
+        iter([file_content]),
+        media_type=REPORT_MEDIA_TYPES[report_format.value],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+async def _render_cached(
+    cache_key: str,
+    report_type: str,
+    report_format: ReportFormat,
+    collect_data: Callable[[], Awaitable[dict]],
+) -> bytes:
+    """
+    Retorna el reporte desde caché o lo genera (datos + render en el pool).
+
+    La clave incluye la versión de los datos, así que un cambio en MongoDB
+    invalida automáticamente el reporte cacheado.
+    """
+    cached = report_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    report_data = await collect_data()
+    file_content = await report_jobs.render_bytes(
+        report_data, report_type, report_format.value
+    )
+    report_cache.put(cache_key, file_content)
+    return file_content
+
+
+def _growth_basename(request: GenerateGrowthReportRequest) -> str:
+    """Nombre base del archivo de crecimiento (individual o grupal)."""
+    report_type = "individual" if request.animal_id else "grupal"
+    entity_id = request.animal_id or request.farm_id
+    return f"crecimiento_{report_type}_{entity_id}"
+
+
 @router.post(
     "/traceability/{animal_id}",
     status_code=status.HTTP_200_OK,
@@ -71,28 +145,25 @@ async def generate_traceability_report(
     ],
 ) -> StreamingResponse:
     """Genera reporte de trazabilidad de un animal."""
-    # 1. Ejecutar use case
-    report_data = await usecase.execute(animal_id, request.format.value)
-
-    # 2. Generar archivo según formato
-    if request.format == ReportFormat.PDF:
-        file_content = ReportGenerator.generate_pdf(report_data, "traceability")
-        media_type = "application/pdf"
-        filename = f"trazabilidad_{animal_id}.pdf"
-    elif request.format == ReportFormat.EXCEL:
-        file_content = ReportGenerator.generate_excel(report_data, "traceability")
-        media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        filename = f"trazabilidad_{animal_id}.xlsx"
-    else:
-        raise ValueError(f"Formato no soportado: {request.format}")
+    # 1. Clave de caché (tipo + parámetros + versión de datos)
+    cache_key = report_cache.build_key(
+        "traceability",
+        request.format.value,
+        {"animal_id": str(animal_id)},
+        await usecase.get_data_version(animal_id),
+    )
 
-    # 3. Retornar como streaming response
-    return StreamingResponse(
-        iter([file_content]),
-        media_type=media_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    # 2. Obtener de caché o generar (render en el pool de procesos)
+    file_content = await _render_cached(
+        cache_key,
+        "traceability",
+        request.format,
+        partial(usecase.execute, animal_id, request.format.value),
     )
 
+    # 3. Retornar como streaming response
+    return _file_response(file_content, request.format, f"trazabilidad_{animal_id}")
+
 
 @router.post(
     "/inventory",
@@ -120,34 +191,32 @@ async def generate_inventory_report(
     ],
 ) -> StreamingResponse:
     """Genera reporte de inventario."""
-    # 1. Ejecutar use case
-    report_data = await usecase.execute(
-        farm_id=request.farm_id,
-        format=request.format.value,
-        status=request.status,
-        breed=request.breed,
-        date_from=request.date_from,
-        date_to=request.date_to,
+    # 1. Clave de caché (tipo + parámetros + versión de datos)
+    cache_key = report_cache.build_key(
+        "inventory",
+        request.format.value,
+        request.model_dump(mode="json"),
+        await usecase.get_data_version(request.farm_id),
     )
 
-    # 2. Generar archivo según formato
-    if request.format == ReportFormat.PDF:
-        file_content = ReportGenerator.generate_pdf(report_data, "inventory")
-        media_type = "application/pdf"
-        filename = f"inventario_{request.farm_id}.pdf"
-    elif request.format == ReportFormat.EXCEL:
-        file_content = ReportGenerator.generate_excel(report_data, "inventory")
-        media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        filename = f"inventario_{request.farm_id}.xlsx"
-    else:
-        raise ValueError(f"Formato no soportado: {request.format}")
+    # 2. Obtener de caché o generar (render en el pool de procesos)
+    file_content = await _render_cached(
+        cache_key,
+        "inventory",
+        request.format,
+        partial(
+            usecase.execute,
+            farm_id=request.farm_id,
+            format=request.format.value,
+            status=request.status,
+            breed=request.breed,
+            date_from=request.date_from,
+            date_to=request.date_to,
+        ),
+    )
 
     # 3. Retornar como streaming response
-    return StreamingResponse(
-        iter([file_content]),
-        media_type=media_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return _file_response(file_content, request.format, f"inventario_{request.farm_id}")
 
 
 @router.post(
@@ -176,32 +245,32 @@ async def generate_movements_report(
     ],
 ) -> StreamingResponse:
     """Genera reporte de movimientos."""
-    # 1. Ejecutar use case
-    report_data = await usecase.execute(
-        farm_id=request.farm_id,
-        format=request.format.value,
-        movement_type=request.movement_type,
-        date_from=request.date_from,
-        date_to=request.date_to,
+    # 1. Clave de caché (tipo + parámetros + versión de datos)
+    cache_key = report_cache.build_key(
+        "movements",
+        request.format.value,
+        request.model_dump(mode="json"),
+        await usecase.get_data_version(request.farm_id),
     )
 
-    # 2. Generar archivo según formato
-    if request.format == ReportFormat.PDF:
-        file_content = ReportGenerator.generate_pdf(report_data, "movements")
-        media_type = "application/pdf"
-        filename = f"movimientos_{request.farm_id}.pdf"
-    elif request.format == ReportFormat.EXCEL:
-        file_content = ReportGenerator.generate_excel(report_data, "movements")
-        media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        filename = f"movimientos_{request.farm_id}.xlsx"
-    else:
-        raise ValueError(f"Formato no soportado: {request.format}")
+    # 2. Obtener de caché o generar (render en el pool de procesos)
+    file_content = await _render_cached(
+        cache_key,
+        "movements",
+        request.format,
+        partial(
+            usecase.execute,
+            farm_id=request.farm_id,
+            format=request.format.value,
+            movement_type=request.movement_type,
+            date_from=request.date_from,
+            date_to=request.date_to,
+        ),
+    )
 
     # 3. Retornar como streaming response
-    return StreamingResponse(
-        iter([file_content]),
-        media_type=media_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    return _file_response(
+        file_content, request.format, f"movimientos_{request.farm_id}"
     )
 
 
@@ -234,33 +303,338 @@ async def generate_growth_report(
     ],
 ) -> StreamingResponse:
     """Genera reporte de crecimiento."""
-    # 1. Ejecutar use case
-    report_data = await usecase.execute(
-        animal_id=request.animal_id,
-        farm_id=request.farm_id,
-        format=request.format.value,
+    # 1. Clave de caché (tipo + parámetros + versión de datos)
+    cache_key = report_cache.build_key(
+        "growth",
+        request.format.value,
+        request.model_dump(mode="json"),
+        await usecase.get_data_version(
+            animal_id=request.animal_id, farm_id=request.farm_id
+        ),
     )
 
-    # 2. Generar archivo según formato
-    report_type = "individual" if request.animal_id else "grupal"
-    entity_id = request.animal_id or request.farm_id
-
-    if request.format == ReportFormat.PDF:
-        file_content = ReportGenerator.generate_pdf(report_data, "growth")
-        media_type = "application/pdf"
-        filename = f"crecimiento_{report_type}_{entity_id}.pdf"
-    elif request.format == ReportFormat.EXCEL:
-        file_content = ReportGenerator.generate_excel(report_data, "growth")
-        media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        report_type = "individual" if request.animal_id else "grupal"
-        entity_id = request.animal_id or request.farm_id
-        filename = f"crecimiento_{report_type}_{entity_id}.xlsx"
-    else:
-        raise ValueError(f"Formato no soportado: {request.format}")
+    # 2. Obtener de caché o generar (render en el pool de procesos)
+    file_content = await _render_cached(
+        cache_key,
+        "growth",
+        request.format,
+        partial(
+            usecase.execute,
+            animal_id=request.animal_id,
+            farm_id=request.farm_id,
+            format=request.format.value,
+        ),
+    )
 
     # 3. Retornar como streaming response
-    return StreamingResponse(
-        iter([file_content]),
-        media_type=media_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    return _file_response(file_content, request.format, _growth_basename(request))
+
+
+# ===== Trabajos en segundo plano =====
+
+
+@router.post(
+    "/jobs/traceability/{animal_id}",
+    response_model=ReportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Encolar reporte de trazabilidad",
+    description="""
+    Encola la generación del reporte de trazabilidad y retorna inmediatamente.
+
+    Consultar el progreso con `GET /jobs/{job_id}` y descargar con
+    `GET /jobs/{job_id}/download` cuando `status=completed`.
+    """,
+)
+@handle_domain_exceptions
+async def enqueue_traceability_report(
+    animal_id: UUID,
+    request: GenerateTraceabilityReportRequest,
+    usecase: Annotated[
+        GenerateTraceabilityReportUseCase,
+        Depends(get_generate_traceability_report_usecase),
+    ],
+) -> ReportJobResponse:
+    """Encola reporte de trazabilidad de un animal."""
+    cache_key = report_cache.build_key(
+        "traceability",
+        request.format.value,
+        {"animal_id": str(animal_id)},
+        await usecase.get_data_version(animal_id),
+    )
+    job = report_jobs.submit(
+        report_type="traceability",
+        report_format=request.format.value,
+        filename=_report_filename(f"trazabilidad_{animal_id}", request.format),
+        collect_data=partial(usecase.execute, animal_id, request.format.value),
+        cache_key=cache_key,
+    )
+    return ReportMapper.to_job_response(job)
+
+
+@router.post(
+    "/jobs/inventory",
+    response_model=ReportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Encolar reporte de inventario",
+    description="Encola la generación del reporte de inventario de una finca.",
+)
+@handle_domain_exceptions
+async def enqueue_inventory_report(
+    request: GenerateInventoryReportRequest,
+    usecase: Annotated[
+        GenerateInventoryReportUseCase,
+        Depends(get_generate_inventory_report_usecase),
+    ],
+) -> ReportJobResponse:
+    """Encola reporte de inventario."""
+    cache_key = report_cache.build_key(
+        "inventory",
+        request.format.value,
+        request.model_dump(mode="json"),
+        await usecase.get_data_version(request.farm_id),
+    )
+    job = report_jobs.submit(
+        report_type="inventory",
+        report_format=request.format.value,
+        filename=_report_filename(f"inventario_{request.farm_id}", request.format),
+        collect_data=partial(
+            usecase.execute,
+            farm_id=request.farm_id,
+            format=request.format.value,
+            status=request.status,
+            breed=request.breed,
+            date_from=request.date_from,
+            date_to=request.date_to,
+        ),
+        cache_key=cache_key,
+    )
+    return ReportMapper.to_job_response(job)
+
+
+@router.post(
+    "/jobs/movements",
+    response_model=ReportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Encolar reporte de movimientos",
+    description="Encola la generación del reporte de movimientos (ventas/muertes).",
+)
+@handle_domain_exceptions
+async def enqueue_movements_report(
+    request: GenerateMovementsReportRequest,
+    usecase: Annotated[
+        GenerateMovementsReportUseCase,
+        Depends(get_generate_movements_report_usecase),
+    ],
+) -> ReportJobResponse:
+    """Encola reporte de movimientos."""
+    cache_key = report_cache.build_key(
+        "movements",
+        request.format.value,
+        request.model_dump(mode="json"),
+        await usecase.get_data_version(request.farm_id),
+    )
+    job = report_jobs.submit(
+        report_type="movements",
+        report_format=request.format.value,
+        filename=_report_filename(f"movimientos_{request.farm_id}", request.format),
+        collect_data=partial(
+            usecase.execute,
+            farm_id=request.farm_id,
+            format=request.format.value,
+            movement_type=request.movement_type,
+            date_from=request.date_from,
+            date_to=request.date_to,
+        ),
+        cache_key=cache_key,
+    )
+    return ReportMapper.to_job_response(job)
+
+
+@router.post(
+    "/jobs/growth",
+    response_model=ReportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Encolar reporte de crecimiento",
+    description="Encola el reporte de crecimiento (individual o grupal).",
+)
+@handle_domain_exceptions
+async def enqueue_growth_report(
+    request: GenerateGrowthReportRequest,
+    usecase: Annotated[
+        GenerateGrowthReportUseCase, Depends(get_generate_growth_report_usecase)
+    ],
+) -> ReportJobResponse:
+    """Encola reporte de crecimiento."""
+    cache_key = report_cache.build_key(
+        "growth",
+        request.format.value,
+        request.model_dump(mode="json"),
+        await usecase.get_data_version(
+            animal_id=request.animal_id, farm_id=request.farm_id
+        ),
+    )
+    job = report_jobs.submit(
+        report_type="growth",
+        report_format=request.format.value,
+        filename=_report_filename(_growth_basename(request), request.format),
+        collect_data=partial(
+            usecase.execute,
+            animal_id=request.animal_id,
+            farm_id=request.farm_id,
+            format=request.format.value,
+        ),
+        cache_key=cache_key,
+    )
+    return ReportMapper.to_job_response(job)
+
+
+class _TemporaryFileResponse(FileResponse):
+    """FileResponse cuya tarea de fondo corre también si el cliente corta."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        except BaseException:
+            # Descarga interrumpida: FileResponse no llega a la tarea de fondo
+            if self.background is not None:
+                await self.background()
+            raise
+
+
+def _remove_file(path: str) -> None:
+    """Elimina un archivo temporal (si todavía existe)."""
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+
+
+def _export_response(path: str, basename: str) -> FileResponse:
+    """Descarga de una exportación Excel ya generada (se elimina al terminar)."""
+    response = _TemporaryFileResponse(
+        path,
+        media_type=REPORT_MEDIA_TYPES[ReportFormat.EXCEL.value],
+        filename=_report_filename(basename, ReportFormat.EXCEL),
+        background=BackgroundTask(_remove_file, path),
+    )
+    response.chunk_size = settings.REPORTS_EXPORT_CHUNK_KB * 1024
+    return response
+
+
+@router.post(
+    "/export/inventory",
+    status_code=status.HTTP_200_OK,
+    summary="Exportar inventario completo (Excel en streaming)",
+    description="""
+    Exporta una fila por animal de una o varias fincas.
+
+    A diferencia de `/inventory`, el libro se genera con memoria constante
+    (cursor de MongoDB + hoja write-only) en un archivo temporal y se envía
+    por chunks, por lo que sirve para operaciones con muchas fincas. Un
+    error durante la generación responde con su código HTTP (no hay
+    descargas truncadas).
+
+    **Formato**: Excel
+    """,
+)
+@handle_domain_exceptions
+async def export_inventory(
+    request: ExportInventoryRequest,
+    usecase: Annotated[ExportInventoryUseCase, Depends(get_export_inventory_usecase)],
+) -> FileResponse:
+    """Exporta el inventario completo."""
+    rows = usecase.execute(
+        farm_ids=request.farm_ids,
+        status=request.status,
+        breed=request.breed,
+        date_from=request.date_from,
+        date_to=request.date_to,
+    )
+    path = await build_excel_export(
+        rows,
+        sheet_title="Inventario",
+        title="REPORTE DE INVENTARIO",
+        columns=INVENTORY_EXPORT_COLUMNS,
+        batch_size=settings.REPORTS_EXPORT_BATCH_SIZE,
+    )
+    return _export_response(path, "inventario_export")
+
+
+@router.post(
+    "/export/weighings",
+    status_code=status.HTTP_200_OK,
+    summary="Exportar estimaciones de peso (Excel en streaming)",
+    description="""
+    Exporta todas las estimaciones de peso de una o varias fincas.
+
+    El libro se genera con memoria constante (cursores de MongoDB + hoja
+    write-only) en un archivo temporal y se envía por chunks.
+
+    **Formato**: Excel
+    """,
+)
+@handle_domain_exceptions
+async def export_weighings(
+    request: ExportWeighingsRequest,
+    usecase: Annotated[ExportWeighingsUseCase, Depends(get_export_weighings_usecase)],
+) -> FileResponse:
+    """Exporta las estimaciones de peso."""
+    rows = usecase.execute(
+        farm_ids=request.farm_ids,
+        breed=request.breed,
+        date_from=request.date_from,
+        date_to=request.date_to,
+    )
+    path = await build_excel_export(
+        rows,
+        sheet_title="Pesajes",
+        title="EXPORTACIÓN DE PESAJES",
+        columns=WEIGHINGS_EXPORT_COLUMNS,
+        batch_size=settings.REPORTS_EXPORT_BATCH_SIZE,
     )
+    return _export_response(path, "pesajes_export")
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=ReportJobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Estado de un trabajo de reporte",
+    description="Retorna estado, progreso y URL de descarga del trabajo.",
+)
+async def get_report_job(job_id: UUID) -> ReportJobResponse:
+    """Obtiene el estado de un trabajo de reporte."""
+    job = report_jobs.get(job_id.hex)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Trabajo de reporte '{job_id}' no encontrado o expirado",
+        )
+    return ReportMapper.to_job_response(job)
+
+
+@router.get(
+    "/jobs/{job_id}/download",
+    status_code=status.HTTP_200_OK,
+    summary="Descargar reporte generado",
+    description="Descarga el archivo de un trabajo de reporte completado.",
+)
+async def download_report_job(job_id: UUID) -> FileResponse:
+    """Descarga el archivo generado por un trabajo de reporte."""
+    job = report_jobs.get(job_id.hex)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Trabajo de reporte '{job_id}' no encontrado o expirado",
+        )
+    if job.status != ReportJobStatus.COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"El reporte aún no está listo (status={job.status.value})",
+        )
+
+    path = report_jobs.artifact_path(job)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archivo del reporte no disponible",
+        )
+    return FileResponse(path, media_type=job.media_type, filename=job.filename)
@@ -3,11 +3,21 @@ Resources Routes - API Endpoints
 Endpoints REST para servir recursos estáticos (imágenes)
 """
 
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import FileResponse
+import asyncio
+import os
 
-from ...core.utils.image_storage import ensure_uploads_directory
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import Response
+
+from ...core.config import settings
+from ...core.utils.image_storage import (
+    ensure_uploads_directory,
+    image_storage_service,
+    variant_relative_path,
+)
+from ...domain.entities.image_blob import ImageBlob
 from ..utils.exception_handlers import handle_domain_exceptions
+from ..utils.file_response import build_file_response, stat_etag
 
 # Router con prefijo /api/v1/resources
 router = APIRouter(
@@ -20,39 +30,67 @@ router = APIRouter(
     },
 )
 
+# Content-Type por extensión
+IMAGE_MEDIA_TYPES: dict[str, str] = {
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+# Imágenes en cas/ nunca cambian de contenido (el path es su hash)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Original servido en lugar de una variante que no se pudo generar: revalidar
+# siempre, para no cachear la imagen completa como miniatura
+FALLBACK_CACHE_CONTROL = "no-cache"
+
 
-@router.get(
+@router.api_route(
     "/images/{image_path:path}",
+    methods=["GET", "HEAD"],
     summary="Obtener imagen",
     description="""
     Sirve imágenes desde el directorio de uploads.
 
     **Path**:
     - image_path: Ruta relativa de la imagen desde uploads/
+      - Ejemplo: `cas/3f/a2/3fa2...e1.jpg`
       - Ejemplo: `nelore/nelore_213.jpg`
-      - Ejemplo: `brahman/animal_123.jpg`
-      - Ejemplo: `estimations/estimation_456.jpg`
 
-    **Response**:
-    - Archivo de imagen con Content-Type apropiado
+    **Query**:
+    - w: Lado máximo en px de una variante redimensionada (miniatura o vista
+      previa). Se genera la primera vez y queda guardada en disco.
+
+    **Cache HTTP**:
+    - ETag / Last-Modified: responde 304 a If-None-Match / If-Modified-Since
+    - Imágenes en `cas/`: `Cache-Control: immutable` por 1 año
+    - Range: soporta descargas parciales (206)
 
     **Errores**:
     - 404: Imagen no encontrada
-    - 400: Path inválido (intenta acceder fuera de uploads/)
+    - 400: Path inválido (intenta acceder fuera de uploads/) o tamaño no permitido
+    - 416: Rango no satisfacible
     """,
     response_description="Archivo de imagen",
 )
 @handle_domain_exceptions
-async def get_image(image_path: str) -> FileResponse:
+async def get_image(
+    request: Request,
+    image_path: str,
+    w: int | None = Query(
+        None, description="Ancho/alto máximo de la variante (ej: 256, 1024)"
+    ),
+) -> Response:
     """
     Endpoint para servir imágenes desde el directorio de uploads.
 
     Args:
+        request: Request HTTP (headers condicionales y Range)
         image_path: Ruta relativa de la imagen desde uploads/
                    (ej: "nelore/nelore_213.jpg")
+        w: Tamaño de la variante (opcional)
 
     Returns:
-        FileResponse con el archivo de imagen
+        Response con la imagen (200/206) o 304 si el cliente ya la tiene
 
     Raises:
         HTTPException 404: Si la imagen no existe
@@ -78,27 +116,83 @@ async def get_image(image_path: str) -> FileResponse:
         )
 
     # Verificar que el archivo existe
-    if not image_file.exists() or not image_file.is_file():
+    original_stat = await asyncio.to_thread(_stat_file, str(image_file))
+    if original_stat is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Imagen no encontrada: {image_path}",
         )
 
-    # Determinar Content-Type basado en extensión
-    content_type = "image/jpeg"  # Por defecto JPEG
-    suffix = image_file.suffix.lower()
-    if suffix in [".png"]:
-        content_type = "image/png"
-    elif suffix in [".gif"]:
-        content_type = "image/gif"
-    elif suffix in [".webp"]:
-        content_type = "image/webp"
-
-    # Retornar archivo con headers apropiados
-    return FileResponse(
-        path=str(image_file),
-        media_type=content_type,
-        headers={
-            "Cache-Control": "public, max-age=31536000",  # Cache por 1 año
-        },
+    served_path = normalized_path
+    if w is not None:
+        allowed_sizes = sorted(set(image_storage_service.variants.values()))
+        if w not in allowed_sizes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Tamaño no permitido: {w}. Tamaños: {allowed_sizes}",
+            )
+        served_path = await _resolve_variant(normalized_path, w)
+
+    served_file = uploads_dir / served_path
+    file_stat = (
+        original_stat
+        if served_path == normalized_path
+        else await asyncio.to_thread(_stat_file, str(served_file))
+    )
+    if file_stat is None:
+        served_path, served_file, file_stat = normalized_path, image_file, original_stat
+
+    # Validadores: el hash del contenido en cas/, mtime+tamaño en el resto
+    digest = ImageBlob.digest_from_path(normalized_path)
+    if w is not None and served_path == normalized_path:
+        etag = f'"{digest}"' if digest is not None else stat_etag(file_stat)
+        cache_control = FALLBACK_CACHE_CONTROL
+    elif digest is not None:
+        etag = f'"{digest}-w{w}"' if served_path != normalized_path else f'"{digest}"'
+        cache_control = IMMUTABLE_CACHE_CONTROL
+    else:
+        etag = stat_etag(file_stat)
+        cache_control = f"public, max-age={settings.IMAGES_CACHE_MAX_AGE_S}"
+
+    accel_redirect = None
+    if settings.IMAGES_X_ACCEL_PREFIX:
+        accel_redirect = f"{settings.IMAGES_X_ACCEL_PREFIX.rstrip('/')}/{served_path}"
+
+    media_type = "image/jpeg"  # Por defecto JPEG (también las variantes)
+    media_type = IMAGE_MEDIA_TYPES.get(served_file.suffix.lower(), media_type)
+
+    return build_file_response(
+        request_headers=request.headers,
+        method=request.method,
+        path=str(served_file),
+        stat_result=file_stat,
+        media_type=media_type,
+        etag=etag,
+        cache_control=cache_control,
+        accel_redirect=accel_redirect,
     )
+
+
+def _stat_file(path: str) -> os.stat_result | None:
+    """os.stat de un archivo regular, o None si no existe."""
+    try:
+        result = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return result if os.path.isfile(path) else None
+
+
+async def _resolve_variant(relative_path: str, size: int) -> str:
+    """
+    Path de la variante pedida, generándola si aún no existe.
+
+    Si la imagen no se puede redimensionar se sirve el original.
+    """
+    variant_path = variant_relative_path(relative_path, size)
+    if variant_path == relative_path:
+        return relative_path
+    try:
+        return await image_storage_service.ensure_variant(relative_path, size)
+    except Exception as e:
+        print(f"⚠️ No se pudo generar la variante {variant_path}: {e}")
+        return relative_path
@@ -98,6 +98,7 @@ async def sync_cattle_batch(
     result = await sync_usecase.execute(
         items=items_dict,
         device_id=request.device_id,
+        pending_count=request.pending_count,
     )
 
     # Convertir resultado a response usando mapper
@@ -160,6 +161,7 @@ async def sync_weight_estimations_batch(
     result = await sync_usecase.execute(
         items=items_dict,
         device_id=request.device_id,
+        pending_count=request.pending_count,
     )
 
     # Convertir resultado a response usando mapper
@@ -178,6 +180,11 @@ async def sync_weight_estimations_batch(
     - Llamar antes de sync para verificar conectividad
     - Timeout corto (2-3 segundos) para detectar offline rápido
     - Usar para mostrar indicador de conexión en UI
+
+    **Métricas** (registro en memoria, cacheadas unos segundos):
+    - Latencia del ping a MongoDB
+    - Batches en curso, items/seg y latencia p50/p95 por batch
+    - Último sync y backlog estimado por dispositivo
     """,
 )
 @handle_domain_exceptions
@@ -17,7 +17,7 @@ from ...core.dependencies import (
     get_get_users_by_criteria_usecase,
     get_update_user_usecase,
 )
-from ...core.utils.password import get_password_hash
+from ...core.utils.password import get_password_hash_async
 from ...domain.entities.user import User
 from ...domain.usecases.users import (
     CreateUserUseCase,
@@ -75,7 +75,7 @@ async def create_user(
 ) -> UserResponse:
     """Crea un nuevo usuario."""
     # Hash de contraseña
-    hashed_password = get_password_hash(request.password)
+    hashed_password = await get_password_hash_async(request.password)
 
     # Convertir request a parámetros y ejecutar use case
     params = UserMapper.create_request_to_params(request, hashed_password)
@@ -209,7 +209,7 @@ async def update_user(
     # Hash de contraseña si se proporciona
     hashed_password = None
     if request.password is not None:
-        hashed_password = get_password_hash(request.password)
+        hashed_password = await get_password_hash_async(request.password)
 
     # Convertir request a parámetros y ejecutar use case
     params = UserMapper.update_request_to_params(request, hashed_password)
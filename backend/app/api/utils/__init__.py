@@ -4,10 +4,12 @@ Funciones helper y utilidades comunes para endpoints
 """
 
 from .exception_handlers import handle_domain_exceptions
+from .file_response import build_file_response
 from .pagination import calculate_pagination, calculate_skip
 
 __all__ = [
     "handle_domain_exceptions",
+    "build_file_response",
     "calculate_pagination",
     "calculate_skip",
 ]
@@ -11,8 +11,10 @@ from fastapi import HTTPException, status
 
 from app.core.exceptions import (
     AlreadyExistsException,
+    AuthenticationException,
     MLModelException,
     NotFoundException,
+    RateLimitException,
     ValidationException,
 )
 
@@ -29,6 +31,8 @@ def handle_domain_exceptions(
     - NotFoundException → HTTP 404
     - AlreadyExistsException → HTTP 400
     - ValidationException → HTTP 400
+    - AuthenticationException → HTTP 401
+    - RateLimitException → HTTP 429 (con Retry-After)
     - MLModelException → HTTP 500
     - ValueError → HTTP 400
 
@@ -58,6 +62,18 @@ def handle_domain_exceptions(
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         except ValidationException as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except AuthenticationException as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=str(e),
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        except RateLimitException as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=str(e),
+                headers={"Retry-After": str(e.retry_after)},
+            )
         except MLModelException as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
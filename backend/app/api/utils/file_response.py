@@ -0,0 +1,243 @@
+"""
+File Responses - Utilidades para routes
+Respuestas de archivos con validadores HTTP, 304 y rangos
+
+Starlette 0.27 (FileResponse) no responde 304 ni soporta Range. Este módulo
+agrega:
+- ETag / Last-Modified y 304 para If-None-Match / If-Modified-Since
+- Range de un solo tramo (206 / 416) con If-Range
+- Envío sin copia: X-Accel-Redirect (NGINX hace sendfile) si está
+  configurado, la extensión ASGI `http.response.zerocopysend` si el servidor
+  la ofrece, o lectura por chunks en un hilo como último recurso
+"""
+
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+CHUNK_SIZE = 64 * 1024
+
+
+def stat_etag(stat_result: os.stat_result) -> str:
+    """ETag derivado de mtime y tamaño (archivos con path mutable)."""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def is_not_modified(
+    request_headers: Headers, etag: str, last_modified_ts: float
+) -> bool:
+    """
+    Evalúa las precondiciones condicionales de un GET.
+
+    If-None-Match tiene prioridad sobre If-Modified-Since (RFC 9110 §13.2.2).
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified_ts) <= since
+    return False
+
+
+def parse_range(
+    request_headers: Headers, etag: str, size: int
+) -> tuple[int, int] | None:
+    """
+    Interpreta un header Range de un solo tramo.
+
+    Returns:
+        (inicio, fin inclusivo), o None para responder el archivo completo
+
+    Raises:
+        ValueError: Si el rango no es satisfacible (416)
+    """
+    range_header = request_headers.get("range")
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+
+    # If-Range con otro validador: el recurso cambió, enviar completo
+    if_range = request_headers.get("if-range")
+    if if_range is not None and if_range.strip() != etag:
+        return None
+
+    spec = range_header.removeprefix("bytes=").strip()
+    if "," in spec:
+        return None  # Multi-rango: se responde el archivo completo
+
+    start_text, _, end_text = spec.partition("-")
+    try:
+        if not start_text:
+            # bytes=-N: últimos N bytes
+            suffix = int(end_text)
+            if suffix <= 0:
+                raise ValueError("Rango vacío")
+            start, end = max(size - suffix, 0), size - 1
+        else:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+            end = min(end, size - 1)
+    except ValueError as e:
+        raise ValueError(f"Rango inválido: {range_header}") from e
+
+    if start >= size or start > end:
+        raise ValueError(f"Rango no satisfacible: {range_header}")
+    return start, end
+
+
+class FileRangeResponse(Response):
+    """
+    Respuesta con (parte de) un archivo.
+
+    El body se envía sin cargar el archivo en memoria; si el servidor ASGI
+    soporta `http.response.zerocopysend`, el kernel copia directamente del
+    archivo al socket.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        start: int,
+        end: int,
+        status_code: int,
+        headers: dict[str, str],
+        media_type: str,
+        send_body: bool = True,
+    ):
+        """
+        Inicializa la respuesta.
+
+        Args:
+            path: Path absoluto del archivo
+            start: Primer byte a enviar
+            end: Último byte a enviar (inclusivo)
+            status_code: 200 o 206
+            headers: Headers de la respuesta (sin Content-Length)
+            media_type: Content-Type
+            send_body: False para HEAD
+        """
+        self.path = path
+        self.start = start
+        self.length = max(end - start + 1, 0)
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.send_body = send_body
+        self.init_headers({**headers, "content-length": str(self.length)})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Envía headers y el tramo del archivo."""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if not self.send_body or self.length == 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        extensions: dict[str, Any] = scope.get("extensions") or {}
+        if "http.response.zerocopysend" in extensions:
+            with open(self.path, "rb") as f:
+                await send(
+                    {
+                        "type": "http.response.zerocopysend",
+                        "file": f,
+                        "offset": self.start,
+                        "count": self.length,
+                    }
+                )
+            return
+
+        remaining = self.length
+        async with await anyio.open_file(self.path, mode="rb") as f:
+            await f.seek(self.start)
+            while remaining > 0:
+                chunk = await f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0,
+                    }
+                )
+        if remaining > 0:
+            # El archivo se truncó durante el envío: cerrar el body
+            await send({"type": "http.response.body", "body": b""})
+
+
+def build_file_response(
+    request_headers: Headers,
+    method: str,
+    path: str,
+    stat_result: os.stat_result,
+    media_type: str,
+    etag: str,
+    cache_control: str,
+    accel_redirect: str | None = None,
+) -> Response:
+    """
+    Construye la respuesta adecuada para servir un archivo.
+
+    Args:
+        request_headers: Headers del request
+        method: GET o HEAD
+        path: Path absoluto del archivo
+        stat_result: os.stat del archivo
+        media_type: Content-Type
+        etag: ETag (entre comillas)
+        cache_control: Valor de Cache-Control
+        accel_redirect: URI interna para X-Accel-Redirect (NGINX sirve el archivo)
+
+    Returns:
+        304, 416, respuesta X-Accel-Redirect o FileRangeResponse (200/206)
+    """
+    headers = {
+        "etag": etag,
+        "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "cache-control": cache_control,
+        "accept-ranges": "bytes",
+    }
+
+    if is_not_modified(request_headers, etag, stat_result.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    if accel_redirect:
+        # NGINX resuelve condicionales y rangos y envía con sendfile
+        return Response(
+            status_code=200,
+            headers={**headers, "x-accel-redirect": accel_redirect},
+            media_type=media_type,
+        )
+
+    size = stat_result.st_size
+    try:
+        byte_range = parse_range(request_headers, etag, size)
+    except ValueError:
+        return Response(
+            status_code=416, headers={**headers, "content-range": f"bytes */{size}"}
+        )
+
+    send_body = method != "HEAD"
+    if byte_range is None:
+        return FileRangeResponse(path, 0, size - 1, 200, headers, media_type, send_body)
+
+    start, end = byte_range
+    headers["content-range"] = f"bytes {start}-{end}/{size}"
+    return FileRangeResponse(path, start, end, 206, headers, media_type, send_body)
@@ -14,6 +14,7 @@ from .exceptions import (
     DomainException,
     MLModelException,
     NotFoundException,
+    RateLimitException,
     SyncConflictException,
     ValidationException,
 )
@@ -32,4 +33,5 @@ __all__ = [
     "DatabaseException",
     "MLModelException",
     "SyncConflictException",
+    "RateLimitException",
 ]
@@ -82,6 +82,28 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(
         default=10080, description="Minutos de expiración del token JWT (7 días)"
     )
+    AUTH_PRINCIPAL_CACHE_TTL_S: float = Field(
+        default=30.0,
+        description="TTL (s) de la caché de usuarios autenticados (0=off)",
+    )
+    AUTH_PRINCIPAL_CACHE_MAX_SIZE: int = Field(
+        default=10000, description="Usuarios máximos en la caché de autenticación"
+    )
+    PASSWORD_HASH_MAX_WORKERS: int = Field(
+        default=4, description="Hilos para bcrypt (hash/verificación concurrentes)"
+    )
+    PASSWORD_HASH_MAX_PENDING: int = Field(
+        default=256, description="Operaciones bcrypt máximas en cola (luego 429)"
+    )
+    LOGIN_RATE_PER_SECOND: float = Field(
+        default=20.0, description="Verificaciones de login por segundo (0=sin límite)"
+    )
+    LOGIN_BURST: int = Field(
+        default=40, description="Verificaciones de login permitidas en ráfaga"
+    )
+    LOGIN_MAX_WAIT_S: float = Field(
+        default=5.0, description="Espera máxima de un login en cola antes de 429"
+    )
 
     # ===== ML Models =====
     ML_MODELS_PATH: str = Field(
@@ -102,6 +124,42 @@ class Settings(BaseSettings):
     ML_CONFIDENCE_THRESHOLD: float = Field(
         default=0.80, description="Umbral mínimo de confianza ML (80%)"
     )
+    ML_MODEL_FORMATS: str | list[str] = Field(
+        default="int8,float16,float32",
+        description=(
+            "Variantes preferidas en orden: busca <modelo>-<formato>.tflite y "
+            "recurre a ML_DEFAULT_MODEL"
+        ),
+    )
+    ML_NUM_THREADS: int = Field(
+        default=0,
+        description="Hilos del intérprete TFLite (0 = auto-tune al cargar el modelo)",
+    )
+    ML_AUTOTUNE_INVOCATIONS: int = Field(
+        default=5, description="Invocaciones medidas por candidato en el auto-tune"
+    )
+    ML_USE_XNNPACK: bool = Field(
+        default=True, description="Usar el delegado XNNPACK (CPU) del intérprete"
+    )
+    ML_OP_RESOLVER: str = Field(
+        default="auto",
+        description="Op resolver TFLite: auto, builtin o builtin_ref (kernels de referencia)",
+    )
+    ML_PRELOAD_MODEL: bool = Field(
+        default=True,
+        description="Cargar (y auto-tunear) el modelo al iniciar en vez del primer request",
+    )
+    ML_REGISTRY_PATH: str = Field(
+        default="./ml_models/registry",
+        description=(
+            "Registry local de modelos versionados (manifest.json); sin manifest "
+            "se usa ML_DEFAULT_MODEL"
+        ),
+    )
+    ML_REGISTRY_POLL_S: float = Field(
+        default=10.0,
+        description="Cada cuántos segundos revisar cambios del manifest (0 = no revisar)",
+    )
 
     # ===== Logging =====
     LOG_LEVEL: str = Field(default="INFO", description="Nivel de logs")
@@ -115,6 +173,106 @@ class Settings(BaseSettings):
         default=30, description="Timeout de requests en segundos"
     )
 
+    # ===== Request Metrics =====
+    METRICS_ENABLED: bool = Field(
+        default=True,
+        description="Medir requests/MongoDB y exponer métricas Prometheus",
+    )
+    METRICS_PATH: str = Field(
+        default="/metrics", description="Ruta del endpoint de métricas Prometheus"
+    )
+    METRICS_SERVER_TIMING: bool = Field(
+        default=True,
+        description="Agregar el header Server-Timing (app, db, etapas ML)",
+    )
+
+    # ===== Sync Metrics =====
+    SYNC_METRICS_WINDOW_S: int = Field(
+        default=300,
+        description="Ventana deslizante (s) para throughput y latencias de sync",
+    )
+    SYNC_HEALTH_CACHE_TTL_S: float = Field(
+        default=5.0,
+        description="TTL (s) del snapshot de métricas y ping a MongoDB del health",
+    )
+
+    # ===== Report Jobs =====
+    REPORTS_STORAGE_PATH: str = Field(
+        default="./generated_reports",
+        description="Directorio para reportes generados en segundo plano",
+    )
+    REPORTS_MAX_WORKERS: int = Field(
+        default=2, description="Procesos máximos para renderizar reportes"
+    )
+    REPORTS_TTL_MINUTES: int = Field(
+        default=60, description="Minutos que un reporte generado queda descargable"
+    )
+    REPORTS_CACHE_PATH: str = Field(
+        default="./report_cache",
+        description="Directorio de la caché de reportes (clave por versión de datos)",
+    )
+    REPORTS_CACHE_MAX_MB: int = Field(
+        default=256, description="Tamaño máximo de la caché de reportes (0=off)"
+    )
+    REPORTS_EXPORT_BATCH_SIZE: int = Field(
+        default=1000, description="Filas por lote en exportaciones Excel en streaming"
+    )
+    REPORTS_EXPORT_CHUNK_KB: int = Field(
+        default=64, description="Tamaño de chunk (KB) al enviar exportaciones"
+    )
+
+    # ===== Image Storage =====
+    IMAGES_THUMBNAIL_SIZE: int = Field(
+        default=256, description="Lado máximo (px) de la miniatura para listados"
+    )
+    IMAGES_PREVIEW_SIZE: int = Field(
+        default=1024, description="Lado máximo (px) de la vista previa"
+    )
+    IMAGES_VARIANT_QUALITY: int = Field(
+        default=80, description="Calidad JPEG de miniaturas y vistas previas"
+    )
+    IMAGES_MAX_WORKERS: int = Field(
+        default=2, description="Hilos para generar miniaturas en segundo plano"
+    )
+    IMAGES_MAX_PENDING: int = Field(
+        default=200,
+        description="Imágenes máximas en cola de miniaturas (el resto se omite)",
+    )
+    IMAGES_CACHE_MAX_AGE_S: int = Field(
+        default=86400,
+        description="Cache-Control (s) de imágenes fuera de cas/ (las de cas/ son inmutables)",
+    )
+    IMAGES_X_ACCEL_PREFIX: str = Field(
+        default="",
+        description="Location interna de NGINX para servir con X-Accel-Redirect (vacío=off)",
+    )
+
+    # ===== Alert Scheduler =====
+    ALERTS_SCHEDULER_ENABLED: bool = Field(
+        default=True, description="Despachar alertas programadas en este proceso"
+    )
+    ALERTS_SCHEDULER_BATCH_SIZE: int = Field(
+        default=500, description="Alertas por lote al marcar enviadas"
+    )
+    ALERTS_SCHEDULER_HORIZON_S: int = Field(
+        default=300,
+        description="Ventana (s) de próximas alertas precargadas en memoria",
+    )
+    ALERTS_SCHEDULER_PREFETCH: int = Field(
+        default=1000, description="Máximo de fechas precargadas por ventana"
+    )
+    ALERTS_ARCHIVE_AFTER_DAYS: int = Field(
+        default=90,
+        description="Días tras completar/cancelar una alerta para archivarla (0=off)",
+    )
+    ALERTS_ARCHIVE_RETENTION_DAYS: int = Field(
+        default=730,
+        description="TTL (días) de las alertas en alerts_archive (0=sin expiración)",
+    )
+    ALERTS_ARCHIVE_INTERVAL_S: int = Field(
+        default=3600, description="Intervalo (s) entre pasadas de archivado"
+    )
+
     # ===== Hacienda Gamelera =====
     HACIENDA_NAME: str = Field(
         default="Hacienda Gamelera", description="Nombre de la hacienda"
@@ -193,6 +351,31 @@ class Settings(BaseSettings):
             return [item.strip() for item in v.split(",") if item.strip()]
         return []
 
+    @field_validator("ML_MODEL_FORMATS", mode="before")
+    @classmethod
+    def validate_ml_model_formats(cls, v: str | list[str]) -> list[str]:
+        """Convierte la lista de variantes (separada por comas) y la valida."""
+        formats = (
+            [item.strip() for item in v.split(",") if item.strip()]
+            if isinstance(v, str)
+            else list(v)
+        )
+        allowed = ["int8", "float16", "float32"]
+        invalid = [f for f in formats if f not in allowed]
+        if invalid:
+            raise ValueError(f"ML_MODEL_FORMATS debe contener solo: {allowed}")
+        return formats
+
+    @field_validator("ML_OP_RESOLVER")
+    @classmethod
+    def validate_ml_op_resolver(cls, v: str) -> str:
+        """Valida el op resolver TFLite."""
+        allowed = ["auto", "builtin", "builtin_ref"]
+        v_lower = v.lower()
+        if v_lower not in allowed:
+            raise ValueError(f"ML_OP_RESOLVER debe ser uno de: {allowed}")
+        return v_lower
+
     @property
     def is_production(self) -> bool:
         """Verifica si está en producción."""
@@ -3,13 +3,17 @@ Database Configuration
 Configuración y setup de MongoDB con Beanie ODM
 """
 
+import time
+
 from beanie import init_beanie
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from app.core.config import settings
+from app.core.utils.request_metrics import request_metrics
 from app.data.models.alert_model import AlertModel
 from app.data.models.animal_model import AnimalModel
 from app.data.models.farm_model import FarmModel
+from app.data.models.image_blob_model import ImageBlobModel
 from app.data.models.role_model import RoleModel
 from app.data.models.user_model import UserModel
 from app.data.models.weight_estimation_model import WeightEstimationModel
@@ -22,7 +26,13 @@ async def connect_to_mongodb() -> AsyncIOMotorClient:
     Returns:
         AsyncIOMotorClient: Cliente de MongoDB conectado
     """
-    client: AsyncIOMotorClient = AsyncIOMotorClient(settings.MONGODB_URL)  # type: ignore[assignment]
+    # Command monitoring: cantidad y tiempo de comandos por request (/metrics)
+    event_listeners = (
+        [request_metrics.command_listener] if settings.METRICS_ENABLED else []
+    )
+    client: AsyncIOMotorClient = AsyncIOMotorClient(  # type: ignore[assignment]
+        settings.MONGODB_URL, event_listeners=event_listeners
+    )
     return client
 
 
@@ -44,6 +54,7 @@ async def init_database(client: AsyncIOMotorClient) -> AsyncIOMotorDatabase:
             AlertModel,
             AnimalModel,
             FarmModel,
+            ImageBlobModel,
             RoleModel,
             UserModel,
             WeightEstimationModel,
@@ -61,3 +72,19 @@ async def close_mongodb_connection(client: AsyncIOMotorClient) -> None:
         client: Cliente de MongoDB a cerrar
     """
     client.close()
+
+
+async def ping_database() -> float:
+    """
+    Hace ping a MongoDB usando el cliente ya inicializado por Beanie.
+
+    Returns:
+        Latencia del ping en milisegundos
+
+    Raises:
+        Exception: Si MongoDB no responde
+    """
+    database = AnimalModel.get_motor_collection().database
+    start = time.monotonic()
+    await database.command("ping")
+    return (time.monotonic() - start) * 1000
@@ -6,8 +6,10 @@ Single Responsibility: Cada archivo maneja dependencias de un módulo específic
 """
 
 from .alerts import (
+    get_alert_scheduler,
     get_create_alert_usecase,
     get_delete_alert_usecase,
+    get_generate_herd_alerts_usecase,
     get_get_alert_by_id_usecase,
     get_get_pending_alerts_usecase,
     get_get_scheduled_alerts_usecase,
@@ -35,6 +37,7 @@ from .auth import (
     get_current_superuser,
     get_current_user,
     get_get_user_by_token_usecase,
+    get_principal_cache,
     security,
 )
 from .dashboard import get_get_dashboard_stats_usecase
@@ -47,6 +50,8 @@ from .farms import (
     get_update_farm_usecase,
 )
 from .reports import (
+    get_export_inventory_usecase,
+    get_export_weighings_usecase,
     get_generate_growth_report_usecase,
     get_generate_inventory_report_usecase,
     get_generate_movements_report_usecase,
@@ -56,6 +61,7 @@ from .repositories import (
     get_alert_repository,
     get_animal_repository,
     get_farm_repository,
+    get_image_blob_repository,
     get_role_repository,
     get_user_repository,
     get_weight_estimation_repository,
@@ -70,6 +76,7 @@ from .roles import (
 from .sync import (
     get_sync_cattle_batch_usecase,
     get_sync_health_usecase,
+    get_sync_metrics,
     get_sync_weight_estimations_batch_usecase,
 )
 from .users import (
@@ -97,12 +104,14 @@ __all__ = [
     "get_animal_repository",
     "get_alert_repository",
     "get_weight_estimation_repository",
+    "get_image_blob_repository",
     # Auth
     "get_authenticate_user_usecase",
     "get_get_user_by_token_usecase",
     "get_current_user",
     "get_current_active_user",
     "get_current_superuser",
+    "get_principal_cache",
     "security",
     # User Use Cases
     "get_create_user_usecase",
@@ -135,7 +144,9 @@ __all__ = [
     "get_update_animal_usecase",
     "get_delete_animal_usecase",
     # Alert Use Cases
+    "get_alert_scheduler",
     "get_create_alert_usecase",
+    "get_generate_herd_alerts_usecase",
     "get_get_alert_by_id_usecase",
     "get_list_alerts_usecase",
     "get_update_alert_usecase",
@@ -150,6 +161,7 @@ __all__ = [
     "get_sync_cattle_batch_usecase",
     "get_sync_weight_estimations_batch_usecase",
     "get_sync_health_usecase",
+    "get_sync_metrics",
     # Weight Estimation Use Cases
     "get_create_weight_estimation_usecase",
     "get_estimate_weight_from_image_usecase",
@@ -162,6 +174,8 @@ __all__ = [
     "get_generate_inventory_report_usecase",
     "get_generate_movements_report_usecase",
     "get_generate_growth_report_usecase",
+    "get_export_inventory_usecase",
+    "get_export_weighings_usecase",
     # Dashboard Use Cases
     "get_get_dashboard_stats_usecase",
     # Repositories
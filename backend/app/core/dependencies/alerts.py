@@ -7,11 +7,14 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.core.utils.alert_scheduler import AlertScheduler, alert_scheduler
 from app.domain.repositories.alert_repository import AlertRepository
+from app.domain.repositories.animal_repository import AnimalRepository
 from app.domain.repositories.user_repository import UserRepository
 from app.domain.usecases.alerts import (
     CreateAlertUseCase,
     DeleteAlertUseCase,
+    GenerateHerdAlertsUseCase,
     GetAlertByIdUseCase,
     GetPendingAlertsUseCase,
     GetScheduledAlertsUseCase,
@@ -23,16 +26,43 @@ from app.domain.usecases.alerts import (
     UpdateAlertUseCase,
 )
 
-from .repositories import get_alert_repository, get_user_repository
+from .repositories import (
+    get_alert_repository,
+    get_animal_repository,
+    get_user_repository,
+)
+
+
+def get_alert_scheduler() -> AlertScheduler:
+    """Dependency para el scheduler de alertas programadas (singleton)."""
+    return alert_scheduler
 
 
 def get_create_alert_usecase(
     alert_repository: Annotated[AlertRepository, Depends(get_alert_repository)],
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    scheduler: Annotated[AlertScheduler, Depends(get_alert_scheduler)],
 ) -> CreateAlertUseCase:
     """Dependency para CreateAlertUseCase."""
     return CreateAlertUseCase(
-        alert_repository=alert_repository, user_repository=user_repository
+        alert_repository=alert_repository,
+        user_repository=user_repository,
+        alert_scheduler=scheduler,
+    )
+
+
+def get_generate_herd_alerts_usecase(
+    alert_repository: Annotated[AlertRepository, Depends(get_alert_repository)],
+    animal_repository: Annotated[AnimalRepository, Depends(get_animal_repository)],
+    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    scheduler: Annotated[AlertScheduler, Depends(get_alert_scheduler)],
+) -> GenerateHerdAlertsUseCase:
+    """Dependency para GenerateHerdAlertsUseCase."""
+    return GenerateHerdAlertsUseCase(
+        alert_repository=alert_repository,
+        animal_repository=animal_repository,
+        user_repository=user_repository,
+        alert_scheduler=scheduler,
     )
 
 
@@ -52,9 +82,12 @@ def get_list_alerts_usecase(
 
 def get_update_alert_usecase(
     alert_repository: Annotated[AlertRepository, Depends(get_alert_repository)],
+    scheduler: Annotated[AlertScheduler, Depends(get_alert_scheduler)],
 ) -> UpdateAlertUseCase:
     """Dependency para UpdateAlertUseCase."""
-    return UpdateAlertUseCase(alert_repository=alert_repository)
+    return UpdateAlertUseCase(
+        alert_repository=alert_repository, alert_scheduler=scheduler
+    )
 
 
 def get_delete_alert_usecase(
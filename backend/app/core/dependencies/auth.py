@@ -10,7 +10,8 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.core.exceptions import AuthenticationException
 from app.core.utils.jwt import decode_access_token
-from app.core.utils.password import verify_password
+from app.core.utils.password import verify_password_async
+from app.core.utils.principal_cache import PrincipalCache, principal_cache
 from app.domain.entities.user import User
 from app.domain.repositories.role_repository import RoleRepository
 from app.domain.repositories.user_repository import UserRepository
@@ -30,15 +31,21 @@ def get_authenticate_user_usecase(
     return AuthenticateUserUseCase(
         user_repository=user_repository,
         role_repository=role_repository,
-        password_verifier=verify_password,
+        password_verifier=verify_password_async,
     )
 
 
+def get_principal_cache() -> PrincipalCache:
+    """Dependency para la caché de usuarios autenticados (singleton)."""
+    return principal_cache
+
+
 def get_get_user_by_token_usecase(
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    cache: Annotated[PrincipalCache, Depends(get_principal_cache)],
 ) -> GetUserByTokenUseCase:
     """Dependency para GetUserByTokenUseCase."""
-    return GetUserByTokenUseCase(user_repository=user_repository)
+    return GetUserByTokenUseCase(user_repository=user_repository, principal_cache=cache)
 
 
 async def get_current_user(
@@ -7,11 +7,14 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.core.config import settings
 from app.domain.repositories.animal_repository import AnimalRepository
 from app.domain.repositories.weight_estimation_repository import (
     WeightEstimationRepository,
 )
 from app.domain.usecases.reports import (
+    ExportInventoryUseCase,
+    ExportWeighingsUseCase,
     GenerateGrowthReportUseCase,
     GenerateInventoryReportUseCase,
     GenerateMovementsReportUseCase,
@@ -62,3 +65,27 @@ def get_generate_growth_report_usecase(
         animal_repository=animal_repository,
         weight_estimation_repository=weight_estimation_repository,
     )
+
+
+def get_export_inventory_usecase(
+    animal_repository: Annotated[AnimalRepository, Depends(get_animal_repository)],
+) -> ExportInventoryUseCase:
+    """Dependency para ExportInventoryUseCase."""
+    return ExportInventoryUseCase(
+        animal_repository=animal_repository,
+        batch_size=settings.REPORTS_EXPORT_BATCH_SIZE,
+    )
+
+
+def get_export_weighings_usecase(
+    animal_repository: Annotated[AnimalRepository, Depends(get_animal_repository)],
+    weight_estimation_repository: Annotated[
+        WeightEstimationRepository, Depends(get_weight_estimation_repository)
+    ],
+) -> ExportWeighingsUseCase:
+    """Dependency para ExportWeighingsUseCase."""
+    return ExportWeighingsUseCase(
+        animal_repository=animal_repository,
+        weight_estimation_repository=weight_estimation_repository,
+        batch_size=settings.REPORTS_EXPORT_BATCH_SIZE,
+    )
@@ -6,6 +6,7 @@ Dependencias para inyectar repositorios
 from app.data.repositories.alert_repository_impl import AlertRepositoryImpl
 from app.data.repositories.animal_repository_impl import AnimalRepositoryImpl
 from app.data.repositories.farm_repository_impl import FarmRepositoryImpl
+from app.data.repositories.image_blob_repository_impl import ImageBlobRepositoryImpl
 from app.data.repositories.role_repository_impl import RoleRepositoryImpl
 from app.data.repositories.user_repository_impl import UserRepositoryImpl
 from app.data.repositories.weight_estimation_repository_impl import (
@@ -14,6 +15,7 @@ from app.data.repositories.weight_estimation_repository_impl import (
 from app.domain.repositories.alert_repository import AlertRepository
 from app.domain.repositories.animal_repository import AnimalRepository
 from app.domain.repositories.farm_repository import FarmRepository
+from app.domain.repositories.image_blob_repository import ImageBlobRepository
 from app.domain.repositories.role_repository import RoleRepository
 from app.domain.repositories.user_repository import UserRepository
 from app.domain.repositories.weight_estimation_repository import (
@@ -49,3 +51,8 @@ def get_alert_repository() -> AlertRepository:
 def get_weight_estimation_repository() -> WeightEstimationRepository:
     """Dependency para obtener WeightEstimationRepository."""
     return WeightEstimationRepositoryImpl()
+
+
+def get_image_blob_repository() -> ImageBlobRepository:
+    """Dependency para obtener ImageBlobRepository."""
+    return ImageBlobRepositoryImpl()
@@ -7,6 +7,7 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.core.utils.principal_cache import PrincipalCache
 from app.domain.repositories.role_repository import RoleRepository
 from app.domain.usecases.roles import (
     CreateRoleUseCase,
@@ -16,6 +17,7 @@ from app.domain.usecases.roles import (
     UpdateRoleUseCase,
 )
 
+from .auth import get_principal_cache
 from .repositories import get_role_repository
 
 
@@ -42,13 +44,19 @@ def get_get_all_roles_usecase(
 
 def get_update_role_usecase(
     role_repository: Annotated[RoleRepository, Depends(get_role_repository)],
+    principal_cache: Annotated[PrincipalCache, Depends(get_principal_cache)],
 ) -> UpdateRoleUseCase:
     """Dependency para UpdateRoleUseCase."""
-    return UpdateRoleUseCase(role_repository=role_repository)
+    return UpdateRoleUseCase(
+        role_repository=role_repository, principal_cache=principal_cache
+    )
 
 
 def get_delete_role_usecase(
     role_repository: Annotated[RoleRepository, Depends(get_role_repository)],
+    principal_cache: Annotated[PrincipalCache, Depends(get_principal_cache)],
 ) -> DeleteRoleUseCase:
     """Dependency para DeleteRoleUseCase."""
-    return DeleteRoleUseCase(role_repository=role_repository)
+    return DeleteRoleUseCase(
+        role_repository=role_repository, principal_cache=principal_cache
+    )
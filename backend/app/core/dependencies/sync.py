@@ -7,6 +7,8 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from ...core.database import ping_database
+from ...core.utils.sync_metrics import SyncMetricsRegistry, sync_metrics
 from ...domain.repositories.animal_repository import AnimalRepository
 from ...domain.repositories.weight_estimation_repository import (
     WeightEstimationRepository,
@@ -22,26 +24,34 @@ from .repositories import (
 )
 
 
+def get_sync_metrics() -> SyncMetricsRegistry:
+    """Dependency para el registro de métricas de sincronización (singleton)."""
+    return sync_metrics
+
+
 def get_sync_cattle_batch_usecase(
     animal_repository: Annotated[AnimalRepository, Depends(get_animal_repository)],
+    metrics: Annotated[SyncMetricsRegistry, Depends(get_sync_metrics)],
 ) -> SyncCattleBatchUseCase:
     """Dependency para SyncCattleBatchUseCase."""
-    return SyncCattleBatchUseCase(animal_repository=animal_repository)
+    return SyncCattleBatchUseCase(animal_repository=animal_repository, metrics=metrics)
 
 
 def get_sync_weight_estimations_batch_usecase(
     weight_estimation_repository: Annotated[
         WeightEstimationRepository, Depends(get_weight_estimation_repository)
     ],
+    metrics: Annotated[SyncMetricsRegistry, Depends(get_sync_metrics)],
 ) -> SyncWeightEstimationsBatchUseCase:
     """Dependency para SyncWeightEstimationsBatchUseCase."""
     return SyncWeightEstimationsBatchUseCase(
-        weight_estimation_repository=weight_estimation_repository
+        weight_estimation_repository=weight_estimation_repository,
+        metrics=metrics,
     )
 
 
 def get_sync_health_usecase(
-    animal_repository: Annotated[AnimalRepository, Depends(get_animal_repository)],
+    metrics: Annotated[SyncMetricsRegistry, Depends(get_sync_metrics)],
 ) -> GetSyncHealthUseCase:
     """Dependency para GetSyncHealthUseCase."""
-    return GetSyncHealthUseCase(animal_repository=animal_repository)
+    return GetSyncHealthUseCase(metrics=metrics, database_ping=ping_database)
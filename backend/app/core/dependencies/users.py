@@ -7,6 +7,7 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.core.utils.principal_cache import PrincipalCache
 from app.domain.repositories.role_repository import RoleRepository
 from app.domain.repositories.user_repository import UserRepository
 from app.domain.usecases.users import (
@@ -18,6 +19,7 @@ from app.domain.usecases.users import (
     UpdateUserUseCase,
 )
 
+from .auth import get_principal_cache
 from .repositories import get_role_repository, get_user_repository
 
 
@@ -48,18 +50,24 @@ def get_get_all_users_usecase(
 def get_update_user_usecase(
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     role_repository: Annotated[RoleRepository, Depends(get_role_repository)],
+    principal_cache: Annotated[PrincipalCache, Depends(get_principal_cache)],
 ) -> UpdateUserUseCase:
     """Dependency para UpdateUserUseCase."""
     return UpdateUserUseCase(
-        user_repository=user_repository, role_repository=role_repository
+        user_repository=user_repository,
+        role_repository=role_repository,
+        principal_cache=principal_cache,
     )
 
 
 def get_delete_user_usecase(
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    principal_cache: Annotated[PrincipalCache, Depends(get_principal_cache)],
 ) -> DeleteUserUseCase:
     """Dependency para DeleteUserUseCase."""
-    return DeleteUserUseCase(user_repository=user_repository)
+    return DeleteUserUseCase(
+        user_repository=user_repository, principal_cache=principal_cache
+    )
 
 
 def get_get_users_by_criteria_usecase(
@@ -79,3 +79,11 @@ class AuthenticationException(DomainException):
 
     def __init__(self, message: str):
         super().__init__(message, code="AUTHENTICATION_ERROR")
+
+
+class RateLimitException(DomainException):
+    """Excepción cuando se supera la capacidad de un recurso (HTTP 429)."""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message, code="RATE_LIMITED")
+        self.retry_after = retry_after
@@ -3,6 +3,7 @@ Application Lifespan Management
 Gestión del ciclo de vida de la aplicación FastAPI
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -13,6 +14,12 @@ from app.core.database import (
     connect_to_mongodb,
     init_database,
 )
+from app.core.exceptions import MLModelException
+from app.core.utils.alert_scheduler import alert_scheduler
+from app.core.utils.image_storage import image_storage_service
+from app.core.utils.password import password_hasher
+from app.core.utils.report_jobs import report_jobs
+from app.data.repositories.alert_repository_impl import AlertRepositoryImpl
 
 
 @asynccontextmanager
@@ -40,9 +47,32 @@ async def lifespan(app: FastAPI):
     await init_database(client)
     print(f"✅ MongoDB conectado: {settings.MONGODB_DB_NAME}")
 
+    # Limpieza periódica de reportes generados expirados
+    report_jobs.cleanup_expired()
+    reports_cleanup_task = asyncio.create_task(report_jobs.run_cleanup_loop())
+
+    # Despacho de alertas programadas
+    if settings.ALERTS_SCHEDULER_ENABLED:
+        alert_scheduler.start(AlertRepositoryImpl())
+
+    # Modelos ML (registry o genérico): cargar y auto-tunear antes del primer request
+    if settings.ML_PRELOAD_MODEL:
+        # Import diferido: carga TensorFlow/tflite_runtime solo si se precarga
+        from app.ml.model_loader import MLModelLoader
+
+        try:
+            await asyncio.to_thread(MLModelLoader().ensure_loaded)
+        except MLModelException as e:
+            print(f"⚠️ Modelo ML no precargado: {e}")
+
     yield
 
     # Shutdown
     print("🔴 Cerrando conexiones...")
+    reports_cleanup_task.cancel()
+    report_jobs.shutdown()
+    alert_scheduler.shutdown()
+    password_hasher.shutdown()
+    image_storage_service.shutdown()
     await close_mongodb_connection(client)
     print("👋 Servidor detenido")
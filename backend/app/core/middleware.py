@@ -1,12 +1,103 @@
 """
 Middleware Configuration
-Configuración de middlewares para FastAPI (CORS, etc.)
+Configuración de middlewares para FastAPI (CORS, métricas)
 """
 
+import time
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
+from app.core.utils.request_metrics import (
+    UNMATCHED_ROUTE,
+    RequestMetricsRegistry,
+    request_metrics,
+)
+
+
+def route_label(scope: Scope) -> str:
+    """
+    Plantilla de la ruta atendida (`/api/v1/animals/{animal_id}`).
+
+    FastAPI deja la ruta en `scope["route"]` al hacer match; los Mount
+    (archivos estáticos) solo dejan su prefijo en root_path.
+    """
+    route = scope.get("route")
+    if route is not None and hasattr(route, "path"):
+        return route.path
+    if "endpoint" in scope and scope.get("root_path"):
+        return scope["root_path"]
+    return UNMATCHED_ROUTE
+
+
+class RequestMetricsMiddleware:
+    """
+    Middleware ASGI de métricas por request.
+
+    ASGI puro (no BaseHTTPMiddleware): no bufferiza el body de las
+    respuestas en streaming y el ContextVar del request llega a los
+    endpoints y a los hilos de Motor.
+    """
+
+    def __init__(self, app: ASGIApp, registry: RequestMetricsRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        timings = self.registry.request_started()
+        request_bytes = 0
+        response_bytes = 0
+        status = 500
+
+        async def receive_wrapper() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_bytes, status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.registry.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        self.registry.server_timing_header(
+                            timings, (time.perf_counter() - start) * 1000
+                        ),
+                    )
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            elif message["type"] == "http.response.zerocopysend":
+                response_bytes += message.get("count") or 0
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            if not request_bytes:
+                # Body no leído (rechazado antes del endpoint): usar el header
+                content_length = Headers(scope=scope).get("content-length", "")
+                request_bytes = int(content_length) if content_length.isdigit() else 0
+            self.registry.request_finished(
+                method=scope["method"],
+                route=route_label(scope),
+                status=status,
+                duration_s=time.perf_counter() - start,
+                request_bytes=request_bytes,
+                response_bytes=response_bytes,
+                timings=timings,
+            )
 
 
 def setup_middleware(app: FastAPI) -> None:
@@ -23,4 +114,9 @@ def setup_middleware(app: FastAPI) -> None:
         allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
         allow_methods=settings.CORS_ALLOW_METHODS,
         allow_headers=settings.CORS_ALLOW_HEADERS,
+        expose_headers=["Server-Timing"],
     )
+
+    # Métricas (el último agregado es el más externo: mide también CORS)
+    if settings.METRICS_ENABLED:
+        app.add_middleware(RequestMetricsMiddleware, registry=request_metrics)
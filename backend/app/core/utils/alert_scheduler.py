@@ -0,0 +1,281 @@
+"""
+Alert Scheduler - Core Layer
+Despacho en proceso de alertas programadas
+
+Single Responsibility: Marcar como enviadas las alertas cuya fecha programada
+vence y materializar la siguiente ocurrencia de las recurrentes.
+
+MongoDB es la cola: el índice (status, scheduled_at) da las alertas vencidas
+sin recorrer la colección. En memoria solo se mantiene un heap con las fechas
+de las próximas alertas (una ventana de `horizon_s`), para dormir exactamente
+hasta la siguiente en lugar de consultar periódicamente.
+
+Con varios workers cada uno ejecuta su propio scheduler: el despacho es
+idempotente (el update solo afecta alertas aún pendientes y las ocurrencias
+tienen ID determinista), por lo que solo se duplican consultas.
+
+El scheduler también archiva periódicamente las alertas cerradas
+(completadas/canceladas) hace más de `archive_after_days` en la colección
+alerts_archive, que las expira por TTL.
+"""
+
+import asyncio
+import heapq
+from datetime import datetime, timedelta
+from typing import Any
+
+from ...domain.entities.alert import Alert, AlertStatus
+from ...domain.repositories.alert_repository import AlertRepository
+from ..config import settings
+
+# Espera tras un error (MongoDB caído) antes de reintentar
+ERROR_BACKOFF_S = 30.0
+
+
+class AlertScheduler:
+    """
+    Scheduler de alertas respaldado por una consulta indexada.
+
+    - Heap de fechas de vencimiento precargado hasta `horizon_s` adelante
+      (consulta cubierta, como máximo `prefetch` fechas)
+    - Despierta en la próxima fecha o cuando `notify` recibe una alerta
+      que vence antes
+    - Despacha en lotes de `batch_size`: inserta las siguientes ocurrencias
+      con un insert_many y marca el lote como enviado con un update_many
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        horizon_s: float,
+        prefetch: int,
+        archive_after_days: int = 0,
+        archive_retention_days: int = 0,
+        archive_interval_s: float = 3600,
+    ):
+        """
+        Inicializa el scheduler.
+
+        Args:
+            batch_size: Alertas por lote de despacho (y de archivado)
+            horizon_s: Ventana (s) de fechas precargadas en el heap
+            prefetch: Máximo de fechas precargadas por ventana
+            archive_after_days: Días tras el cierre para archivar (0 = no archivar)
+            archive_retention_days: TTL (días) en la colección de archivo
+            archive_interval_s: Intervalo (s) entre pasadas de archivado
+        """
+        self.batch_size = batch_size
+        self.horizon_s = horizon_s
+        self.prefetch = prefetch
+        self.archive_after_days = archive_after_days
+        self.archive_retention_days = archive_retention_days
+        self.archive_interval_s = archive_interval_s
+
+        self._due_heap: list[datetime] = []
+        self._window_end: datetime = datetime.min
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._archive_task: asyncio.Task | None = None
+        self._repository: AlertRepository | None = None
+
+        self.dispatched = 0
+        self.occurrences_created = 0
+        self.wakeups = 0
+        self.refills = 0
+        self.errors = 0
+        self.archived = 0
+        self.last_run_at: datetime | None = None
+
+    def start(self, repository: AlertRepository) -> None:
+        """Lanza el loop del scheduler (se llama desde el lifespan)."""
+        if self._task is not None:
+            return
+        self._repository = repository
+        self._task = asyncio.create_task(self.run_loop())
+        if self.archive_after_days > 0:
+            self._archive_task = asyncio.create_task(self.run_archive_loop())
+
+    def notify(self, alert: Alert) -> None:
+        """
+        Informa una alerta creada o reprogramada.
+
+        Si vence dentro de la ventana precargada se agrega al heap, y si es
+        la próxima en vencer se despierta el loop.
+        """
+        if self._task is None or alert.status != AlertStatus.PENDING:
+            return
+        if alert.scheduled_at is None or alert.scheduled_at > self._window_end:
+            return  # Se cargará al recargar la ventana
+
+        heapq.heappush(self._due_heap, alert.scheduled_at)
+        if self._due_heap[0] == alert.scheduled_at:
+            self._wakeup.set()
+
+    async def dispatch_due(self, now: datetime | None = None) -> int:
+        """
+        Despacha todas las alertas vencidas.
+
+        Args:
+            now: Fecha de corte (por defecto, ahora)
+
+        Returns:
+            Número de alertas marcadas como enviadas
+        """
+        if self._repository is None:
+            return 0
+
+        now = now or datetime.utcnow()
+        total = 0
+        while True:
+            batch = await self._repository.find_due(now, self.batch_size)
+            if not batch:
+                break
+
+            # Primero las ocurrencias (idempotente) y luego el envío: si el
+            # proceso cae entre ambos pasos, el lote se reintenta sin perder
+            # la recurrencia
+            occurrences = [
+                occurrence
+                for alert in batch
+                if (occurrence := alert.next_occurrence(after=now)) is not None
+            ]
+            if occurrences:
+                self.occurrences_created += await self._repository.save_many(
+                    occurrences
+                )
+                for occurrence in occurrences:
+                    self.notify(occurrence)
+
+            marked = await self._repository.mark_sent(
+                [alert.id for alert in batch], sent_at=now
+            )
+            total += marked
+            if len(batch) < self.batch_size or marked == 0:
+                break
+
+        while self._due_heap and self._due_heap[0] <= now:
+            heapq.heappop(self._due_heap)
+
+        self.dispatched += total
+        self.last_run_at = now
+        return total
+
+    async def _seconds_until_next(self) -> float:
+        """Recarga la ventana si se agotó y calcula cuánto dormir."""
+        assert self._repository is not None
+        now = datetime.utcnow()
+
+        if not self._due_heap and now >= self._window_end:
+            until = now + timedelta(seconds=self.horizon_s)
+            due_times = await self._repository.find_due_times(until, self.prefetch)
+            # Ya ordenadas: una lista ordenada es un heap válido
+            self._due_heap = due_times
+            # Ventana llena: la siguiente recarga empieza en la última fecha
+            self._window_end = (
+                due_times[-1] if len(due_times) >= self.prefetch else until
+            )
+            self.refills += 1
+
+        target = self._window_end
+        if self._due_heap:
+            target = min(target, self._due_heap[0])
+        return max((target - now).total_seconds(), 0.0)
+
+    async def run_loop(self) -> None:
+        """Loop del scheduler: despachar, dormir hasta la próxima alerta."""
+        while True:
+            # Limpiar antes de consultar: un notify durante las consultas
+            # no se pierde
+            self._wakeup.clear()
+            try:
+                dispatched = await self.dispatch_due()
+                if dispatched:
+                    print(f"🔔 Alertas programadas enviadas: {dispatched}")
+                wait_s = await self._seconds_until_next()
+            except Exception as e:
+                self.errors += 1
+                print(f"⚠️ Error en el scheduler de alertas: {e}")
+                wait_s = ERROR_BACKOFF_S
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=wait_s)
+                self.wakeups += 1
+            except TimeoutError:
+                pass
+
+    async def archive_closed(self, now: datetime | None = None) -> int:
+        """
+        Archiva en lotes las alertas cerradas hace más de archive_after_days.
+
+        Returns:
+            Número de alertas archivadas
+        """
+        if self._repository is None:
+            return 0
+
+        closed_before = (now or datetime.utcnow()) - timedelta(
+            days=self.archive_after_days
+        )
+        total = 0
+        while True:
+            moved = await self._repository.archive_closed(
+                closed_before, self.batch_size
+            )
+            total += moved
+            if moved < self.batch_size:
+                break
+
+        self.archived += total
+        return total
+
+    async def run_archive_loop(self) -> None:
+        """Loop periódico de archivado (se lanza desde start)."""
+        assert self._repository is not None
+        try:
+            await self._repository.ensure_archive_indexes(self.archive_retention_days)
+        except Exception as e:
+            print(f"⚠️ Error creando el índice TTL del archivo de alertas: {e}")
+
+        while True:
+            try:
+                archived = await self.archive_closed()
+                if archived:
+                    print(f"🗄️ Alertas cerradas archivadas: {archived}")
+            except Exception as e:
+                self.errors += 1
+                print(f"⚠️ Error archivando alertas: {e}")
+            await asyncio.sleep(self.archive_interval_s)
+
+    def stats(self) -> dict[str, Any]:
+        """Estadísticas del scheduler en este proceso."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "queued": len(self._due_heap),
+            "next_due_at": self._due_heap[0].isoformat() if self._due_heap else None,
+            "dispatched": self.dispatched,
+            "occurrences_created": self.occurrences_created,
+            "wakeups": self.wakeups,
+            "refills": self.refills,
+            "archived": self.archived,
+            "errors": self.errors,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+        }
+
+    def shutdown(self) -> None:
+        """Detiene el loop del scheduler."""
+        for task in (self._task, self._archive_task):
+            if task is not None:
+                task.cancel()
+        self._task = None
+        self._archive_task = None
+
+
+# Instancia global (singleton por proceso)
+alert_scheduler = AlertScheduler(
+    batch_size=settings.ALERTS_SCHEDULER_BATCH_SIZE,
+    horizon_s=settings.ALERTS_SCHEDULER_HORIZON_S,
+    prefetch=settings.ALERTS_SCHEDULER_PREFETCH,
+    archive_after_days=settings.ALERTS_ARCHIVE_AFTER_DAYS,
+    archive_retention_days=settings.ALERTS_ARCHIVE_RETENTION_DAYS,
+    archive_interval_s=settings.ALERTS_ARCHIVE_INTERVAL_S,
+)
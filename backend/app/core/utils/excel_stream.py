@@ -0,0 +1,287 @@
+"""
+Excel Stream Writer - Core Layer
+Exportación Excel en streaming con memoria constante
+
+Single Responsibility: Escribir exportaciones masivas (todas las estimaciones o
+todo el inventario de varias haciendas) sin construir el libro en memoria.
+Usa hojas write-only de openpyxl (las filas se vuelcan a un archivo temporal
+a medida que se agregan) y estilos con nombre registrados una sola vez.
+"""
+
+import asyncio
+import os
+import tempfile
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from openpyxl import Workbook  # type: ignore[import-untyped, import-not-found, import]
+from openpyxl.cell import (  # type: ignore[import-untyped, import-not-found, import]
+    WriteOnlyCell,
+)
+from openpyxl.styles import (  # type: ignore[import-untyped, import-not-found, import]
+    Alignment,
+    Border,
+    Font,
+    NamedStyle,
+    PatternFill,
+    Side,
+)
+from openpyxl.utils import (  # type: ignore[import-untyped, import-not-found, import]
+    get_column_letter,
+)
+
+from .excel_generator import ExcelGenerator
+
+# Formatos numéricos por tipo de columna
+NUMBER_FORMATS: dict[str, str] = {
+    "text": "General",
+    "integer": "0",
+    "decimal": "0.00",
+    "datetime": "yyyy-mm-dd hh:mm",
+    "date": "yyyy-mm-dd",
+}
+
+
+@dataclass(frozen=True)
+class ExcelColumn:
+    """Columna de una exportación (clave del dict de fila → celda)."""
+
+    key: str
+    header: str
+    width: int = 15
+    kind: str = "text"  # text, integer, decimal, datetime o date
+
+
+# Columnas de las exportaciones disponibles
+INVENTORY_EXPORT_COLUMNS: list[ExcelColumn] = [
+    ExcelColumn("farm_id", "Hacienda", 38),
+    ExcelColumn("ear_tag", "Caravana", 14),
+    ExcelColumn("name", "Nombre", 18),
+    ExcelColumn("breed", "Raza", 16),
+    ExcelColumn("gender", "Género", 10),
+    ExcelColumn("birth_date", "Nacimiento", 12, "date"),
+    ExcelColumn("age_months", "Edad (meses)", 12, "integer"),
+    ExcelColumn("age_category", "Categoría", 20),
+    ExcelColumn("color", "Color", 12),
+    ExcelColumn("status", "Estado", 10),
+    ExcelColumn("registration_date", "Registro", 12, "date"),
+]
+
+WEIGHINGS_EXPORT_COLUMNS: list[ExcelColumn] = [
+    ExcelColumn("farm_id", "Hacienda", 38),
+    ExcelColumn("ear_tag", "Caravana", 14),
+    ExcelColumn("animal_id", "ID Animal", 38),
+    ExcelColumn("breed", "Raza", 16),
+    ExcelColumn("timestamp", "Fecha", 17, "datetime"),
+    ExcelColumn("estimated_weight_kg", "Peso (kg)", 11, "decimal"),
+    ExcelColumn("confidence", "Confianza", 11, "decimal"),
+    ExcelColumn("method", "Método", 10),
+    ExcelColumn("ml_model_version", "Modelo", 10),
+    ExcelColumn("processing_time_ms", "Proceso (ms)", 12, "integer"),
+    ExcelColumn("latitude", "Latitud", 12, "decimal"),
+    ExcelColumn("longitude", "Longitud", 12, "decimal"),
+    ExcelColumn("device_id", "Dispositivo", 20),
+]
+
+
+class ExcelStreamWriter:
+    """
+    Escritor de un libro write-only de una sola hoja.
+
+    Los estilos se registran como NamedStyle al crear el libro y cada celda
+    solo referencia el nombre, en lugar de instanciar Font/Fill/Border por
+    celda como hace ExcelGenerator.
+    """
+
+    STYLE_TITLE = "export_title"
+    STYLE_HEADER = "export_header"
+    STYLE_FOOTER = "export_footer"
+
+    def __init__(
+        self,
+        output_path: str,
+        sheet_title: str,
+        title: str,
+        columns: list[ExcelColumn],
+    ):
+        """
+        Inicializa el libro y escribe título y encabezados.
+
+        Args:
+            output_path: Ruta donde se guardará el .xlsx al cerrar
+            sheet_title: Nombre de la hoja
+            title: Título mostrado en la primera fila
+            columns: Columnas de la exportación
+        """
+        self.output_path = output_path
+        self.columns = columns
+        self.rows_written = 0
+
+        self._wb = Workbook(write_only=True)
+        self._register_styles()
+
+        self._ws = self._wb.create_sheet(sheet_title)
+        for index, column in enumerate(columns, start=1):
+            self._ws.column_dimensions[get_column_letter(index)].width = column.width
+        self._ws.freeze_panes = "A4"
+
+        self._ws.append([self._cell(title, self.STYLE_TITLE)])
+        self._ws.append([])
+        self._ws.append([self._cell(c.header, self.STYLE_HEADER) for c in columns])
+
+        # Nombre de estilo por columna y alternancia (precalculado)
+        self._data_styles = [
+            (self._data_style(c.kind, False), self._data_style(c.kind, True))
+            for c in columns
+        ]
+
+    @staticmethod
+    def _data_style(kind: str, is_alternate: bool) -> str:
+        suffix = "_alt" if is_alternate else ""
+        return f"export_{kind}{suffix}"
+
+    def _register_styles(self) -> None:
+        """Registra los estilos con nombre del libro (una sola vez)."""
+        thin_black = Side(style="thin", color="000000")
+        thin_grey = Side(style="thin", color="CCCCCC")
+
+        self._wb.add_named_style(
+            NamedStyle(
+                name=self.STYLE_TITLE,
+                font=Font(bold=True, size=16, color=ExcelGenerator.COLOR_PRIMARY),
+                alignment=Alignment(horizontal="left", vertical="center"),
+            )
+        )
+        self._wb.add_named_style(
+            NamedStyle(
+                name=self.STYLE_HEADER,
+                font=Font(bold=True, color="FFFFFF", size=11),
+                fill=PatternFill(
+                    start_color=ExcelGenerator.COLOR_HEADER,
+                    end_color=ExcelGenerator.COLOR_HEADER,
+                    fill_type="solid",
+                ),
+                alignment=Alignment(horizontal="center", vertical="center"),
+                border=Border(
+                    left=thin_black, right=thin_black, top=thin_black, bottom=thin_black
+                ),
+            )
+        )
+        self._wb.add_named_style(
+            NamedStyle(
+                name=self.STYLE_FOOTER,
+                font=Font(
+                    size=8, italic=True, color=ExcelGenerator.COLOR_TEXT_SECONDARY
+                ),
+            )
+        )
+
+        alternate_fill = PatternFill(
+            start_color=ExcelGenerator.COLOR_LIGHT,
+            end_color=ExcelGenerator.COLOR_LIGHT,
+            fill_type="solid",
+        )
+        data_border = Border(
+            left=thin_grey, right=thin_grey, top=thin_grey, bottom=thin_grey
+        )
+        for kind, number_format in NUMBER_FORMATS.items():
+            for is_alternate in (False, True):
+                style = NamedStyle(
+                    name=self._data_style(kind, is_alternate),
+                    font=Font(size=10),
+                    alignment=Alignment(
+                        horizontal="left" if kind == "text" else "right",
+                        vertical="center",
+                    ),
+                    border=data_border,
+                    number_format=number_format,
+                )
+                if is_alternate:
+                    style.fill = alternate_fill
+                self._wb.add_named_style(style)
+
+    def _cell(self, value: Any, style: str) -> WriteOnlyCell:
+        cell = WriteOnlyCell(self._ws, value=value)
+        cell.style = style
+        return cell
+
+    def append_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Agrega filas de datos (bloqueante: llamar desde un hilo).
+
+        Args:
+            rows: Dicts con valores por clave de columna
+        """
+        for row in rows:
+            style_index = self.rows_written % 2
+            self._ws.append(
+                [
+                    self._cell(row.get(column.key), styles[style_index])
+                    for column, styles in zip(
+                        self.columns, self._data_styles, strict=True
+                    )
+                ]
+            )
+            self.rows_written += 1
+
+    def close(self) -> None:
+        """Escribe el pie y guarda el libro en output_path."""
+        self._ws.append([])
+        self._ws.append(
+            [
+                self._cell(
+                    f"{self.rows_written} registros · Generado el "
+                    f"{datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}",
+                    self.STYLE_FOOTER,
+                )
+            ]
+        )
+        self._wb.save(self.output_path)
+
+
+async def build_excel_export(
+    rows: AsyncIterator[dict[str, Any]],
+    sheet_title: str,
+    title: str,
+    columns: list[ExcelColumn],
+    batch_size: int = 1000,
+) -> str:
+    """
+    Genera un .xlsx completo a partir de un cursor async.
+
+    Las filas se escriben por lotes en un hilo (openpyxl es bloqueante) y el
+    libro nunca está completo en memoria: las filas van a un archivo
+    temporal de openpyxl y el .xlsx final a un archivo temporal propio. El
+    archivo se termina antes de responder, así los errores del cursor o del
+    caso de uso se traducen en un código HTTP y no en una descarga truncada.
+
+    Args:
+        rows: Iterador async de dicts (una fila por elemento)
+        sheet_title: Nombre de la hoja
+        title: Título del reporte
+        columns: Columnas de la exportación
+        batch_size: Filas acumuladas antes de escribir en el libro
+
+    Returns:
+        Ruta del .xlsx temporal (el llamador debe eliminarlo)
+    """
+    fd, path = tempfile.mkstemp(prefix="export_", suffix=".xlsx")
+    os.close(fd)
+    try:
+        writer = ExcelStreamWriter(path, sheet_title, title, columns)
+
+        batch: list[dict[str, Any]] = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                await asyncio.to_thread(writer.append_rows, batch)
+                batch = []
+        if batch:
+            await asyncio.to_thread(writer.append_rows, batch)
+        await asyncio.to_thread(writer.close)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
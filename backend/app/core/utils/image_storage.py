@@ -3,14 +3,69 @@ Image Storage Utils - Core Layer
 Utilidades para guardar y gestionar imágenes en el sistema de archivos
 
 Single Responsibility: Funciones auxiliares para almacenamiento de imágenes
+
+Las imágenes se guardan direccionadas por contenido en
+uploads/cas/{h[0:2]}/{h[2:4]}/{sha256}.{ext}: la misma foto subida varias
+veces ocupa un solo archivo y ningún directorio crece sin límite. Los
+originales JPEG/PNG/WEBP se guardan tal como llegan (sin recomprimir). La
+conversión a RGB y generación de variantes (miniatura y vista previa JPEG) se
+hace en segundo plano con ImageStorageService, fuera del event loop.
+
+Las referencias (estimaciones y animales) se cuentan en MongoDB
+(ImageBlobRepository) y scripts/image_store.py elimina las huérfanas.
 """
 
+import asyncio
+import hashlib
 import io
-from datetime import datetime
-from pathlib import Path
-from uuid import UUID, uuid4
+import os
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Any
+from uuid import uuid4
+
+from PIL import Image, ImageOps
+
+from ...domain.entities.image_blob import CAS_DIRECTORY, ImageBlob
+from ..config import settings
+
+# Extensión de archivo por formato detectado (originales guardados tal cual)
+IMAGE_EXTENSIONS: dict[str, str] = {"jpeg": ".jpg", "png": ".png", "webp": ".webp"}
+
+# Sufijo de las variantes redimensionadas (ej: ".w256.jpg")
+_VARIANT_SUFFIX_PATTERN = re.compile(r"\.w\d+\.jpg$")
+
+
+@dataclass(frozen=True)
+class StoredImage:
+    """Resultado de guardar una imagen en el almacenamiento por contenido."""
+
+    digest: str
+    relative_path: str
+    size_bytes: int
+    created: bool  # False si el contenido ya existía (deduplicado)
 
-from PIL import Image
+
+def detect_image_format(image_bytes: bytes) -> str | None:
+    """
+    Detecta el formato de una imagen por su firma (sin decodificarla).
+
+    Args:
+        image_bytes: Bytes de la imagen
+
+    Returns:
+        "jpeg", "png", "webp" o None si no se reconoce
+    """
+    if image_bytes[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    if image_bytes[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+        return "webp"
+    return None
 
 
 def ensure_uploads_directory() -> Path:
@@ -29,132 +84,79 @@ def ensure_uploads_directory() -> Path:
     return uploads_dir
 
 
-def save_animal_photo(
-    image_bytes: bytes,
-    animal_id: UUID | str,
-    breed: str | None = None,
-    filename: str | None = None,
-) -> str:
-    """
-    Guarda la foto de un animal en backend/uploads.
+def _write_atomic(file_path: Path, content: bytes) -> None:
+    """Escribe un archivo de forma atómica (tmp único + rename)."""
+    tmp_path = file_path.with_name(f"{file_path.name}.{uuid4().hex[:8]}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, file_path)
 
-    Estructura de directorios:
-    - backend/uploads/{breed}/animal_{animal_id}_{timestamp}.jpg
 
-    Args:
-        image_bytes: Bytes de la imagen
-        animal_id: ID del animal
-        breed: Raza del animal (opcional, para organizar por carpeta)
-        filename: Nombre del archivo (opcional, se genera automáticamente si no se proporciona)
+def _to_rgb(image: Image.Image) -> Image.Image:
+    """Convierte a RGB (fondo blanco para PNG con transparencia)."""
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        rgb_image = Image.new("RGB", image.size, (255, 255, 255))
+        rgb_image.paste(image, mask=image.split()[-1])
+        return rgb_image
+    if image.mode != "RGB":
+        return image.convert("RGB")
+    return image
 
-    Returns:
-        str: Path relativo de la imagen guardada (ej: "brahman/animal_123_20240101.jpg")
+
+def _encode_jpeg(image_bytes: bytes) -> bytes:
     """
-    # Asegurar que el directorio existe
-    uploads_dir = ensure_uploads_directory()
+    Recodifica una imagen no JPEG como JPEG.
 
-    # Crear subdirectorio por raza si se proporciona
-    if breed:
-        breed_dir = uploads_dir / breed.lower()
-        breed_dir.mkdir(parents=True, exist_ok=True)
-        target_dir = breed_dir
-    else:
-        target_dir = uploads_dir
-
-    # Generar nombre de archivo si no se proporciona
-    if not filename:
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        animal_id_str = str(animal_id).replace("-", "")[:8]
-        filename = f"animal_{animal_id_str}_{timestamp}.jpg"
-
-    # Asegurar extensión .jpg
-    if not filename.lower().endswith((".jpg", ".jpeg", ".png")):
-        filename = f"{filename}.jpg"
-
-    # Path completo del archivo
-    file_path = target_dir / filename
-
-    # Guardar imagen
-    image = Image.open(io.BytesIO(image_bytes))
-    # Convertir a RGB si es necesario (para PNG con transparencia)
-    if image.mode in ("RGBA", "P"):
-        rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-        rgb_image.paste(image, mask=image.split()[-1] if image.mode == "RGBA" else None)
-        image = rgb_image
+    Bloqueante (decodificación PIL): llamar desde un hilo.
+    """
+    image = _to_rgb(Image.open(io.BytesIO(image_bytes)))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=85, optimize=True)
+    return buffer.getvalue()
+
+
+def stored_content(image_bytes: bytes) -> tuple[bytes, str]:
+    """
+    Contenido y extensión con que se guarda una imagen (bloqueante).
 
-    # Guardar como JPEG
-    image.save(file_path, "JPEG", quality=85, optimize=True)
+    JPEG, PNG y WEBP se guardan sin recomprimir; otros formatos se
+    convierten a JPEG.
 
-    # Retornar path relativo desde backend/uploads
-    if breed:
-        return f"{breed.lower()}/{filename}"
-    return filename
+    Returns:
+        (bytes a guardar, extensión)
+    """
+    image_format = detect_image_format(image_bytes)
+    if image_format is None:
+        return _encode_jpeg(image_bytes), ".jpg"
+    return image_bytes, IMAGE_EXTENSIONS[image_format]
 
 
-def save_estimation_frame(
-    image_bytes: bytes,
-    animal_id: UUID | str | None = None,
-    breed: str | None = None,
-    estimation_id: UUID | str | None = None,
-) -> str:
+def store_image(image_bytes: bytes) -> StoredImage:
     """
-    Guarda el frame/foto usado para una estimación de peso en backend/uploads.
+    Guarda una imagen direccionada por contenido (bloqueante: llamar desde un hilo).
 
-    Estructura de directorios:
-    - backend/uploads/{breed}/estimation_{estimation_id}_{timestamp}.jpg
-    - backend/uploads/estimations/estimation_{estimation_id}_{timestamp}.jpg (si no hay raza)
+    JPEG, PNG y WEBP se guardan sin recomprimir; otros formatos se
+    convierten a JPEG. Si el contenido ya existe no se escribe nada.
 
     Args:
         image_bytes: Bytes de la imagen
-        animal_id: ID del animal (opcional)
-        breed: Raza del animal (opcional, para organizar por carpeta)
-        estimation_id: ID de la estimación (opcional, se genera UUID si no se proporciona)
 
     Returns:
-        str: Path relativo de la imagen guardada
+        StoredImage con hash y path relativo (ej: "cas/3f/a2/3fa2...e1.jpg")
     """
-    # Asegurar que el directorio existe
-    uploads_dir = ensure_uploads_directory()
-
-    # Generar ID de estimación si no se proporciona
-    if not estimation_id:
-        estimation_id = uuid4()
-
-    # Crear subdirectorio por raza si se proporciona
-    if breed:
-        breed_dir = uploads_dir / breed.lower()
-        breed_dir.mkdir(parents=True, exist_ok=True)
-        target_dir = breed_dir
-        subdir = breed.lower()
-    else:
-        # Si no hay raza, usar carpeta "estimations"
-        estimations_dir = uploads_dir / "estimations"
-        estimations_dir.mkdir(parents=True, exist_ok=True)
-        target_dir = estimations_dir
-        subdir = "estimations"
-
-    # Generar nombre de archivo
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    estimation_id_str = str(estimation_id).replace("-", "")[:8]
-    animal_id_str = f"_{str(animal_id).replace('-', '')[:8]}" if animal_id else ""
-    filename = f"estimation_{estimation_id_str}{animal_id_str}_{timestamp}.jpg"
-
-    # Path completo del archivo
-    file_path = target_dir / filename
-
-    # Guardar imagen
-    image = Image.open(io.BytesIO(image_bytes))
-    # Convertir a RGB si es necesario
-    if image.mode in ("RGBA", "P"):
-        rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-        rgb_image.paste(image, mask=image.split()[-1] if image.mode == "RGBA" else None)
-        image = rgb_image
-
-    # Guardar como JPEG
-    image.save(file_path, "JPEG", quality=85, optimize=True)
+    content, extension = stored_content(image_bytes)
+    digest = hashlib.sha256(content).hexdigest()
+    relative_path = ImageBlob.relative_path_for(digest, extension)
+    file_path = get_image_path(relative_path)
+    if file_path.is_file():
+        # Renovar mtime: el recolector respeta un período de gracia desde aquí
+        os.utime(file_path)
+        return StoredImage(digest, relative_path, len(content), created=False)
 
-    # Retornar path relativo desde backend/uploads
-    return f"{subdir}/{filename}"
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(file_path, content)
+    return StoredImage(digest, relative_path, len(content), created=True)
 
 
 def get_image_path(relative_path: str) -> Path:
@@ -183,3 +185,292 @@ def image_exists(relative_path: str) -> bool:
     """
     file_path = get_image_path(relative_path)
     return file_path.exists() and file_path.is_file()
+
+
+def variant_relative_path(relative_path: str, size: int) -> str:
+    """
+    Path relativo de una variante redimensionada.
+
+    Ejemplo: "nelore/estimation_1.jpg" con 256 → "nelore/estimation_1.w256.jpg"
+    """
+    path = PurePosixPath(relative_path)
+    return str(path.with_name(f"{path.stem}.w{size}.jpg"))
+
+
+def generate_image_variants(
+    relative_path: str, sizes: dict[str, int], quality: int
+) -> dict[str, str]:
+    """
+    Genera las variantes JPEG de una imagen guardada.
+
+    Bloqueante (PIL): se ejecuta en el pool de ImageStorageService. Si todas
+    las variantes ya existen (imagen deduplicada) no se decodifica nada. Los
+    JPEG se decodifican directamente a escala reducida (draft) y cada
+    variante se obtiene de la anterior, de mayor a menor.
+
+    Args:
+        relative_path: Path relativo del original desde backend/uploads
+        sizes: Nombre de variante → lado máximo en px
+        quality: Calidad JPEG de las variantes
+
+    Returns:
+        Nombre de variante → path relativo generado
+    """
+    generated: dict[str, str] = {}
+    if all(
+        image_exists(variant_relative_path(relative_path, size))
+        for size in sizes.values()
+    ):
+        return generated
+
+    with Image.open(get_image_path(relative_path)) as source:
+        source.draft("RGB", (max(sizes.values()), max(sizes.values())))
+        image = _to_rgb(ImageOps.exif_transpose(source))
+
+        for name, size in sorted(sizes.items(), key=lambda item: -item[1]):
+            image.thumbnail((size, size), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, "JPEG", quality=quality)
+            variant_path = variant_relative_path(relative_path, size)
+            _write_atomic(get_image_path(variant_path), buffer.getvalue())
+            generated[name] = variant_path
+    return generated
+
+
+def iter_stored_images() -> Iterator[tuple[str, int, float]]:
+    """
+    Recorre los originales del almacenamiento por contenido (bloqueante).
+
+    Yields:
+        (path relativo, tamaño en bytes, mtime) de cada original
+    """
+    uploads_dir = ensure_uploads_directory()
+    cas_dir = uploads_dir / CAS_DIRECTORY
+    if not cas_dir.is_dir():
+        return
+    for file_path in cas_dir.glob("*/*/*"):
+        if file_path.suffix == ".tmp" or _VARIANT_SUFFIX_PATTERN.search(file_path.name):
+            continue
+        stat = file_path.stat()
+        yield file_path.relative_to(uploads_dir).as_posix(), stat.st_size, stat.st_mtime
+
+
+def delete_stored_image(relative_path: str, sizes: list[int]) -> int:
+    """
+    Elimina un original y sus variantes (bloqueante).
+
+    Args:
+        relative_path: Path relativo del original
+        sizes: Lados de las variantes a eliminar
+
+    Returns:
+        Bytes liberados
+    """
+    freed = 0
+    paths = [relative_path] + [variant_relative_path(relative_path, s) for s in sizes]
+    for path in paths:
+        file_path = get_image_path(path)
+        try:
+            freed += file_path.stat().st_size
+            file_path.unlink()
+        except FileNotFoundError:
+            continue
+    return freed
+
+
+class ImageStorageService:
+    """
+    Almacenamiento de imágenes con variantes generadas en segundo plano.
+
+    - El original se escribe en disco en un hilo, una sola vez por contenido
+      (sin recomprimir si el formato es JPEG, PNG o WEBP)
+    - Las variantes (miniatura y vista previa) se generan en un pool de hilos
+      propio, sin que el request espere por ellas
+    - Cola acotada: por encima de max_pending no se generan variantes y los
+      clientes usan el original
+    """
+
+    def __init__(
+        self,
+        variants: dict[str, int],
+        quality: int,
+        max_workers: int,
+        max_pending: int,
+    ):
+        """
+        Inicializa el servicio.
+
+        Args:
+            variants: Nombre de variante → lado máximo en px
+            quality: Calidad JPEG de las variantes
+            max_workers: Hilos para generar variantes
+            max_pending: Imágenes máximas en cola de variantes
+        """
+        self.variants = variants
+        self.quality = quality
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+        self.stored = 0
+        self.deduplicated = 0
+        self.variants_generated = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Crea el pool de hilos de forma perezosa."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="image-variants"
+            )
+        return self._executor
+
+    async def store(self, image_bytes: bytes) -> StoredImage:
+        """
+        Guarda una imagen (fuera del event loop) y encola sus variantes.
+
+        Args:
+            image_bytes: Bytes de la imagen
+
+        Returns:
+            StoredImage con el path relativo a guardar en la estimación o animal
+        """
+        stored = await asyncio.to_thread(store_image, image_bytes)
+        if stored.created:
+            self.stored += 1
+        else:
+            self.deduplicated += 1
+        self.schedule_variants(stored.relative_path)
+        return stored
+
+    def schedule_variants(self, relative_path: str) -> bool:
+        """
+        Encola la generación de variantes de una imagen ya guardada.
+
+        Args:
+            relative_path: Path relativo del original
+
+        Returns:
+            True si se encoló, False si la cola está llena
+        """
+        if not self.variants:
+            return False
+        if len(self._tasks) >= self.max_pending:
+            self.skipped += 1
+            return False
+
+        task = asyncio.get_running_loop().create_task(self._generate(relative_path))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _generate(self, relative_path: str) -> None:
+        """Genera las variantes en el pool y registra el resultado."""
+        loop = asyncio.get_running_loop()
+        try:
+            generated = await loop.run_in_executor(
+                self._get_executor(),
+                generate_image_variants,
+                relative_path,
+                self.variants,
+                self.quality,
+            )
+            self.variants_generated += len(generated)
+        except Exception as e:
+            self.failed += 1
+            print(f"⚠️ Error generando variantes de {relative_path}: {e}")
+
+    async def ensure_variant(self, relative_path: str, size: int) -> str:
+        """
+        Obtiene (generando si falta) una variante bajo demanda.
+
+        Requests simultáneos por la misma variante comparten una sola
+        generación; el resultado queda en disco para los siguientes.
+
+        Args:
+            relative_path: Path relativo del original
+            size: Lado máximo en px (uno de los tamaños configurados)
+
+        Returns:
+            Path relativo de la variante
+        """
+        variant_path = variant_relative_path(relative_path, size)
+        future = self._in_flight.get(variant_path)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._get_executor(),
+                generate_image_variants,
+                relative_path,
+                {str(size): size},
+                self.quality,
+            )
+            self._in_flight[variant_path] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(variant_path, None))
+        generated = await asyncio.shield(future)
+        self.variants_generated += len(generated)
+        return variant_path
+
+    def variant_paths(self, relative_path: str) -> dict[str, str]:
+        """Paths relativos esperados de todas las variantes de una imagen."""
+        return {
+            name: variant_relative_path(relative_path, size)
+            for name, size in self.variants.items()
+        }
+
+    def get_variants(self, relative_path: str | None) -> dict[str, str]:
+        """
+        Variantes ya generadas de una imagen.
+
+        Paths externos (URLs, rutas del dispositivo móvil) no tienen variantes.
+
+        Args:
+            relative_path: Path relativo del original desde backend/uploads
+
+        Returns:
+            Nombre de variante → path relativo (solo las que existen en disco)
+        """
+        if not relative_path or "://" in relative_path:
+            return {}
+        normalized = relative_path.lstrip("/").removeprefix("uploads/")
+        if ".." in PurePosixPath(normalized).parts:
+            return {}
+        return {
+            name: path
+            for name, path in self.variant_paths(normalized).items()
+            if image_exists(path)
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Estadísticas del servicio en este proceso."""
+        return {
+            "pending": len(self._tasks),
+            "stored": self.stored,
+            "deduplicated": self.deduplicated,
+            "variants_generated": self.variants_generated,
+            "skipped": self.skipped,
+            "failed": self.failed,
+        }
+
+    def shutdown(self) -> None:
+        """Cancela variantes pendientes y cierra el pool."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Instancia global (singleton por proceso)
+image_storage_service = ImageStorageService(
+    variants={
+        "thumbnail": settings.IMAGES_THUMBNAIL_SIZE,
+        "preview": settings.IMAGES_PREVIEW_SIZE,
+    },
+    quality=settings.IMAGES_VARIANT_QUALITY,
+    max_workers=settings.IMAGES_MAX_WORKERS,
+    max_pending=settings.IMAGES_MAX_PENDING,
+)
@@ -5,6 +5,7 @@ Utilidades para inferencia ML
 Single Responsibility: Funciones auxiliares para procesamiento ML
 """
 
+import asyncio
 from datetime import datetime
 
 from ...core.exceptions import ValidationException
@@ -65,6 +66,7 @@ async def estimate_weight_from_image(
         method="strategy_based",  # Indicar método basado en estrategias
         ml_model_version=result.ml_model_version,
         processing_time_ms=result.processing_time_ms,
+        stage_timings_ms=result.stage_timings_ms,
         frame_image_path=image_path,
         device_id=device_id,
         timestamp=datetime.utcnow(),
@@ -80,3 +82,20 @@ async def get_ml_models_status() -> dict:
     """
     engine = MLInferenceEngine()
     return engine.get_loaded_models_info()
+
+
+async def reload_ml_models() -> dict:
+    """
+    Recarga los modelos ML (registry o genérico) sin reiniciar el proceso.
+
+    Los requests en curso terminan con el modelo anterior.
+
+    Returns:
+        Diccionario con info de modelos tras la recarga
+
+    Raises:
+        MLModelException: Si la recarga falla (se conserva el conjunto anterior)
+    """
+    engine = MLInferenceEngine()
+    await asyncio.to_thread(engine.model_loader.reload)
+    return engine.get_loaded_models_info()
@@ -1,10 +1,24 @@
 """
 Password Utilities
 Utilidades para hashing y verificación de contraseñas
+
+bcrypt tarda ~100-300 ms por operación. Las versiones async ejecutan el
+trabajo en un pool de hilos acotado (bcrypt libera el GIL) para no bloquear
+el event loop, y las verificaciones de login pasan por un token bucket que
+reparte las ráfagas (inicio de jornada) en el tiempo.
 """
 
+import asyncio
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 from passlib.context import CryptContext
 
+from ..config import settings
+from ..exceptions import RateLimitException
+
 # Contexto para hashing de contraseñas
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -34,3 +48,177 @@ def get_password_hash(password: str) -> str:
         Hash de la contraseña
     """
     return pwd_context.hash(password)
+
+
+class PasswordHasher:
+    """
+    Ejecutor de operaciones bcrypt fuera del event loop.
+
+    - Pool de hilos de tamaño fijo: limita la CPU dedicada a bcrypt
+    - Cola acotada: por encima de max_pending se rechaza (429) en lugar de
+      acumular requests en memoria
+    - Token bucket para logins: hasta `login_burst` verificaciones inmediatas
+      y luego `login_rate` por segundo; el resto espera su turno (hasta
+      `login_max_wait_s`) en lugar de competir por el pool
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        login_rate: float,
+        login_burst: int,
+        login_max_wait_s: float,
+    ):
+        """
+        Inicializa el ejecutor.
+
+        Args:
+            max_workers: Hilos del pool (operaciones bcrypt concurrentes)
+            max_pending: Operaciones máximas en cola + ejecución
+            login_rate: Verificaciones de login por segundo (0 = sin límite)
+            login_burst: Verificaciones permitidas en ráfaga
+            login_max_wait_s: Espera máxima antes de rechazar un login
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.login_rate = login_rate
+        self.login_burst = login_burst
+        self.login_max_wait_s = login_max_wait_s
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self._tokens = float(login_burst)
+        self._tokens_at = time.monotonic()
+
+        self.completed = 0
+        self.rejected = 0
+        self.shaped = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Crea el pool de hilos de forma perezosa."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+        return self._executor
+
+    def _reserve_login_slot(self) -> float:
+        """
+        Reserva un token del bucket de logins.
+
+        Returns:
+            Segundos a esperar antes de verificar (0 si hay token disponible)
+
+        Raises:
+            RateLimitException: Si la espera superaría login_max_wait_s
+        """
+        if self.login_rate <= 0:
+            return 0.0
+
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.login_burst),
+            self._tokens + (now - self._tokens_at) * self.login_rate,
+        )
+        self._tokens_at = now
+        self._tokens -= 1
+
+        if self._tokens >= 0:
+            return 0.0
+
+        delay = -self._tokens / self.login_rate
+        if delay > self.login_max_wait_s:
+            self._tokens += 1  # Devolver el token: este login no se atiende
+            self.rejected += 1
+            raise RateLimitException(
+                "Demasiados inicios de sesión simultáneos, intente nuevamente",
+                retry_after=math.ceil(delay),
+            )
+        return delay
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        """Ejecuta una función bcrypt en el pool respetando max_pending."""
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise RateLimitException(
+                "Servicio de autenticación saturado, intente nuevamente",
+                retry_after=1,
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), func, *args)
+            self.completed += 1
+            return result
+        finally:
+            self._pending -= 1
+
+    async def verify_login(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verifica la contraseña de un login (con rate shaping).
+
+        Args:
+            plain_password: Contraseña en texto plano
+            hashed_password: Contraseña hasheada
+
+        Returns:
+            True si la contraseña es correcta
+
+        Raises:
+            RateLimitException: Si se supera la capacidad de logins
+        """
+        delay = self._reserve_login_slot()
+        if delay > 0:
+            self.shaped += 1
+            await asyncio.sleep(delay)
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        """
+        Genera el hash de una contraseña en el pool.
+
+        Args:
+            password: Contraseña en texto plano
+
+        Returns:
+            Hash de la contraseña
+        """
+        return await self._run(get_password_hash, password)
+
+    def stats(self) -> dict[str, Any]:
+        """Estadísticas del ejecutor en este proceso."""
+        return {
+            "max_workers": self.max_workers,
+            "pending": self._pending,
+            "completed": self.completed,
+            "shaped": self.shaped,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        """Cierra el pool de hilos."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Instancia global (singleton por proceso)
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    login_rate=settings.LOGIN_RATE_PER_SECOND,
+    login_burst=settings.LOGIN_BURST,
+    login_max_wait_s=settings.LOGIN_MAX_WAIT_S,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verifica una contraseña de login sin bloquear el event loop."""
+    return await password_hasher.verify_login(plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Genera el hash de una contraseña sin bloquear el event loop."""
+    return await password_hasher.hash(password)
@@ -15,7 +15,9 @@ Características:
 # pyright: reportMissingTypeStubs=false
 
 import os
+from collections.abc import Sequence
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 
 import qrcode  # type: ignore[import-untyped]
@@ -30,6 +32,7 @@ from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY  # type: ignore[import-unt
 from reportlab.lib.pagesizes import letter  # type: ignore[import-untyped]
 from reportlab.lib.styles import (  # type: ignore[import-untyped]
     ParagraphStyle,
+    StyleSheet1,
     getSampleStyleSheet,
 )
 from reportlab.lib.units import cm  # type: ignore[import-untyped]
@@ -48,6 +51,91 @@ from reportlab.platypus import (
 # type: ignore[import-untyped]
 from .image_storage import get_image_path, image_exists
 
+# Puntos máximos del gráfico de evolución (LTTB por encima de este número)
+CHART_MAX_POINTS = 120
+
+# Filas máximas de la tabla de historial (paginada, encabezado repetido)
+HISTORY_TABLE_MAX_ROWS = 1000
+
+# Códigos QR cacheados por proceso (uno por animal)
+QR_CACHE_SIZE = 512
+
+
+def lttb_downsample(points: Sequence[tuple[float, float]], threshold: int) -> list[int]:
+    """
+    Reduce una serie con Largest-Triangle-Three-Buckets.
+
+    Conserva la forma visual (picos y valles) de la curva eligiendo, en cada
+    bucket, el punto que forma el triángulo de mayor área con el punto
+    elegido anterior y el promedio del bucket siguiente.
+
+    Args:
+        points: Puntos (x, y) ordenados por x
+        threshold: Cantidad de puntos deseada (>= 3)
+
+    Returns:
+        Índices de los puntos seleccionados (incluye primero y último)
+    """
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    selected = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        # Promedio del bucket siguiente
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        next_len = next_end - next_start
+        avg_x = sum(points[j][0] for j in range(next_start, next_end)) / next_len
+        avg_y = sum(points[j][1] for j in range(next_start, next_end)) / next_len
+
+        # Punto del bucket actual con mayor área de triángulo
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = points[a]
+        max_area = -1.0
+        max_index = start
+        for j in range(start, end):
+            area = abs(
+                (ax - avg_x) * (points[j][1] - ay) - (ax - points[j][0]) * (avg_y - ay)
+            )
+            if area > max_area:
+                max_area = area
+                max_index = j
+
+        selected.append(max_index)
+        a = max_index
+
+    selected.append(n - 1)
+    return selected
+
+
+@lru_cache(maxsize=QR_CACHE_SIZE)
+def _render_qr_png(qr_data: str, fill_color: str) -> bytes:
+    """
+    Genera el PNG de un código QR (cacheado por proceso).
+
+    La URL codificada incluye el ID del animal, así que la caché queda
+    efectivamente indexada por animal.
+    """
+    qr = qrcode.QRCode(
+        version=1,
+        box_size=12,  # Aumentado para mejor legibilidad
+        border=3,  # Borde más visible
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+    )
+    qr.add_data(qr_data)
+    qr.make(fit=True)
+
+    # Convertir QR a imagen con color corporativo
+    qr_img = qr.make_image(fill_color=fill_color, back_color="white")
+    qr_buffer = BytesIO()
+    qr_img.save(qr_buffer, format="PNG")
+    return qr_buffer.getvalue()
+
 
 class TraceabilityPDFGenerator:
     """
@@ -85,6 +173,9 @@ class TraceabilityPDFGenerator:
     GRAY_MEDIUM_HEX = "#9E9E9E"
     GRAY_DARK_HEX = "#424242"
 
+    # Hoja de estilos compartida (se construye una vez por proceso)
+    _stylesheet: StyleSheet1 | None = None
+
     def _get_color_hex(self, color_obj) -> str:
         """
         Obtiene el valor hexadecimal de un color en formato #RRGGBB.
@@ -107,18 +198,32 @@ class TraceabilityPDFGenerator:
             farm_name: Nombre de la hacienda
         """
         self.farm_name = farm_name
-        self.styles = getSampleStyleSheet()
-        self._create_custom_styles()
+        self.styles = self._get_stylesheet()
 
-    def _create_custom_styles(self):
+    @classmethod
+    def _get_stylesheet(cls) -> StyleSheet1:
+        """
+        Retorna la hoja de estilos del documento.
+
+        Se construye la primera vez y se reutiliza en los reportes siguientes
+        del mismo proceso (los estilos no se modifican después de crearse).
+        """
+        if cls._stylesheet is None:
+            styles = getSampleStyleSheet()
+            cls._create_custom_styles(styles)
+            cls._stylesheet = styles
+        return cls._stylesheet
+
+    @classmethod
+    def _create_custom_styles(cls, styles: StyleSheet1) -> None:
         """Crea estilos personalizados para el documento."""
         # Título principal
-        self.styles.add(
+        styles.add(
             ParagraphStyle(
                 name="CustomTitle",
-                parent=self.styles["Heading1"],
+                parent=styles["Heading1"],
                 fontSize=24,
-                textColor=self.PRIMARY_COLOR,
+                textColor=cls.PRIMARY_COLOR,
                 spaceAfter=20,
                 alignment=TA_CENTER,
                 fontName="Helvetica-Bold",
@@ -126,75 +231,75 @@ class TraceabilityPDFGenerator:
         )
 
         # Subtítulo de sección
-        self.styles.add(
+        styles.add(
             ParagraphStyle(
                 name="SectionHeader",
-                parent=self.styles["Heading2"],
+                parent=styles["Heading2"],
                 fontSize=16,
-                textColor=self.SECONDARY_COLOR,
+                textColor=cls.SECONDARY_COLOR,
                 spaceAfter=12,
                 spaceBefore=15,
                 fontName="Helvetica-Bold",
                 borderWidth=0,
-                borderColor=self.SECONDARY_COLOR,
+                borderColor=cls.SECONDARY_COLOR,
                 borderPadding=5,
-                backColor=self.GRAY_LIGHT,
+                backColor=cls.GRAY_LIGHT,
             )
         )
 
         # Texto normal mejorado
-        self.styles.add(
+        styles.add(
             ParagraphStyle(
                 name="CustomBody",
-                parent=self.styles["Normal"],
+                parent=styles["Normal"],
                 fontSize=10,
                 leading=14,
-                textColor=self.GRAY_DARK,
+                textColor=cls.GRAY_DARK,
                 alignment=TA_JUSTIFY,
             )
         )
 
         # Etiqueta (label)
-        self.styles.add(
+        styles.add(
             ParagraphStyle(
                 name="Label",
-                parent=self.styles["Normal"],
+                parent=styles["Normal"],
                 fontSize=9,
-                textColor=self.GRAY_MEDIUM,
+                textColor=cls.GRAY_MEDIUM,
                 fontName="Helvetica-Bold",
             )
         )
 
         # Valor (value)
-        self.styles.add(
+        styles.add(
             ParagraphStyle(
                 name="Value",
-                parent=self.styles["Normal"],
+                parent=styles["Normal"],
                 fontSize=11,
-                textColor=self.GRAY_DARK,
+                textColor=cls.GRAY_DARK,
                 fontName="Helvetica",
             )
         )
 
         # Estadística destacada
-        self.styles.add(
+        styles.add(
             ParagraphStyle(
                 name="StatHighlight",
-                parent=self.styles["Normal"],
+                parent=styles["Normal"],
                 fontSize=20,
-                textColor=self.SUCCESS_COLOR,
+                textColor=cls.SUCCESS_COLOR,
                 fontName="Helvetica-Bold",
                 alignment=TA_CENTER,
             )
         )
 
         # Pie de página
-        self.styles.add(
+        styles.add(
             ParagraphStyle(
                 name="Footer",
-                parent=self.styles["Normal"],
+                parent=styles["Normal"],
                 fontSize=8,
-                textColor=self.GRAY_MEDIUM,
+                textColor=cls.GRAY_MEDIUM,
                 alignment=TA_CENTER,
             )
         )
@@ -650,6 +755,16 @@ class TraceabilityPDFGenerator:
         # Ordenar por fecha (más antiguo primero para el gráfico)
         sorted_estimations = sorted(weight_estimations, key=lambda x: x.timestamp)
 
+        # Historias largas: reducir con LTTB (el gráfico mide 300pt de ancho)
+        if len(sorted_estimations) > CHART_MAX_POINTS:
+            points = [
+                (e.timestamp.timestamp(), e.estimated_weight_kg)
+                for e in sorted_estimations
+            ]
+            sorted_estimations = [
+                sorted_estimations[i] for i in lttb_downsample(points, CHART_MAX_POINTS)
+            ]
+
         # Preparar datos para el gráfico
         weights = [e.estimated_weight_kg for e in sorted_estimations]
         dates = [e.timestamp.strftime("%Y-%m") for e in sorted_estimations]
@@ -671,7 +786,7 @@ class TraceabilityPDFGenerator:
         # Configurar ejes
         chart.valueAxis.valueMin = min(weights) * 0.9
         chart.valueAxis.valueMax = max(weights) * 1.1
-        chart.valueAxis.valueStep = (max(weights) - min(weights)) / 5
+        chart.valueAxis.valueStep = max((max(weights) - min(weights)) / 5, 1)
 
         # Etiquetas del eje X (solo cada N)
         step = max(1, len(dates) // 10)
@@ -788,66 +903,32 @@ class TraceabilityPDFGenerator:
             ]
         ]
 
-        # Datos (máximo 20 registros más recientes)
-        for estimation in weight_estimations[:20]:
+        # Datos (más recientes primero). Celdas como texto plano: la tabla
+        # puede ocupar varias páginas y los Paragraph por celda son costosos
+        for estimation in weight_estimations[:HISTORY_TABLE_MAX_ROWS]:
             table_data.append(
                 [
-                    Paragraph(
-                        estimation.timestamp.strftime("%d/%m/%Y %H:%M"),
-                        self.styles["Value"],
-                    ),
-                    Paragraph(
-                        f"<b>{estimation.estimated_weight_kg:.1f}</b>",
-                        self.styles["Value"],
-                    ),
-                    Paragraph(
-                        f"{estimation.confidence * 100:.1f}%", self.styles["Value"]
-                    ),
-                    Paragraph(estimation.method, self.styles["Value"]),
-                    Paragraph(estimation.ml_model_version, self.styles["Value"]),
+                    estimation.timestamp.strftime("%d/%m/%Y %H:%M"),
+                    f"{estimation.estimated_weight_kg:.1f}",
+                    f"{estimation.confidence * 100:.1f}%",
+                    estimation.method,
+                    estimation.ml_model_version,
                 ]
             )
 
+        # repeatRows=1: el encabezado se repite en cada página de la tabla
         history_table = Table(
-            table_data, colWidths=[3.5 * cm, 2.5 * cm, 2.5 * cm, 2.5 * cm, 2.5 * cm]
-        )
-
-        history_table.setStyle(
-            TableStyle(
-                [
-                    # Encabezado
-                    ("BACKGROUND", (0, 0), (-1, 0), self.SECONDARY_COLOR),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                    ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
-                    # Datos
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                    ("TEXTCOLOR", (0, 1), (-1, -1), self.GRAY_DARK),
-                    ("ALIGN", (0, 1), (-1, -1), "CENTER"),
-                    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 1), (-1, -1), 9),
-                    ("TOPPADDING", (0, 1), (-1, -1), 6),
-                    ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
-                    # Bordes
-                    ("GRID", (0, 0), (-1, -1), 0.5, self.GRAY_MEDIUM),
-                    # Filas alternadas
-                    (
-                        "ROWBACKGROUNDS",
-                        (0, 1),
-                        (-1, -1),
-                        [colors.white, self.GRAY_LIGHT],
-                    ),
-                ]
-            )
+            table_data,
+            colWidths=[3.5 * cm, 2.5 * cm, 2.5 * cm, 2.5 * cm, 2.5 * cm],
+            repeatRows=1,
         )
+        history_table.setStyle(self._history_table_style())
 
         elements.append(history_table)
 
-        if len(weight_estimations) > 20:
+        if len(weight_estimations) > HISTORY_TABLE_MAX_ROWS:
             note = Paragraph(
-                f"<i>Mostrando los 20 registros más recientes de {len(weight_estimations)} totales.</i>",
+                f"<i>Mostrando los {HISTORY_TABLE_MAX_ROWS} registros más recientes de {len(weight_estimations)} totales.</i>",
                 self.styles["Footer"],
             )
             elements.append(Spacer(1, 0.2 * cm))
@@ -857,6 +938,39 @@ class TraceabilityPDFGenerator:
 
         return elements
 
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _history_table_style(cls) -> TableStyle:
+        """Estilo de la tabla de historial (construido una vez por proceso)."""
+        return TableStyle(
+            [
+                # Encabezado
+                ("BACKGROUND", (0, 0), (-1, 0), cls.SECONDARY_COLOR),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, 0), 10),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
+                # Datos
+                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+                ("TEXTCOLOR", (0, 1), (-1, -1), cls.GRAY_DARK),
+                ("ALIGN", (0, 1), (-1, -1), "CENTER"),
+                ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+                ("FONTSIZE", (0, 1), (-1, -1), 9),
+                ("TOPPADDING", (0, 1), (-1, -1), 6),
+                ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
+                # Bordes
+                ("GRID", (0, 0), (-1, -1), 0.5, cls.GRAY_MEDIUM),
+                # Filas alternadas
+                (
+                    "ROWBACKGROUNDS",
+                    (0, 1),
+                    (-1, -1),
+                    [colors.white, cls.GRAY_LIGHT],
+                ),
+            ]
+        )
+
     def _build_timeline(self, report_data: dict) -> list:
         """Construye timeline visual de eventos."""
         elements = []
@@ -951,21 +1065,8 @@ class TraceabilityPDFGenerator:
         # Construir URL completa del animal
         qr_data = f"{frontend_url}/cattle/{animal.id}"
 
-        # Generar código QR con mejor configuración
-        qr = qrcode.QRCode(
-            version=1,
-            box_size=12,  # Aumentado para mejor legibilidad
-            border=3,  # Borde más visible
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-        )
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-
-        # Convertir QR a imagen con color corporativo
-        qr_img = qr.make_image(fill_color=self.PRIMARY_COLOR_HEX, back_color="white")
-        qr_buffer = BytesIO()
-        qr_img.save(qr_buffer, format="PNG")
-        qr_buffer.seek(0)
+        # PNG del QR cacheado por proceso (se regenera solo para animales nuevos)
+        qr_buffer = BytesIO(_render_qr_png(qr_data, self.PRIMARY_COLOR_HEX))
 
         # Crear tabla con QR y descripción mejorada
         qr_image = ReportLabImage(qr_buffer, width=5 * cm, height=5 * cm)
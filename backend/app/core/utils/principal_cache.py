@@ -0,0 +1,143 @@
+"""
+Principal Cache - Core Layer
+Caché en memoria del usuario autenticado (principal) por ID
+
+Single Responsibility: Evitar la consulta a MongoDB en cada request autenticado.
+get_current_user resuelve el usuario del JWT desde aquí; los casos de uso que
+modifican usuarios o roles invalidan las entradas afectadas.
+
+La caché es por proceso: con varios workers de uvicorn, una invalidación solo
+alcanza al worker que atendió el cambio y los demás ven el usuario actualizado
+al expirar el TTL (por eso el TTL es corto).
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any
+from uuid import UUID
+
+from ...domain.entities.user import User
+from ..config import settings
+
+
+class PrincipalCache:
+    """
+    Caché LRU con TTL de usuarios autenticados.
+
+    Solo almacena usuarios activos; los errores (usuario inexistente o
+    inactivo) siempre se resuelven contra la base de datos.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        """
+        Inicializa la caché.
+
+        Args:
+            ttl_seconds: Segundos que un usuario permanece en caché (0 la deshabilita)
+            max_size: Máximo de usuarios retenidos (LRU)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+
+        self._entries: OrderedDict[UUID, tuple[float, User]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True si la caché está habilitada."""
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    def get(self, user_id: UUID) -> User | None:
+        """
+        Obtiene un usuario cacheado.
+
+        Args:
+            user_id: ID del usuario (claim del JWT)
+
+        Returns:
+            Copia del User cacheado, o None si no está o expiró
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, user = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        # Copia: los handlers no deben poder modificar la entrada compartida
+        return copy.copy(user)
+
+    def put(self, user: User) -> None:
+        """
+        Guarda un usuario activo en caché.
+
+        Args:
+            user: Usuario recién obtenido de la base de datos
+        """
+        if not self.enabled or not user.is_active:
+            return
+
+        self._entries[user.id] = (time.monotonic() + self.ttl_seconds, copy.copy(user))
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Elimina un usuario de la caché (actualización o eliminación)."""
+        if self._entries.pop(user_id, None) is not None:
+            self.invalidations += 1
+
+    def invalidate_role(self, role_id: UUID) -> None:
+        """Elimina de la caché todos los usuarios con el rol indicado."""
+        stale = [
+            user_id
+            for user_id, (_expires_at, user) in self._entries.items()
+            if user.role_id == role_id
+        ]
+        for user_id in stale:
+            del self._entries[user_id]
+        self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        """Vacía la caché y reinicia contadores (útil en tests)."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Estadísticas de la caché en este proceso."""
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+# Instancia global (singleton por proceso)
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_S,
+    max_size=settings.AUTH_PRINCIPAL_CACHE_MAX_SIZE,
+)
@@ -0,0 +1,202 @@
+"""
+Report Cache - Core Layer
+Caché en disco de reportes generados, con clave por versión de datos
+
+Single Responsibility: Guardar y servir reportes ya renderizados mientras los
+datos de origen no cambien. La clave incluye tipo de reporte, formato,
+parámetros y una huella de los datos (conteos y timestamps máximos), de modo
+que cualquier cambio en MongoDB produce una clave nueva (invalidación
+automática). El tamaño total está acotado con desalojo LRU.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..config import settings
+
+
+class ReportCache:
+    """
+    Caché LRU de reportes en disco.
+
+    El orden LRU se mantiene con el mtime de cada archivo (se actualiza en cada
+    hit), por lo que es compartido entre workers de uvicorn.
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: int):
+        """
+        Inicializa la caché.
+
+        Args:
+            cache_dir: Directorio de la caché
+            max_size_mb: Tamaño máximo total en MB (0 deshabilita la caché)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """True si la caché está habilitada."""
+        return self.max_size_bytes > 0
+
+    @staticmethod
+    def build_key(
+        report_type: str,
+        report_format: str,
+        params: dict[str, Any],
+        data_version: dict[str, Any],
+    ) -> str:
+        """
+        Construye la clave de caché.
+
+        Incluye la fecha UTC actual porque los reportes muestran valores
+        derivados del día (edad en meses, fecha de generación).
+
+        Args:
+            report_type: traceability, inventory, movements o growth
+            report_format: pdf o excel
+            params: Parámetros del request (filtros, IDs)
+            data_version: Huella de los datos de origen
+
+        Returns:
+            Hash SHA-256 hexadecimal
+        """
+        payload = json.dumps(
+            {
+                "type": report_type,
+                "format": report_format,
+                "params": params,
+                "version": data_version,
+                "day": datetime.utcnow().date().isoformat(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.bin"
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Obtiene un reporte cacheado.
+
+        Args:
+            key: Clave construida con build_key
+
+        Returns:
+            Bytes del reporte, o None si no está en caché
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            content = path.read_bytes()
+            os.utime(path)  # Marcar como usado recientemente (LRU)
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return content
+
+    def get_path(self, key: str) -> Path | None:
+        """Ruta del reporte cacheado (marcándolo como usado), o None."""
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return path
+
+    def put(self, key: str, content: bytes) -> None:
+        """
+        Guarda un reporte en caché (escritura atómica) y aplica el límite.
+
+        Args:
+            key: Clave construida con build_key
+            content: Bytes del reporte
+        """
+        if not self.enabled or len(content) > self.max_size_bytes:
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def put_file(self, key: str, source: Path) -> None:
+        """Copia un archivo ya generado a la caché."""
+        if not self.enabled or source.stat().st_size > self.max_size_bytes:
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Elimina los archivos menos usados hasta respetar max_size_bytes."""
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.glob("*/*.bin"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total <= self.max_size_bytes:
+                return
+
+            entries.sort()
+            for _mtime, size, path in entries:
+                if total <= self.max_size_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def clear(self) -> None:
+        """Vacía la caché."""
+        with self._lock:
+            if self.cache_dir.exists():
+                shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Estadísticas de la caché en este proceso."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+            "max_size_mb": self.max_size_bytes // (1024 * 1024),
+        }
+
+
+# Instancia global (singleton por proceso)
+report_cache = ReportCache(
+    cache_dir=settings.REPORTS_CACHE_PATH,
+    max_size_mb=settings.REPORTS_CACHE_MAX_MB,
+)
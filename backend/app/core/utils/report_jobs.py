@@ -0,0 +1,390 @@
+"""
+Report Jobs - Core Layer
+Cola de trabajos en segundo plano para generación de reportes
+
+Single Responsibility: Ejecutar el renderizado de reportes (ReportLab/openpyxl,
+CPU-bound) en un pool de procesos, fuera del event loop, y guardar el archivo
+resultante en disco con TTL para su descarga posterior.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from ..config import settings
+from .report_cache import report_cache
+from .report_generator import ReportGenerator
+
+# Media types y extensiones por formato de reporte
+REPORT_MEDIA_TYPES: dict[str, str] = {
+    "pdf": "application/pdf",
+    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+REPORT_EXTENSIONS: dict[str, str] = {"pdf": "pdf", "excel": "xlsx"}
+
+
+class ReportJobStatus(str, Enum):
+    """Estado de un trabajo de reporte."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class ReportJob:
+    """Trabajo de generación de reporte."""
+
+    id: str
+    report_type: str
+    format: str
+    filename: str
+    status: ReportJobStatus = ReportJobStatus.PENDING
+    progress: int = 0
+    stage: str = "queued"
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    expires_at: datetime | None = None
+    file_size_bytes: int | None = None
+    error: str | None = None
+
+    @property
+    def media_type(self) -> str:
+        """Media type HTTP del archivo generado."""
+        return REPORT_MEDIA_TYPES[self.format]
+
+    def is_expired(self, ttl: timedelta) -> bool:
+        """
+        True si el trabajo ya superó su TTL.
+
+        Un trabajo sin terminar cuyo proceso murió (reinicio del servidor)
+        se considera expirado tras dos TTL desde su creación.
+        """
+        now = datetime.utcnow()
+        if self.expires_at is not None:
+            return now >= self.expires_at
+        return now >= self.created_at + 2 * ttl
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializa a dict JSON-compatible."""
+        data = asdict(self)
+        data["status"] = self.status.value
+        for key in ("created_at", "started_at", "finished_at", "expires_at"):
+            data[key] = data[key].isoformat() if data[key] else None
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ReportJob":
+        """Deserializa desde dict (metadatos persistidos en disco)."""
+        data = dict(data)
+        data["status"] = ReportJobStatus(data["status"])
+        for key in ("created_at", "started_at", "finished_at", "expires_at"):
+            data[key] = datetime.fromisoformat(data[key]) if data.get(key) else None
+        return cls(**data)
+
+
+def render_report_bytes(
+    report_data: dict, report_type: str, report_format: str
+) -> bytes:
+    """
+    Renderiza un reporte a bytes.
+
+    Función de módulo (picklable) para ejecutarse en el pool de procesos.
+
+    Args:
+        report_data: Datos preparados por el caso de uso
+        report_type: traceability, inventory, movements o growth
+        report_format: pdf o excel
+
+    Returns:
+        Bytes del archivo generado
+    """
+    if report_format == "pdf":
+        return ReportGenerator.generate_pdf(report_data, report_type)
+    if report_format == "excel":
+        return ReportGenerator.generate_excel(report_data, report_type)
+    raise ValueError(f"Formato no soportado: {report_format}")
+
+
+def render_report_file(
+    report_data: dict, report_type: str, report_format: str, output_path: str
+) -> int:
+    """
+    Renderiza un reporte y lo escribe en disco de forma atómica.
+
+    Args:
+        report_data: Datos preparados por el caso de uso
+        report_type: traceability, inventory, movements o growth
+        report_format: pdf o excel
+        output_path: Ruta final del archivo
+
+    Returns:
+        Tamaño del archivo en bytes
+    """
+    content = render_report_bytes(report_data, report_type, report_format)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, output_path)
+    return len(content)
+
+
+class ReportJobManager:
+    """
+    Gestor de trabajos de reportes.
+
+    - La recolección de datos (async, MongoDB) corre en el event loop
+    - El renderizado corre en un ProcessPoolExecutor acotado
+    - Los metadatos se persisten como JSON junto al archivo, de modo que
+      cualquier worker de uvicorn puede responder el estado y la descarga
+    """
+
+    def __init__(self, storage_dir: str, max_workers: int, ttl_minutes: int):
+        """
+        Inicializa el gestor.
+
+        Args:
+            storage_dir: Directorio donde se guardan artefactos y metadatos
+            max_workers: Procesos máximos para renderizar reportes
+            ttl_minutes: Minutos que un reporte terminado permanece descargable
+        """
+        self.storage_dir = Path(storage_dir)
+        self.max_workers = max_workers
+        self.ttl = timedelta(minutes=ttl_minutes)
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._jobs: dict[str, ReportJob] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Crea el pool de procesos de forma perezosa."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _artifact_path(self, job: ReportJob) -> Path:
+        return self.storage_dir / f"{job.id}.{REPORT_EXTENSIONS[job.format]}"
+
+    def _metadata_path(self, job_id: str) -> Path:
+        return self.storage_dir / f"{job_id}.json"
+
+    def _persist(self, job: ReportJob) -> None:
+        """Guarda metadatos del trabajo en disco (escritura atómica)."""
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        path = self._metadata_path(job.id)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(job.to_dict()), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    async def render_bytes(
+        self, report_data: dict, report_type: str, report_format: str
+    ) -> bytes:
+        """
+        Renderiza un reporte en el pool de procesos y retorna los bytes.
+
+        Usado por los endpoints síncronos para no bloquear el event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            render_report_bytes,
+            report_data,
+            report_type,
+            report_format,
+        )
+
+    def submit(
+        self,
+        report_type: str,
+        report_format: str,
+        filename: str,
+        collect_data: Callable[[], Awaitable[dict]],
+        cache_key: str | None = None,
+    ) -> ReportJob:
+        """
+        Encola un trabajo de reporte.
+
+        Args:
+            report_type: traceability, inventory, movements o growth
+            report_format: pdf o excel
+            filename: Nombre de descarga del archivo
+            collect_data: Corrutina que obtiene los datos del reporte (caso de uso)
+            cache_key: Clave de ReportCache (None para no usar caché)
+
+        Returns:
+            ReportJob en estado pending
+        """
+        job = ReportJob(
+            id=uuid4().hex,
+            report_type=report_type,
+            format=report_format,
+            filename=filename,
+        )
+        self._jobs[job.id] = job
+        self._persist(job)
+
+        task = asyncio.create_task(self._run(job, collect_data, cache_key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    async def _run(
+        self,
+        job: ReportJob,
+        collect_data: Callable[[], Awaitable[dict]],
+        cache_key: str | None,
+    ) -> None:
+        """Ejecuta un trabajo: caché → recolección de datos → render → disco."""
+        job.status = ReportJobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+        job.stage = "collecting_data"
+        job.progress = 10
+        self._persist(job)
+
+        try:
+            cached_path = report_cache.get_path(cache_key) if cache_key else None
+            if cached_path is not None:
+                artifact_path = self._artifact_path(job)
+                try:
+                    shutil.copyfile(cached_path, artifact_path)
+                    self._complete(job, artifact_path.stat().st_size, stage="cached")
+                    return
+                except OSError:
+                    pass  # Desalojado de la caché entre tanto: regenerar
+
+            report_data = await collect_data()
+
+            job.stage = "rendering"
+            job.progress = 40
+            self._persist(job)
+
+            loop = asyncio.get_running_loop()
+            file_size = await loop.run_in_executor(
+                self._get_executor(),
+                render_report_file,
+                report_data,
+                job.report_type,
+                job.format,
+                str(self._artifact_path(job)),
+            )
+            if cache_key:
+                report_cache.put_file(cache_key, self._artifact_path(job))
+
+            self._complete(job, file_size, stage="done")
+        except Exception as e:
+            job.status = ReportJobStatus.FAILED
+            job.stage = "failed"
+            job.error = getattr(e, "message", None) or str(e)
+            job.finished_at = datetime.utcnow()
+            job.expires_at = job.finished_at + self.ttl
+        finally:
+            self._persist(job)
+            # El estado final queda en disco; no retener en memoria
+            self._jobs.pop(job.id, None)
+
+    def _complete(self, job: ReportJob, file_size: int, stage: str) -> None:
+        """Marca un trabajo como completado."""
+        job.status = ReportJobStatus.COMPLETED
+        job.stage = stage
+        job.progress = 100
+        job.file_size_bytes = file_size
+        job.finished_at = datetime.utcnow()
+        job.expires_at = job.finished_at + self.ttl
+
+    def get(self, job_id: str) -> ReportJob | None:
+        """
+        Obtiene un trabajo por ID (memoria local o metadatos en disco).
+
+        Returns:
+            ReportJob, o None si no existe o ya expiró
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            path = self._metadata_path(job_id)
+            if not path.exists():
+                return None
+            try:
+                job = ReportJob.from_dict(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError, TypeError, KeyError):
+                return None
+
+        if job.is_expired(self.ttl):
+            self._delete(job)
+            return None
+        return job
+
+    def artifact_path(self, job: ReportJob) -> Path | None:
+        """Ruta del archivo generado, o None si no está disponible."""
+        if job.status != ReportJobStatus.COMPLETED:
+            return None
+        path = self._artifact_path(job)
+        return path if path.exists() else None
+
+    def _delete(self, job: ReportJob) -> None:
+        """Elimina artefacto y metadatos de un trabajo."""
+        self._artifact_path(job).unlink(missing_ok=True)
+        self._metadata_path(job.id).unlink(missing_ok=True)
+
+    def cleanup_expired(self) -> int:
+        """
+        Elimina artefactos expirados del directorio de reportes.
+
+        Returns:
+            Cantidad de trabajos eliminados
+        """
+        if not self.storage_dir.exists():
+            return 0
+
+        removed = 0
+        for path in self.storage_dir.glob("*.json"):
+            try:
+                job = ReportJob.from_dict(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError, TypeError, KeyError):
+                # Metadatos corruptos: eliminar si son antiguos
+                if time.time() - path.stat().st_mtime > self.ttl.total_seconds():
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                continue
+            if job.is_expired(self.ttl):
+                self._delete(job)
+                removed += 1
+        return removed
+
+    async def run_cleanup_loop(self, interval_seconds: float = 300) -> None:
+        """Loop periódico de limpieza (se lanza desde el lifespan)."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = self.cleanup_expired()
+                if removed:
+                    print(f"🧹 Reportes expirados eliminados: {removed}")
+            except Exception as e:
+                print(f"⚠️ Error limpiando reportes expirados: {e}")
+
+    def shutdown(self) -> None:
+        """Cancela trabajos pendientes y cierra el pool de procesos."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Instancia global (singleton por proceso)
+report_jobs = ReportJobManager(
+    storage_dir=settings.REPORTS_STORAGE_PATH,
+    max_workers=settings.REPORTS_MAX_WORKERS,
+    ttl_minutes=settings.REPORTS_TTL_MINUTES,
+)
@@ -0,0 +1,350 @@
+"""
+Request Metrics Registry - Core Layer
+Registro en memoria de métricas de requests HTTP, MongoDB y etapas ML
+
+Single Responsibility: Acumular histogramas y contadores de rendimiento y
+exponerlos en formato de texto Prometheus (`/metrics`) sin dependencias
+externas.
+
+Cada request lleva un `RequestTimings` en un ContextVar: los comandos de
+MongoDB (vía command monitoring de PyMongo; Motor copia el contexto al
+ejecutar en su pool de hilos) y las etapas ML medidas con `stage()` se
+acumulan ahí para el header `Server-Timing`.
+
+Con varios workers cada proceso tiene su propio registro: Prometheus debe
+consultar cada worker o agregarse aguas arriba.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from pymongo import monitoring
+
+from ..config import settings
+
+# Buckets (s) de latencia: de 5 ms al presupuesto de inferencia (3 s) y más
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 3.0, 5.0, 10.0)
+
+# Buckets (bytes) de tamaño de request/response
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 5_000_000, 10_000_000)
+
+# Buckets de cantidad de comandos MongoDB por request
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100)
+
+# Etiqueta para requests sin ruta (404): evita una serie por URL
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass
+class RequestTimings:
+    """Tiempos acumulados durante un request (para Server-Timing)."""
+
+    db_commands: int = 0
+    db_ms: float = 0.0
+    stages: list[tuple[str, float]] = field(default_factory=list)
+
+
+_current_request: ContextVar[RequestTimings | None] = ContextVar(
+    "request_timings", default=None
+)
+
+
+class _Histogram:
+    """Histograma acumulativo con etiquetas (formato Prometheus)."""
+
+    def __init__(
+        self, name: str, help_text: str, labels: tuple[str, ...], buckets: tuple
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = buckets
+        # etiquetas -> [conteo por bucket..., +Inf], suma
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, label_values: tuple[str, ...], value: float) -> None:
+        """Registra una observación (debe llamarse con el lock tomado)."""
+        series = self._series.get(label_values)
+        if series is None:
+            series = ([0] * (len(self.buckets) + 1), [0.0])
+            self._series[label_values] = series
+        counts, total = series
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+        counts[-1] += 1
+        total[0] += value
+
+    def render(self) -> list[str]:
+        """Líneas en formato de exposición Prometheus."""
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for label_values, (counts, total) in sorted(self._series.items()):
+            labels = _format_labels(self.labels, label_values)
+            prefix = f"{labels}," if labels else ""
+            for bound, count in zip(self.buckets, counts, strict=False):
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {counts[-1]}')
+            lines.append(f"{self.name}_sum{{{labels}}} {total[0]:.6f}")
+            lines.append(f"{self.name}_count{{{labels}}} {counts[-1]}")
+        return lines
+
+
+class _Counter:
+    """Contador con etiquetas (formato Prometheus)."""
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._series: dict[tuple[str, ...], float] = {}
+
+    def inc(self, label_values: tuple[str, ...], amount: float = 1) -> None:
+        """Incrementa la serie (debe llamarse con el lock tomado)."""
+        self._series[label_values] = self._series.get(label_values, 0) + amount
+
+    def render(self) -> list[str]:
+        """Líneas en formato de exposición Prometheus."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for label_values, value in sorted(self._series.items()):
+            labels = _format_labels(self.labels, label_values)
+            lines.append(f"{self.name}{{{labels}}} {value:g}")
+        return lines
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    """`a="1",b="2"` con los valores escapados."""
+    return ",".join(
+        f'{name}="{_escape_label(value)}"'
+        for name, value in zip(names, values, strict=True)
+    )
+
+
+def _escape_label(value: str) -> str:
+    """Escapa un valor de etiqueta (barra invertida, comillas y saltos)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MongoCommandListener(monitoring.CommandListener):
+    """
+    Listener de comandos de PyMongo.
+
+    Se registra en el cliente Motor (`event_listeners`). Los eventos llegan
+    desde los hilos de Motor con el contexto del request que los originó.
+    """
+
+    def __init__(self, registry: "RequestMetricsRegistry"):
+        self._registry = registry
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        """Sin efecto: la duración llega en succeeded/failed."""
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        """Registra un comando exitoso."""
+        self._registry.observe_db_command(
+            event.command_name, event.duration_micros / 1e6, failed=False
+        )
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        """Registra un comando fallido."""
+        self._registry.observe_db_command(
+            event.command_name, event.duration_micros / 1e6, failed=True
+        )
+
+
+class RequestMetricsRegistry:
+    """
+    Registro en proceso de métricas de rendimiento.
+
+    - Latencia por ruta (plantilla, no URL), método y código de estado
+    - Requests en curso (gauge) y tamaños de request/response
+    - Comandos MongoDB: totales por comando y por request (cantidad y tiempo)
+    - Duración de las etapas ML
+    """
+
+    def __init__(self, server_timing: bool = True):
+        """
+        Inicializa el registro.
+
+        Args:
+            server_timing: Agregar el header Server-Timing a las respuestas
+        """
+        self.server_timing = server_timing
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._started_at = time.time()
+
+        route_labels = ("method", "route", "status")
+        self._request_duration = _Histogram(
+            "http_request_duration_seconds",
+            "Latencia de requests HTTP",
+            route_labels,
+            LATENCY_BUCKETS,
+        )
+        self._request_size = _Histogram(
+            "http_request_size_bytes",
+            "Tamaño del body de los requests",
+            ("method", "route"),
+            SIZE_BUCKETS,
+        )
+        self._response_size = _Histogram(
+            "http_response_size_bytes",
+            "Tamaño del body de las respuestas",
+            route_labels,
+            SIZE_BUCKETS,
+        )
+        self._request_db_commands = _Histogram(
+            "http_request_db_commands",
+            "Comandos MongoDB por request",
+            ("method", "route"),
+            COUNT_BUCKETS,
+        )
+        self._request_db_duration = _Histogram(
+            "http_request_db_duration_seconds",
+            "Tiempo en MongoDB por request",
+            ("method", "route"),
+            LATENCY_BUCKETS,
+        )
+        self._db_command_duration = _Histogram(
+            "mongodb_command_duration_seconds",
+            "Duración de comandos MongoDB",
+            ("command",),
+            LATENCY_BUCKETS,
+        )
+        self._db_command_failures = _Counter(
+            "mongodb_command_failures_total",
+            "Comandos MongoDB fallidos",
+            ("command",),
+        )
+        self._stage_duration = _Histogram(
+            "ml_stage_duration_seconds",
+            "Duración de las etapas del pipeline ML",
+            ("stage",),
+            LATENCY_BUCKETS,
+        )
+
+        self.command_listener = MongoCommandListener(self)
+
+    # ----- Requests -----
+
+    def request_started(self) -> RequestTimings:
+        """Abre el contexto de un request y lo cuenta como en curso."""
+        with self._lock:
+            self._in_flight += 1
+        timings = RequestTimings()
+        _current_request.set(timings)
+        return timings
+
+    def request_finished(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration_s: float,
+        request_bytes: int,
+        response_bytes: int,
+        timings: RequestTimings,
+    ) -> None:
+        """Registra un request terminado."""
+        status_label = str(status)
+        with self._lock:
+            self._in_flight -= 1
+            self._request_duration.observe((method, route, status_label), duration_s)
+            self._request_size.observe((method, route), request_bytes)
+            self._response_size.observe((method, route, status_label), response_bytes)
+            self._request_db_commands.observe((method, route), timings.db_commands)
+            self._request_db_duration.observe((method, route), timings.db_ms / 1000)
+
+    def server_timing_header(self, timings: RequestTimings, total_ms: float) -> str:
+        """Valor del header Server-Timing (RFC: métricas separadas por coma)."""
+        entries = [f"app;dur={total_ms:.1f}"]
+        if timings.db_commands:
+            entries.append(
+                f'db;dur={timings.db_ms:.1f};desc="{timings.db_commands} comandos"'
+            )
+        entries.extend(f"{name};dur={ms:.1f}" for name, ms in timings.stages)
+        return ", ".join(entries)
+
+    # ----- MongoDB -----
+
+    def observe_db_command(self, command: str, duration_s: float, failed: bool) -> None:
+        """Registra un comando MongoDB (llamado desde el listener)."""
+        timings = _current_request.get()
+        with self._lock:
+            self._db_command_duration.observe((command,), duration_s)
+            if failed:
+                self._db_command_failures.inc((command,))
+            if timings is not None:
+                timings.db_commands += 1
+                timings.db_ms += duration_s * 1000
+
+    # ----- Etapas ML -----
+
+    def observe_stage(self, name: str, duration_s: float) -> None:
+        """Registra la duración de una etapa (y la agrega al request actual)."""
+        timings = _current_request.get()
+        with self._lock:
+            self._stage_duration.observe((name,), duration_s)
+            if timings is not None:
+                timings.stages.append((name, duration_s * 1000))
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Mide una etapa con reloj monotónico.
+
+        Args:
+            name: Nombre de la etapa (token válido de Server-Timing)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(name, time.perf_counter() - start)
+
+    # ----- Exposición -----
+
+    def render(self) -> str:
+        """Todas las métricas en formato de texto Prometheus (v0.0.4)."""
+        with self._lock:
+            lines = [
+                "# HELP http_requests_in_flight Requests HTTP en curso",
+                "# TYPE http_requests_in_flight gauge",
+                f"http_requests_in_flight {self._in_flight}",
+                "# HELP process_start_time_seconds Inicio del proceso (epoch)",
+                "# TYPE process_start_time_seconds gauge",
+                f"process_start_time_seconds {self._started_at:.3f}",
+            ]
+            for metric in (
+                self._request_duration,
+                self._request_size,
+                self._response_size,
+                self._request_db_commands,
+                self._request_db_duration,
+                self._db_command_duration,
+                self._db_command_failures,
+                self._stage_duration,
+            ):
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def stats(self) -> dict[str, Any]:
+        """Resumen para el health check."""
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "routes": len(self._request_duration._series),
+                "server_timing": self.server_timing,
+            }
+
+
+# Instancia global (singleton por proceso)
+request_metrics = RequestMetricsRegistry(server_timing=settings.METRICS_SERVER_TIMING)
@@ -0,0 +1,263 @@
+"""
+Sync Metrics Registry - Core Layer
+Registro en memoria de métricas operacionales de sincronización
+
+Single Responsibility: Acumular métricas de batches de sync sin consultar MongoDB.
+El health check de sincronización lee de aquí en lugar de escanear colecciones.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from ..config import settings
+
+# Tamaño máximo de batch aceptado por los endpoints de sync
+MAX_SYNC_BATCH_SIZE = 100
+
+# Dispositivos (más recientes primero) incluidos en cada snapshot
+SNAPSHOT_MAX_DEVICES = 50
+
+
+@dataclass
+class _BatchRecord:
+    """Registro de un batch de sincronización finalizado."""
+
+    finished_at: float  # time.monotonic()
+    kind: str
+    items: int
+    latency_ms: float
+    failed: bool
+
+
+@dataclass
+class DeviceSyncState:
+    """Estado de sincronización conocido de un dispositivo."""
+
+    device_id: str
+    last_sync_at: datetime
+    last_batch_kind: str
+    last_batch_size: int
+    backlog_estimate: int | None
+
+
+class SyncMetricsRegistry:
+    """
+    Registro en proceso de métricas de sincronización.
+
+    - Batches en curso (gauge)
+    - Items/seg y latencia p50/p95 sobre una ventana deslizante
+    - Último sync y backlog estimado por dispositivo (LRU acotado)
+    - Ping a MongoDB y snapshot cacheados con TTL corto
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = 300,
+        max_records: int = 2048,
+        max_devices: int = 1000,
+        snapshot_ttl_seconds: float = 5.0,
+    ):
+        """
+        Inicializa el registro.
+
+        Args:
+            window_seconds: Ventana deslizante para throughput y percentiles
+            max_records: Máximo de batches retenidos en la ventana
+            max_devices: Máximo de dispositivos retenidos (LRU)
+            snapshot_ttl_seconds: TTL del snapshot y del ping cacheados
+        """
+        self.window_seconds = window_seconds
+        self.max_devices = max_devices
+        self.snapshot_ttl_seconds = snapshot_ttl_seconds
+
+        self._lock = threading.Lock()
+        self._records: deque[_BatchRecord] = deque(maxlen=max_records)
+        self._devices: OrderedDict[str, DeviceSyncState] = OrderedDict()
+        self._in_flight = 0
+        self._total_batches = 0
+        self._total_items = 0
+        self._started_at = time.monotonic()
+
+        self._snapshot: dict[str, Any] | None = None
+        self._snapshot_at = 0.0
+        self._ping_ms: float | None = None
+        self._ping_error: str | None = None
+        self._ping_at = 0.0
+
+    @contextmanager
+    def track_batch(
+        self,
+        kind: str,
+        device_id: str,
+        item_count: int,
+        pending_count: int | None = None,
+    ) -> Iterator[None]:
+        """
+        Mide un batch de sincronización (latencia, items, dispositivo).
+
+        Args:
+            kind: Tipo de batch ("cattle" o "weight_estimations")
+            device_id: ID del dispositivo móvil
+            item_count: Cantidad de items del batch
+            pending_count: Items que el dispositivo reporta aún pendientes
+
+        Yields:
+            None: El cuerpo del batch se ejecuta dentro del contexto
+        """
+        with self._lock:
+            self._in_flight += 1
+        start = time.monotonic()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            finished = time.monotonic()
+            with self._lock:
+                self._in_flight -= 1
+                self._total_batches += 1
+                self._total_items += item_count
+                self._records.append(
+                    _BatchRecord(
+                        finished_at=finished,
+                        kind=kind,
+                        items=item_count,
+                        latency_ms=(finished - start) * 1000,
+                        failed=failed,
+                    )
+                )
+                self._touch_device(kind, device_id, item_count, pending_count)
+
+    def _touch_device(
+        self,
+        kind: str,
+        device_id: str,
+        item_count: int,
+        pending_count: int | None,
+    ) -> None:
+        """Actualiza estado del dispositivo (debe llamarse con el lock tomado)."""
+        # Sin reporte explícito: un batch incompleto implica que no quedan pendientes
+        if pending_count is None and item_count < MAX_SYNC_BATCH_SIZE:
+            pending_count = 0
+
+        self._devices[device_id] = DeviceSyncState(
+            device_id=device_id,
+            last_sync_at=datetime.utcnow(),
+            last_batch_kind=kind,
+            last_batch_size=item_count,
+            backlog_estimate=pending_count,
+        )
+        self._devices.move_to_end(device_id)
+        while len(self._devices) > self.max_devices:
+            self._devices.popitem(last=False)
+
+    async def ping_database(
+        self, ping: Callable[[], Awaitable[float]]
+    ) -> tuple[float | None, str | None]:
+        """
+        Ejecuta (o reutiliza) el ping a MongoDB.
+
+        Args:
+            ping: Corrutina que hace ping y retorna latencia en ms
+
+        Returns:
+            Tupla (latencia_ms, error); uno de los dos es None
+        """
+        now = time.monotonic()
+        if self._ping_at and now - self._ping_at < self.snapshot_ttl_seconds:
+            return self._ping_ms, self._ping_error
+
+        try:
+            self._ping_ms = round(await ping(), 2)
+            self._ping_error = None
+        except Exception as e:
+            self._ping_ms = None
+            self._ping_error = str(e)
+        self._ping_at = time.monotonic()
+        return self._ping_ms, self._ping_error
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Retorna métricas agregadas (cacheadas durante snapshot_ttl_seconds).
+
+        Returns:
+            Dict con in_flight, throughput, percentiles y dispositivos
+        """
+        now = time.monotonic()
+        if (
+            self._snapshot is not None
+            and now - self._snapshot_at < self.snapshot_ttl_seconds
+        ):
+            return self._snapshot
+
+        with self._lock:
+            cutoff = now - self.window_seconds
+            window = [r for r in self._records if r.finished_at >= cutoff]
+            devices = list(self._devices.values())
+            in_flight = self._in_flight
+            total_batches = self._total_batches
+            total_items = self._total_items
+
+        latencies = sorted(r.latency_ms for r in window)
+        items_in_window = sum(r.items for r in window)
+        # Si el proceso lleva menos que la ventana, dividir por el tiempo real
+        elapsed = min(float(self.window_seconds), max(now - self._started_at, 1.0))
+
+        self._snapshot = {
+            "in_flight_batches": in_flight,
+            "window_seconds": self.window_seconds,
+            "batches_in_window": len(window),
+            "failed_batches_in_window": sum(1 for r in window if r.failed),
+            "items_per_second": round(items_in_window / elapsed, 3),
+            "batch_latency_p50_ms": self._percentile(latencies, 50),
+            "batch_latency_p95_ms": self._percentile(latencies, 95),
+            "total_batches": total_batches,
+            "total_items": total_items,
+            "tracked_devices": len(devices),
+            "devices": [
+                {
+                    "device_id": d.device_id,
+                    "last_sync_at": d.last_sync_at,
+                    "last_batch_kind": d.last_batch_kind,
+                    "last_batch_size": d.last_batch_size,
+                    "backlog_estimate": d.backlog_estimate,
+                }
+                for d in list(reversed(devices))[:SNAPSHOT_MAX_DEVICES]
+            ],
+        }
+        self._snapshot_at = now
+        return self._snapshot
+
+    @staticmethod
+    def _percentile(sorted_values: list[float], percentile: float) -> float | None:
+        """Percentil por nearest-rank sobre una lista ya ordenada."""
+        if not sorted_values:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * len(sorted_values)))
+        return round(sorted_values[rank - 1], 2)
+
+    def reset(self) -> None:
+        """Limpia todas las métricas (útil en tests)."""
+        with self._lock:
+            self._records.clear()
+            self._devices.clear()
+            self._in_flight = 0
+            self._total_batches = 0
+            self._total_items = 0
+            self._started_at = time.monotonic()
+            self._snapshot = None
+            self._ping_at = 0.0
+
+
+# Instancia global (singleton por proceso)
+sync_metrics = SyncMetricsRegistry(
+    window_seconds=settings.SYNC_METRICS_WINDOW_S,
+    snapshot_ttl_seconds=settings.SYNC_HEALTH_CACHE_TTL_S,
+)
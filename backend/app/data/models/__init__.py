@@ -6,6 +6,7 @@ Modelos de persistencia para MongoDB
 from .alert_model import AlertModel
 from .animal_model import AnimalModel
 from .farm_model import FarmModel
+from .image_blob_model import ImageBlobModel
 from .role_model import RoleModel
 from .user_model import UserModel
 from .weight_estimation_model import WeightEstimationModel
@@ -14,6 +15,7 @@ __all__ = [
     "AlertModel",
     "AnimalModel",
     "FarmModel",
+    "ImageBlobModel",
     "RoleModel",
     "UserModel",
     "WeightEstimationModel",
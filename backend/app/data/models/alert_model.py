@@ -4,14 +4,17 @@ Modelo de persistencia para alertas y notificaciones con soporte para cronograma
 """
 
 from datetime import datetime, timedelta
-from typing import Annotated
 from uuid import UUID, uuid4
 
-from beanie import Document, Indexed
+from beanie import Document
 from pydantic import Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from ...domain.entities.alert import AlertStatus, AlertType, RecurrenceType
 
+# Estados terminales: las alertas cerradas se mueven a la colección de archivo
+CLOSED_STATUSES = [AlertStatus.COMPLETED.value, AlertStatus.CANCELLED.value]
+
 
 class AlertModel(Document):
     """
@@ -24,7 +27,7 @@ class AlertModel(Document):
     id: UUID = Field(default_factory=uuid4, alias="_id")  # type: ignore
 
     # Usuario y finca
-    user_id: Annotated[UUID, Indexed()] = Field(..., description="ID del usuario")  # type: ignore
+    user_id: UUID = Field(..., description="ID del usuario")  # type: ignore
     farm_id: UUID | None = Field(None, description="ID de la finca (opcional)")  # type: ignore
 
     # Tipo y contenido
@@ -81,6 +84,9 @@ class AlertModel(Document):
     sent_at: datetime | None = None
     read_at: datetime | None = None
     completed_at: datetime | None = None
+    closed_at: datetime | None = Field(
+        None, description="Fecha de cierre (completada/cancelada), base del archivado"
+    )
 
     class Settings:
         """Configuración de Beanie."""
@@ -89,15 +95,45 @@ class AlertModel(Document):
         use_state_management = True
         validate_on_save = True
 
-        # Índices para optimizar queries
+        # Plan de índices de las consultas frecuentes (ver
+        # scripts/check_alert_indexes.py). Igualdades antes del rango de
+        # scheduled_at; sin índices de un campo que sean prefijo de un compuesto.
         indexes = [
-            "user_id",
-            "status",
             "type",
-            "scheduled_at",  # Para consultas de cronograma
-            "farm_id",
-            [("user_id", 1), ("status", 1)],  # Índice compuesto
-            [("scheduled_at", 1), ("status", 1)],  # Para procesar alertas programadas
+            # Cronograma global (find_scheduled)
+            "scheduled_at",
+            # Cronograma de un usuario / finca (find_today, find_upcoming)
+            IndexModel(
+                [("user_id", ASCENDING), ("scheduled_at", ASCENDING)],
+                name="user_scheduled_at",
+            ),
+            IndexModel(
+                [("farm_id", ASCENDING), ("scheduled_at", ASCENDING)],
+                name="farm_scheduled_at",
+            ),
+            # Listado de un usuario (find, ordenado por created_at)
+            IndexModel(
+                [("user_id", ASCENDING), ("created_at", DESCENDING)],
+                name="user_created_at",
+            ),
+            # Cola del scheduler (find_due, find_due_times, find_pending):
+            # parcial, solo indexa las alertas aún no enviadas
+            IndexModel(
+                [("status", ASCENDING), ("scheduled_at", ASCENDING)],
+                name="pending_scheduled_at",
+                partialFilterExpression={"status": AlertStatus.PENDING.value},
+            ),
+            # Deduplicación de alertas generadas por reglas de hato
+            IndexModel(
+                [("related_entity_id", ASCENDING), ("type", ASCENDING)],
+                name="related_entity_type",
+            ),
+            # Archivado de alertas cerradas
+            IndexModel(
+                [("closed_at", ASCENDING)],
+                name="closed_at",
+                partialFilterExpression={"status": {"$in": CLOSED_STATUSES}},
+            ),
         ]
 
     def is_scheduled(self) -> bool:
@@ -141,10 +177,12 @@ class AlertModel(Document):
         """Marca el evento como completado."""
         self.status = AlertStatus.COMPLETED
         self.completed_at = datetime.utcnow()
+        self.closed_at = self.completed_at
 
     def cancel(self) -> None:
         """Cancela la alerta."""
         self.status = AlertStatus.CANCELLED
+        self.closed_at = datetime.utcnow()
 
     def get_next_recurrence_date(self) -> datetime | None:
         """
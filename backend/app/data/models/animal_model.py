@@ -55,6 +55,10 @@ class AnimalModel(Document):
     last_updated: datetime = Field(
         default_factory=datetime.utcnow, description="Última actualización"
     )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="Última escritura (la fija el repositorio; huella de reportes)",
+    )
 
     # Sincronización (US-005)
     device_id: str | None = Field(
@@ -79,6 +83,8 @@ class AnimalModel(Document):
             "farm_id",  # Filtro por hacienda
             "registration_date",  # Ordenamiento cronológico
             [("ear_tag", 1), ("farm_id", 1)],  # Índice compuesto para búsqueda
+            # Reglas de hato: hacienda + estado y rango de nacimiento (edad)
+            [("farm_id", 1), ("status", 1), ("birth_date", 1)],
         ]
 
     def calculate_age_months(self) -> int:
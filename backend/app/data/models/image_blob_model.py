@@ -0,0 +1,59 @@
+"""
+Image Blob Model - Beanie ODM
+Modelo de persistencia para el conteo de referencias de imágenes en MongoDB
+"""
+
+from datetime import datetime
+
+from beanie import Document
+from pydantic import Field
+
+from ...domain.entities.image_blob import ImageBlob
+
+
+class ImageBlobModel(Document):
+    """
+    Modelo de imagen direccionada por contenido para MongoDB.
+
+    Single Responsibility: Persistir cuántas estimaciones y animales
+    referencian cada archivo de uploads/cas/ (el recolector elimina los
+    que quedan en cero).
+    """
+
+    # SHA-256 del contenido (mismo valor que el nombre del archivo)
+    id: str = Field(..., alias="_id")  # type: ignore[assignment]
+
+    path: str = Field(..., description="Path relativo desde uploads/")
+    ref_count: int = Field(default=0, description="Referencias activas")
+
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow, description="Primera referencia"
+    )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow, description="Último cambio de referencias"
+    )
+
+    class Settings:
+        """Configuración de Beanie."""
+
+        name = "image_blobs"
+
+        # Candidatos del recolector: sin referencias y sin cambios recientes
+        indexes = [
+            [("ref_count", 1), ("updated_at", 1)],
+        ]
+
+    def to_entity(self) -> ImageBlob:
+        """
+        Convierte ImageBlobModel a entidad ImageBlob.
+
+        Returns:
+            ImageBlob entity del dominio
+        """
+        return ImageBlob(
+            digest=self.id,
+            path=self.path,
+            ref_count=self.ref_count,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
@@ -59,6 +59,13 @@ class WeightEstimationModel(Document):
         default="1.0.0", description="Versión del modelo ML usado"
     )
     processing_time_ms: int = Field(..., description="Tiempo de procesamiento en ms")
+    stage_timings_ms: dict[str, float] | None = Field(
+        None,
+        description=(
+            "Tiempos por etapa del pipeline ML en ms "
+            "(decode, preprocess, queue_wait, invoke, detect, post_correction)"
+        ),
+    )
     frame_image_path: str = Field(..., description="Path del fotograma usado")
 
     # Datos de ubicación (opcional)
@@ -72,6 +79,10 @@ class WeightEstimationModel(Document):
     created_at: datetime = Field(
         default_factory=datetime.utcnow, description="Creación en sistema"
     )
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="Última escritura (la fija el repositorio; huella de reportes)",
+    )
 
     # Sincronización (US-005)
     device_id: str | None = Field(
@@ -3,13 +3,79 @@ Alert Repository Implementation - Data Layer
 Implementación del repositorio de alertas usando Beanie ODM
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, cast
 from uuid import UUID
 
-from ...domain.entities.alert import Alert
+from beanie.operators import In, Set
+from pydantic import BaseModel, Field
+from pymongo.errors import BulkWriteError, OperationFailure
+
+from ...domain.entities.alert import Alert, AlertStatus
 from ...domain.repositories.alert_repository import AlertRepository
-from ..models.alert_model import AlertModel
+from ..models.alert_model import CLOSED_STATUSES, AlertModel
+
+# Estados visibles en el cronograma: igualdad múltiple ($in) en lugar de
+# `status != cancelled`, que no acota el índice (status, scheduled_at)
+SCHEDULE_STATUSES = [
+    status.value for status in AlertStatus if status != AlertStatus.CANCELLED
+]
+
+# Colección fría con las alertas cerradas archivadas
+ARCHIVE_COLLECTION = "alerts_archive"
+ARCHIVE_TTL_INDEX = "closed_at_ttl"
+
+# Códigos de error de MongoDB
+DUPLICATE_KEY_ERROR = 11000
+INDEX_OPTIONS_CONFLICT = 85
+
+
+def schedule_query(
+    start: datetime,
+    end: datetime,
+    user_id: UUID | None = None,
+    farm_id: UUID | None = None,
+) -> dict[str, Any]:
+    """Filtro del cronograma (find_scheduled, find_today, find_upcoming)."""
+    query: dict[str, Any] = {
+        "scheduled_at": {"$gte": start, "$lte": end},
+        "status": {"$in": SCHEDULE_STATUSES},
+    }
+    if user_id:
+        query["user_id"] = user_id
+    if farm_id:
+        query["farm_id"] = farm_id
+    return query
+
+
+def pending_query(user_id: UUID | None = None) -> dict[str, Any]:
+    """Filtro de alertas pendientes (find_pending)."""
+    query: dict[str, Any] = {"status": AlertStatus.PENDING.value}
+    if user_id:
+        query["user_id"] = user_id
+    return query
+
+
+def due_query(until: datetime) -> dict[str, Any]:
+    """Filtro de la cola del scheduler (find_due, find_due_times)."""
+    return {"status": AlertStatus.PENDING.value, "scheduled_at": {"$lte": until}}
+
+
+def closed_query(closed_before: datetime) -> dict[str, Any]:
+    """Filtro de alertas cerradas a archivar (usa el índice parcial closed_at)."""
+    return {"status": {"$in": CLOSED_STATUSES}, "closed_at": {"$lte": closed_before}}
+
+
+class AlertIdView(BaseModel):
+    """Proyección con solo el ID de la alerta."""
+
+    id: UUID = Field(alias="_id")
+
+
+class RelatedEntityView(BaseModel):
+    """Proyección con solo la entidad relacionada de la alerta."""
+
+    related_entity_id: UUID | None = None
 
 
 class AlertRepositoryImpl(AlertRepository):
@@ -49,6 +115,7 @@ class AlertRepositoryImpl(AlertRepository):
             sent_at=model.sent_at,
             read_at=model.read_at,
             completed_at=model.completed_at,
+            closed_at=model.closed_at,
         )
 
     def _to_model(self, entity: Alert) -> AlertModel:
@@ -81,6 +148,7 @@ class AlertRepositoryImpl(AlertRepository):
             sent_at=entity.sent_at,
             read_at=entity.read_at,
             completed_at=entity.completed_at,
+            closed_at=entity.closed_at,
         )
 
     async def save(self, alert: Alert) -> Alert:
@@ -175,27 +243,18 @@ class AlertRepositoryImpl(AlertRepository):
 
     async def find_pending(self, user_id: UUID | None = None) -> list[Alert]:
         """Busca alertas pendientes."""
-        query: dict[str, Any] = {"status": "pending"}
-        if user_id:
-            query["user_id"] = user_id
-
-        alerts = await AlertModel.find(query).sort(AlertModel.scheduled_at).to_list()
+        alerts = (
+            await AlertModel.find(pending_query(user_id))
+            .sort(AlertModel.scheduled_at)
+            .to_list()
+        )
         return [self._to_entity(alert) for alert in alerts]
 
     async def find_scheduled(
         self, from_date: datetime, to_date: datetime
     ) -> list[Alert]:
         """Busca alertas programadas en un rango de fechas."""
-        alerts = (
-            await AlertModel.find(
-                AlertModel.scheduled_at >= from_date,  # type: ignore
-                AlertModel.scheduled_at <= to_date,  # type: ignore
-                AlertModel.status != "cancelled",  # type: ignore
-            )
-            .sort(AlertModel.scheduled_at)
-            .to_list()
-        )
-        return [self._to_entity(alert) for alert in alerts]
+        return await self._find_schedule(schedule_query(from_date, to_date))
 
     async def find_today(
         self, user_id: UUID | None = None, farm_id: UUID | None = None
@@ -204,24 +263,9 @@ class AlertRepositoryImpl(AlertRepository):
         now = datetime.utcnow()
         start_of_day = datetime(now.year, now.month, now.day, 0, 0, 0)
         end_of_day = datetime(now.year, now.month, now.day, 23, 59, 59)
-
-        query_conditions = [
-            AlertModel.scheduled_at >= start_of_day,  # type: ignore
-            AlertModel.scheduled_at <= end_of_day,  # type: ignore
-            AlertModel.status != "cancelled",  # type: ignore
-        ]
-
-        if user_id:
-            query_conditions.append(AlertModel.user_id == user_id)  # type: ignore
-        if farm_id:
-            query_conditions.append(AlertModel.farm_id == farm_id)  # type: ignore
-
-        alerts = (
-            await AlertModel.find(*query_conditions)
-            .sort(AlertModel.scheduled_at)
-            .to_list()
+        return await self._find_schedule(
+            schedule_query(start_of_day, end_of_day, user_id, farm_id)
         )
-        return [self._to_entity(alert) for alert in alerts]
 
     async def find_upcoming(
         self,
@@ -230,26 +274,149 @@ class AlertRepositoryImpl(AlertRepository):
         farm_id: UUID | None = None,
     ) -> list[Alert]:
         """Busca alertas programadas para los próximos N días."""
-        from datetime import timedelta
-
         now = datetime.utcnow()
         start_of_today = datetime(now.year, now.month, now.day, 0, 0, 0)
         end_date = start_of_today + timedelta(days=days_ahead)
+        return await self._find_schedule(
+            schedule_query(start_of_today, end_date, user_id, farm_id)
+        )
 
-        query_conditions = [
-            AlertModel.scheduled_at >= start_of_today,  # type: ignore
-            AlertModel.scheduled_at <= end_date,  # type: ignore
-            AlertModel.status != "cancelled",  # type: ignore
-        ]
-
-        if user_id:
-            query_conditions.append(AlertModel.user_id == user_id)  # type: ignore
-        if farm_id:
-            query_conditions.append(AlertModel.farm_id == farm_id)  # type: ignore
+    async def _find_schedule(self, query: dict[str, Any]) -> list[Alert]:
+        """Ejecuta una consulta del cronograma ordenada por fecha."""
+        alerts = await AlertModel.find(query).sort(AlertModel.scheduled_at).to_list()
+        return [self._to_entity(alert) for alert in alerts]
 
+    async def find_due(self, until: datetime, limit: int) -> list[Alert]:
+        """Busca alertas pendientes vencidas (lote ordenado por scheduled_at)."""
         alerts = (
-            await AlertModel.find(*query_conditions)
+            await AlertModel.find(due_query(until))
             .sort(AlertModel.scheduled_at)
+            .limit(limit)
             .to_list()
         )
         return [self._to_entity(alert) for alert in alerts]
+
+    async def find_due_times(self, until: datetime, limit: int) -> list[datetime]:
+        """Fechas de las próximas alertas pendientes (consulta cubierta)."""
+        cursor = (
+            AlertModel.get_motor_collection()
+            .find(due_query(until), {"_id": 0, "scheduled_at": 1})
+            .sort("scheduled_at", 1)
+            .limit(limit)
+        )
+        return [doc["scheduled_at"] async for doc in cursor]
+
+    async def save_many(self, alerts: list[Alert]) -> int:
+        """Inserta alertas nuevas omitiendo las que ya existen."""
+        if not alerts:
+            return 0
+        try:
+            result = await AlertModel.insert_many(
+                [self._to_model(alert) for alert in alerts], ordered=False
+            )
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors):
+                raise
+            return e.details.get("nInserted", 0)
+
+    async def mark_sent(self, alert_ids: list[UUID], sent_at: datetime) -> int:
+        """Marca como enviadas las alertas pendientes (un solo update_many)."""
+        if not alert_ids:
+            return 0
+        result = await AlertModel.find(
+            In(AlertModel.id, alert_ids),
+            AlertModel.status == AlertStatus.PENDING,
+        ).update_many(
+            Set({AlertModel.status: AlertStatus.SENT, AlertModel.sent_at: sent_at})
+        )
+        return result.modified_count if result is not None else 0
+
+    async def find_pending_related_ids(
+        self, type: str, related_entity_type: str, related_entity_ids: list[UUID]
+    ) -> set[UUID]:
+        """Entidades con una alerta pendiente del tipo indicado (una consulta)."""
+        if not related_entity_ids:
+            return set()
+        views = await AlertModel.find(
+            AlertModel.type == type,
+            AlertModel.status == AlertStatus.PENDING,
+            AlertModel.related_entity_type == related_entity_type,
+            In(AlertModel.related_entity_id, related_entity_ids),
+            projection_model=RelatedEntityView,
+        ).to_list()
+        return {view.related_entity_id for view in views if view.related_entity_id}
+
+    async def archive_closed(self, closed_before: datetime, limit: int) -> int:
+        """Mueve un lote de alertas cerradas a la colección de archivo."""
+        views = (
+            await AlertModel.find(
+                closed_query(closed_before), projection_model=AlertIdView
+            )
+            .limit(limit)
+            .to_list()
+        )
+        alert_ids = [view.id for view in views]
+        if not alert_ids:
+            return 0
+
+        # Repetir el filtro de cierre: una alerta reabierta o reprogramada
+        # desde el find anterior no se copia ni se elimina
+        batch_query = AlertModel.find(
+            In(AlertModel.id, alert_ids), closed_query(closed_before)
+        )
+
+        # $merge copia en el servidor (sin pasar por la aplicación); reemplazar
+        # en conflicto hace que reintentar un lote sea idempotente
+        await (
+            batch_query.clone()
+            .aggregate(
+                [
+                    {
+                        "$merge": {
+                            "into": ARCHIVE_COLLECTION,
+                            "on": "_id",
+                            "whenMatched": "replace",
+                            "whenNotMatched": "insert",
+                        }
+                    }
+                ]
+            )
+            .to_list()
+        )
+        result = await batch_query.delete()
+        deleted = result.deleted_count if result is not None else 0
+        if deleted < len(alert_ids):
+            # Reabiertas entre el $merge y el delete: quitar la copia archivada
+            remaining = await AlertModel.find(
+                In(AlertModel.id, alert_ids), projection_model=AlertIdView
+            ).to_list()
+            if remaining:
+                collection = AlertModel.get_motor_collection()
+                archive = collection.database.get_collection(
+                    ARCHIVE_COLLECTION, codec_options=collection.codec_options
+                )
+                await archive.delete_many({"_id": {"$in": [v.id for v in remaining]}})
+        return deleted
+
+    async def ensure_archive_indexes(self, retention_days: int) -> None:
+        """Crea (o ajusta) el índice TTL de la colección de archivo."""
+        if retention_days <= 0:
+            return
+
+        database = AlertModel.get_motor_collection().database
+        expire_after = retention_days * 24 * 3600
+        try:
+            await database[ARCHIVE_COLLECTION].create_index(
+                "closed_at", name=ARCHIVE_TTL_INDEX, expireAfterSeconds=expire_after
+            )
+        except OperationFailure as e:
+            if e.code != INDEX_OPTIONS_CONFLICT:
+                raise
+            # Cambió la retención: actualizar el TTL sin recrear el índice
+            await database.command(
+                "collMod",
+                ARCHIVE_COLLECTION,
+                index={"name": ARCHIVE_TTL_INDEX, "expireAfterSeconds": expire_after},
+            )
@@ -3,11 +3,65 @@ Animal Repository Implementation - Data Layer
 Implementación del repositorio de animales usando Beanie ODM
 """
 
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
+from pydantic import BaseModel, Field
+
 from ...domain.entities.animal import Animal
 from ...domain.repositories.animal_repository import AnimalRepository
+from ...domain.repositories.image_blob_repository import ImageBlobRepository
+from ...domain.shared.constants import AgeCategory
 from ..models.animal_model import AnimalModel
+from ..models.weight_estimation_model import WeightEstimationModel
+from .image_blob_repository_impl import ImageBlobRepositoryImpl
+
+# Edad en meses (inclusive) de cada categoría, según AgeCategory.from_age_months
+AGE_CATEGORY_MONTHS: dict[AgeCategory, tuple[int | None, int | None]] = {
+    AgeCategory.TERNEROS: (None, 7),
+    AgeCategory.VAQUILLONAS_TORILLOS: (8, 18),
+    AgeCategory.VAQUILLONAS_TORETES: (19, 30),
+    AgeCategory.VACAS_TOROS: (31, None),
+}
+
+
+class AnimalIdView(BaseModel):
+    """Proyección con solo el ID del animal."""
+
+    id: UUID = Field(alias="_id")
+
+
+def _month_start(month_index: int) -> datetime:
+    """Primer día del mes a partir de año * 12 + (mes - 1)."""
+    return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+
+def birth_date_query(age_category: str, now: datetime | None = None) -> dict:
+    """
+    Traduce una categoría de edad a un rango de birth_date.
+
+    La edad se calcula por meses calendario (calculate_age_months), así que
+    el rango es exacto: edad >= N meses ⇔ nacido antes del mes (actual - N + 1).
+
+    Args:
+        age_category: Categoría de edad
+        now: Fecha de referencia (por defecto, ahora)
+
+    Returns:
+        Condición de MongoDB para birth_date
+    """
+    now = now or datetime.utcnow()
+    current = now.year * 12 + now.month - 1
+    min_months, max_months = AGE_CATEGORY_MONTHS[AgeCategory(age_category)]
+
+    condition: dict[str, datetime] = {}
+    if max_months is not None:
+        condition["$gte"] = _month_start(current - max_months)
+    if min_months is not None:
+        condition["$lt"] = _month_start(current - min_months + 1)
+    return condition
 
 
 class AnimalRepositoryImpl(AnimalRepository):
@@ -17,6 +71,15 @@ class AnimalRepositoryImpl(AnimalRepository):
     Single Responsibility: Persistencia de animales en MongoDB.
     """
 
+    def __init__(self, image_blob_repository: ImageBlobRepository | None = None):
+        """
+        Inicializa el repositorio.
+
+        Args:
+            image_blob_repository: Contador de referencias de la foto (opcional)
+        """
+        self.image_blob_repository = image_blob_repository or ImageBlobRepositoryImpl()
+
     def _to_entity(self, model: AnimalModel) -> Animal:
         """
         Convierte AnimalModel (Data) a Animal (Domain Entity).
@@ -89,8 +152,16 @@ class AnimalRepositoryImpl(AnimalRepository):
         Returns:
             Animal guardado con ID asignado
         """
+        previous = await AnimalModel.get(animal.id)
+        previous_photo_url = previous.photo_url if previous else None
+
         model = self._to_model(animal)
+        # last_updated viene de la entidad (o del dispositivo al sincronizar)
+        model.updated_at = datetime.utcnow()
         await model.save()
+        if model.photo_url != previous_photo_url:
+            await self.image_blob_repository.acquire(model.photo_url)
+            await self.image_blob_repository.release(previous_photo_url)
         return self._to_entity(model)
 
     async def get_by_id(self, animal_id: UUID) -> Animal | None:
@@ -171,6 +242,7 @@ class AnimalRepositoryImpl(AnimalRepository):
         # Soft delete (marcar como inactive)
         model.status = "inactive"
         model.update_timestamp()
+        model.updated_at = model.last_updated
         await model.save()
 
         return True
@@ -198,35 +270,34 @@ class AnimalRepositoryImpl(AnimalRepository):
         Returns:
             Lista de Animal que cumplen los criterios
         """
-        # Construir query base
-        query = AnimalModel.find(AnimalModel.farm_id == farm_id)
+        query = AnimalModel.find(
+            self._rule_query(farm_id, breed, age_category, gender, status)
+        )
+        if limit:
+            query = query.limit(limit)
 
-        # Aplicar filtros
+        models = await query.to_list()
+        return [self._to_entity(model) for model in models]
+
+    def _rule_query(
+        self,
+        farm_id: UUID,
+        breed: str | None,
+        age_category: str | None,
+        gender: str | None,
+        status: str | None,
+    ) -> dict[str, Any]:
+        """Construye el filtro de MongoDB de una regla de hato."""
+        query: dict[str, Any] = {"farm_id": farm_id}
         if breed:
-            query = query.find(AnimalModel.breed == breed)
+            query["breed"] = breed
         if gender:
-            query = query.find(AnimalModel.gender == gender)
+            query["gender"] = gender
         if status:
-            query = query.find(AnimalModel.status == status)
-
-        # Obtener todos los animales que cumplen los filtros básicos
-        models = await query.to_list()
-
-        # Filtrar por categoría de edad si se especifica
+            query["status"] = status
         if age_category:
-            filtered_models = []
-            for model in models:
-                animal_entity = self._to_entity(model)
-                animal_age_category = animal_entity.calculate_age_category()
-                if animal_age_category.value == age_category:
-                    filtered_models.append(model)
-            models = filtered_models
-
-        # Aplicar límite si se especifica
-        if limit:
-            models = models[:limit]
-
-        return [self._to_entity(model) for model in models]
+            query["birth_date"] = birth_date_query(age_category)
+        return query
 
     async def find_by_criteria_dict(
         self,
@@ -415,3 +486,106 @@ class AnimalRepositoryImpl(AnimalRepository):
             models = list(all_models.values())
 
         return [self._to_entity(model) for model in models]
+
+    async def get_data_version(self, farm_id: UUID) -> dict[str, Any]:
+        """
+        Huella de los animales de una hacienda (una sola agregación).
+
+        Args:
+            farm_id: ID de la hacienda
+
+        Returns:
+            Dict con count, max_last_updated y max_updated_at
+        """
+        result = (
+            await AnimalModel.find(AnimalModel.farm_id == farm_id)
+            .aggregate(
+                [
+                    {
+                        "$group": {
+                            "_id": None,
+                            "count": {"$sum": 1},
+                            "max_last_updated": {"$max": "$last_updated"},
+                            "max_updated_at": {"$max": "$updated_at"},
+                        }
+                    }
+                ]
+            )
+            .to_list()
+        )
+
+        if not result:
+            return {"count": 0, "max_last_updated": None, "max_updated_at": None}
+        max_last_updated = result[0].get("max_last_updated")
+        max_updated_at = result[0].get("max_updated_at")
+        return {
+            "count": result[0]["count"],
+            "max_last_updated": (
+                max_last_updated.isoformat() if max_last_updated else None
+            ),
+            "max_updated_at": max_updated_at.isoformat() if max_updated_at else None,
+        }
+
+    async def iter_by_farms(
+        self,
+        farm_ids: list[UUID],
+        breed: str | None = None,
+        status: str | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Animal]:
+        """
+        Recorre animales de varias haciendas con un cursor de Motor.
+
+        Args:
+            farm_ids: IDs de las haciendas
+            breed: Filtro por raza (opcional)
+            status: Filtro por estado (opcional)
+            batch_size: Documentos por lote del cursor
+
+        Yields:
+            Animal ordenados por hacienda y caravana
+        """
+        query: dict[str, Any] = {"farm_id": {"$in": list(farm_ids)}}
+        if breed:
+            query["breed"] = breed
+        if status:
+            query["status"] = status
+
+        cursor = AnimalModel.find(query, batch_size=batch_size).sort(
+            +AnimalModel.farm_id, +AnimalModel.ear_tag
+        )
+        async for model in cursor:
+            yield self._to_entity(model)
+
+    async def find_ids_by_rule(
+        self,
+        farm_id: UUID,
+        breed: str | None = None,
+        age_category: str | None = None,
+        gender: str | None = None,
+        status: str | None = "active",
+        not_weighed_since: datetime | None = None,
+    ) -> list[UUID]:
+        """IDs de los animales que cumplen una regla de hato."""
+        views = await AnimalModel.find(
+            self._rule_query(farm_id, breed, age_category, gender, status),
+            projection_model=AnimalIdView,
+        ).to_list()
+        animal_ids = [view.id for view in views]
+        if not_weighed_since is None or not animal_ids:
+            return animal_ids
+
+        # animal_id se guarda como string en las estimaciones: la exclusión de
+        # los pesados recientemente es una consulta distinct sobre el índice
+        # (animal_id, timestamp)
+        weighed = await WeightEstimationModel.get_motor_collection().distinct(
+            "animal_id",
+            {
+                "animal_id": {"$in": [str(animal_id) for animal_id in animal_ids]},
+                "timestamp": {"$gte": not_weighed_since},
+            },
+        )
+        weighed_ids = set(weighed)
+        return [
+            animal_id for animal_id in animal_ids if str(animal_id) not in weighed_ids
+        ]
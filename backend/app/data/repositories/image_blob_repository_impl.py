@@ -0,0 +1,154 @@
+"""
+Image Blob Repository Implementation - Data Layer
+Implementación del conteo de referencias de imágenes usando Beanie ODM
+"""
+
+from datetime import datetime
+
+from pymongo import UpdateMany, UpdateOne
+
+from ...domain.entities.image_blob import CAS_DIRECTORY, ImageBlob
+from ...domain.repositories.image_blob_repository import ImageBlobRepository
+from ..models.animal_model import AnimalModel
+from ..models.image_blob_model import ImageBlobModel
+from ..models.weight_estimation_model import WeightEstimationModel
+
+# Operaciones por bulk_write
+BULK_CHUNK_SIZE = 1000
+
+
+def _normalize_path(path: str) -> str:
+    """Path relativo desde uploads/ tal como se sirve por /resources/images."""
+    return path.lstrip("/").removeprefix("uploads/")
+
+
+def _path_aliases(path: str) -> list[str]:
+    """Formas en que un path normalizado puede estar guardado (las de recount)."""
+    return [path, f"/{path}", f"uploads/{path}", f"/uploads/{path}"]
+
+
+class ImageBlobRepositoryImpl(ImageBlobRepository):
+    """
+    Implementación del repositorio de imágenes usando Beanie.
+
+    Single Responsibility: Mantener los contadores de referencias de
+    uploads/cas/ en MongoDB (colección image_blobs).
+    """
+
+    # Colección → campo que referencia imágenes
+    REFERENCE_FIELDS = (
+        (WeightEstimationModel, "frame_image_path"),
+        (AnimalModel, "photo_url"),
+    )
+
+    async def _adjust(self, path: str | None, delta: int) -> None:
+        """Suma `delta` referencias a la imagen del path (si es del almacenamiento)."""
+        digest = ImageBlob.digest_from_path(path)
+        if digest is None or path is None:
+            return
+
+        now = datetime.utcnow()
+        await ImageBlobModel.get_motor_collection().update_one(
+            {"_id": digest},
+            {
+                "$inc": {"ref_count": delta},
+                "$set": {"path": _normalize_path(path), "updated_at": now},
+                "$setOnInsert": {"created_at": now},
+            },
+            # Solo acquire crea el registro; un release sin registro no hace nada
+            upsert=delta > 0,
+        )
+
+    async def acquire(self, path: str | None) -> None:
+        """Suma una referencia a la imagen."""
+        await self._adjust(path, 1)
+
+    async def release(self, path: str | None) -> None:
+        """Resta una referencia a la imagen."""
+        await self._adjust(path, -1)
+
+    async def get_by_digests(self, digests: list[str]) -> dict[str, ImageBlob]:
+        """Obtiene las imágenes registradas por hash (una sola consulta)."""
+        if not digests:
+            return {}
+        models = await ImageBlobModel.find({"_id": {"$in": digests}}).to_list()
+        return {model.id: model.to_entity() for model in models}
+
+    async def find_referenced_paths(self, paths: list[str]) -> set[str]:
+        """Paths todavía referenciados por estimaciones o animales."""
+        if not paths:
+            return set()
+
+        # Las referencias pueden guardarse como "/uploads/cas/..." o "cas/...":
+        # buscar todas las formas y devolverlas normalizadas
+        aliases = [alias for path in paths for alias in _path_aliases(path)]
+        referenced: set[str] = set()
+        for model, field in self.REFERENCE_FIELDS:
+            values = await model.get_motor_collection().distinct(
+                field, {field: {"$in": aliases}}
+            )
+            referenced.update(_normalize_path(value) for value in values)
+        return referenced
+
+    async def recount(self) -> int:
+        """Recalcula los contadores con una agregación por colección."""
+        counts: dict[str, int] = {}
+        blob_paths: dict[str, str] = {}
+
+        for model, field in self.REFERENCE_FIELDS:
+            pipeline = [
+                {"$match": {field: {"$regex": f"^/?(uploads/)?{CAS_DIRECTORY}/"}}},
+                {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+            ]
+            cursor = model.get_motor_collection().aggregate(pipeline)
+            async for row in cursor:
+                digest = ImageBlob.digest_from_path(row["_id"])
+                if digest is None:
+                    continue
+                counts[digest] = counts.get(digest, 0) + row["count"]
+                blob_paths[digest] = _normalize_path(row["_id"])
+
+        now = datetime.utcnow()
+        collection = ImageBlobModel.get_motor_collection()
+        operations = [
+            UpdateOne(
+                {"_id": digest},
+                {
+                    "$set": {"ref_count": count, "path": blob_paths[digest]},
+                    "$setOnInsert": {"created_at": now, "updated_at": now},
+                },
+                upsert=True,
+            )
+            for digest, count in counts.items()
+        ]
+        for start in range(0, len(operations), BULK_CHUNK_SIZE):
+            await collection.bulk_write(
+                operations[start : start + BULK_CHUNK_SIZE], ordered=False
+            )
+
+        # Sin referencias: a cero (updated_at marca el inicio del período de gracia)
+        await collection.update_many(
+            {"_id": {"$nin": list(counts)}, "ref_count": {"$ne": 0}},
+            {"$set": {"ref_count": 0, "updated_at": now}},
+        )
+        return len(counts)
+
+    async def replace_paths(self, mapping: dict[str, str]) -> int:
+        """Reemplaza paths en estimaciones y animales con bulk_write."""
+        modified = 0
+        items = list(mapping.items())
+        for model, field in self.REFERENCE_FIELDS:
+            collection = model.get_motor_collection()
+            for start in range(0, len(items), BULK_CHUNK_SIZE):
+                operations = [
+                    UpdateMany({field: old_path}, {"$set": {field: new_path}})
+                    for old_path, new_path in items[start : start + BULK_CHUNK_SIZE]
+                ]
+                result = await collection.bulk_write(operations, ordered=False)
+                modified += result.modified_count
+        return modified
+
+    async def delete(self, digest: str) -> bool:
+        """Elimina el registro de una imagen."""
+        result = await ImageBlobModel.get_motor_collection().delete_one({"_id": digest})
+        return result.deleted_count > 0
@@ -3,13 +3,18 @@ Weight Estimation Repository Implementation - Data Layer
 Implementación del repositorio usando Beanie ODM
 """
 
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from ...domain.entities.weight_estimation import WeightEstimation
+from ...domain.repositories.image_blob_repository import ImageBlobRepository
 from ...domain.repositories.weight_estimation_repository import (
     WeightEstimationRepository,
 )
 from ..models.weight_estimation_model import WeightEstimationModel
+from .image_blob_repository_impl import ImageBlobRepositoryImpl
 
 
 class WeightEstimationRepositoryImpl(WeightEstimationRepository):
@@ -19,6 +24,15 @@ class WeightEstimationRepositoryImpl(WeightEstimationRepository):
     Single Responsibility: Persistencia de estimaciones en MongoDB.
     """
 
+    def __init__(self, image_blob_repository: ImageBlobRepository | None = None):
+        """
+        Inicializa el repositorio.
+
+        Args:
+            image_blob_repository: Contador de referencias del frame (opcional)
+        """
+        self.image_blob_repository = image_blob_repository or ImageBlobRepositoryImpl()
+
     async def find_by_id(self, estimation_id: UUID) -> WeightEstimation | None:
         """Busca una estimación por ID."""
         model = await WeightEstimationModel.get(estimation_id)
@@ -29,7 +43,9 @@ class WeightEstimationRepositoryImpl(WeightEstimationRepository):
     async def create(self, estimation: WeightEstimation) -> WeightEstimation:
         """Crea una nueva estimación."""
         model = self._to_model(estimation)
+        model.updated_at = datetime.utcnow()
         await model.insert()
+        await self.image_blob_repository.acquire(model.frame_image_path)
         return self._to_entity(model)
 
     async def update(self, estimation: WeightEstimation) -> WeightEstimation:
@@ -38,6 +54,8 @@ class WeightEstimationRepositoryImpl(WeightEstimationRepository):
         if model is None:
             raise ValueError(f"Estimación {estimation.id} no encontrada")
 
+        previous_frame_path = model.frame_image_path
+
         # Actualizar campos
         model.animal_id = estimation.animal_id
         model.breed = estimation.breed
@@ -46,14 +64,20 @@ class WeightEstimationRepositoryImpl(WeightEstimationRepository):
         model.method = estimation.method
         model.ml_model_version = estimation.ml_model_version
         model.processing_time_ms = estimation.processing_time_ms
+        model.stage_timings_ms = estimation.stage_timings_ms or None
         model.frame_image_path = estimation.frame_image_path
         model.latitude = estimation.latitude
         model.longitude = estimation.longitude
         model.timestamp = estimation.timestamp
         model.device_id = estimation.device_id
         model.synced_at = estimation.synced_at
+        # La sincronización reescribe campos sin tocar timestamp/created_at
+        model.updated_at = datetime.utcnow()
 
         await model.save()
+        if model.frame_image_path != previous_frame_path:
+            await self.image_blob_repository.acquire(model.frame_image_path)
+            await self.image_blob_repository.release(previous_frame_path)
         return self._to_entity(model)
 
     async def count(self) -> int:
@@ -161,8 +185,98 @@ class WeightEstimationRepositoryImpl(WeightEstimationRepository):
         if model is None:
             return False
         await model.delete()
+        await self.image_blob_repository.release(model.frame_image_path)
         return True
 
+    async def get_data_version(self, animal_id: str | None = None) -> dict[str, Any]:
+        """Huella de las estimaciones (una sola agregación)."""
+        query = (
+            WeightEstimationModel.find(WeightEstimationModel.animal_id == animal_id)
+            if animal_id
+            else WeightEstimationModel.find_all()
+        )
+        result = await query.aggregate(
+            [
+                {
+                    "$group": {
+                        "_id": None,
+                        "count": {"$sum": 1},
+                        "max_timestamp": {"$max": "$timestamp"},
+                        "max_created_at": {"$max": "$created_at"},
+                        "max_updated_at": {"$max": "$updated_at"},
+                    }
+                }
+            ]
+        ).to_list()
+
+        if not result:
+            return {
+                "count": 0,
+                "max_timestamp": None,
+                "max_created_at": None,
+                "max_updated_at": None,
+            }
+        return {
+            "count": result[0]["count"],
+            "max_timestamp": (
+                result[0]["max_timestamp"].isoformat()
+                if result[0].get("max_timestamp")
+                else None
+            ),
+            "max_created_at": (
+                result[0]["max_created_at"].isoformat()
+                if result[0].get("max_created_at")
+                else None
+            ),
+            "max_updated_at": (
+                result[0]["max_updated_at"].isoformat()
+                if result[0].get("max_updated_at")
+                else None
+            ),
+        }
+
+    async def iter_by_criteria(
+        self,
+        filters: dict,
+        animal_ids: list[str] | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[WeightEstimation]:
+        """
+        Recorre estimaciones con un cursor de Motor (memoria constante).
+
+        Args:
+            filters: Diccionario con criterios de filtrado (igualdad)
+            animal_ids: Restringir a estos animales (None para todos)
+            date_from: Timestamp mínimo (opcional)
+            date_to: Timestamp máximo (opcional)
+            batch_size: Documentos por lote del cursor
+
+        Yields:
+            WeightEstimation en orden cronológico
+        """
+        query: dict[str, Any] = {
+            key: value
+            for key, value in filters.items()
+            if value is not None and hasattr(WeightEstimationModel, key)
+        }
+        if animal_ids is not None:
+            query["animal_id"] = {"$in": animal_ids}
+        if date_from or date_to:
+            timestamp_range: dict[str, datetime] = {}
+            if date_from:
+                timestamp_range["$gte"] = date_from
+            if date_to:
+                timestamp_range["$lte"] = date_to
+            query["timestamp"] = timestamp_range
+
+        cursor = WeightEstimationModel.find(query, batch_size=batch_size).sort(
+            +WeightEstimationModel.timestamp
+        )
+        async for model in cursor:
+            yield self._to_entity(model)
+
     def _to_entity(self, model: WeightEstimationModel) -> WeightEstimation:
         """Convierte Model a Entity."""
         return WeightEstimation(
@@ -174,6 +288,7 @@ class WeightEstimationRepositoryImpl(WeightEstimationRepository):
             method=model.method,
             ml_model_version=model.ml_model_version,
             processing_time_ms=model.processing_time_ms,
+            stage_timings_ms=model.stage_timings_ms,
             frame_image_path=model.frame_image_path,
             latitude=model.latitude,
             longitude=model.longitude,
@@ -193,6 +308,7 @@ class WeightEstimationRepositoryImpl(WeightEstimationRepository):
             method=entity.method,
             ml_model_version=entity.ml_model_version,
             processing_time_ms=entity.processing_time_ms,
+            stage_timings_ms=entity.stage_timings_ms or None,
             frame_image_path=entity.frame_image_path,
             latitude=entity.latitude,
             longitude=entity.longitude,
@@ -6,6 +6,7 @@ Sin dependencias de frameworks o infraestructura
 from .alert import Alert, AlertStatus, AlertType, RecurrenceType
 from .animal import Animal
 from .farm import Farm
+from .image_blob import ImageBlob
 from .role import Role
 from .sync_result import SyncBatchResult, SyncItemResult, SyncItemStatus
 from .user import User
@@ -17,6 +18,7 @@ __all__ = [
     "AlertType",
     "Animal",
     "Farm",
+    "ImageBlob",
     "RecurrenceType",
     "Role",
     "SyncBatchResult",
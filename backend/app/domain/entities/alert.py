@@ -5,7 +5,7 @@ Entidad pura del dominio sin dependencias externas
 
 from datetime import datetime, timedelta
 from enum import Enum
-from uuid import UUID, uuid4
+from uuid import UUID, uuid4, uuid5
 
 
 class AlertType(str, Enum):
@@ -75,6 +75,7 @@ class Alert:
         sent_at: datetime | None = None,
         read_at: datetime | None = None,
         completed_at: datetime | None = None,
+        closed_at: datetime | None = None,
     ):
         """Inicializa entidad Alert."""
         self.id = id or uuid4()
@@ -100,6 +101,8 @@ class Alert:
         self.sent_at = sent_at
         self.read_at = read_at
         self.completed_at = completed_at
+        # Fecha de cierre (completada/cancelada): base del archivado
+        self.closed_at = closed_at
 
     def is_scheduled(self) -> bool:
         """
@@ -142,25 +145,51 @@ class Alert:
         """Marca el evento como completado."""
         self.status = AlertStatus.COMPLETED
         self.completed_at = datetime.utcnow()
+        self.closed_at = self.completed_at
 
     def cancel(self) -> None:
         """Cancela la alerta."""
         self.status = AlertStatus.CANCELLED
+        self.closed_at = datetime.utcnow()
 
-    def get_next_recurrence_date(self) -> datetime | None:
+    def change_status(self, status: AlertStatus | str) -> None:
+        """
+        Cambia el estado manteniendo la fecha de cierre.
+
+        closed_at se fija solo al pasar de abierta a cerrada (guardar de nuevo
+        una alerta cerrada no la mueve) y se limpia si se reabre.
+        """
+        status = status if isinstance(status, AlertStatus) else AlertStatus(status)
+        if status == self.status:
+            return
+        if status == AlertStatus.COMPLETED:
+            self.mark_as_completed()
+        elif status == AlertStatus.CANCELLED:
+            self.cancel()
+        else:
+            self.status = status
+            self.closed_at = None
+
+    def get_next_recurrence_date(
+        self, after: datetime | None = None
+    ) -> datetime | None:
         """
         Calcula la próxima fecha de recurrencia.
 
+        Args:
+            after: Fecha de referencia (por defecto, ahora). Las ocurrencias
+                anteriores o iguales se omiten.
+
         Returns:
             Próxima fecha o None si no hay recurrencia
         """
         if self.recurrence == RecurrenceType.NONE or not self.scheduled_at:
             return None
 
-        if self.recurrence_end and datetime.utcnow() >= self.recurrence_end:
+        now = after or datetime.utcnow()
+        if self.recurrence_end and now >= self.recurrence_end:
             return None
 
-        now = datetime.utcnow()
         next_date = self.scheduled_at
 
         # Calcular siguiente fecha según tipo de recurrencia
@@ -183,6 +212,42 @@ class Alert:
 
         return next_date
 
+    def next_occurrence(self, after: datetime | None = None) -> "Alert | None":
+        """
+        Crea la siguiente ocurrencia de una alerta recurrente.
+
+        Las recurrencias se materializan de a una: al enviarse una ocurrencia
+        se crea la siguiente. El ID es determinista (derivado del ID actual y
+        la fecha), de modo que materializarla dos veces no duplica la alerta.
+
+        Args:
+            after: Fecha de referencia (por defecto, ahora)
+
+        Returns:
+            Nueva alerta pendiente, o None si no hay más ocurrencias
+        """
+        next_date = self.get_next_recurrence_date(after)
+        if next_date is None:
+            return None
+
+        return Alert(
+            id=uuid5(self.id, next_date.isoformat()),
+            user_id=self.user_id,
+            farm_id=self.farm_id,
+            type=self.type,
+            title=self.title,
+            message=self.message,
+            status=AlertStatus.PENDING,
+            scheduled_at=next_date,
+            recurrence=self.recurrence,
+            recurrence_end=self.recurrence_end,
+            reminder_before_days=list(self.reminder_before_days),
+            related_entity_type=self.related_entity_type,
+            related_entity_id=self.related_entity_id,
+            filter_criteria=self.filter_criteria,
+            location=self.location,
+        )
+
     def update_timestamp(self) -> None:
         """Actualiza timestamp de last_updated."""
         # Nota: Alert no tiene last_updated, pero mantenemos consistencia con otras entidades
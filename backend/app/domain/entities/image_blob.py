@@ -0,0 +1,87 @@
+"""
+Image Blob Entity - Domain Layer
+Entidad pura del dominio sin dependencias externas
+"""
+
+import re
+from datetime import datetime
+
+# Directorio (relativo a uploads/) del almacenamiento direccionado por contenido
+CAS_DIRECTORY = "cas"
+
+# cas/ab/cd/<sha256>.<ext> (las variantes .w256.jpg no coinciden)
+_CAS_PATH_PATTERN = re.compile(
+    rf"(?:^|/){CAS_DIRECTORY}/[0-9a-f]{{2}}/[0-9a-f]{{2}}/([0-9a-f]{{64}})\.(?:jpg|png|webp)$"
+)
+
+
+class ImageBlob:
+    """
+    Entidad ImageBlob del dominio.
+
+    Single Responsibility: Representar una imagen almacenada una sola vez
+    por su contenido (SHA-256), compartida por todas las estimaciones y
+    animales que la referencian.
+    """
+
+    def __init__(
+        self,
+        digest: str,
+        path: str,
+        ref_count: int = 0,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ):
+        """Inicializa entidad ImageBlob."""
+        self.digest = digest
+        self.path = path
+        self.ref_count = ref_count
+        self.created_at = created_at or datetime.utcnow()
+        self.updated_at = updated_at or datetime.utcnow()
+
+    @staticmethod
+    def relative_path_for(digest: str, extension: str) -> str:
+        """
+        Path relativo (desde uploads/) de un contenido.
+
+        Los dos primeros niveles de directorio salen del hash, de modo que
+        ningún directorio supera 256 entradas de subdirectorios.
+
+        Args:
+            digest: SHA-256 hexadecimal del contenido
+            extension: Extensión con punto (".jpg", ".png", ".webp")
+
+        Returns:
+            Path relativo (ej: "cas/3f/a2/3fa2...e1.jpg")
+        """
+        return f"{CAS_DIRECTORY}/{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+
+    @staticmethod
+    def digest_from_path(path: str | None) -> str | None:
+        """
+        Extrae el hash de un path direccionado por contenido.
+
+        Args:
+            path: Path guardado en una estimación o animal
+
+        Returns:
+            SHA-256 del contenido, o None si el path no pertenece al almacenamiento
+        """
+        if not path:
+            return None
+        match = _CAS_PATH_PATTERN.search(path)
+        return match.group(1) if match else None
+
+    def is_orphan(self) -> bool:
+        """True si ninguna estimación ni animal referencia la imagen."""
+        return self.ref_count <= 0
+
+    def __eq__(self, other: object) -> bool:
+        """Compara dos imágenes por hash."""
+        if not isinstance(other, ImageBlob):
+            return False
+        return self.digest == other.digest
+
+    def __hash__(self) -> int:
+        """Hash basado en el hash del contenido."""
+        return hash(self.digest)
@@ -25,6 +25,7 @@ class WeightEstimation:
         method: str = "tflite",
         ml_model_version: str = "1.0.0",
         processing_time_ms: int = 0,
+        stage_timings_ms: dict[str, float] | None = None,
         frame_image_path: str = "",
         latitude: float | None = None,
         longitude: float | None = None,
@@ -41,6 +42,8 @@ class WeightEstimation:
         self.method = method
         self.ml_model_version = ml_model_version
         self.processing_time_ms = processing_time_ms
+        # Tiempos por etapa del pipeline ML (decode, preprocess, invoke, ...)
+        self.stage_timings_ms = stage_timings_ms or {}
         self.frame_image_path = frame_image_path
         self.latitude = latitude
         self.longitude = longitude
@@ -6,6 +6,7 @@ Interfaces (ABC) para repositorios del dominio
 from .alert_repository import AlertRepository
 from .animal_repository import AnimalRepository
 from .farm_repository import FarmRepository
+from .image_blob_repository import ImageBlobRepository
 from .role_repository import RoleRepository
 from .user_repository import UserRepository
 
@@ -13,6 +14,7 @@ __all__ = [
     "AlertRepository",
     "AnimalRepository",
     "FarmRepository",
+    "ImageBlobRepository",
     "RoleRepository",
     "UserRepository",
 ]
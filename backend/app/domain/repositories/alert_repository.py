@@ -176,3 +176,107 @@ class AlertRepository(ABC):
             Lista de Alert próximas
         """
         pass
+
+    @abstractmethod
+    async def find_due(self, until: datetime, limit: int) -> list[Alert]:
+        """
+        Busca alertas pendientes cuya fecha programada ya venció.
+
+        Usa el índice (status, scheduled_at): no recorre la colección.
+
+        Args:
+            until: Fecha límite (inclusive)
+            limit: Máximo de alertas (tamaño del lote)
+
+        Returns:
+            Lista de Alert ordenada por scheduled_at
+        """
+        pass
+
+    @abstractmethod
+    async def find_due_times(self, until: datetime, limit: int) -> list[datetime]:
+        """
+        Obtiene las fechas programadas de las próximas alertas pendientes.
+
+        Consulta cubierta por el índice (status, scheduled_at): solo lee el
+        índice, sin cargar documentos.
+
+        Args:
+            until: Fecha límite (inclusive)
+            limit: Máximo de fechas
+
+        Returns:
+            Fechas ordenadas de forma ascendente
+        """
+        pass
+
+    @abstractmethod
+    async def save_many(self, alerts: list[Alert]) -> int:
+        """
+        Inserta varias alertas nuevas en una sola operación.
+
+        Las alertas cuyo ID ya existe se omiten (inserción idempotente).
+
+        Args:
+            alerts: Alertas a insertar
+
+        Returns:
+            Número de alertas insertadas
+        """
+        pass
+
+    @abstractmethod
+    async def mark_sent(self, alert_ids: list[UUID], sent_at: datetime) -> int:
+        """
+        Marca como enviadas las alertas indicadas que sigan pendientes.
+
+        Args:
+            alert_ids: IDs de las alertas
+            sent_at: Fecha de envío
+
+        Returns:
+            Número de alertas actualizadas
+        """
+        pass
+
+    @abstractmethod
+    async def find_pending_related_ids(
+        self, type: str, related_entity_type: str, related_entity_ids: list[UUID]
+    ) -> set[UUID]:
+        """
+        Entidades que ya tienen una alerta pendiente del tipo indicado.
+
+        Args:
+            type: Tipo de alerta
+            related_entity_type: Tipo de entidad relacionada (ej: 'animal')
+            related_entity_ids: IDs de las entidades a verificar
+
+        Returns:
+            IDs de las entidades con alerta pendiente
+        """
+        pass
+
+    @abstractmethod
+    async def archive_closed(self, closed_before: datetime, limit: int) -> int:
+        """
+        Mueve alertas completadas/canceladas a la colección de archivo.
+
+        Args:
+            closed_before: Solo alertas cerradas antes de esta fecha
+            limit: Máximo de alertas por lote
+
+        Returns:
+            Número de alertas archivadas
+        """
+        pass
+
+    @abstractmethod
+    async def ensure_archive_indexes(self, retention_days: int) -> None:
+        """
+        Crea el índice TTL de la colección de archivo.
+
+        Args:
+            retention_days: Días que se conservan las alertas archivadas
+                (0 = sin expiración)
+        """
+        pass
@@ -4,6 +4,9 @@ Contrato para persistencia de animales (Dependency Inversion)
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from ..entities.animal import Animal
@@ -202,3 +205,73 @@ class AnimalRepository(ABC):
             Lista de Animal que son hijos del animal especificado
         """
         pass
+
+    @abstractmethod
+    async def get_data_version(self, farm_id: UUID) -> dict[str, Any]:
+        """
+        Obtiene una huella barata del estado de los animales de una hacienda.
+
+        Cambia cuando se crea, elimina o modifica un animal de la hacienda.
+        Se usa para invalidar reportes cacheados.
+
+        Args:
+            farm_id: ID de la hacienda
+
+        Returns:
+            Dict con count, max_last_updated y max_updated_at (ISO string o None)
+        """
+        pass
+
+    @abstractmethod
+    def iter_by_farms(
+        self,
+        farm_ids: list[UUID],
+        breed: str | None = None,
+        status: str | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Animal]:
+        """
+        Recorre los animales de una o varias haciendas con un cursor.
+
+        No carga la colección completa en memoria (exportaciones masivas).
+
+        Args:
+            farm_ids: IDs de las haciendas
+            breed: Filtro por raza (opcional)
+            status: Filtro por estado (opcional)
+            batch_size: Documentos por lote del cursor de MongoDB
+
+        Yields:
+            Animal ordenados por hacienda y caravana
+        """
+        pass
+
+    @abstractmethod
+    async def find_ids_by_rule(
+        self,
+        farm_id: UUID,
+        breed: str | None = None,
+        age_category: str | None = None,
+        gender: str | None = None,
+        status: str | None = "active",
+        not_weighed_since: datetime | None = None,
+    ) -> list[UUID]:
+        """
+        Obtiene los IDs de los animales que cumplen una regla de hato.
+
+        Todos los criterios se resuelven en MongoDB (la categoría de edad se
+        traduce a un rango de fechas de nacimiento): no se cargan animales.
+
+        Args:
+            farm_id: ID de la hacienda
+            breed: Raza (opcional)
+            age_category: Categoría de edad (opcional)
+            gender: Género (opcional)
+            status: Estado (por defecto, solo activos)
+            not_weighed_since: Solo animales sin pesaje desde esta fecha
+                (incluye los nunca pesados)
+
+        Returns:
+            IDs de los animales
+        """
+        pass
@@ -0,0 +1,100 @@
+"""
+Image Blob Repository Interface - Domain Layer
+Contrato para el conteo de referencias de imágenes (Dependency Inversion)
+"""
+
+from abc import ABC, abstractmethod
+
+from ..entities.image_blob import ImageBlob
+
+
+class ImageBlobRepository(ABC):
+    """
+    Interfaz para repositorio de imágenes direccionadas por contenido.
+
+    Dependency Inversion: Domain define el contrato, Data lo implementa.
+    Los repositorios de estimaciones y animales llaman a acquire/release al
+    crear, modificar o eliminar referencias a una imagen.
+    """
+
+    @abstractmethod
+    async def acquire(self, path: str | None) -> None:
+        """
+        Suma una referencia a la imagen (si el path es del almacenamiento).
+
+        Args:
+            path: Path guardado en la estimación o animal
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, path: str | None) -> None:
+        """
+        Resta una referencia a la imagen (si el path es del almacenamiento).
+
+        Args:
+            path: Path que la estimación o animal dejó de usar
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_digests(self, digests: list[str]) -> dict[str, ImageBlob]:
+        """
+        Obtiene las imágenes registradas por hash.
+
+        Args:
+            digests: Hashes SHA-256
+
+        Returns:
+            Dict hash → ImageBlob (los hashes sin registro no aparecen)
+        """
+        pass
+
+    @abstractmethod
+    async def find_referenced_paths(self, paths: list[str]) -> set[str]:
+        """
+        Verifica contra estimaciones y animales qué paths siguen en uso.
+
+        Args:
+            paths: Paths relativos a verificar
+
+        Returns:
+            Subconjunto de paths referenciados por al menos un documento
+        """
+        pass
+
+    @abstractmethod
+    async def recount(self) -> int:
+        """
+        Recalcula todos los contadores a partir de las referencias reales.
+
+        Returns:
+            Número de imágenes con al menos una referencia
+        """
+        pass
+
+    @abstractmethod
+    async def replace_paths(self, mapping: dict[str, str]) -> int:
+        """
+        Reemplaza paths antiguos por paths del almacenamiento (migración).
+
+        Args:
+            mapping: Path antiguo → path nuevo
+
+        Returns:
+            Documentos actualizados (estimaciones + animales)
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, digest: str) -> bool:
+        """
+        Elimina el registro de una imagen.
+
+        Args:
+            digest: Hash SHA-256
+
+        Returns:
+            True si existía
+        """
+        pass
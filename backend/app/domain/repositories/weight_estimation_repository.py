@@ -4,6 +4,9 @@ Interfaz para repositorio de estimaciones de peso
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from ..entities.weight_estimation import WeightEstimation
@@ -148,3 +151,46 @@ class WeightEstimationRepository(ABC):
             True si se eliminó exitosamente, False si no se encontró
         """
         pass
+
+    @abstractmethod
+    async def get_data_version(self, animal_id: str | None = None) -> dict[str, Any]:
+        """
+        Obtiene una huella barata del estado de las estimaciones.
+
+        Cambia cuando se crea, elimina o actualiza una estimación.
+        Se usa para invalidar reportes cacheados.
+
+        Args:
+            animal_id: ID del animal (None para todas las estimaciones)
+
+        Returns:
+            Dict con count, max_timestamp, max_created_at y max_updated_at
+            (ISO string o None)
+        """
+        pass
+
+    @abstractmethod
+    def iter_by_criteria(
+        self,
+        filters: dict,
+        animal_ids: list[str] | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[WeightEstimation]:
+        """
+        Recorre estimaciones con un cursor, sin cargarlas todas en memoria.
+
+        Pensado para exportaciones masivas (streaming).
+
+        Args:
+            filters: Diccionario con criterios de filtrado (igualdad)
+            animal_ids: Restringir a estos animales (None para todos)
+            date_from: Timestamp mínimo (opcional)
+            date_to: Timestamp máximo (opcional)
+            batch_size: Documentos por lote del cursor de MongoDB
+
+        Yields:
+            WeightEstimation en orden cronológico
+        """
+        pass
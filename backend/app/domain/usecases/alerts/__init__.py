@@ -5,6 +5,7 @@ Casos de uso para gestión de alertas y cronograma
 
 from .create_alert_usecase import CreateAlertUseCase
 from .delete_alert_usecase import DeleteAlertUseCase
+from .generate_herd_alerts_usecase import GenerateHerdAlertsUseCase
 from .get_alert_by_id_usecase import GetAlertByIdUseCase
 from .get_pending_alerts_usecase import GetPendingAlertsUseCase
 from .get_scheduled_alerts_usecase import GetScheduledAlertsUseCase
@@ -17,6 +18,7 @@ from .update_alert_usecase import UpdateAlertUseCase
 
 __all__ = [
     "CreateAlertUseCase",
+    "GenerateHerdAlertsUseCase",
     "GetAlertByIdUseCase",
     "ListAlertsUseCase",
     "UpdateAlertUseCase",
@@ -7,6 +7,7 @@ from datetime import datetime
 from uuid import UUID
 
 from ....core.exceptions import NotFoundException, ValidationException
+from ....core.utils.alert_scheduler import AlertScheduler
 from ...entities.alert import Alert
 from ...repositories.alert_repository import AlertRepository
 from ...repositories.user_repository import UserRepository
@@ -24,6 +25,7 @@ class CreateAlertUseCase:
         self,
         alert_repository: AlertRepository,
         user_repository: UserRepository,
+        alert_scheduler: AlertScheduler,
     ):
         """
         Inicializa el caso de uso.
@@ -31,9 +33,11 @@ class CreateAlertUseCase:
         Args:
             alert_repository: Repositorio de alertas (inyección de dependencia)
             user_repository: Repositorio de usuarios (inyección de dependencia)
+            alert_scheduler: Scheduler de alertas programadas (se notifica)
         """
         self._alert_repository = alert_repository
         self._user_repository = user_repository
+        self._alert_scheduler = alert_scheduler
 
     async def execute(
         self,
@@ -103,7 +107,9 @@ class CreateAlertUseCase:
         )
 
         # Guardar usando el repositorio
-        return await self._alert_repository.save(alert)
+        saved = await self._alert_repository.save(alert)
+        self._alert_scheduler.notify(saved)
+        return saved
 
     def _validate_filter_criteria(self, criteria: dict) -> None:
         """
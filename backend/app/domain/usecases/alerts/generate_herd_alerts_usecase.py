@@ -0,0 +1,145 @@
+"""
+Generate Herd Alerts Use Case - Domain Layer
+Caso de uso para generar alertas masivas a partir de una regla de hato
+"""
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from ....core.exceptions import NotFoundException
+from ....core.utils.alert_scheduler import AlertScheduler
+from ...entities.alert import Alert
+from ...repositories.alert_repository import AlertRepository
+from ...repositories.animal_repository import AnimalRepository
+from ...repositories.user_repository import UserRepository
+
+# Tipo de entidad relacionada de las alertas por animal
+ANIMAL_ENTITY_TYPE = "animal"
+
+
+class GenerateHerdAlertsUseCase:
+    """
+    Caso de uso para generar alertas por animal desde una regla de hato.
+
+    Single Responsibility: Crear una alerta por cada animal que cumple la
+    regla (campañas de vacunación, pesajes programados) con un número fijo
+    de consultas, independiente del tamaño del hato:
+    1. IDs de los animales que cumplen la regla
+    2. Animales que ya tienen una alerta pendiente del mismo tipo
+    3. Inserción masiva de las alertas nuevas
+    """
+
+    def __init__(
+        self,
+        alert_repository: AlertRepository,
+        animal_repository: AnimalRepository,
+        user_repository: UserRepository,
+        alert_scheduler: AlertScheduler,
+    ):
+        """
+        Inicializa el caso de uso.
+
+        Args:
+            alert_repository: Repositorio de alertas (inyección de dependencia)
+            animal_repository: Repositorio de animales (inyección de dependencia)
+            user_repository: Repositorio de usuarios (inyección de dependencia)
+            alert_scheduler: Scheduler de alertas programadas (se notifica)
+        """
+        self._alert_repository = alert_repository
+        self._animal_repository = animal_repository
+        self._user_repository = user_repository
+        self._alert_scheduler = alert_scheduler
+
+    async def execute(
+        self,
+        user_id: UUID,
+        farm_id: UUID,
+        type: str,
+        title: str,
+        message: str,
+        scheduled_at: datetime,
+        recurrence: str = "none",
+        recurrence_end: datetime | None = None,
+        reminder_before_days: list[int] | None = None,
+        breed: str | None = None,
+        age_category: str | None = None,
+        gender: str | None = None,
+        last_weighed_before_days: int | None = None,
+    ) -> dict:
+        """
+        Ejecuta el caso de uso para generar alertas de hato.
+
+        Args:
+            user_id: ID del usuario
+            farm_id: ID de la finca
+            type: Tipo de alerta
+            title: Título de las alertas
+            message: Mensaje de las alertas
+            scheduled_at: Fecha/hora programada
+            recurrence: Tipo de recurrencia
+            recurrence_end: Fecha de fin de recurrencia (opcional)
+            reminder_before_days: Días antes para recordatorios (opcional)
+            breed: Raza (opcional)
+            age_category: Categoría de edad (opcional)
+            gender: Género (opcional)
+            last_weighed_before_days: Solo animales sin pesaje en los últimos
+                N días (opcional)
+
+        Returns:
+            Dict con matched, already_pending y created
+
+        Raises:
+            NotFoundException: Si el usuario no existe
+        """
+        user = await self._user_repository.get_by_id(user_id)
+        if user is None:
+            raise NotFoundException(resource="User", field="id", value=str(user_id))
+
+        not_weighed_since = None
+        if last_weighed_before_days is not None:
+            not_weighed_since = datetime.utcnow() - timedelta(
+                days=last_weighed_before_days
+            )
+
+        animal_ids = await self._animal_repository.find_ids_by_rule(
+            farm_id=farm_id,
+            breed=breed,
+            age_category=age_category,
+            gender=gender,
+            not_weighed_since=not_weighed_since,
+        )
+
+        already_pending = await self._alert_repository.find_pending_related_ids(
+            type=type,
+            related_entity_type=ANIMAL_ENTITY_TYPE,
+            related_entity_ids=animal_ids,
+        )
+
+        alerts = [
+            Alert(
+                user_id=user_id,
+                farm_id=farm_id,
+                type=type,
+                title=title,
+                message=message,
+                scheduled_at=scheduled_at,
+                recurrence=recurrence,
+                recurrence_end=recurrence_end,
+                reminder_before_days=reminder_before_days or [],
+                related_entity_type=ANIMAL_ENTITY_TYPE,
+                related_entity_id=animal_id,
+            )
+            for animal_id in animal_ids
+            if animal_id not in already_pending
+        ]
+
+        created = await self._alert_repository.save_many(alerts)
+        if alerts:
+            # Todas vencen a la vez: basta una notificación
+            self._alert_scheduler.notify(alerts[0])
+
+        return {
+            "matched": len(animal_ids),
+            "already_pending": len(already_pending),
+            "created": created,
+        }
@@ -7,6 +7,7 @@ from datetime import datetime
 from uuid import UUID
 
 from ....core.exceptions import NotFoundException
+from ....core.utils.alert_scheduler import AlertScheduler
 from ...entities.alert import Alert
 from ...repositories.alert_repository import AlertRepository
 
@@ -18,14 +19,18 @@ class UpdateAlertUseCase:
     Single Responsibility: Actualizar una alerta existente.
     """
 
-    def __init__(self, alert_repository: AlertRepository):
+    def __init__(
+        self, alert_repository: AlertRepository, alert_scheduler: AlertScheduler
+    ):
         """
         Inicializa el caso de uso.
 
         Args:
             alert_repository: Repositorio de alertas (inyección de dependencia)
+            alert_scheduler: Scheduler de alertas programadas (se notifica)
         """
         self._alert_repository = alert_repository
+        self._alert_scheduler = alert_scheduler
 
     async def execute(
         self,
@@ -69,7 +74,7 @@ class UpdateAlertUseCase:
         if message is not None:
             alert.message = message
         if status is not None:
-            alert.status = status
+            alert.change_status(status)
         if scheduled_at is not None:
             alert.scheduled_at = scheduled_at
         if recurrence is not None:
@@ -81,4 +86,6 @@ class UpdateAlertUseCase:
         if location is not None:
             alert.location = location
 
-        return await self._alert_repository.save(alert)
+        saved = await self._alert_repository.save(alert)
+        self._alert_scheduler.notify(saved)
+        return saved
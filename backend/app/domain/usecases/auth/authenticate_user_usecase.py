@@ -3,7 +3,7 @@ Authenticate User Use Case - Domain Layer
 Caso de uso para autenticar un usuario
 """
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 from ....core.exceptions import AuthenticationException, NotFoundException
 from ...entities.role import Role
@@ -23,7 +23,7 @@ class AuthenticateUserUseCase:
         self,
         user_repository: UserRepository,
         role_repository: RoleRepository,
-        password_verifier: Callable[[str, str], bool],
+        password_verifier: Callable[[str, str], Awaitable[bool]],
     ):
         """
         Inicializa el caso de uso.
@@ -31,7 +31,7 @@ class AuthenticateUserUseCase:
         Args:
             user_repository: Repositorio de usuarios
             role_repository: Repositorio de roles
-            password_verifier: Función para verificar contraseña (verify_password)
+            password_verifier: Corrutina que verifica la contraseña (verify_password_async)
         """
         self._user_repository = user_repository
         self._role_repository = role_repository
@@ -62,7 +62,7 @@ class AuthenticateUserUseCase:
             raise AuthenticationException("Usuario o contraseña incorrectos")
 
         # Verificar contraseña
-        if not self._password_verifier(password, user.hashed_password):
+        if not await self._password_verifier(password, user.hashed_password):
             raise AuthenticationException("Usuario o contraseña incorrectos")
 
         # Verificar que el usuario esté activo
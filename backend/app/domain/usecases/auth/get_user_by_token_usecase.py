@@ -6,6 +6,7 @@ Caso de uso para obtener usuario desde token JWT
 from uuid import UUID
 
 from ....core.exceptions import AuthenticationException, NotFoundException
+from ....core.utils.principal_cache import PrincipalCache
 from ...entities.user import User
 from ...repositories.user_repository import UserRepository
 
@@ -15,16 +16,23 @@ class GetUserByTokenUseCase:
     Caso de uso para obtener un usuario desde token JWT decodificado.
 
     Single Responsibility: Obtener usuario desde datos del token.
+    Consulta primero la caché de principals para no ir a MongoDB en cada request.
     """
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        principal_cache: PrincipalCache,
+    ):
         """
         Inicializa el caso de uso.
 
         Args:
             user_repository: Repositorio de usuarios
+            principal_cache: Caché de usuarios autenticados
         """
         self._user_repository = user_repository
+        self._principal_cache = principal_cache
 
     async def execute(self, user_id: UUID) -> User:
         """
@@ -40,6 +48,11 @@ class GetUserByTokenUseCase:
             NotFoundException: Si el usuario no existe
             AuthenticationException: Si el usuario está inactivo
         """
+        # Usuario activo cacheado
+        cached = self._principal_cache.get(user_id)
+        if cached is not None:
+            return cached
+
         # Buscar usuario
         user = await self._user_repository.get_by_id(user_id)
         if user is None:
@@ -49,4 +62,5 @@ class GetUserByTokenUseCase:
         if not user.is_active:
             raise AuthenticationException("Usuario inactivo")
 
+        self._principal_cache.put(user)
         return user
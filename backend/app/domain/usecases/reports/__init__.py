@@ -3,6 +3,8 @@ Reports Use Cases - Domain Layer
 Casos de uso para generación de reportes
 """
 
+from .export_inventory_usecase import ExportInventoryUseCase
+from .export_weighings_usecase import ExportWeighingsUseCase
 from .generate_growth_report_usecase import GenerateGrowthReportUseCase
 from .generate_inventory_report_usecase import GenerateInventoryReportUseCase
 from .generate_movements_report_usecase import GenerateMovementsReportUseCase
@@ -13,4 +15,6 @@ __all__ = [
     "GenerateInventoryReportUseCase",
     "GenerateMovementsReportUseCase",
     "GenerateGrowthReportUseCase",
+    "ExportInventoryUseCase",
+    "ExportWeighingsUseCase",
 ]
@@ -0,0 +1,74 @@
+"""
+Export Inventory Use Case
+Caso de uso para exportar el inventario completo de varias haciendas
+"""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from ...repositories.animal_repository import AnimalRepository
+
+
+class ExportInventoryUseCase:
+    """
+    Caso de uso para exportación masiva del inventario (una fila por animal).
+
+    Single Responsibility: Recorrer los animales con un cursor y producir
+    filas planas, sin cargar la colección en memoria.
+    """
+
+    def __init__(self, animal_repository: AnimalRepository, batch_size: int = 1000):
+        """
+        Inicializa el caso de uso.
+
+        Args:
+            animal_repository: Repositorio de animales
+            batch_size: Documentos por lote del cursor de MongoDB
+        """
+        self.animal_repository = animal_repository
+        self.batch_size = batch_size
+
+    async def execute(
+        self,
+        farm_ids: list[UUID],
+        status: str | None = None,
+        breed: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Ejecuta el caso de uso.
+
+        Args:
+            farm_ids: IDs de las haciendas a exportar
+            status: Filtro por estado (opcional)
+            breed: Filtro por raza (opcional)
+            date_from: Fecha desde para filtrar por registro (opcional)
+            date_to: Fecha hasta para filtrar por registro (opcional)
+
+        Yields:
+            Dict por animal con sus datos de inventario
+        """
+        async for animal in self.animal_repository.iter_by_farms(
+            farm_ids, breed=breed, status=status, batch_size=self.batch_size
+        ):
+            if date_from and animal.registration_date < date_from:
+                continue
+            if date_to and animal.registration_date > date_to:
+                continue
+
+            yield {
+                "farm_id": str(animal.farm_id),
+                "ear_tag": animal.ear_tag,
+                "name": animal.name,
+                "breed": animal.breed,
+                "gender": animal.gender,
+                "birth_date": animal.birth_date,
+                "age_months": animal.calculate_age_months(),
+                "age_category": animal.calculate_age_category().value,
+                "color": animal.color,
+                "status": animal.status,
+                "registration_date": animal.registration_date,
+            }
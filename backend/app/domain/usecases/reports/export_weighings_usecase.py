@@ -0,0 +1,95 @@
+"""
+Export Weighings Use Case
+Caso de uso para exportar todas las estimaciones de peso de varias haciendas
+"""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from ...repositories.animal_repository import AnimalRepository
+from ...repositories.weight_estimation_repository import WeightEstimationRepository
+
+
+class ExportWeighingsUseCase:
+    """
+    Caso de uso para exportación masiva de estimaciones de peso.
+
+    Single Responsibility: Recorrer las estimaciones con un cursor y producir
+    filas planas, sin cargar la colección en memoria.
+    """
+
+    def __init__(
+        self,
+        animal_repository: AnimalRepository,
+        weight_estimation_repository: WeightEstimationRepository,
+        batch_size: int = 1000,
+    ):
+        """
+        Inicializa el caso de uso.
+
+        Args:
+            animal_repository: Repositorio de animales
+            weight_estimation_repository: Repositorio de estimaciones de peso
+            batch_size: Documentos por lote de los cursores de MongoDB
+        """
+        self.animal_repository = animal_repository
+        self.weight_estimation_repository = weight_estimation_repository
+        self.batch_size = batch_size
+
+    async def execute(
+        self,
+        farm_ids: list[UUID],
+        breed: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Ejecuta el caso de uso.
+
+        Las estimaciones no guardan farm_id: primero se recorren los animales
+        de las haciendas (solo se retienen ID → caravana/hacienda) y luego las
+        estimaciones de esos animales con un segundo cursor.
+
+        Args:
+            farm_ids: IDs de las haciendas a exportar
+            breed: Filtro por raza (opcional)
+            date_from: Fecha desde (opcional)
+            date_to: Fecha hasta (opcional)
+
+        Yields:
+            Dict por estimación con datos del animal y de la estimación
+        """
+        animals: dict[str, tuple[str, str]] = {}
+        async for animal in self.animal_repository.iter_by_farms(
+            farm_ids, breed=breed, batch_size=self.batch_size
+        ):
+            animals[str(animal.id)] = (animal.ear_tag, str(animal.farm_id))
+
+        if not animals:
+            return
+
+        async for estimation in self.weight_estimation_repository.iter_by_criteria(
+            {"breed": breed},
+            animal_ids=list(animals),
+            date_from=date_from,
+            date_to=date_to,
+            batch_size=self.batch_size,
+        ):
+            ear_tag, farm_id = animals.get(estimation.animal_id or "", ("", ""))
+            yield {
+                "farm_id": farm_id,
+                "ear_tag": ear_tag,
+                "animal_id": estimation.animal_id,
+                "breed": estimation.breed,
+                "estimated_weight_kg": estimation.estimated_weight_kg,
+                "confidence": estimation.confidence,
+                "method": estimation.method,
+                "ml_model_version": estimation.ml_model_version,
+                "processing_time_ms": estimation.processing_time_ms,
+                "timestamp": estimation.timestamp,
+                "latitude": estimation.latitude,
+                "longitude": estimation.longitude,
+                "device_id": estimation.device_id,
+            }
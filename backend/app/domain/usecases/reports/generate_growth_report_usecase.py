@@ -5,6 +5,7 @@ Caso de uso para generar reporte de crecimiento (GDP, evolución de peso)
 
 from uuid import UUID
 
+from ....core.exceptions import NotFoundException
 from ...repositories.animal_repository import AnimalRepository
 from ...repositories.weight_estimation_repository import WeightEstimationRepository
 
@@ -31,6 +32,52 @@ class GenerateGrowthReportUseCase:
         self.animal_repository = animal_repository
         self.weight_estimation_repository = weight_estimation_repository
 
+    async def get_data_version(
+        self,
+        animal_id: UUID | None = None,
+        farm_id: UUID | None = None,
+    ) -> dict:
+        """
+        Obtiene la huella de los datos que alimentan el reporte.
+
+        Las estimaciones no guardan farm_id, por lo que el reporte grupal usa
+        la huella global de estimaciones (invalidación conservadora).
+
+        Args:
+            animal_id: ID del animal (reporte individual)
+            farm_id: ID de la finca (reporte grupal)
+
+        Returns:
+            Dict con huellas de animales y estimaciones
+
+        Raises:
+            NotFoundException: Si se especifica animal_id y no existe
+        """
+        if animal_id:
+            animal = await self.animal_repository.get_by_id(animal_id)
+            if animal is None:
+                raise NotFoundException(
+                    resource="Animal", field="id", value=str(animal_id)
+                )
+            return {
+                "animal": animal.last_updated.isoformat(),
+                "weight_estimations": (
+                    await self.weight_estimation_repository.get_data_version(
+                        str(animal_id)
+                    )
+                ),
+            }
+
+        if farm_id is None:
+            raise ValueError("Debe especificar animal_id o farm_id")
+
+        return {
+            "animals": await self.animal_repository.get_data_version(farm_id),
+            "weight_estimations": (
+                await self.weight_estimation_repository.get_data_version()
+            ),
+        }
+
     async def execute(
         self,
         animal_id: UUID | None = None,
@@ -25,6 +25,18 @@ class GenerateMovementsReportUseCase:
         """
         self.animal_repository = animal_repository
 
+    async def get_data_version(self, farm_id: UUID) -> dict:
+        """
+        Obtiene la huella de los animales de la finca que alimentan el reporte.
+
+        Args:
+            farm_id: ID de la finca
+
+        Returns:
+            Dict con huella de animales
+        """
+        return {"animals": await self.animal_repository.get_data_version(farm_id)}
+
     async def execute(
         self,
         farm_id: UUID,
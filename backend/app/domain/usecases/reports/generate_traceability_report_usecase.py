@@ -37,6 +37,36 @@ class GenerateTraceabilityReportUseCase:
             animal_repository, weight_estimation_repository
         )
 
+    async def get_data_version(self, animal_id: UUID) -> dict:
+        """
+        Obtiene la huella de los datos que alimentan el reporte.
+
+        Cubre el animal, su linaje (animales de la hacienda) y sus estimaciones.
+
+        Args:
+            animal_id: ID del animal
+
+        Returns:
+            Dict con huellas de animales y estimaciones
+
+        Raises:
+            NotFoundException: Si el animal no existe
+        """
+        animal = await self.animal_repository.get_by_id(animal_id)
+        if animal is None:
+            raise NotFoundException(resource="Animal", field="id", value=str(animal_id))
+
+        return {
+            "animals": (
+                await self.animal_repository.get_data_version(animal.farm_id)
+                if animal.farm_id
+                else {"last_updated": animal.last_updated.isoformat()}
+            ),
+            "weight_estimations": (
+                await self.weight_estimation_repository.get_data_version(str(animal_id))
+            ),
+        }
+
     async def execute(self, animal_id: UUID, format: str = "pdf") -> dict:
         """
         Ejecuta el caso de uso.
@@ -6,6 +6,7 @@ Caso de uso para eliminar un rol
 from uuid import UUID
 
 from ....core.exceptions import NotFoundException
+from ....core.utils.principal_cache import PrincipalCache
 from ...repositories.role_repository import RoleRepository
 
 
@@ -16,14 +17,20 @@ class DeleteRoleUseCase:
     Single Responsibility: Eliminar un rol del dominio.
     """
 
-    def __init__(self, role_repository: RoleRepository):
+    def __init__(
+        self,
+        role_repository: RoleRepository,
+        principal_cache: PrincipalCache,
+    ):
         """
         Inicializa el caso de uso.
 
         Args:
             role_repository: Repositorio de roles
+            principal_cache: Caché de usuarios autenticados (se invalida)
         """
         self._role_repository = role_repository
+        self._principal_cache = principal_cache
 
     async def execute(self, role_id: UUID) -> None:
         """
@@ -42,3 +49,4 @@ class DeleteRoleUseCase:
 
         # Eliminar
         await self._role_repository.delete(role_id)
+        self._principal_cache.invalidate_role(role_id)
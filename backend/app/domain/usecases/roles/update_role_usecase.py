@@ -6,6 +6,7 @@ Caso de uso para actualizar un rol
 from uuid import UUID
 
 from ....core.exceptions import AlreadyExistsException, NotFoundException
+from ....core.utils.principal_cache import PrincipalCache
 from ...entities.role import Role
 from ...repositories.role_repository import RoleRepository
 
@@ -17,14 +18,20 @@ class UpdateRoleUseCase:
     Single Responsibility: Validar y actualizar un rol en el dominio.
     """
 
-    def __init__(self, role_repository: RoleRepository):
+    def __init__(
+        self,
+        role_repository: RoleRepository,
+        principal_cache: PrincipalCache,
+    ):
         """
         Inicializa el caso de uso.
 
         Args:
             role_repository: Repositorio de roles
+            principal_cache: Caché de usuarios autenticados (se invalida)
         """
         self._role_repository = role_repository
+        self._principal_cache = principal_cache
 
     async def execute(
         self,
@@ -75,4 +82,8 @@ class UpdateRoleUseCase:
         role.update_timestamp()
 
         # Guardar cambios
-        return await self._role_repository.save(role)
+        saved = await self._role_repository.save(role)
+
+        # Los usuarios cacheados con este rol deben recargarse
+        self._principal_cache.invalidate_role(role_id)
+        return saved
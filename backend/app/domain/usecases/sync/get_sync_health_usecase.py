@@ -3,48 +3,52 @@ Get Sync Health Use Case - Domain Layer
 Caso de uso para verificar salud del servicio de sincronización
 """
 
+from collections.abc import Awaitable, Callable
 from datetime import datetime
+from typing import Any
 
-from ...repositories.animal_repository import AnimalRepository
+from ....core.config import settings
+from ....core.utils.sync_metrics import SyncMetricsRegistry
 
 
 class GetSyncHealthUseCase:
     """
     Caso de uso para verificar salud del servicio de sincronización.
 
-    Single Responsibility: Verificar conectividad y estado de la base de datos.
+    Single Responsibility: Reportar conectividad y carga del servicio de sync.
+    Usa el registro de métricas en memoria y un ping cacheado, sin escanear
+    colecciones en cada probe.
     """
 
-    def __init__(self, animal_repository: AnimalRepository):
+    def __init__(
+        self,
+        metrics: SyncMetricsRegistry,
+        database_ping: Callable[[], Awaitable[float]],
+    ):
         """
         Inicializa el caso de uso.
 
         Args:
-            animal_repository: Repositorio de animales (para verificar conexión)
+            metrics: Registro en memoria de métricas de sincronización
+            database_ping: Corrutina que hace ping a MongoDB (retorna latencia en ms)
         """
-        self._animal_repository = animal_repository
+        self._metrics = metrics
+        self._database_ping = database_ping
 
-    async def execute(self) -> dict[str, str]:
+    async def execute(self) -> dict[str, Any]:
         """
         Ejecuta la verificación de salud.
 
         Returns:
-            Dict con status y database
+            Dict con status, database, latencia de MongoDB y métricas de sync
         """
-        try:
-            # Verificar MongoDB connection contando documentos
-            # El método count() está definido en AnimalRepository (interfaz ABC)
-            await self._animal_repository.count()
-            return {
-                "status": "online",
-                "database": "connected",
-                "timestamp": datetime.utcnow().isoformat(),
-                "version": "1.0.0",
-            }
-        except Exception as e:
-            return {
-                "status": "error",
-                "database": f"error: {str(e)}",
-                "timestamp": datetime.utcnow().isoformat(),
-                "version": "1.0.0",
-            }
+        latency_ms, error = await self._metrics.ping_database(self._database_ping)
+
+        return {
+            "status": "online" if error is None else "error",
+            "database": "connected" if error is None else f"error: {error}",
+            "database_latency_ms": latency_ms,
+            "timestamp": datetime.utcnow().isoformat(),
+            "version": settings.APP_VERSION,
+            "metrics": self._metrics.snapshot(),
+        }
@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from ....core.utils.sync_metrics import SyncMetricsRegistry
 from ...entities.animal import Animal
 from ...entities.sync_result import SyncBatchResult, SyncItemResult, SyncItemStatus
 from ...repositories.animal_repository import AnimalRepository
@@ -19,19 +20,26 @@ class SyncCattleBatchUseCase:
     Single Responsibility: Sincronizar animales con estrategia last-write-wins.
     """
 
-    def __init__(self, animal_repository: AnimalRepository):
+    def __init__(
+        self,
+        animal_repository: AnimalRepository,
+        metrics: SyncMetricsRegistry,
+    ):
         """
         Inicializa el caso de uso.
 
         Args:
             animal_repository: Repositorio de animales (inyección de dependencia)
+            metrics: Registro de métricas de sincronización
         """
         self._animal_repository = animal_repository
+        self._metrics = metrics
 
     async def execute(
         self,
         items: list[dict[str, Any]],
         device_id: str,
+        pending_count: int | None = None,
     ) -> SyncBatchResult:
         """
         Ejecuta la sincronización de batch de animales.
@@ -39,10 +47,25 @@ class SyncCattleBatchUseCase:
         Args:
             items: Lista de items a sincronizar (max 100)
             device_id: ID del dispositivo móvil
+            pending_count: Items que el dispositivo reporta aún pendientes
 
         Returns:
             SyncBatchResult con resultados por item
         """
+        with self._metrics.track_batch(
+            kind="cattle",
+            device_id=device_id,
+            item_count=len(items),
+            pending_count=pending_count,
+        ):
+            return await self._sync_batch(items, device_id)
+
+    async def _sync_batch(
+        self,
+        items: list[dict[str, Any]],
+        device_id: str,
+    ) -> SyncBatchResult:
+        """Sincroniza los items del batch uno a uno y agrega resultados."""
         results: list[SyncItemResult] = []
         synced_count = 0
         failed_count = 0
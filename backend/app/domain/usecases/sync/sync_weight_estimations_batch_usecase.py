@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from ....core.utils.sync_metrics import SyncMetricsRegistry
 from ...entities.sync_result import SyncBatchResult, SyncItemResult, SyncItemStatus
 from ...entities.weight_estimation import WeightEstimation
 from ...repositories.weight_estimation_repository import WeightEstimationRepository
@@ -19,19 +20,26 @@ class SyncWeightEstimationsBatchUseCase:
     Single Responsibility: Sincronizar estimaciones con estrategia last-write-wins.
     """
 
-    def __init__(self, weight_estimation_repository: WeightEstimationRepository):
+    def __init__(
+        self,
+        weight_estimation_repository: WeightEstimationRepository,
+        metrics: SyncMetricsRegistry,
+    ):
         """
         Inicializa el caso de uso.
 
         Args:
             weight_estimation_repository: Repositorio de estimaciones (inyección de dependencia)
+            metrics: Registro de métricas de sincronización
         """
         self._weight_estimation_repository = weight_estimation_repository
+        self._metrics = metrics
 
     async def execute(
         self,
         items: list[dict[str, Any]],
         device_id: str,
+        pending_count: int | None = None,
     ) -> SyncBatchResult:
         """
         Ejecuta la sincronización de batch de estimaciones.
@@ -39,10 +47,25 @@ class SyncWeightEstimationsBatchUseCase:
         Args:
             items: Lista de items a sincronizar (max 100)
             device_id: ID del dispositivo móvil
+            pending_count: Items que el dispositivo reporta aún pendientes
 
         Returns:
             SyncBatchResult con resultados por item
         """
+        with self._metrics.track_batch(
+            kind="weight_estimations",
+            device_id=device_id,
+            item_count=len(items),
+            pending_count=pending_count,
+        ):
+            return await self._sync_batch(items, device_id)
+
+    async def _sync_batch(
+        self,
+        items: list[dict[str, Any]],
+        device_id: str,
+    ) -> SyncBatchResult:
+        """Sincroniza los items del batch uno a uno y agrega resultados."""
         results: list[SyncItemResult] = []
         synced_count = 0
         failed_count = 0
@@ -6,6 +6,7 @@ Caso de uso para eliminar un usuario
 from uuid import UUID
 
 from ....core.exceptions import NotFoundException
+from ....core.utils.principal_cache import PrincipalCache
 from ...repositories.user_repository import UserRepository
 
 
@@ -16,14 +17,20 @@ class DeleteUserUseCase:
     Single Responsibility: Eliminar un usuario del dominio.
     """
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        principal_cache: PrincipalCache,
+    ):
         """
         Inicializa el caso de uso.
 
         Args:
             user_repository: Repositorio de usuarios
+            principal_cache: Caché de usuarios autenticados (se invalida)
         """
         self._user_repository = user_repository
+        self._principal_cache = principal_cache
 
     async def execute(self, user_id: UUID) -> None:
         """
@@ -42,3 +49,4 @@ class DeleteUserUseCase:
 
         # Eliminar
         await self._user_repository.delete(user_id)
+        self._principal_cache.invalidate(user_id)
@@ -6,6 +6,7 @@ Caso de uso para actualizar un usuario
 from uuid import UUID
 
 from ....core.exceptions import AlreadyExistsException, NotFoundException
+from ....core.utils.principal_cache import PrincipalCache
 from ...entities.user import User
 from ...repositories.role_repository import RoleRepository
 from ...repositories.user_repository import UserRepository
@@ -22,6 +23,7 @@ class UpdateUserUseCase:
         self,
         user_repository: UserRepository,
         role_repository: RoleRepository,
+        principal_cache: PrincipalCache,
     ):
         """
         Inicializa el caso de uso.
@@ -29,9 +31,11 @@ class UpdateUserUseCase:
         Args:
             user_repository: Repositorio de usuarios
             role_repository: Repositorio de roles
+            principal_cache: Caché de usuarios autenticados (se invalida)
         """
         self._user_repository = user_repository
         self._role_repository = role_repository
+        self._principal_cache = principal_cache
 
     async def execute(
         self,
@@ -109,4 +113,8 @@ class UpdateUserUseCase:
         user.update_timestamp()
 
         # Guardar cambios
-        return await self._user_repository.save(user)
+        saved = await self._user_repository.save(user)
+
+        # El usuario autenticado cacheado ya no es válido (rol, estado, etc.)
+        self._principal_cache.invalidate(user_id)
+        return saved
@@ -3,9 +3,11 @@ Estimate Weight From Image Use Case - Domain Layer
 Caso de uso para estimar peso desde imagen usando ML
 """
 
+import time
 from uuid import UUID
 
 from ....core.utils.ml_inference import estimate_weight_from_image
+from ....ml.stage_timings import STAGE_PERSISTENCE, observe_stage
 from ...entities.weight_estimation import WeightEstimation
 from ...repositories.animal_repository import AnimalRepository
 from ...repositories.weight_estimation_repository import WeightEstimationRepository
@@ -79,5 +81,14 @@ class EstimateWeightFromImageUseCase:
             frame_image_path=frame_image_path,
         )
 
-        # Guardar estimación usando el repositorio
-        return await self._weight_estimation_repository.create(estimation)
+        # Guardar estimación usando el repositorio. La persistencia se mide
+        # mientras se escribe el documento: solo llega a la respuesta
+        start = time.perf_counter()
+        saved = await self._weight_estimation_repository.create(estimation)
+        persistence_ms = (time.perf_counter() - start) * 1000
+        observe_stage(STAGE_PERSISTENCE, persistence_ms)
+        saved.stage_timings_ms = {
+            **saved.stage_timings_ms,
+            STAGE_PERSISTENCE: round(persistence_ms, 1),
+        }
+        return saved
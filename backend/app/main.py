@@ -12,11 +12,13 @@ Responsabilidades:
 """
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from app.core.config import settings
 from app.core.lifespan import lifespan
 from app.core.middleware import setup_middleware
 from app.core.routes import setup_routes
+from app.core.utils.request_metrics import request_metrics
 
 
 def create_application() -> FastAPI:
@@ -89,11 +91,21 @@ async def health():
         models_loaded = 1 if model_loader.is_model_loaded() else 0
         loaded_breeds = model_loader.get_loaded_breeds()
 
+        from app.core.utils.alert_scheduler import alert_scheduler
+        from app.core.utils.image_storage import image_storage_service
+        from app.core.utils.password import password_hasher
+        from app.core.utils.principal_cache import principal_cache
+
         return {
             "status": "healthy",
             "database": "connected",  # MongoDB
             "models_loaded": models_loaded,
             "loaded_models": loaded_breeds,
+            "auth_cache": principal_cache.stats(),
+            "password_hasher": password_hasher.stats(),
+            "image_storage": image_storage_service.stats(),
+            "alert_scheduler": alert_scheduler.stats(),
+            "request_metrics": request_metrics.stats(),
             "services": {
                 "sync": "active",  # US-005
                 "animals": "active",  # US-003
@@ -110,6 +122,25 @@ async def health():
         }
 
 
+if settings.METRICS_ENABLED:
+
+    @app.get(settings.METRICS_PATH, tags=["Root"], include_in_schema=False)
+    async def metrics():
+        """
+        Métricas de rendimiento en formato Prometheus.
+
+        Latencia por ruta, requests en curso, tamaños, comandos MongoDB y
+        etapas ML de este proceso (cada worker expone las suyas).
+
+        Returns:
+            Texto en formato de exposición Prometheus 0.0.4
+        """
+        return PlainTextResponse(
+            request_metrics.render(),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -5,6 +5,7 @@ Motor de inferencia para estimación de peso bovino
 Single Responsibility: Ejecutar inferencia con modelos ML usando Strategy Pattern
 """
 
+import asyncio
 import time
 
 import numpy as np
@@ -14,6 +15,7 @@ from app.domain.shared.constants import BreedType, SystemMetrics
 
 from .model_loader import MLModelLoader
 from .preprocessing import ImagePreprocessor
+from .stage_timings import STAGE_QUEUE_WAIT, StageTimings, observe_stage
 from .strategy_context import WeightEstimationContext
 
 
@@ -27,12 +29,14 @@ class MLInferenceResult:
         processing_time_ms: int,
         ml_model_version: str,
         breed: BreedType,
+        stage_timings_ms: dict[str, float] | None = None,
     ):
         self.estimated_weight_kg = estimated_weight_kg
         self.confidence = confidence
         self.processing_time_ms = processing_time_ms
         self.ml_model_version = ml_model_version
         self.breed = breed
+        self.stage_timings_ms = stage_timings_ms or {}
 
     def to_dict(self) -> dict:
         """Convierte a diccionario."""
@@ -42,6 +46,7 @@ class MLInferenceResult:
             "processing_time_ms": self.processing_time_ms,
             "ml_model_version": self.ml_model_version,
             "breed": self.breed.value,
+            "stage_timings_ms": self.stage_timings_ms,
             "meets_quality_criteria": self.confidence >= SystemMetrics.MIN_CONFIDENCE
             and self.processing_time_ms < SystemMetrics.MAX_PROCESSING_TIME_MS,
         }
@@ -77,7 +82,8 @@ class MLInferenceEngine:
             MLModelException: Si hay error en inferencia
             ValidationException: Si imagen es inválida
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        timings = StageTimings()
 
         try:
             # 1. Validar y convertir raza a BreedType
@@ -98,22 +104,34 @@ class MLInferenceEngine:
                 )
 
             # 2. Usar contexto de estrategias para estimación
-            # Esto reemplaza el sistema híbrido anterior con Strategy Pattern
-            strategy_result = self.strategy_context.estimate_weight(
-                image_bytes, breed_enum
-            )
+            # Esto reemplaza el sistema híbrido anterior con Strategy Pattern.
+            # Se ejecuta en un hilo para no bloquear el event loop; la espera
+            # hasta que un hilo la toma se reporta como queue_wait
+            submitted_at = time.perf_counter()
+
+            def run_strategies() -> dict:
+                timings.add(
+                    STAGE_QUEUE_WAIT, (time.perf_counter() - submitted_at) * 1000
+                )
+                return self.strategy_context.estimate_weight(
+                    image_bytes, breed_enum, timings
+                )
+
+            strategy_result = await asyncio.to_thread(run_strategies)
+            observe_stage("ml_inference", (time.perf_counter() - submitted_at) * 1000)
 
             estimated_weight = strategy_result["weight"]
             confidence = strategy_result["confidence"]
             selected_strategy = strategy_result.get("selected_strategy", "unknown")
 
             # 3. Calcular tiempo de procesamiento
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = int((time.perf_counter() - start_time) * 1000)
 
             # 4. Validar que cumpla métricas del sistema
             if processing_time_ms > SystemMetrics.MAX_PROCESSING_TIME_MS:
                 print(
-                    f"⚠️ ADVERTENCIA: Procesamiento {processing_time_ms}ms > 3000ms objetivo"
+                    f"⚠️ ADVERTENCIA: Procesamiento {processing_time_ms}ms > 3000ms objetivo "
+                    f"(etapas: {timings.to_dict()})"
                 )
 
             if confidence < SystemMetrics.MIN_CONFIDENCE:
@@ -124,8 +142,12 @@ class MLInferenceEngine:
                 estimated_weight_kg=estimated_weight,
                 confidence=confidence,
                 processing_time_ms=processing_time_ms,
-                ml_model_version=f"1.0.0-{selected_strategy}",  # Indicar estrategia usada
+                # Versión real del modelo (ej. nelore-v1.0.0); si la estrategia no
+                # usa un modelo versionado, se indica la estrategia
+                ml_model_version=strategy_result.get("ml_model_version")
+                or f"1.0.0-{selected_strategy}",
                 breed=breed,
+                stage_timings_ms=timings.to_dict(),
             )
 
         except ValidationException:
@@ -196,18 +218,23 @@ class MLInferenceEngine:
         strategy_info = self.strategy_context.get_strategy_info()
 
         # Si hay modelo genérico cargado, todas las razas están disponibles
-        # El modelo genérico sirve para todas las 7 razas
+        # El modelo genérico sirve para todas las 7 razas; el registry puede
+        # agregar modelos específicos por raza
         has_generic_model = "generic" in loaded_model_keys
         all_breeds_list = [breed.value for breed in BreedType]
 
-        breeds_loaded = all_breeds_list if has_generic_model else []
-        missing_breeds = [] if has_generic_model else all_breeds_list
+        if has_generic_model:
+            breeds_loaded = all_breeds_list
+        else:
+            breeds_loaded = [b for b in all_breeds_list if b in loaded_model_keys]
+        missing_breeds = [b for b in all_breeds_list if b not in breeds_loaded]
 
         return {
             "total_loaded": len(loaded_model_keys),
             "breeds_loaded": breeds_loaded,
             "all_breeds": all_breeds_list,
             "missing_breeds": missing_breeds,
+            "models": self.model_loader.get_active_models_info(),
             "strategies": strategy_info,
             "available_strategies": self.strategy_context.get_available_strategies(),
         }
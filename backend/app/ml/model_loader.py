@@ -5,13 +5,20 @@ Carga y gestión de modelos TensorFlow/TFLite
 Single Responsibility: Cargar modelos ML en memoria
 """
 
+import hashlib
+import json
 import logging
 import os
+import statistics
+import threading
+import time
 from contextlib import redirect_stderr
 from io import StringIO
 from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
+
 from ..core.config import settings
 from ..core.exceptions import MLModelException
 from ..domain.shared.constants import BreedType
@@ -43,10 +50,12 @@ except ImportError:
         class TFLiteWrapper:
             """Wrapper para usar tf.lite.Interpreter como tflite_runtime.interpreter"""
 
+            OpResolverType = tf.lite.experimental.OpResolverType
+
             @staticmethod
-            def Interpreter(model_path: str):  # type: ignore[misc]  # noqa: N802
-                """Crea un Interpreter de TensorFlow Lite."""
-                return tf.lite.Interpreter(model_path=model_path)
+            def Interpreter(model_path: str, **kwargs):  # type: ignore[misc]  # noqa: N802
+                """Crea un Interpreter de TensorFlow Lite (num_threads, delegados...)."""
+                return tf.lite.Interpreter(model_path=model_path, **kwargs)
 
         tflite = TFLiteWrapper()  # type: ignore[assignment]
         TFLITE_AVAILABLE = True
@@ -70,9 +79,14 @@ class MLModelLoader:
     """
 
     _instance: Optional["MLModelLoader"] = None
-    _models_cache: dict[str, dict[str, Any]] = (
-        {}
-    )  # Cache de modelos cargados (key: "generic" o breed.value)
+    # Modelos activos (key: "generic" o breed.value). Nunca se modifica en
+    # sitio: una recarga publica un dict nuevo y los requests en curso
+    # terminan con el conjunto que tomaron
+    _models_cache: dict[str, dict[str, Any]] = {}
+    _load_lock = threading.Lock()  # Una sola carga (y auto-tune) a la vez
+    _registry_mtime: float | None = None  # mtime del manifest cargado
+    _registry_checked_at: float = 0.0  # Último stat del manifest (monotónico)
+    _tuned_threads: int | None = None  # Hilos del auto-tune (se mide una vez)
 
     def __new__(cls):
         """Singleton pattern."""
@@ -86,116 +100,465 @@ class MLModelLoader:
         self.models_path.mkdir(parents=True, exist_ok=True)
         self.model_loaded = False
 
+    @property
+    def registry_manifest_path(self) -> Path:
+        """Manifest del registry local de modelos versionados."""
+        return Path(settings.ML_REGISTRY_PATH) / "manifest.json"
+
     def load_generic_model(self) -> dict[str, Any]:
         """
         Carga modelo genérico TFLite (para todas las razas).
 
-        El modelo exportado desde Colab es genérico y funciona para todas las razas.
-
         Returns:
             Diccionario con interpreter TFLite y metadatos
 
         Raises:
             MLModelException: Si el modelo no se puede cargar
         """
-        # Verificar cache
-        if "generic" in self._models_cache:
-            return self._models_cache["generic"]
+        return self.load_model(None)
 
-        # Construir path del modelo genérico
-        model_filename = settings.ML_DEFAULT_MODEL
-        model_path = self.models_path / model_filename
+    def load_model(self, breed: BreedType | None) -> dict[str, Any]:
+        """
+        Modelo activo para una raza: el específico de la raza o el genérico.
 
-        # Verificar que existe
-        if not model_path.exists():
+        Revisa (como máximo cada ML_REGISTRY_POLL_S) si el manifest del
+        registry cambió y, en ese caso, recarga antes de responder.
+
+        Args:
+            breed: Raza del animal (None = modelo genérico)
+
+        Returns:
+            Diccionario con interpreter TFLite y metadatos
+
+        Raises:
+            MLModelException: Si no hay modelo para la raza ni genérico
+        """
+        self._refresh_if_changed()
+        models = self.ensure_loaded()
+
+        key = breed.value if breed is not None else "generic"
+        model = models.get(key) or models.get("generic")
+        if model is None:
             raise MLModelException(
-                f"Modelo TFLite no encontrado: {model_path}. "
-                f"Descarga el modelo desde Colab/Drive a: {self.models_path}/. "
-                f"Ver guía: backend/INTEGRATION_GUIDE.md"
+                f"No hay modelo para '{key}' ni modelo genérico. "
+                f"Modelos activos: {sorted(models)}"
+            )
+        return model
+
+    def ensure_loaded(self) -> dict[str, dict[str, Any]]:
+        """
+        Conjunto de modelos activo (lo carga si aún no hay ninguno).
+
+        Returns:
+            Diccionario key → modelo cargado
+
+        Raises:
+            MLModelException: Si no se pudo cargar ningún modelo
+        """
+        models = self._models_cache
+        if models:
+            return models
+
+        with self._load_lock:
+            # Otro hilo pudo cargarlo mientras se esperaba el lock
+            if self._models_cache:
+                return self._models_cache
+            return self._reload_locked()
+
+    def reload(self) -> dict[str, dict[str, Any]]:
+        """
+        Recarga los modelos y los publica de forma atómica (hot swap).
+
+        El conjunto nuevo se carga completo antes de reemplazar al anterior:
+        si algún modelo falla, se conserva el conjunto actual.
+
+        Returns:
+            Diccionario key → modelo cargado
+
+        Raises:
+            MLModelException: Si la recarga falla
+        """
+        with self._load_lock:
+            return self._reload_locked()
+
+    def _refresh_if_changed(self) -> None:
+        """
+        Recarga en segundo plano si cambió el manifest del registry.
+
+        El request que detecta el cambio (y los siguientes) siguen con el
+        conjunto actual hasta que el hilo de recarga publica el nuevo.
+        """
+        if settings.ML_REGISTRY_POLL_S <= 0 or not self._models_cache:
+            return
+
+        now = time.monotonic()
+        if now - self._registry_checked_at < settings.ML_REGISTRY_POLL_S:
+            return
+        MLModelLoader._registry_checked_at = now
+
+        if self._manifest_mtime() == self._registry_mtime:
+            return
+
+        # Otro hilo ya está recargando: seguir con el conjunto actual
+        if not self._load_lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(
+                target=self._background_reload, name="ml-model-reload", daemon=True
+            ).start()
+        except RuntimeError:
+            self._load_lock.release()
+            raise
+
+    def _background_reload(self) -> None:
+        """Recarga del hilo de _refresh_if_changed (libera _load_lock al terminar)."""
+        try:
+            self._reload_locked()
+        except Exception as e:
+            print(f"⚠️ Recarga de modelos fallida, se mantiene el conjunto actual: {e}")
+            # No reintentar el mismo manifest en cada poll
+            MLModelLoader._registry_mtime = self._manifest_mtime()
+        finally:
+            self._load_lock.release()
+
+    def _manifest_mtime(self) -> float | None:
+        """mtime del manifest del registry (None si no existe)."""
+        try:
+            return self.registry_manifest_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def _reload_locked(self) -> dict[str, dict[str, Any]]:
+        """Carga y publica el conjunto de modelos (requiere _load_lock)."""
+        # Verificar que TFLite está disponible (runtime o TensorFlow completo)
+        if not TFLITE_AVAILABLE or tflite is None:
+            raise MLModelException(
+                "TensorFlow o tensorflow-lite-runtime no instalado. "
+                "Ejecuta: pip install tensorflow"
             )
 
+        mtime = self._manifest_mtime()
+        if mtime is not None:
+            models = self._load_registry()
+        else:
+            models = {"generic": self._load_default_model()}
+
+        # Publicación atómica (una asignación)
+        MLModelLoader._models_cache = models
+        MLModelLoader._registry_mtime = mtime
+        self.model_loaded = True
+
+        print(
+            "🔄 Modelos activos: "
+            + ", ".join(f"{key}={model['version']}" for key, model in models.items())
+        )
+        return models
+
+    def _load_registry(self) -> dict[str, dict[str, Any]]:
+        """
+        Carga los modelos del manifest del registry.
+
+        Formato (el de train_all_breeds.generate_manifest):
+        {"models": [{"breed_type", "version", "path" o "filename", "sha256"?}]}.
+        Los modelos cuyo archivo no cambió (mismo path, sha256, tamaño y
+        mtime) se reutilizan sin recargar.
+
+        Returns:
+            Diccionario key → modelo cargado
+        """
+        registry_path = Path(settings.ML_REGISTRY_PATH)
         try:
-            # Verificar que TFLite está disponible (runtime o TensorFlow completo)
-            if not TFLITE_AVAILABLE:
+            with open(self.registry_manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            raise MLModelException(f"Manifest del registry inválido: {str(e)}")
+
+        entries = manifest.get("models") or []
+        if not entries:
+            raise MLModelException(
+                f"El manifest {self.registry_manifest_path} no tiene modelos"
+            )
+
+        models: dict[str, dict[str, Any]] = {}
+        for entry in entries:
+            try:
+                breed_type = entry["breed_type"]
+                version = entry.get("version") or manifest.get("version", "v1.0.0")
+                model_path = registry_path / (
+                    entry.get("path") or f"{breed_type}/{version}/{entry['filename']}"
+                )
+            except KeyError as e:
+                raise MLModelException(f"Entrada del manifest sin {e}: {entry}")
+
+            try:
+                stat = model_path.stat()
+            except FileNotFoundError:
                 raise MLModelException(
-                    "TensorFlow o tensorflow-lite-runtime no instalado. "
-                    "Ejecuta: pip install tensorflow"
+                    f"Modelo del manifest no encontrado: {model_path}"
                 )
 
-            # Cargar TFLite Interpreter
-            # Nota: TensorFlow Lite puede imprimir mensajes INFO/WARNING durante la carga,
-            # estos son normales y no indican errores (delegados, optimizaciones, etc.)
-            if tflite is None:
-                raise MLModelException("TFLite runtime no disponible")
-
-            # Redirigir temporalmente stderr para suprimir mensajes de carga del modelo
-            stderr_buffer = StringIO()
-            with redirect_stderr(stderr_buffer):
-                interpreter = tflite.Interpreter(model_path=str(model_path))  # type: ignore[union-attr]
-                interpreter.allocate_tensors()  # type: ignore[union-attr]
-
-            # Obtener input/output details
-            input_details = interpreter.get_input_details()  # type: ignore[union-attr]
-            output_details = interpreter.get_output_details()  # type: ignore[union-attr]
-
-            print(f"✅ Modelo TFLite cargado: {model_filename}")
-            print(f"   Input shape: {input_details[0]['shape']}")
-            print(f"   Output shape: {output_details[0]['shape']}")
-            print(f"   Path: {model_path}")
-
-            # Crear diccionario con modelo y metadatos
-            model_data = {
-                "interpreter": interpreter,
-                "input_details": input_details,
-                "output_details": output_details,
-                "version": "1.0.0",
-                "path": str(model_path),
-                "loaded": True,
-            }
+            sha256 = entry.get("sha256")
+            # Sin sha256 en el manifest, un archivo sobrescrito en el mismo
+            # path solo se detecta por tamaño/mtime
+            file_stat = (stat.st_size, stat.st_mtime_ns)
+            current = self._models_cache.get(breed_type)
+            if (
+                current is not None
+                and current["path"] == str(model_path)
+                and current.get("sha256") == sha256
+                and current.get("file_stat") == file_stat
+            ):
+                models[breed_type] = current
+                continue
+
+            if sha256 and file_sha256(model_path) != sha256:
+                raise MLModelException(
+                    f"SHA-256 de {model_path.name} no coincide con el manifest "
+                    "(copia incompleta?)"
+                )
 
-            # Cachear
-            self._models_cache["generic"] = model_data
-            self.model_loaded = True
+            model_data = self._load_tflite(
+                model_path,
+                entry.get("format", "default"),
+                version=f"{breed_type}-{version}",
+            )
+            model_data["sha256"] = sha256
+            model_data["file_stat"] = file_stat
+            models[breed_type] = model_data
 
-            return model_data
+        return models
 
-        except MLModelException:
-            raise
-        except Exception as e:
-            raise MLModelException(f"Error al cargar modelo TFLite: {str(e)}")
+    def _load_default_model(self) -> dict[str, Any]:
+        """
+        Carga ML_DEFAULT_MODEL (sin registry).
+
+        Usa la primera variante disponible según ML_MODEL_FORMATS (int8,
+        float16...) y recurre a la siguiente si una no carga.
+
+        Returns:
+            Diccionario con interpreter TFLite y metadatos
+        """
+        candidates = self._candidate_model_paths()
+        if not candidates:
+            model_path = self.models_path / settings.ML_DEFAULT_MODEL
+            raise MLModelException(
+                f"Modelo TFLite no encontrado: {model_path}. "
+                f"Descarga el modelo desde Colab/Drive a: {self.models_path}/. "
+                f"Ver guía: backend/INTEGRATION_GUIDE.md"
+            )
+
+        errors = []
+        for model_format, model_path in candidates:
+            try:
+                # Versión = nombre del archivo (ej. generic-cattle-v1.0.0-int8)
+                return self._load_tflite(model_path, model_format, model_path.stem)
+            except Exception as e:
+                # Variante no soportada en este host: probar la siguiente
+                print(f"⚠️ No se pudo cargar {model_path.name}: {str(e)}")
+                errors.append(f"{model_path.name}: {str(e)}")
+
+        raise MLModelException(f"Error al cargar modelo TFLite: {'; '.join(errors)}")
 
-    def load_model(self, breed: BreedType) -> dict[str, Any]:
+    def _candidate_model_paths(self) -> list[tuple[str, Path]]:
         """
-        Carga modelo TFLite (usa modelo genérico para todas las razas).
+        Archivos de modelo existentes en orden de preferencia.
 
-        Por ahora, el modelo exportado desde Colab es genérico.
-        En el futuro, puede haber modelos específicos por raza.
+        Para ML_DEFAULT_MODEL=generic-cattle-v1.0.0.tflite busca
+        generic-cattle-v1.0.0-<formato>.tflite por cada formato de
+        ML_MODEL_FORMATS (variantes exportadas por ml-training) y, al final,
+        el propio ML_DEFAULT_MODEL.
+
+        Returns:
+            Lista de (formato, path)
+        """
+        default_path = self.models_path / settings.ML_DEFAULT_MODEL
+        candidates = [
+            (
+                model_format,
+                default_path.with_name(
+                    f"{default_path.stem}-{model_format}{default_path.suffix}"
+                ),
+            )
+            for model_format in settings.ML_MODEL_FORMATS
+        ]
+        candidates.append(("default", default_path))
+        return [(fmt, path) for fmt, path in candidates if path.exists()]
+
+    def _load_tflite(
+        self, model_path: Path, model_format: str, version: str
+    ) -> dict[str, Any]:
+        """
+        Crea el Interpreter de un archivo con los hilos configurados o auto-tuneados.
+
+        El auto-tune se mide con el primer modelo cargado y se reutiliza para
+        los demás (misma arquitectura en todas las razas).
 
         Args:
-            breed: Raza del animal (usado para validación)
+            model_path: Archivo .tflite
+            model_format: Variante (int8, float16, float32 o default)
+            version: Versión registrada en cada estimación
 
         Returns:
-            Modelo genérico cargado
+            Diccionario con interpreter TFLite y metadatos
+        """
+        autotune_ms: dict[int, float] = {}
+        if settings.ML_NUM_THREADS > 0:
+            num_threads = settings.ML_NUM_THREADS
+            interpreter = self._create_interpreter(model_path, num_threads)
+        elif self._tuned_threads is not None:
+            num_threads = self._tuned_threads
+            interpreter = self._create_interpreter(model_path, num_threads)
+        else:
+            num_threads, interpreter, autotune_ms = self._autotune_threads(model_path)
+            MLModelLoader._tuned_threads = num_threads
+
+        # Obtener input/output details
+        input_details = interpreter.get_input_details()
+        output_details = interpreter.get_output_details()
 
-        Raises:
-            MLModelException: Si el modelo no se puede cargar
+        print(
+            f"✅ Modelo TFLite cargado: {model_path.name} ({model_format}, {version})"
+        )
+        print(
+            f"   Input shape: {input_details[0]['shape']} "
+            f"({input_details[0]['dtype'].__name__})"
+        )
+        if input_details[0]["quantization"][0]:
+            scale, zero_point = input_details[0]["quantization"]
+            print(f"   Input cuantizado: scale={scale:.6f}, zero_point={zero_point}")
+        print(f"   Output shape: {output_details[0]['shape']}")
+        print(
+            f"   Hilos: {num_threads}"
+            + (" (auto-tune)" if autotune_ms else "")
+            + f", XNNPACK: {'sí' if settings.ML_USE_XNNPACK else 'no'}"
+            + f", op resolver: {settings.ML_OP_RESOLVER}"
+        )
+        print(f"   Path: {model_path}")
+
+        # Crear diccionario con modelo y metadatos
+        return {
+            "interpreter": interpreter,
+            # Un Interpreter no admite invoke concurrente (inferencia en hilos)
+            "lock": threading.Lock(),
+            "input_details": input_details,
+            "output_details": output_details,
+            "version": version,
+            "format": model_format,
+            "num_threads": num_threads,
+            "autotune_ms": autotune_ms,
+            "path": str(model_path),
+            "loaded": True,
+        }
+
+    @staticmethod
+    def _interpreter_options() -> dict[str, Any]:
         """
-        # Por ahora, usar modelo genérico para todas las razas
-        return self.load_generic_model()
+        Opciones del Interpreter según Settings (op resolver y XNNPACK).
+
+        XNNPACK es el delegado por defecto del op resolver: desactivarlo es
+        usar BUILTIN_WITHOUT_DEFAULT_DELEGATES.
+        """
+        resolver_type = getattr(tflite, "OpResolverType", None)
+        if resolver_type is None:
+            return {}
+
+        if settings.ML_OP_RESOLVER == "builtin_ref":
+            resolver = resolver_type.BUILTIN_REF
+        elif not settings.ML_USE_XNNPACK:
+            resolver = resolver_type.BUILTIN_WITHOUT_DEFAULT_DELEGATES
+        elif settings.ML_OP_RESOLVER == "builtin":
+            resolver = resolver_type.BUILTIN
+        else:
+            resolver = resolver_type.AUTO
+        return {"experimental_op_resolver_type": resolver}
+
+    def _create_interpreter(self, model_path: Path, num_threads: int) -> Any:
+        """
+        Crea y asigna un Interpreter.
+
+        Args:
+            model_path: Archivo .tflite
+            num_threads: Hilos del intérprete (y de XNNPACK)
+
+        Returns:
+            Interpreter con tensores asignados
+        """
+        # Nota: TensorFlow Lite puede imprimir mensajes INFO/WARNING durante la carga,
+        # estos son normales y no indican errores (delegados, optimizaciones, etc.)
+        # Redirigir temporalmente stderr para suprimir mensajes de carga del modelo
+        stderr_buffer = StringIO()
+        with redirect_stderr(stderr_buffer):
+            interpreter = tflite.Interpreter(  # type: ignore[union-attr]
+                model_path=str(model_path),
+                num_threads=num_threads,
+                **self._interpreter_options(),
+            )
+            interpreter.allocate_tensors()
+        return interpreter
+
+    def _autotune_threads(self, model_path: Path) -> tuple[int, Any, dict[int, float]]:
+        """
+        Elige los hilos del intérprete midiendo unas invocaciones por candidato.
+
+        Candidatos: 1, 2, 4... hasta los núcleos disponibles para el proceso.
+        Se elige la menor cantidad de hilos a ≤5% de la mejor mediana: más
+        hilos por request compiten con los requests concurrentes.
+
+        Args:
+            model_path: Archivo .tflite
+
+        Returns:
+            (hilos, interpreter con esos hilos, mediana en ms por candidato)
+        """
+        cpu_count = (
+            len(os.sched_getaffinity(0))
+            if hasattr(os, "sched_getaffinity")
+            else os.cpu_count() or 1
+        )
+        candidates = sorted(
+            {1, cpu_count} | {2**i for i in range(1, cpu_count.bit_length())}
+        )
+        candidates = [n for n in candidates if n <= cpu_count]
+
+        interpreters: dict[int, Any] = {}
+        medians_ms: dict[int, float] = {}
+        for num_threads in candidates:
+            interpreter = self._create_interpreter(model_path, num_threads)
+            input_details = interpreter.get_input_details()[0]
+            dummy = np.zeros(input_details["shape"], dtype=input_details["dtype"])
+
+            times_ms = []
+            for i in range(settings.ML_AUTOTUNE_INVOCATIONS + 1):
+                interpreter.set_tensor(input_details["index"], dummy)
+                start = time.perf_counter()
+                interpreter.invoke()
+                if i > 0:  # La primera invocación prepara kernels/delegado
+                    times_ms.append((time.perf_counter() - start) * 1000)
+
+            interpreters[num_threads] = interpreter
+            medians_ms[num_threads] = round(statistics.median(times_ms), 3)
+
+        best_ms = min(medians_ms.values())
+        num_threads = min(n for n, ms in medians_ms.items() if ms <= best_ms * 1.05)
+        print(
+            "⏱️ Auto-tune de hilos TFLite: "
+            + ", ".join(f"{n}={ms:.1f}ms" for n, ms in medians_ms.items())
+            + f" → {num_threads}"
+        )
+        return num_threads, interpreters[num_threads], medians_ms
 
     def load_all_models(self) -> dict[str, dict[str, Any]]:
         """
-        Carga modelo genérico TFLite (por ahora solo hay uno genérico).
+        Carga los modelos activos (registry o modelo genérico).
 
         Returns:
-            Diccionario con modelo genérico cargado
+            Diccionario key → modelo cargado
 
         Raises:
             MLModelException: Si el modelo falla
         """
         try:
-            generic_model = self.load_generic_model()
-            return {"generic": generic_model}
+            return self.ensure_loaded()
         except MLModelException as e:
             raise MLModelException(
                 f"No se pudo cargar modelo TFLite: {str(e)}. "
@@ -207,36 +570,72 @@ class MLModelLoader:
         Verifica si un modelo está cargado.
 
         Args:
-            breed: Raza a verificar (opcional, por ahora usa modelo genérico)
+            breed: Raza a verificar (None = cualquier modelo)
 
         Returns:
-            True si está en cache
+            True si hay modelo de la raza o genérico en cache
         """
-        return "generic" in self._models_cache
+        models = self._models_cache
+        if breed is None:
+            return bool(models)
+        return breed.value in models or "generic" in models
 
     def get_loaded_breeds(self) -> list[str]:
         """
         Obtiene lista de modelos cargados.
 
         Returns:
-            Lista de nombres de modelos (por ahora solo "generic")
+            Lista de keys de modelos ("generic" y/o razas)
         """
         return list(self._models_cache.keys())
 
+    def get_active_models_info(self) -> list[dict[str, Any]]:
+        """
+        Versión, variante y archivo de cada modelo activo.
+
+        Returns:
+            Lista de dicts (sin el interpreter)
+        """
+        return [
+            {
+                "key": key,
+                "version": model["version"],
+                "format": model["format"],
+                "num_threads": model["num_threads"],
+                "path": model["path"],
+            }
+            for key, model in self._models_cache.items()
+        ]
+
     def unload_model(self, breed: BreedType | None = None) -> None:
         """
         Descarga modelo de memoria.
 
         Args:
-            breed: Raza del modelo a descargar (opcional, por ahora solo hay genérico)
+            breed: Raza del modelo a descargar (None = modelo genérico)
         """
-        if "generic" in self._models_cache:
-            del self._models_cache["generic"]
-            self.model_loaded = False
-            print("🗑️ Modelo genérico descargado de memoria")
+        key = breed.value if breed is not None else "generic"
+        with self._load_lock:
+            if key in self._models_cache:
+                MLModelLoader._models_cache = {
+                    k: v for k, v in self._models_cache.items() if k != key
+                }
+                self.model_loaded = bool(self._models_cache)
+                print(f"🗑️ Modelo {key} descargado de memoria")
 
     def unload_all_models(self) -> None:
         """Descarga todos los modelos de memoria."""
-        self._models_cache.clear()
-        self.model_loaded = False
+        with self._load_lock:
+            MLModelLoader._models_cache = {}
+            MLModelLoader._registry_mtime = None
+            self.model_loaded = False
         print("🗑️ Todos los modelos descargados")
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 de un archivo (verificación de modelos del registry)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -35,6 +35,22 @@ class ImagePreprocessor:
         Returns:
             numpy array (1, 224, 224, 3) float32 normalizado
 
+        Raises:
+            ValueError: Si la imagen es inválida
+        """
+        return cls.preprocess_from_pil(cls.decode(image_bytes))
+
+    @classmethod
+    def decode(cls, image_bytes: bytes) -> Image.Image:
+        """
+        Decodifica imagen desde bytes a PIL RGB.
+
+        Args:
+            image_bytes: Bytes de imagen (JPEG/PNG)
+
+        Returns:
+            Imagen PIL en formato RGB
+
         Raises:
             ValueError: Si la imagen es inválida
         """
@@ -46,8 +62,9 @@ class ImagePreprocessor:
             if image.mode != "RGB":
                 image = image.convert("RGB")
 
-            # Preprocesar
-            return cls.preprocess_from_pil(image)
+            # Forzar la decodificación (PIL es lazy) para medirla aparte
+            image.load()
+            return image
 
         except Exception as e:
             raise ValueError(f"Error al cargar imagen: {str(e)}")
@@ -78,6 +95,31 @@ class ImagePreprocessor:
         # Expandir dimensión de batch (1, 224, 224, 3)
         return np.expand_dims(img_array, axis=0)
 
+    @classmethod
+    def to_model_input(cls, img_array: np.ndarray, input_details: dict) -> np.ndarray:
+        """
+        Adapta el tensor preprocesado al tipo de entrada del modelo.
+
+        Modelos float32/float16: float32 sin cambios. Modelos int8/uint8
+        (cuantización completa): q = x / scale + zero_point con los parámetros
+        de cuantización del tensor de entrada, redondeado y saturado.
+
+        Args:
+            img_array: Array (1, 224, 224, 3) float32 normalizado
+            input_details: Detalles del tensor de entrada del Interpreter
+
+        Returns:
+            Array con el dtype del tensor de entrada
+        """
+        dtype = input_details["dtype"]
+        if not np.issubdtype(dtype, np.integer):
+            return img_array.astype(np.float32)
+
+        scale, zero_point = input_details["quantization"]
+        info = np.iinfo(dtype)
+        quantized = np.round(img_array / scale + zero_point)
+        return np.clip(quantized, info.min, info.max).astype(dtype)
+
     @classmethod
     def _normalize(cls, img_array: np.ndarray) -> np.ndarray:
         """
@@ -0,0 +1,80 @@
+"""
+Stage Timings - ML Pipeline
+Tiempos por etapa de una inferencia
+
+Single Responsibility: Medir con reloj monotónico cada etapa del pipeline
+(decodificación, preprocesamiento, espera, inferencia, detección,
+corrección, persistencia) de una estimación.
+
+Cada etapa se reporta también al registro de métricas: aparece en el header
+Server-Timing del request y en el histograma ml_stage_duration_seconds.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+# Etapas del pipeline (nombres válidos como token de Server-Timing)
+STAGE_DECODE = "decode"
+STAGE_PREPROCESS = "preprocess"
+STAGE_QUEUE_WAIT = "queue_wait"
+STAGE_INVOKE = "invoke"
+STAGE_DETECT = "detect"
+STAGE_POST_CORRECTION = "post_correction"
+STAGE_PERSISTENCE = "persistence"
+
+
+def observe_stage(stage: str, duration_ms: float) -> None:
+    """
+    Reporta una etapa al registro de métricas del request.
+
+    Args:
+        stage: Nombre de la etapa
+        duration_ms: Duración en ms
+    """
+    # Import diferido: app.core.utils importa app.ml (import circular)
+    from app.core.utils.request_metrics import request_metrics
+
+    request_metrics.observe_stage(stage, duration_ms / 1000)
+
+
+class StageTimings:
+    """
+    Tiempos (ms) por etapa de una inferencia.
+
+    Una etapa medida varias veces (por ejemplo, espera en cola y espera del
+    intérprete) acumula su tiempo.
+    """
+
+    def __init__(self):
+        """Inicializa sin etapas."""
+        self._stages_ms: dict[str, float] = {}
+
+    def add(self, stage: str, duration_ms: float) -> None:
+        """
+        Suma tiempo a una etapa.
+
+        Args:
+            stage: Nombre de la etapa
+            duration_ms: Duración en ms
+        """
+        self._stages_ms[stage] = self._stages_ms.get(stage, 0.0) + duration_ms
+        observe_stage(stage, duration_ms)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Mide una etapa con time.perf_counter.
+
+        Args:
+            stage: Nombre de la etapa
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, (time.perf_counter() - start) * 1000)
+
+    def to_dict(self) -> dict[str, float]:
+        """Etapas medidas en orden de ejecución, redondeadas a 0.1 ms."""
+        return {stage: round(ms, 1) for stage, ms in self._stages_ms.items()}
@@ -7,6 +7,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict
 
 from app.domain.shared.constants import BreedType
+from app.ml.stage_timings import StageTimings
 
 
 class BaseWeightEstimationStrategy(ABC):
@@ -19,13 +20,19 @@ class BaseWeightEstimationStrategy(ABC):
     """
 
     @abstractmethod
-    def estimate_weight(self, image_bytes: bytes, breed: BreedType) -> Dict[str, Any]:
+    def estimate_weight(
+        self,
+        image_bytes: bytes,
+        breed: BreedType,
+        timings: StageTimings | None = None,
+    ) -> Dict[str, Any]:
         """
         Estima peso usando la estrategia específica.
 
         Args:
             image_bytes: Bytes de imagen (JPEG/PNG)
             breed: Raza del animal
+            timings: Tiempos por etapa a completar (opcional)
 
         Returns:
             Dict con peso estimado, confianza, método y metadatos
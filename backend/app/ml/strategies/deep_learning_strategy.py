@@ -8,6 +8,14 @@ import numpy as np
 from app.domain.shared.constants import BreedType
 from app.ml.model_loader import MLModelLoader
 from app.ml.preprocessing import ImagePreprocessor
+from app.ml.stage_timings import (
+    STAGE_DECODE,
+    STAGE_INVOKE,
+    STAGE_POST_CORRECTION,
+    STAGE_PREPROCESS,
+    STAGE_QUEUE_WAIT,
+    StageTimings,
+)
 
 from .base_strategy import BaseWeightEstimationStrategy
 
@@ -28,20 +36,20 @@ class DeepLearningWeightEstimationStrategy(BaseWeightEstimationStrategy):
         """Inicializa la estrategia de Deep Learning."""
         self.model_loader = MLModelLoader()
         self.preprocessor = ImagePreprocessor()
-        self._model = None
 
-    def _ensure_model_loaded(self):
-        """Asegura que el modelo TFLite esté cargado."""
-        if self._model is None:
-            self._model = self.model_loader.load_generic_model()
-
-    def estimate_weight(self, image_bytes: bytes, breed: BreedType) -> dict:
+    def estimate_weight(
+        self,
+        image_bytes: bytes,
+        breed: BreedType,
+        timings: StageTimings | None = None,
+    ) -> dict:
         """
         Estima peso usando modelo TFLite entrenado.
 
         Args:
             image_bytes: Bytes de imagen (JPEG/PNG)
-            breed: Raza del animal (usado para validación, modelo es genérico)
+            breed: Raza del animal (modelo de la raza o genérico)
+            timings: Tiempos por etapa a completar (opcional)
 
         Returns:
             Dict con peso estimado, confianza, método y metadatos
@@ -49,40 +57,53 @@ class DeepLearningWeightEstimationStrategy(BaseWeightEstimationStrategy):
         Raises:
             ValueError: Si no se puede estimar el peso
         """
+        timings = timings or StageTimings()
         try:
-            # 1. Cargar modelo si no está cargado
-            self._ensure_model_loaded()
-
-            # 2. Preprocesar imagen
-            preprocessed_image = self.preprocessor.preprocess_from_bytes(image_bytes)
+            # 1. Modelo activo de la raza (o genérico). Se conserva la referencia
+            # durante todo el request aunque una recarga publique otro modelo
+            model = self.model_loader.load_model(breed)
+
+            # 2. Decodificar y preprocesar imagen
+            with timings.measure(STAGE_DECODE):
+                image = self.preprocessor.decode(image_bytes)
+            with timings.measure(STAGE_PREPROCESS):
+                preprocessed_image = self.preprocessor.preprocess_from_pil(image)
+                # Preparar input (ya viene con batch dimension del preprocessor);
+                # cuantizado si el modelo es int8
+                input_data = self.preprocessor.to_model_input(
+                    preprocessed_image, model["input_details"][0]
+                )
 
             # 3. Ejecutar inferencia TFLite
-            interpreter = self._model["interpreter"]
-            input_details = self._model["input_details"]
-            output_details = self._model["output_details"]
-
-            # Preparar input (ya viene con batch dimension del preprocessor)
-            input_data = preprocessed_image.astype(np.float32)
-
-            # Ejecutar inferencia
-            interpreter.set_tensor(input_details[0]["index"], input_data)
-            interpreter.invoke()
-
-            # Obtener output
-            output_data = interpreter.get_tensor(output_details[0]["index"])
-            raw_weight = float(output_data[0][0])  # Modelo retorna peso directamente
-
-            # 4. Aplicar corrección post-procesamiento para animales fuera del rango
-            estimated_weight = self._apply_weight_correction(raw_weight, breed)
-
-            # 5. Calcular confidence basado en peso corregido y rango típico de la raza
-            confidence = self._calculate_confidence(estimated_weight, breed)
+            interpreter = model["interpreter"]
+            input_details = model["input_details"]
+            output_details = model["output_details"]
+
+            # Esperar el intérprete (compartido entre requests concurrentes)
+            with timings.measure(STAGE_QUEUE_WAIT):
+                model["lock"].acquire()
+            try:
+                with timings.measure(STAGE_INVOKE):
+                    interpreter.set_tensor(input_details[0]["index"], input_data)
+                    interpreter.invoke()
+                    output_data = interpreter.get_tensor(output_details[0]["index"])
+            finally:
+                model["lock"].release()
+            # Modelo retorna peso directamente (decuantizado si la salida es entera)
+            raw_weight = self._read_weight(output_data, output_details[0])
+
+            with timings.measure(STAGE_POST_CORRECTION):
+                # 4. Aplicar corrección post-procesamiento para animales fuera del rango
+                estimated_weight = self._apply_weight_correction(raw_weight, breed)
+
+                # 5. Calcular confidence basado en peso corregido y rango típico
+                confidence = self._calculate_confidence(estimated_weight, breed)
 
             return {
                 "weight": round(estimated_weight, 2),
                 "confidence": confidence,
                 "method": "tflite_model",
-                "ml_model_version": self._model["version"],
+                "ml_model_version": model["version"],
                 "strategy": self.get_strategy_name(),
                 "detection_quality": "good" if confidence > 0.85 else "acceptable",
                 "weight_corrected": raw_weight
@@ -103,6 +124,24 @@ class DeepLearningWeightEstimationStrategy(BaseWeightEstimationStrategy):
                 "detection_quality": "acceptable",
             }
 
+    @staticmethod
+    def _read_weight(output_data: np.ndarray, output_details: dict) -> float:
+        """
+        Lee el peso de la salida del modelo.
+
+        Args:
+            output_data: Tensor de salida (1, 1)
+            output_details: Detalles del tensor de salida del Interpreter
+
+        Returns:
+            Peso en kg (float)
+        """
+        value = float(output_data[0][0])
+        if np.issubdtype(output_details["dtype"], np.integer):
+            scale, zero_point = output_details["quantization"]
+            value = (value - zero_point) * scale
+        return value
+
     def _mock_ml_inference(
         self, breed: BreedType, image_bytes: bytes
     ) -> tuple[float, float]:
@@ -240,9 +279,8 @@ class DeepLearningWeightEstimationStrategy(BaseWeightEstimationStrategy):
             # Si está muy por debajo del mínimo de hembras (< 85%), probablemente es un toro grande subestimado
             # También verificar que no esté extremadamente por debajo del mínimo del modelo
             is_likely_female = (
-                female_min * 0.85 <= raw_weight <= female_max * 1.1
-            ) and (
-                raw_weight >= weight_min * 1.1
+                (female_min * 0.85 <= raw_weight <= female_max * 1.1)
+                and (raw_weight >= weight_min * 1.1)
             )  # Más estricto: debe estar cerca del rango de hembras Y no muy por debajo del mínimo del modelo
 
             if is_likely_female:
@@ -459,8 +497,7 @@ class DeepLearningWeightEstimationStrategy(BaseWeightEstimationStrategy):
             True si hay modelo TFLite disponible
         """
         try:
-            self._ensure_model_loaded()
-            return True
+            return bool(self.model_loader.ensure_loaded())
         except Exception:
             return False
 
@@ -471,8 +508,10 @@ class DeepLearningWeightEstimationStrategy(BaseWeightEstimationStrategy):
         Returns:
             Dict con info de modelos ML
         """
+        models = self.model_loader.get_active_models_info()
         return {
-            "total_loaded": 1 if self._model is not None else 0,
-            "models": ["generic"] if self._model is not None else [],
+            "total_loaded": len(models),
+            "models": [model["key"] for model in models],
+            "versions": {model["key"]: model["version"] for model in models},
             "strategy": self.get_strategy_name(),
         }
@@ -3,11 +3,19 @@ Morphometric Weight Estimation Strategy - Estimación basada en morfometría
 Implementa Strategy Pattern para método morfométrico con detección YOLO
 """
 
+import threading
+
 import cv2
 import numpy as np
 from ultralytics import YOLO
 
 from app.domain.shared.constants import BreedType
+from app.ml.stage_timings import (
+    STAGE_DECODE,
+    STAGE_DETECT,
+    STAGE_QUEUE_WAIT,
+    StageTimings,
+)
 
 from .base_strategy import BaseWeightEstimationStrategy
 
@@ -27,6 +35,10 @@ class MorphometricWeightEstimationStrategy(BaseWeightEstimationStrategy):
     def __init__(self):
         """Inicializa la estrategia morfométrica."""
         self._detector = None
+        # La inferencia corre en hilos (asyncio.to_thread): el predictor de
+        # ultralytics no es thread-safe y se carga una sola vez
+        self._detector_init_lock = threading.Lock()
+        self._detector_lock = threading.Lock()
         self._breed_params = self._initialize_breed_params()
 
     def _initialize_breed_params(self) -> dict:
@@ -89,17 +101,25 @@ class MorphometricWeightEstimationStrategy(BaseWeightEstimationStrategy):
             Instancia de YOLO detector
         """
         if self._detector is None:
-            # YOLOv8-nano pre-entrenado (descarga automática)
-            self._detector = YOLO("yolov8n.pt")
+            with self._detector_init_lock:
+                if self._detector is None:
+                    # YOLOv8-nano pre-entrenado (descarga automática)
+                    self._detector = YOLO("yolov8n.pt")
         return self._detector
 
-    def estimate_weight(self, image_bytes: bytes, breed: BreedType) -> dict:
+    def estimate_weight(
+        self,
+        image_bytes: bytes,
+        breed: BreedType,
+        timings: StageTimings | None = None,
+    ) -> dict:
         """
         Estima peso usando detección YOLO + proxy morfométrico.
 
         Args:
             image_bytes: Bytes de imagen (JPEG/PNG)
             breed: Raza del animal
+            timings: Tiempos por etapa a completar (opcional)
 
         Returns:
             Dict con peso estimado, confianza, método y metadatos
@@ -107,9 +127,12 @@ class MorphometricWeightEstimationStrategy(BaseWeightEstimationStrategy):
         Raises:
             ValueError: Si no se detecta ganado en la imagen
         """
+        timings = timings or StageTimings()
+
         # 1. Convertir bytes a imagen OpenCV
-        nparr = np.frombuffer(image_bytes, np.uint8)
-        img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        with timings.measure(STAGE_DECODE):
+            nparr = np.frombuffer(image_bytes, np.uint8)
+            img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
 
         if img is None:
             raise ValueError("Imagen inválida o corrupta")
@@ -119,7 +142,14 @@ class MorphometricWeightEstimationStrategy(BaseWeightEstimationStrategy):
 
         # 3. Detectar ganado con YOLO
         detector = self._get_detector()
-        results = detector(img, verbose=False)
+        # Esperar el detector (compartido entre requests concurrentes)
+        with timings.measure(STAGE_QUEUE_WAIT):
+            self._detector_lock.acquire()
+        try:
+            with timings.measure(STAGE_DETECT):
+                results = detector(img, verbose=False)
+        finally:
+            self._detector_lock.release()
 
         # Filtrar solo detecciones de vacas con confianza >0.5
         cows = []
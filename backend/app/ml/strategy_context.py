@@ -6,6 +6,7 @@ Implementa Strategy Pattern con selección automática
 from typing import Any, Dict, List
 
 from app.domain.shared.constants import BreedType
+from app.ml.stage_timings import StageTimings
 
 from .strategies.base_strategy import BaseWeightEstimationStrategy
 from .strategies.deep_learning_strategy import DeepLearningWeightEstimationStrategy
@@ -28,13 +29,19 @@ class WeightEstimationContext:
             MorphometricWeightEstimationStrategy(),  # Fallback: Morfométrica con YOLO
         ]
 
-    def estimate_weight(self, image_bytes: bytes, breed: BreedType) -> Dict[str, Any]:
+    def estimate_weight(
+        self,
+        image_bytes: bytes,
+        breed: BreedType,
+        timings: StageTimings | None = None,
+    ) -> Dict[str, Any]:
         """
         Estima peso usando la mejor estrategia disponible.
 
         Args:
             image_bytes: Bytes de imagen (JPEG/PNG)
             breed: Raza del animal
+            timings: Tiempos por etapa a completar (opcional)
 
         Returns:
             Dict con peso estimado, confianza, método y metadatos
@@ -46,7 +53,7 @@ class WeightEstimationContext:
         for strategy in self._strategies:
             if strategy.is_available():
                 try:
-                    result = strategy.estimate_weight(image_bytes, breed)
+                    result = strategy.estimate_weight(image_bytes, breed, timings)
                     result["selected_strategy"] = strategy.get_strategy_name()
                     return result
                 except Exception as e:
@@ -4,11 +4,13 @@ Request/Response models para API de alertas
 """
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
 from ..domain.entities.alert import AlertStatus, AlertType, RecurrenceType
+from ..domain.shared.constants import AgeCategory, BreedType
 
 
 class AlertCreateRequest(BaseModel):
@@ -66,6 +68,64 @@ class AlertCreateRequest(BaseModel):
         return sorted(set(v), reverse=True)  # Ordenar y eliminar duplicados
 
 
+class HerdAlertsCreateRequest(BaseModel):
+    """Request para generar alertas por animal desde una regla de hato."""
+
+    user_id: UUID = Field(..., description="ID del usuario")
+    farm_id: UUID = Field(..., description="ID de la finca")
+    type: AlertType = Field(..., description="Tipo de alerta")
+    title: str = Field(
+        ..., description="Título de las alertas", min_length=1, max_length=200
+    )
+    message: str = Field(
+        ..., description="Mensaje de las alertas", min_length=1, max_length=1000
+    )
+    scheduled_at: datetime = Field(..., description="Fecha/hora programada")
+    recurrence: RecurrenceType = Field(
+        default=RecurrenceType.NONE, description="Tipo de recurrencia"
+    )
+    recurrence_end: datetime | None = Field(
+        None, description="Fecha de fin de recurrencia"
+    )
+    reminder_before_days: list[int] = Field(
+        default_factory=list, description="Días antes para recordatorios (ej: [7, 1])"
+    )
+
+    # Regla de hato
+    breed: BreedType | None = Field(None, description="Raza")
+    age_category: AgeCategory | None = Field(None, description="Categoría de edad")
+    gender: Literal["male", "female"] | None = Field(None, description="Género")
+    last_weighed_before_days: int | None = Field(
+        None, ge=1, description="Solo animales sin pesaje en los últimos N días"
+    )
+
+    @field_validator("title")
+    @classmethod
+    def validate_title(cls, v: str) -> str:
+        """Valida que el título no esté vacío."""
+        if not v.strip():
+            raise ValueError("El título no puede estar vacío")
+        return v.strip()
+
+    @field_validator("reminder_before_days")
+    @classmethod
+    def validate_reminder_days(cls, v: list[int]) -> list[int]:
+        """Valida que los días de recordatorio sean positivos."""
+        if any(day < 0 for day in v):
+            raise ValueError("Los días de recordatorio deben ser positivos")
+        return sorted(set(v), reverse=True)
+
+
+class HerdAlertsResponse(BaseModel):
+    """Response de la generación de alertas de hato."""
+
+    matched: int = Field(..., description="Animales que cumplen la regla")
+    already_pending: int = Field(
+        ..., description="Animales omitidos por tener ya una alerta pendiente"
+    )
+    created: int = Field(..., description="Alertas creadas")
+
+
 class AlertUpdateRequest(BaseModel):
     """Request para actualizar una alerta."""
 
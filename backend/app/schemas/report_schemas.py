@@ -106,6 +106,68 @@ class GenerateGrowthReportRequest(BaseModel):
         return v
 
 
+class ExportInventoryRequest(BaseModel):
+    """Request para exportar el inventario completo (Excel en streaming)."""
+
+    farm_ids: list[UUID] = Field(
+        ..., min_length=1, description="IDs de las fincas a exportar"
+    )
+    status: str | None = Field(
+        None, description="Filtro por estado (active, sold, deceased, inactive)"
+    )
+    breed: str | None = Field(None, description="Filtro por raza")
+    date_from: datetime | None = Field(
+        None, description="Fecha desde (filtro por registro)"
+    )
+    date_to: datetime | None = Field(
+        None, description="Fecha hasta (filtro por registro)"
+    )
+
+    @field_validator("status")
+    @classmethod
+    def validate_status(cls, v: str | None) -> str | None:
+        """Valida status."""
+        if v is not None and v not in ["active", "inactive", "sold", "deceased"]:
+            raise ValueError("Status debe ser: active, inactive, sold o deceased")
+        return v
+
+
+class ExportWeighingsRequest(BaseModel):
+    """Request para exportar todas las estimaciones (Excel en streaming)."""
+
+    farm_ids: list[UUID] = Field(
+        ..., min_length=1, description="IDs de las fincas a exportar"
+    )
+    breed: str | None = Field(None, description="Filtro por raza")
+    date_from: datetime | None = Field(None, description="Fecha desde")
+    date_to: datetime | None = Field(None, description="Fecha hasta")
+
+
+class ReportJobResponse(BaseModel):
+    """Estado de un trabajo de reporte en segundo plano."""
+
+    id: str = Field(..., description="ID del trabajo")
+    report_type: str = Field(
+        ..., description="traceability, inventory, movements o growth"
+    )
+    format: str = Field(..., description="pdf o excel")
+    status: str = Field(..., description="pending, running, completed o failed")
+    progress: int = Field(..., ge=0, le=100, description="Progreso aproximado (%)")
+    stage: str = Field(..., description="Etapa actual del trabajo")
+    filename: str = Field(..., description="Nombre del archivo a descargar")
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    expires_at: datetime | None = Field(
+        None, description="Momento en que el archivo deja de estar disponible"
+    )
+    file_size_bytes: int | None = None
+    error: str | None = None
+    download_url: str | None = Field(
+        None, description="URL de descarga (solo si status=completed)"
+    )
+
+
 class ReportResponse(BaseModel):
     """Response genérico para reportes."""
 
@@ -84,6 +84,11 @@ class CattleSyncBatchRequest(BaseModel):
         ..., min_length=1, max_length=100, description="Máximo 100 items por batch"
     )
     device_id: str = Field(..., description="ID del dispositivo móvil")
+    pending_count: int | None = Field(
+        None,
+        ge=0,
+        description="Items que quedan pendientes en el dispositivo tras este batch",
+    )
     sync_timestamp: datetime = Field(
         default_factory=datetime.utcnow, description="Timestamp UTC de sincronización"
     )
@@ -162,6 +167,11 @@ class WeightEstimationSyncBatchRequest(BaseModel):
         ..., min_length=1, max_length=100, description="Máximo 100 items por batch"
     )
     device_id: str = Field(..., description="ID del dispositivo móvil")
+    pending_count: int | None = Field(
+        None,
+        ge=0,
+        description="Items que quedan pendientes en el dispositivo tras este batch",
+    )
     sync_timestamp: datetime = Field(
         default_factory=datetime.utcnow, description="Timestamp UTC de sincronización"
     )
@@ -193,10 +203,44 @@ class WeightEstimationSyncBatchResponse(BaseModel):
 # ===== Health Check Schema =====
 
 
+class DeviceSyncStatusResponse(BaseModel):
+    """Último sync conocido de un dispositivo"""
+
+    device_id: str
+    last_sync_at: datetime
+    last_batch_kind: str = Field(..., description="cattle/weight_estimations")
+    last_batch_size: int
+    backlog_estimate: int | None = Field(
+        None, description="Items pendientes estimados (None si desconocido)"
+    )
+
+
+class SyncMetricsResponse(BaseModel):
+    """Métricas operacionales de sincronización (registro en memoria)"""
+
+    in_flight_batches: int = Field(..., description="Batches procesándose ahora")
+    window_seconds: int = Field(..., description="Ventana de agregación")
+    batches_in_window: int
+    failed_batches_in_window: int
+    items_per_second: float
+    batch_latency_p50_ms: float | None = None
+    batch_latency_p95_ms: float | None = None
+    total_batches: int
+    total_items: int
+    tracked_devices: int
+    devices: list[DeviceSyncStatusResponse] = Field(
+        default_factory=list, description="Dispositivos más recientes primero"
+    )
+
+
 class HealthCheckResponse(BaseModel):
     """Respuesta de health check"""
 
     status: str = Field(..., description="online/offline")
     database: str = Field(..., description="Estado de MongoDB")
+    database_latency_ms: float | None = Field(
+        None, description="Latencia del ping a MongoDB (cacheado)"
+    )
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     version: str = "1.0.0"
+    metrics: SyncMetricsResponse | None = None
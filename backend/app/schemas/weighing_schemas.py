@@ -65,11 +65,19 @@ class WeighingResponse(BaseModel):
     method: str
     ml_model_version: str
     processing_time_ms: int
+    stage_timings_ms: dict[str, float] = Field(
+        default_factory=dict,
+        description="Tiempos por etapa del pipeline ML en ms (si se estimó en el servidor)",
+    )
     latitude: float | None
     longitude: float | None
     frame_image_path: str = Field(
         ..., description="Path de la imagen usada para la estimación"
     )
+    frame_image_variants: dict[str, str] = Field(
+        default_factory=dict,
+        description="Variantes redimensionadas disponibles (thumbnail, preview)",
+    )
     timestamp: datetime
     created_at: datetime
 
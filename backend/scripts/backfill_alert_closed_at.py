@@ -0,0 +1,71 @@
+"""
+Backfill de closed_at en alertas cerradas (ejecución única)
+
+Las alertas completadas/canceladas guardadas antes de que Alert registrara su
+fecha de cierre no tienen closed_at, así que el archivado nunca las toma.
+Este script la completa en el servidor (un solo update_many):
+- completadas: completed_at
+- canceladas (o completadas sin completed_at): la fecha de ejecución, para
+  que no se archiven antes de cumplir ALERTS_ARCHIVE_AFTER_DAYS desde hoy
+
+Solo toca documentos sin closed_at: ejecutarlo de nuevo no cambia nada.
+
+Uso:
+    python scripts/backfill_alert_closed_at.py --dry-run
+    python scripts/backfill_alert_closed_at.py
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from beanie import init_beanie  # noqa: E402
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.data.models.alert_model import CLOSED_STATUSES, AlertModel  # noqa: E402
+
+# closed_at: null también coincide con documentos sin el campo
+MISSING_CLOSED_AT = {"status": {"$in": CLOSED_STATUSES}, "closed_at": None}
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Cuenta o completa closed_at en las alertas cerradas que no lo tienen."""
+    client: AsyncIOMotorClient = AsyncIOMotorClient(settings.MONGODB_URL)  # type: ignore[assignment]
+    try:
+        database = client[settings.MONGODB_DB_NAME]
+        await init_beanie(database=database, document_models=[AlertModel])  # type: ignore[arg-type]
+        print(f"🗄️  Base de datos: {settings.MONGODB_DB_NAME}")
+
+        collection = AlertModel.get_motor_collection()
+        pending = await collection.count_documents(MISSING_CLOSED_AT)
+        print(f"🔍 Alertas cerradas sin closed_at: {pending}")
+        if args.dry_run or not pending:
+            return
+
+        now = datetime.utcnow()
+        result = await collection.update_many(
+            MISSING_CLOSED_AT,
+            [{"$set": {"closed_at": {"$ifNull": ["$completed_at", now]}}}],
+        )
+        print(f"✅ closed_at completado en {result.modified_count} alertas")
+    finally:
+        client.close()
+
+
+def main() -> None:
+    """Punto de entrada."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Solo contar, sin modificar"
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
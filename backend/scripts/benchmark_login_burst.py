@@ -0,0 +1,127 @@
+"""
+Benchmark de lag del event loop ante una ráfaga de logins
+
+Simula el inicio de jornada: N logins simultáneos verificando bcrypt mientras
+una tarea "ticker" mide cuánto se retrasa el event loop (lo que sufren todos
+los demás requests del worker).
+
+Compara:
+- sync: verify_password llamado directamente en la corrutina (bloquea el loop)
+- pool: PasswordHasher (pool de hilos acotado + token bucket de logins)
+
+Uso:
+    python scripts/benchmark_login_burst.py
+    python scripts/benchmark_login_burst.py --logins 200 --workers 4 --rate 20 --burst 40
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.exceptions import RateLimitException  # noqa: E402
+from app.core.utils.password import (  # noqa: E402
+    PasswordHasher,
+    get_password_hash,
+    verify_password,
+)
+
+TICK_SECONDS = 0.01
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: list[float]) -> None:
+    """Registra el retraso (ms) de cada tick respecto de lo esperado."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append((time.perf_counter() - start - TICK_SECONDS) * 1000)
+
+
+async def run_burst(mode: str, logins: int, hashed: str, args) -> dict:
+    """Ejecuta una ráfaga de logins y retorna métricas."""
+    hasher = PasswordHasher(
+        max_workers=args.workers,
+        max_pending=args.max_pending,
+        login_rate=args.rate,
+        login_burst=args.burst,
+        login_max_wait_s=args.max_wait,
+    )
+
+    # Latencia medida desde el inicio de la ráfaga (lo que espera cada cliente)
+    async def login() -> tuple[bool, float]:
+        try:
+            if mode == "sync":
+                ok = verify_password("password123", hashed)
+            else:
+                ok = await hasher.verify_login("password123", hashed)
+        except RateLimitException:
+            return False, (time.perf_counter() - burst_start) * 1000
+        return ok, (time.perf_counter() - burst_start) * 1000
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_loop_lag(stop, lags))
+    await asyncio.sleep(0.05)  # Línea base del ticker
+
+    burst_start = time.perf_counter()
+    results = await asyncio.gather(*(login() for _ in range(logins)))
+    total_s = time.perf_counter() - burst_start
+
+    stop.set()
+    await ticker
+    hasher.shutdown()
+
+    latencies = sorted(ms for ok, ms in results if ok)
+    lags.sort()
+    return {
+        "mode": mode,
+        "total_s": total_s,
+        "accepted": len(latencies),
+        "rejected": logins - len(latencies),
+        "login_p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "login_max_ms": latencies[-1] if latencies else 0.0,
+        "lag_p50_ms": statistics.median(lags) if lags else 0.0,
+        "lag_p99_ms": lags[int(len(lags) * 0.99) - 1] if lags else 0.0,
+        "lag_max_ms": lags[-1] if lags else 0.0,
+    }
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime una tabla de resultados."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-pending", type=int, default=256)
+    parser.add_argument("--rate", type=float, default=20.0)
+    parser.add_argument("--burst", type=int, default=40)
+    parser.add_argument("--max-wait", type=float, default=5.0)
+    args = parser.parse_args()
+
+    hashed = get_password_hash("password123")
+
+    print(f"🔐 Ráfaga de {args.logins} logins (bcrypt)")
+    header = (
+        f"{'Modo':>5} | {'Total (s)':>9} | {'OK':>4} | {'429':>4} | "
+        f"{'Login p50':>9} | {'Login max':>9} | "
+        f"{'Lag p50':>7} | {'Lag p99':>7} | {'Lag max':>7}"
+    )
+    print(header)
+    print("-" * len(header))
+    for mode in ("sync", "pool"):
+        r = asyncio.run(run_burst(mode, args.logins, hashed, args))
+        print(
+            f"{r['mode']:>5} | {r['total_s']:>9.2f} | {r['accepted']:>4} | "
+            f"{r['rejected']:>4} | {r['login_p50_ms']:>9.0f} | "
+            f"{r['login_max_ms']:>9.0f} | {r['lag_p50_ms']:>7.1f} | "
+            f"{r['lag_p99_ms']:>7.1f} | {r['lag_max_ms']:>7.1f}"
+        )
+    print("\nTiempos en ms. Lag = retraso del event loop (afecta a todos los requests)")
+
+
+if __name__ == "__main__":
+    main()
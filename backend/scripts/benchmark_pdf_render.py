@@ -0,0 +1,132 @@
+"""
+Benchmark de renderizado del PDF de trazabilidad
+
+Mide el tiempo de generación de un reporte de trazabilidad con historias de
+10, 1.000 y 10.000 estimaciones (datos sintéticos, sin MongoDB):
+- Primer reporte del proceso (construye estilos y QR)
+- Reportes siguientes (estilos y QR ya cacheados)
+
+Uso:
+    python scripts/benchmark_pdf_render.py
+    python scripts/benchmark_pdf_render.py --sizes 10 1000 10000 --repeat 5
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.utils.pdf_generator import PDFGenerator  # noqa: E402
+from app.domain.entities.animal import Animal  # noqa: E402
+from app.domain.entities.weight_estimation import WeightEstimation  # noqa: E402
+
+
+def build_report_data(animal: Animal, estimation_count: int) -> dict:
+    """Construye datos de reporte equivalentes a GenerateTraceabilityReportUseCase."""
+    rng = random.Random(estimation_count)
+    start = datetime.utcnow() - timedelta(days=3 * 365)
+    step = timedelta(days=3 * 365) / max(estimation_count, 1)
+
+    estimations = []
+    weight = 35.0
+    for i in range(estimation_count):
+        weight += rng.uniform(-1.5, 3.0)
+        estimations.append(
+            WeightEstimation(
+                animal_id=str(animal.id),
+                breed=animal.breed,
+                estimated_weight_kg=max(weight, 30.0),
+                confidence=rng.uniform(0.8, 0.97),
+                ml_model_version="1.0.0",
+                processing_time_ms=rng.randint(200, 900),
+                timestamp=start + step * i,
+            )
+        )
+
+    # El caso de uso entrega las estimaciones de la más reciente a la más antigua
+    estimations.reverse()
+
+    timeline = [
+        {
+            "date": animal.registration_date,
+            "type": "Registro",
+            "description": f"Animal {animal.ear_tag} registrado",
+        }
+    ]
+
+    return {
+        "animal": animal,
+        "weight_estimations": estimations,
+        "lineage": {"mother": None, "father": None, "descendants": []},
+        "timeline": timeline,
+        "summary": {
+            "total_weight_estimations": len(estimations),
+            "current_weight": estimations[0].estimated_weight_kg
+            if estimations
+            else None,
+            "first_weight": estimations[-1].estimated_weight_kg
+            if estimations
+            else None,
+            "age_months": animal.calculate_age_months(),
+        },
+        "format": "pdf",
+    }
+
+
+def time_render(report_data: dict) -> tuple[float, int]:
+    """Renderiza un reporte y retorna (milisegundos, tamaño en bytes)."""
+    start = time.perf_counter()
+    content = PDFGenerator.generate_traceability_report(report_data)
+    return (time.perf_counter() - start) * 1000, len(content)
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime una tabla de resultados."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 10_000])
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Reportes cacheados por tamaño"
+    )
+    args = parser.parse_args()
+
+    animal = Animal(
+        id=uuid4(),
+        ear_tag="HG-NEL-001",
+        breed="nelore",
+        birth_date=datetime.utcnow() - timedelta(days=3 * 365),
+        gender="female",
+        name="Benchmark",
+        farm_id=uuid4(),
+    )
+
+    print("📄 Benchmark PDF de trazabilidad")
+    print(
+        f"{'Estimaciones':>12} | {'Primero (ms)':>12} | {'Mediana (ms)':>12} | {'Tamaño (KB)':>11}"
+    )
+    print("-" * 57)
+
+    first = True
+    for size in args.sizes:
+        report_data = build_report_data(animal, size)
+
+        cold_ms, _ = time_render(report_data)
+        warm = [time_render(report_data) for _ in range(args.repeat)]
+        warm_ms = statistics.median(ms for ms, _ in warm)
+        size_kb = warm[-1][1] / 1024 if warm else 0
+
+        label = f"{cold_ms:.1f}{' *' if first else ''}"
+        print(f"{size:>12,} | {label:>12} | {warm_ms:>12.1f} | {size_kb:>11.1f}")
+        first = False
+
+    print("\n* Incluye la construcción de estilos y del QR (una vez por proceso)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+"""
+Benchmark del pipeline de inferencia TFLite del backend
+
+Ejecuta el mismo camino que DeepLearningWeightEstimationStrategy:
+ImagePreprocessor (decode + preprocess + cuantización de entrada) →
+Interpreter (set_tensor/invoke/get_tensor) → _apply_weight_correction,
+con JPEGs sintéticos de varias resoluciones y/o imágenes reales.
+
+Mide latencia por batch e imagen (p50/p95/p99), throughput y mediana por
+etapa para cada combinación de batch size y hilos del intérprete, y guarda
+los resultados en JSON. Con --baseline compara contra una ejecución
+anterior y termina con código 1 si alguna configuración empeora más de
+--max-regression.
+
+Uso:
+    python scripts/benchmark_tflite_inference.py --model ml_models/generic-cattle-v1.0.0.tflite
+    python scripts/benchmark_tflite_inference.py --images ../data/sample \\
+        --batch-sizes 1 4 --threads 1 2 4 --output bench.json
+    python scripts/benchmark_tflite_inference.py --baseline bench.json --output bench_new.json
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings  # noqa: E402
+from app.domain.shared.constants import BreedType  # noqa: E402
+from app.ml.model_loader import TFLITE_SOURCE, MLModelLoader, tflite  # noqa: E402
+from app.ml.preprocessing import ImagePreprocessor  # noqa: E402
+from app.ml.stage_timings import (  # noqa: E402
+    STAGE_DECODE,
+    STAGE_INVOKE,
+    STAGE_POST_CORRECTION,
+    STAGE_PREPROCESS,
+)
+from app.ml.strategies.deep_learning_strategy import (  # noqa: E402
+    DeepLearningWeightEstimationStrategy,
+)
+
+DEFAULT_RESOLUTIONS = ["640x480", "1280x960", "1920x1080", "4000x3000"]
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+
+def synthetic_jpeg(width: int, height: int, seed: int) -> bytes:
+    """
+    JPEG sintético con gradiente + ruido (tamaño de archivo realista).
+
+    Args:
+        width, height: Resolución
+        seed: Semilla del ruido
+
+    Returns:
+        Bytes JPEG (quality 90, como una foto de cámara)
+    """
+    rng = np.random.default_rng(seed)
+    gradient = np.linspace(0, 200, width, dtype=np.float32)[None, :, None]
+    noise = rng.normal(0, 25, (height, width, 3)).astype(np.float32)
+    pixels = np.clip(gradient + noise + 30, 0, 255).astype(np.uint8)
+
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def load_image_sets(args: argparse.Namespace) -> dict[str, list[bytes]]:
+    """Conjuntos de imágenes a medir: sintéticos por resolución y reales."""
+    image_sets: dict[str, list[bytes]] = {}
+
+    for resolution in args.resolutions:
+        width, height = (int(v) for v in resolution.lower().split("x"))
+        image_sets[f"synthetic_{width}x{height}"] = [
+            synthetic_jpeg(width, height, seed) for seed in range(args.distinct_images)
+        ]
+
+    if args.images:
+        paths = sorted(
+            p
+            for p in Path(args.images).rglob("*")
+            if p.suffix.lower() in IMAGE_EXTENSIONS
+        )
+        if not paths:
+            raise SystemExit(f"❌ No hay imágenes en {args.images}")
+        image_sets["real"] = [p.read_bytes() for p in paths[: args.max_real_images]]
+
+    return image_sets
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """p50/p95/p99/media en ms."""
+    array = np.asarray(values, dtype=np.float64)
+    return {
+        "p50": round(float(np.percentile(array, 50)), 3),
+        "p95": round(float(np.percentile(array, 95)), 3),
+        "p99": round(float(np.percentile(array, 99)), 3),
+        "mean": round(float(array.mean()), 3),
+    }
+
+
+def run_config(
+    model_path: Path,
+    images: list[bytes],
+    batch_size: int,
+    num_threads: int,
+    iterations: int,
+    warmup: int,
+    breed: BreedType,
+    strategy: DeepLearningWeightEstimationStrategy,
+) -> dict:
+    """
+    Medir una combinación (imágenes, batch size, hilos).
+
+    Cada iteración procesa batch_size imágenes completas: decodificación y
+    preprocesamiento por imagen, un invoke por batch y corrección por salida.
+
+    Returns:
+        dict con latencias, throughput y mediana por etapa
+    """
+    # Mismas opciones que MLModelLoader (op resolver / XNNPACK de Settings)
+    interpreter = tflite.Interpreter(  # type: ignore[union-attr]
+        model_path=str(model_path),
+        num_threads=num_threads,
+        **MLModelLoader._interpreter_options(),
+    )
+    input_details = interpreter.get_input_details()[0]
+    output_details = interpreter.get_output_details()[0]
+    if batch_size != input_details["shape"][0]:
+        interpreter.resize_tensor_input(
+            input_details["index"], [batch_size, *input_details["shape"][1:]]
+        )
+    interpreter.allocate_tensors()
+    input_details = interpreter.get_input_details()[0]
+
+    batch_ms: list[float] = []
+    stages_ms: dict[str, list[float]] = {
+        STAGE_DECODE: [],
+        STAGE_PREPROCESS: [],
+        STAGE_INVOKE: [],
+        STAGE_POST_CORRECTION: [],
+    }
+    sink = io.StringIO()
+
+    for iteration in range(warmup + iterations):
+        batch = [
+            images[(iteration * batch_size + i) % len(images)]
+            for i in range(batch_size)
+        ]
+        stage_totals = dict.fromkeys(stages_ms, 0.0)
+        start = time.perf_counter()
+
+        arrays = []
+        for image_bytes in batch:
+            t0 = time.perf_counter()
+            image = ImagePreprocessor.decode(image_bytes)
+            t1 = time.perf_counter()
+            arrays.append(ImagePreprocessor.preprocess_from_pil(image))
+            t2 = time.perf_counter()
+            stage_totals[STAGE_DECODE] += (t1 - t0) * 1000
+            stage_totals[STAGE_PREPROCESS] += (t2 - t1) * 1000
+
+        t0 = time.perf_counter()
+        input_data = ImagePreprocessor.to_model_input(
+            np.concatenate(arrays), input_details
+        )
+        stage_totals[STAGE_PREPROCESS] += (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        interpreter.set_tensor(input_details["index"], input_data)
+        interpreter.invoke()
+        output_data = interpreter.get_tensor(output_details["index"])
+        stage_totals[STAGE_INVOKE] += (time.perf_counter() - t0) * 1000
+
+        # La corrección imprime cada ajuste: descartar la salida
+        t0 = time.perf_counter()
+        with redirect_stdout(sink):
+            for row in range(batch_size):
+                raw_weight = strategy._read_weight(
+                    output_data[row : row + 1], output_details
+                )
+                strategy._apply_weight_correction(raw_weight, breed)
+        stage_totals[STAGE_POST_CORRECTION] += (time.perf_counter() - t0) * 1000
+        sink.seek(0)
+        sink.truncate()
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if iteration < warmup:
+            continue
+        batch_ms.append(elapsed_ms)
+        for stage, total in stage_totals.items():
+            stages_ms[stage].append(total / batch_size)
+
+    total_s = sum(batch_ms) / 1000
+    return {
+        "batch_size": batch_size,
+        "num_threads": num_threads,
+        "iterations": iterations,
+        "batch_latency_ms": percentiles(batch_ms),
+        "image_latency_ms": percentiles([ms / batch_size for ms in batch_ms]),
+        "throughput_images_per_sec": round(batch_size * iterations / total_s, 2),
+        "stage_p50_ms": {
+            stage: round(float(np.median(values)), 3)
+            for stage, values in stages_ms.items()
+        },
+    }
+
+
+def compare_with_baseline(
+    results: list[dict], baseline_path: Path, max_regression: float
+) -> list[str]:
+    """
+    Comparar p50/p95 por imagen con una ejecución anterior.
+
+    Returns:
+        Lista de regresiones (vacía si ninguna supera max_regression)
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {
+        (r["image_set"], r["batch_size"], r["num_threads"]): r
+        for r in baseline["results"]
+    }
+
+    print(f"\n📈 Comparación con {baseline_path} (p50/p95 por imagen)")
+    regressions = []
+    for result in results:
+        key = (result["image_set"], result["batch_size"], result["num_threads"])
+        if key not in previous:
+            continue
+        for stat in ("p50", "p95"):
+            old = previous[key]["image_latency_ms"][stat]
+            new = result["image_latency_ms"][stat]
+            change = (new - old) / old if old else 0.0
+            marker = "❌" if change > max_regression else "  "
+            print(
+                f"{marker} {key[0]:<22} b={key[1]:<3} t={key[2]:<3} {stat}: "
+                f"{old:8.2f} → {new:8.2f} ms ({change:+.1%})"
+            )
+            if change > max_regression:
+                regressions.append(f"{key} {stat} {change:+.1%}")
+    return regressions
+
+
+def main() -> None:
+    """Ejecuta el benchmark, imprime la tabla y guarda el JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--model",
+        default=str(Path(settings.ML_MODELS_PATH) / settings.ML_DEFAULT_MODEL),
+        help="Modelo .tflite (default: ML_MODELS_PATH/ML_DEFAULT_MODEL)",
+    )
+    parser.add_argument("--images", default=None, help="Directorio con JPEG/PNG reales")
+    parser.add_argument("--max-real-images", type=int, default=50)
+    parser.add_argument("--resolutions", nargs="*", default=DEFAULT_RESOLUTIONS)
+    parser.add_argument(
+        "--distinct-images", type=int, default=4, help="JPEGs sintéticos por resolución"
+    )
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 2, os.cpu_count() or 1]
+    )
+    parser.add_argument("--iterations", type=int, default=30, help="Batches medidos")
+    parser.add_argument("--warmup", type=int, default=3, help="Batches no medidos")
+    parser.add_argument(
+        "--breed", default=BreedType.NELORE.value, choices=[b.value for b in BreedType]
+    )
+    parser.add_argument("--output", default=None, help="Archivo JSON de resultados")
+    parser.add_argument(
+        "--baseline", default=None, help="JSON de una ejecución anterior"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.10,
+        help="Empeoramiento máximo frente a --baseline (0.10 = 10%%)",
+    )
+    args = parser.parse_args()
+
+    model_path = Path(args.model)
+    if not model_path.exists():
+        raise SystemExit(f"❌ Modelo no encontrado: {model_path}")
+    if tflite is None:
+        raise SystemExit("❌ TensorFlow o tflite-runtime no instalado")
+
+    image_sets = load_image_sets(args)
+    thread_counts = sorted(set(args.threads))
+    strategy = DeepLearningWeightEstimationStrategy()
+    breed = BreedType(args.breed)
+
+    print(f"🧪 Benchmark TFLite ({TFLITE_SOURCE}): {model_path.name}")
+    print(
+        f"{'Imágenes':<22} | {'Batch':>5} | {'Hilos':>5} | {'p50 ms':>8} | "
+        f"{'p95 ms':>8} | {'p99 ms':>8} | {'img/s':>7} | {'invoke p50':>10}"
+    )
+    print("-" * 92)
+
+    results = []
+    for name, images in image_sets.items():
+        for batch_size in args.batch_sizes:
+            for num_threads in thread_counts:
+                result = {
+                    "image_set": name,
+                    **run_config(
+                        model_path,
+                        images,
+                        batch_size,
+                        num_threads,
+                        args.iterations,
+                        args.warmup,
+                        breed,
+                        strategy,
+                    ),
+                }
+                results.append(result)
+                latency = result["image_latency_ms"]
+                print(
+                    f"{name:<22} | {batch_size:>5} | {num_threads:>5} | "
+                    f"{latency['p50']:>8.2f} | {latency['p95']:>8.2f} | "
+                    f"{latency['p99']:>8.2f} | "
+                    f"{result['throughput_images_per_sec']:>7.1f} | "
+                    f"{result['stage_p50_ms'][STAGE_INVOKE]:>10.2f}"
+                )
+    print("\nLatencias por imagen (batch / batch size); invoke p50 por imagen")
+
+    report = {
+        "created_at": datetime.utcnow().isoformat(),
+        "model": {
+            "path": str(model_path),
+            "size_bytes": model_path.stat().st_size,
+        },
+        "environment": {
+            "tflite_source": TFLITE_SOURCE,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "ml_use_xnnpack": settings.ML_USE_XNNPACK,
+            "ml_op_resolver": settings.ML_OP_RESOLVER,
+        },
+        "config": {
+            "breed": breed.value,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "image_sets": {name: len(images) for name, images in image_sets.items()},
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Resultados: {args.output}")
+
+    if args.baseline:
+        regressions = compare_with_baseline(
+            results, Path(args.baseline), args.max_regression
+        )
+        if regressions:
+            print(f"\n❌ {len(regressions)} regresiones > {args.max_regression:.0%}")
+            sys.exit(1)
+        print("\n✅ Sin regresiones")
+
+
+if __name__ == "__main__":
+    main()
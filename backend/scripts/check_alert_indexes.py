@@ -0,0 +1,325 @@
+"""
+Verificación del plan de índices de la colección de alertas
+
+Ejecuta `explain` sobre las consultas frecuentes de AlertRepositoryImpl
+(construidas con los mismos filtros del repositorio) y falla si alguna:
+- recorre la colección (COLLSCAN)
+- ordena en memoria (etapa SORT bloqueante)
+- usa un índice distinto al esperado
+- no es cubierta cuando debe serlo (find_due_times)
+
+También lista los índices presentes en MongoDB que no están declarados en
+AlertModel (índices heredados que Beanie no elimina).
+
+Por defecto trabaja sobre una base temporal `<MONGODB_DB_NAME>_explain` con
+alertas sintéticas; con --live usa la base real sin insertar nada.
+
+Uso:
+    python scripts/check_alert_indexes.py
+    python scripts/check_alert_indexes.py --seed 50000 --keep
+    python scripts/check_alert_indexes.py --live
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from beanie import init_beanie  # noqa: E402
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.data.models.alert_model import CLOSED_STATUSES, AlertModel  # noqa: E402
+from app.data.repositories.alert_repository_impl import (  # noqa: E402
+    closed_query,
+    due_query,
+    pending_query,
+    schedule_query,
+)
+from app.domain.entities.alert import AlertStatus, AlertType  # noqa: E402
+
+SEED_BATCH_SIZE = 5000
+SEED_USERS = 200
+SEED_FARMS = 50
+
+
+def seed_alert(
+    now: datetime, users: list[UUID], farms: list[UUID], animals: list[UUID]
+) -> AlertModel:
+    """Alerta sintética con una distribución parecida a la de producción."""
+    status = random.choices(list(AlertStatus), weights=[20, 25, 25, 10, 20], k=1).pop()
+    scheduled_at = now + timedelta(minutes=random.randint(-180 * 1440, 180 * 1440))
+    closed_at = None
+    if status.value in CLOSED_STATUSES:
+        closed_at = scheduled_at + timedelta(days=random.randint(0, 30))
+    return AlertModel(
+        user_id=random.choice(users),
+        farm_id=random.choice(farms),
+        type=random.choice(list(AlertType)),
+        title="Alerta sintética",
+        message="Generada por check_alert_indexes.py",
+        status=status,
+        scheduled_at=scheduled_at,
+        related_entity_type="animal",
+        related_entity_id=random.choice(animals),
+        created_at=scheduled_at - timedelta(days=random.randint(1, 60)),
+        closed_at=closed_at,
+    )
+
+
+async def seed(count: int, now: datetime) -> tuple[UUID, UUID, UUID]:
+    """Inserta alertas sintéticas y retorna un usuario, finca y animal de ejemplo."""
+    users = [uuid4() for _ in range(SEED_USERS)]
+    farms = [uuid4() for _ in range(SEED_FARMS)]
+    animals = [uuid4() for _ in range(count // 10 or 1)]
+
+    start = time.perf_counter()
+    for offset in range(0, count, SEED_BATCH_SIZE):
+        batch = [
+            seed_alert(now, users, farms, animals)
+            for _ in range(min(SEED_BATCH_SIZE, count - offset))
+        ]
+        await AlertModel.insert_many(batch)
+    print(f"🌱 {count} alertas sintéticas en {time.perf_counter() - start:.1f}s")
+    return users[0], farms[0], animals[0]
+
+
+async def sample_ids() -> tuple[UUID, UUID, UUID]:
+    """Usuario, finca y animal de una alerta existente (modo --live)."""
+    alert = await AlertModel.find(
+        AlertModel.farm_id != None,  # noqa: E711
+        AlertModel.related_entity_id != None,  # noqa: E711
+    ).first_or_none()
+    if alert is None:
+        raise SystemExit("❌ No hay alertas con finca y entidad relacionada")
+    assert alert.farm_id is not None and alert.related_entity_id is not None
+    return alert.user_id, alert.farm_id, alert.related_entity_id
+
+
+def hot_queries(
+    now: datetime, user_id: UUID, farm_id: UUID, animal_id: UUID
+) -> list[dict[str, Any]]:
+    """Consultas frecuentes del repositorio con el índice esperado de cada una."""
+    start_of_day = datetime(now.year, now.month, now.day)
+    end_of_day = start_of_day + timedelta(days=1)
+    return [
+        {
+            "name": "find_due",
+            "filter": due_query(now),
+            "sort": [("scheduled_at", 1)],
+            "limit": settings.ALERTS_SCHEDULER_BATCH_SIZE,
+            "indexes": {"pending_scheduled_at"},
+        },
+        {
+            "name": "find_due_times",
+            "filter": due_query(now + timedelta(hours=1)),
+            "projection": {"_id": 0, "scheduled_at": 1},
+            "sort": [("scheduled_at", 1)],
+            "limit": settings.ALERTS_SCHEDULER_PREFETCH,
+            "indexes": {"pending_scheduled_at"},
+            "covered": True,
+        },
+        {
+            "name": "find_pending(user)",
+            "filter": pending_query(user_id),
+            "sort": [("scheduled_at", 1)],
+            "indexes": {"pending_scheduled_at", "user_scheduled_at"},
+        },
+        {
+            "name": "find_today(user)",
+            "filter": schedule_query(start_of_day, end_of_day, user_id=user_id),
+            "sort": [("scheduled_at", 1)],
+            "indexes": {"user_scheduled_at"},
+        },
+        {
+            "name": "find_upcoming(farm)",
+            "filter": schedule_query(
+                start_of_day, start_of_day + timedelta(days=7), farm_id=farm_id
+            ),
+            "sort": [("scheduled_at", 1)],
+            "indexes": {"farm_scheduled_at"},
+        },
+        {
+            "name": "find_scheduled",
+            "filter": schedule_query(start_of_day, end_of_day),
+            "sort": [("scheduled_at", 1)],
+            "indexes": {"scheduled_at_1"},
+        },
+        {
+            "name": "find(user)",
+            "filter": {"user_id": user_id},
+            "sort": [("created_at", -1)],
+            "limit": 50,
+            "indexes": {"user_created_at"},
+        },
+        {
+            "name": "find_pending_related_ids",
+            "filter": {
+                "type": AlertType.SCHEDULED_WEIGHING.value,
+                "status": AlertStatus.PENDING.value,
+                "related_entity_type": "animal",
+                "related_entity_id": {"$in": [animal_id]},
+            },
+            "projection": {"related_entity_id": 1},
+            "indexes": {"related_entity_type"},
+        },
+        {
+            "name": "archive_closed",
+            "filter": closed_query(now - timedelta(days=90)),
+            "projection": {"_id": 1},
+            "limit": settings.ALERTS_SCHEDULER_BATCH_SIZE,
+            "indexes": {"closed_at"},
+        },
+    ]
+
+
+def plan_stages(stage: dict[str, Any]) -> list[dict[str, Any]]:
+    """Aplana el árbol de etapas de un winningPlan."""
+    stages = [stage]
+    if "inputStage" in stage:
+        stages.extend(plan_stages(stage["inputStage"]))
+    for child in stage.get("inputStages", []):
+        stages.extend(plan_stages(child))
+    return stages
+
+
+def check_plan(query: dict[str, Any], explain: dict[str, Any]) -> list[str]:
+    """Problemas del plan ganador de una consulta (lista vacía si está bien)."""
+    planner = explain["queryPlanner"]
+    # Motor de ejecución SBE (MongoDB 7): el árbol está en queryPlan
+    winning = planner["winningPlan"]
+    stages = plan_stages(winning.get("queryPlan", winning))
+    names = {stage["stage"] for stage in stages}
+    used = {stage["indexName"] for stage in stages if "indexName" in stage}
+
+    problems = []
+    if "COLLSCAN" in names:
+        problems.append("COLLSCAN")
+    if "SORT" in names:
+        problems.append("SORT en memoria")
+    if not used & query["indexes"]:
+        expected = ", ".join(sorted(query["indexes"]))
+        problems.append(f"índice {sorted(used) or '-'} (esperado: {expected})")
+    if query.get("covered") and explain["executionStats"]["totalDocsExamined"]:
+        problems.append("no cubierta (docsExamined > 0)")
+    return problems
+
+
+async def explain(query: dict[str, Any]) -> dict[str, Any]:
+    """Ejecuta explain("executionStats") con el filtro codificado por Beanie."""
+    encoded = AlertModel.find(query["filter"]).get_filter_query()
+    find: dict[str, Any] = {
+        "find": AlertModel.get_motor_collection().name,
+        "filter": encoded,
+    }
+    if "projection" in query:
+        find["projection"] = query["projection"]
+    if "sort" in query:
+        find["sort"] = dict(query["sort"])
+    if "limit" in query:
+        find["limit"] = query["limit"]
+
+    database = AlertModel.get_motor_collection().database
+    return await database.command(
+        {"explain": find, "verbosity": "executionStats"},
+        codec_options=AlertModel.get_motor_collection().codec_options,
+    )
+
+
+async def check_indexes() -> list[str]:
+    """Índices presentes en MongoDB que no declara AlertModel."""
+    declared = {"_id_"}
+    for index in AlertModel.Settings.indexes:
+        if isinstance(index, str):
+            declared.add(f"{index}_1")
+        else:
+            declared.add(index.document["name"])
+
+    info = await AlertModel.get_motor_collection().index_information()
+    return sorted(set(info) - declared)
+
+
+async def run(args: argparse.Namespace) -> bool:
+    """Ejecuta la verificación; retorna True si todas las consultas pasan."""
+    client: AsyncIOMotorClient = AsyncIOMotorClient(settings.MONGODB_URL)  # type: ignore[assignment]
+    db_name = settings.MONGODB_DB_NAME
+    if not args.live:
+        db_name = f"{db_name}_explain"
+        await client.drop_database(db_name)
+
+    try:
+        await init_beanie(database=client[db_name], document_models=[AlertModel])  # type: ignore[arg-type]
+        print(f"🗄️  Base de datos: {db_name}")
+
+        now = datetime.utcnow()
+        if args.live:
+            user_id, farm_id, animal_id = await sample_ids()
+        else:
+            user_id, farm_id, animal_id = await seed(args.seed, now)
+
+        ok = True
+        header = (
+            f"{'Consulta':<26} | {'Índice':<22} | {'Keys':>7} | {'Docs':>7} | "
+            f"{'nRet':>6} | {'ms':>5} | Estado"
+        )
+        print(header)
+        print("-" * len(header))
+        for query in hot_queries(now, user_id, farm_id, animal_id):
+            result = await explain(query)
+            stats = result["executionStats"]
+            winning = result["queryPlanner"]["winningPlan"]
+            used = sorted(
+                stage["indexName"]
+                for stage in plan_stages(winning.get("queryPlan", winning))
+                if "indexName" in stage
+            )
+            problems = check_plan(query, result)
+            ok = ok and not problems
+            print(
+                f"{query['name']:<26} | {','.join(used) or '-':<22} | "
+                f"{stats['totalKeysExamined']:>7} | {stats['totalDocsExamined']:>7} | "
+                f"{stats['nReturned']:>6} | {stats['executionTimeMillis']:>5} | "
+                f"{'✅' if not problems else '❌ ' + '; '.join(problems)}"
+            )
+
+        undeclared = await check_indexes()
+        if undeclared:
+            print(f"\n⚠️  Índices no declarados en AlertModel: {', '.join(undeclared)}")
+            print("   (Beanie no los elimina: revisar y eliminar con dropIndex)")
+        return ok
+    finally:
+        if not args.live and not args.keep:
+            await client.drop_database(db_name)
+        client.close()
+
+
+def main() -> None:
+    """Punto de entrada."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--seed", type=int, default=20000, help="Alertas sintéticas a insertar"
+    )
+    parser.add_argument(
+        "--live", action="store_true", help="Usar la base real (sin insertar)"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="No eliminar la base temporal"
+    )
+    args = parser.parse_args()
+
+    if not asyncio.run(run(args)):
+        print("\n❌ Hay consultas sin un plan indexado")
+        sys.exit(1)
+    print("\n✅ Todas las consultas usan el índice esperado")
+
+
+if __name__ == "__main__":
+    main()
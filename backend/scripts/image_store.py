@@ -0,0 +1,264 @@
+"""
+Mantenimiento del almacenamiento de imágenes direccionado por contenido
+
+Subcomandos:
+- migrate: mueve las imágenes con el layout anterior (uploads/{breed}/...) a
+  uploads/cas/, deduplica por SHA-256 y actualiza los paths en estimaciones y
+  animales
+- recount: recalcula los contadores de referencias desde MongoDB
+- gc: elimina las imágenes sin referencias (y sus variantes) con más de
+  --min-age-hours de antigüedad
+
+Uso:
+    python scripts/image_store.py migrate --dry-run
+    python scripts/image_store.py migrate --variants
+    python scripts/image_store.py recount
+    python scripts/image_store.py gc --min-age-hours 24 --dry-run
+"""
+
+import argparse
+import asyncio
+import hashlib
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import (  # noqa: E402
+    close_mongodb_connection,
+    connect_to_mongodb,
+    init_database,
+)
+from app.core.utils.image_storage import (  # noqa: E402
+    delete_stored_image,
+    ensure_uploads_directory,
+    generate_image_variants,
+    image_storage_service,
+    iter_stored_images,
+    store_image,
+    stored_content,
+)
+from app.data.repositories.image_blob_repository_impl import (  # noqa: E402
+    ImageBlobRepositoryImpl,
+)
+from app.domain.entities.image_blob import CAS_DIRECTORY, ImageBlob  # noqa: E402
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+VARIANT_PATTERN = re.compile(r"\.w\d+\.jpg$")
+GC_BATCH_SIZE = 1000
+
+
+def find_legacy_images(uploads_dir: Path) -> tuple[list[Path], list[Path]]:
+    """
+    Busca imágenes fuera de uploads/cas/.
+
+    Returns:
+        (originales, variantes generadas con el layout anterior)
+    """
+    originals: list[Path] = []
+    variants: list[Path] = []
+    for file_path in sorted(uploads_dir.rglob("*")):
+        if not file_path.is_file() or file_path.suffix.lower() not in IMAGE_SUFFIXES:
+            continue
+        relative = file_path.relative_to(uploads_dir)
+        if relative.parts[0] == CAS_DIRECTORY:
+            continue
+        if VARIANT_PATTERN.search(file_path.name):
+            variants.append(file_path)
+        else:
+            originals.append(file_path)
+    return originals, variants
+
+
+def stored_path_aliases(relative_path: str) -> list[str]:
+    """Formas en que un path puede estar guardado en MongoDB."""
+    return [
+        relative_path,
+        f"/{relative_path}",
+        f"uploads/{relative_path}",
+        f"/uploads/{relative_path}",
+    ]
+
+
+async def migrate(
+    args: argparse.Namespace, repository: ImageBlobRepositoryImpl
+) -> None:
+    """Migra el layout anterior a uploads/cas/."""
+    uploads_dir = ensure_uploads_directory()
+    originals, old_variants = await asyncio.to_thread(find_legacy_images, uploads_dir)
+    print(f"📂 {len(originals)} imágenes y {len(old_variants)} variantes fuera de cas/")
+
+    mapping: dict[str, str] = {}
+    digests: set[str] = set()
+    bytes_before = 0
+    bytes_after = 0
+    for file_path in originals:
+        content = await asyncio.to_thread(file_path.read_bytes)
+        bytes_before += len(content)
+        relative = file_path.relative_to(uploads_dir).as_posix()
+
+        if args.dry_run:
+            # Mismo formato/extensión que store_image, sin escribir
+            stored_bytes, extension = await asyncio.to_thread(stored_content, content)
+            digest = hashlib.sha256(stored_bytes).hexdigest()
+            new_path = ImageBlob.relative_path_for(digest, extension)
+            stored_size = len(stored_bytes)
+        else:
+            stored = await asyncio.to_thread(store_image, content)
+            digest, new_path = stored.digest, stored.relative_path
+            stored_size = stored.size_bytes
+
+        if digest not in digests:
+            digests.add(digest)
+            bytes_after += stored_size
+        for alias in stored_path_aliases(relative):
+            mapping[alias] = new_path
+
+    duplicates = len(originals) - len(digests)
+    print(
+        f"🔑 {len(digests)} contenidos únicos ({duplicates} duplicados): "
+        f"{bytes_before / 1e6:.1f} MB → {bytes_after / 1e6:.1f} MB"
+    )
+    if args.dry_run:
+        print("ℹ️  --dry-run: no se modificó nada")
+        return
+
+    updated = await repository.replace_paths(mapping)
+    print(f"📝 {updated} documentos actualizados (estimaciones + animales)")
+
+    # Los archivos antiguos se eliminan solo después de actualizar MongoDB
+    if not args.keep_originals:
+        for file_path in originals + old_variants:
+            file_path.unlink(missing_ok=True)
+        print(f"🗑️  {len(originals) + len(old_variants)} archivos antiguos eliminados")
+
+    referenced = await repository.recount()
+    print(f"🔢 Contadores recalculados: {referenced} imágenes referenciadas")
+
+    if args.variants:
+        start = time.perf_counter()
+        new_paths = sorted(set(mapping.values()))
+        for new_path in new_paths:
+            await asyncio.to_thread(
+                generate_image_variants,
+                new_path,
+                image_storage_service.variants,
+                image_storage_service.quality,
+            )
+        print(
+            f"🖼️  Variantes de {len(new_paths)} imágenes generadas en "
+            f"{time.perf_counter() - start:.1f}s"
+        )
+
+
+async def recount(
+    args: argparse.Namespace, repository: ImageBlobRepositoryImpl
+) -> None:
+    """Recalcula los contadores de referencias."""
+    referenced = await repository.recount()
+    print(f"🔢 Contadores recalculados: {referenced} imágenes referenciadas")
+
+
+async def collect_garbage(
+    args: argparse.Namespace, repository: ImageBlobRepositoryImpl
+) -> None:
+    """Elimina imágenes sin referencias."""
+    cutoff = datetime.utcnow() - timedelta(hours=args.min_age_hours)
+    cutoff_ts = time.time() - args.min_age_hours * 3600
+    sizes = list(image_storage_service.variants.values())
+
+    images = await asyncio.to_thread(lambda: list(iter_stored_images()))
+    print(f"📂 {len(images)} imágenes en {CAS_DIRECTORY}/")
+
+    deleted = 0
+    freed = 0
+    still_referenced = 0
+    for start in range(0, len(images), GC_BATCH_SIZE):
+        batch = images[start : start + GC_BATCH_SIZE]
+        digests = [ImageBlob.digest_from_path(path) for path, _, _ in batch]
+        blobs = await repository.get_by_digests([d for d in digests if d])
+
+        candidates: dict[str, int] = {}
+        for path, size, mtime in batch:
+            if mtime > cutoff_ts:
+                continue  # Recién subida: su estimación puede no existir aún
+            blob = blobs.get(ImageBlob.digest_from_path(path) or "")
+            if blob is None or (blob.is_orphan() and blob.updated_at < cutoff):
+                candidates[path] = size
+
+        # Verificación contra las referencias reales antes de borrar
+        referenced = await repository.find_referenced_paths(list(candidates))
+        still_referenced += len(referenced)
+
+        for path, size in candidates.items():
+            if path in referenced:
+                continue
+            deleted += 1
+            if args.dry_run:
+                freed += size
+                continue
+            freed += await asyncio.to_thread(delete_stored_image, path, sizes)
+            digest = ImageBlob.digest_from_path(path)
+            if digest:
+                await repository.delete(digest)
+
+    # Temporales de escrituras interrumpidas
+    uploads_dir = ensure_uploads_directory()
+    stale_tmp = [
+        tmp
+        for tmp in (uploads_dir / CAS_DIRECTORY).glob("*/*/*.tmp")
+        if tmp.stat().st_mtime < cutoff_ts
+    ]
+    if not args.dry_run:
+        for tmp in stale_tmp:
+            tmp.unlink(missing_ok=True)
+
+    action = "a eliminar" if args.dry_run else "eliminadas"
+    print(f"🗑️  {deleted} imágenes huérfanas {action} ({freed / 1e6:.1f} MB)")
+    print(f"🧹 {len(stale_tmp)} temporales {action}")
+    if still_referenced:
+        print(
+            f"⚠️  {still_referenced} imágenes con contador en cero seguían referenciadas: "
+            "ejecutar `recount`"
+        )
+
+
+async def main() -> None:
+    """Punto de entrada."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="Migrar layout anterior")
+    migrate_parser.add_argument("--dry-run", action="store_true")
+    migrate_parser.add_argument(
+        "--keep-originals",
+        action="store_true",
+        help="No eliminar los archivos antiguos tras migrar",
+    )
+    migrate_parser.add_argument(
+        "--variants", action="store_true", help="Generar miniaturas y vistas previas"
+    )
+
+    subparsers.add_parser("recount", help="Recalcular contadores de referencias")
+
+    gc_parser = subparsers.add_parser("gc", help="Eliminar imágenes huérfanas")
+    gc_parser.add_argument("--min-age-hours", type=float, default=24.0)
+    gc_parser.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args()
+    commands = {"migrate": migrate, "recount": recount, "gc": collect_garbage}
+
+    client = await connect_to_mongodb()
+    try:
+        await init_database(client)
+        await commands[args.command](args, ImageBlobRepositoryImpl())
+    finally:
+        await close_mongodb_connection(client)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,288 @@
+"""
+Registry local de modelos TFLite versionados
+
+Administra ML_REGISTRY_PATH: cada modelo vive en <key>/<versión>/<archivo>
+(key = raza o "generic") y manifest.json indica la versión activa de cada
+key. El backend revisa el manifest cada ML_REGISTRY_POLL_S segundos y
+reemplaza los modelos en caliente (o al instante con POST
+/api/v1/ml/models/reload).
+
+El manifest se escribe de forma atómica (archivo temporal + rename): los
+workers nunca leen un manifest a medias. Las versiones anteriores quedan en
+disco para volver a ellas con `activate`.
+
+Uso:
+    python scripts/model_registry.py list
+    python scripts/model_registry.py publish --file generic-cattle-v1.1.0.tflite \\
+        --key generic --version v1.1.0
+    python scripts/model_registry.py publish --source ../ml-training/models
+    python scripts/model_registry.py activate --key nelore --version v1.0.0
+    python scripts/model_registry.py remove --key nelore
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings  # noqa: E402
+from app.domain.shared.constants import BreedType  # noqa: E402
+
+VALID_KEYS = ["generic"] + [breed.value for breed in BreedType]
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 de un archivo (el mismo que verifica MLModelLoader)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(registry: Path) -> dict[str, Any]:
+    """Manifest del registry (vacío si aún no existe)."""
+    manifest_path = registry / "manifest.json"
+    if not manifest_path.exists():
+        return {"models": []}
+    with open(manifest_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_manifest(registry: Path, manifest: dict[str, Any]) -> None:
+    """Escribe manifest.json de forma atómica."""
+    manifest["updated_at"] = datetime.now().isoformat()
+    manifest["models"].sort(key=lambda entry: entry["breed_type"])
+
+    tmp_path = registry / "manifest.json.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, registry / "manifest.json")
+
+
+def set_active(
+    manifest: dict[str, Any],
+    key: str,
+    version: str,
+    relative_path: str,
+    sha256: str,
+    metrics: dict[str, Any] | None = None,
+) -> None:
+    """Reemplaza (o agrega) la entrada activa de una key."""
+    manifest["models"] = [
+        entry for entry in manifest["models"] if entry["breed_type"] != key
+    ]
+    manifest["models"].append(
+        {
+            "breed_type": key,
+            "version": version,
+            "filename": Path(relative_path).name,
+            "path": relative_path,
+            "sha256": sha256,
+            "metrics": metrics or {},
+        }
+    )
+
+
+def copy_model(registry: Path, source: Path, key: str, version: str) -> str:
+    """
+    Copia un modelo a <key>/<versión>/ del registry.
+
+    Una versión publicada es inmutable: si ya existe con otro contenido, se
+    rechaza (publicar con una versión nueva).
+
+    Returns:
+        Ruta relativa al registry
+    """
+    if key not in VALID_KEYS:
+        raise SystemExit(f"❌ Key inválida: {key}. Opciones: {', '.join(VALID_KEYS)}")
+    if not source.exists():
+        raise SystemExit(f"❌ Modelo no encontrado: {source}")
+
+    relative_path = f"{key}/{version}/{source.name}"
+    target = registry / relative_path
+    published = list(target.parent.glob("*.tflite"))
+    if published:
+        if published != [target] or file_sha256(target) != file_sha256(source):
+            raise SystemExit(
+                f"❌ {key} {version} ya está publicado con otro modelo: "
+                "publicar con una versión nueva"
+            )
+        return relative_path
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Copia completa antes de aparecer con su nombre final
+    tmp_target = target.with_suffix(".tmp")
+    shutil.copyfile(source, tmp_target)
+    os.replace(tmp_target, target)
+    return relative_path
+
+
+def cmd_list(registry: Path, args: argparse.Namespace) -> None:
+    """Modelos activos y versiones disponibles en disco."""
+    manifest = load_manifest(registry)
+    active = {entry["breed_type"]: entry for entry in manifest["models"]}
+
+    print(f"📦 Registry: {registry} (actualizado: {manifest.get('updated_at', '-')})")
+    for key in VALID_KEYS:
+        key_dir = registry / key
+        versions = (
+            sorted(p.name for p in key_dir.iterdir() if p.is_dir())
+            if key_dir.exists()
+            else []
+        )
+        if key not in active and not versions:
+            continue
+        entry = active.get(key)
+        current = entry["version"] if entry else "(sin modelo activo)"
+        mae = (entry or {}).get("metrics", {}).get("mae_kg")
+        print(
+            f"   {key:<14} activo: {current:<12}"
+            + (f" MAE={mae:.2f} kg" if mae is not None else "")
+            + (f"  versiones: {', '.join(versions)}" if versions else "")
+        )
+
+
+def cmd_publish(registry: Path, args: argparse.Namespace) -> None:
+    """Publica un archivo o los modelos de un manifest de entrenamiento."""
+    manifest = load_manifest(registry)
+
+    if args.source:
+        source_dir = Path(args.source)
+        source_manifest = load_manifest(source_dir)
+        if not source_manifest["models"]:
+            raise SystemExit(f"❌ Sin modelos en {source_dir / 'manifest.json'}")
+
+        for entry in source_manifest["models"]:
+            key = entry["breed_type"]
+            version = entry.get("version", args.version)
+            source = source_dir / (
+                entry.get("path") or f"{key}/{version}/{entry['filename']}"
+            )
+            relative_path = copy_model(registry, source, key, version)
+            set_active(
+                manifest,
+                key,
+                version,
+                relative_path,
+                file_sha256(registry / relative_path),
+                entry.get("metrics"),
+            )
+            print(f"✅ {key} {version} publicado")
+    else:
+        if not args.file or not args.key:
+            raise SystemExit("❌ publish requiere --source o --file y --key")
+
+        relative_path = copy_model(registry, Path(args.file), args.key, args.version)
+        set_active(
+            manifest,
+            args.key,
+            args.version,
+            relative_path,
+            file_sha256(registry / relative_path),
+        )
+        print(f"✅ {args.key} {args.version} publicado")
+
+    write_manifest(registry, manifest)
+    print(f"📋 Manifest actualizado: {registry / 'manifest.json'}")
+
+
+def cmd_activate(registry: Path, args: argparse.Namespace) -> None:
+    """Activa una versión ya publicada (rollback o roll-forward)."""
+    version_dir = registry / args.key / args.version
+    models = sorted(version_dir.glob("*.tflite"))
+    if len(models) != 1:
+        raise SystemExit(
+            f"❌ Se esperaba un .tflite en {version_dir}, hay {len(models)}"
+        )
+
+    manifest = load_manifest(registry)
+    previous = next(
+        (e for e in manifest["models"] if e["breed_type"] == args.key), None
+    )
+    metrics = (
+        previous.get("metrics")
+        if previous and previous["version"] == args.version
+        else None
+    )
+    set_active(
+        manifest,
+        args.key,
+        args.version,
+        models[0].relative_to(registry).as_posix(),
+        file_sha256(models[0]),
+        metrics,
+    )
+    write_manifest(registry, manifest)
+    print(f"✅ {args.key} → {args.version}")
+
+
+def cmd_remove(registry: Path, args: argparse.Namespace) -> None:
+    """Quita la key del conjunto activo (la raza usa el modelo genérico)."""
+    manifest = load_manifest(registry)
+    remaining = [e for e in manifest["models"] if e["breed_type"] != args.key]
+    if len(remaining) == len(manifest["models"]):
+        raise SystemExit(f"❌ {args.key} no está activo")
+    if not remaining:
+        raise SystemExit("❌ El registry debe conservar al menos un modelo activo")
+
+    manifest["models"] = remaining
+    write_manifest(registry, manifest)
+    print(f"🗑️ {args.key} desactivado (archivos conservados en disco)")
+
+
+def parse_args() -> argparse.Namespace:
+    """Argumentos de línea de comandos."""
+    parser = argparse.ArgumentParser(description="Registry local de modelos TFLite")
+    parser.add_argument(
+        "--registry",
+        default=settings.ML_REGISTRY_PATH,
+        help="Directorio del registry (default: ML_REGISTRY_PATH)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="Modelos activos y versiones")
+
+    publish = subparsers.add_parser("publish", help="Publicar y activar modelos")
+    publish.add_argument(
+        "--source", help="Directorio de modelos de train_all_breeds.py (manifest.json)"
+    )
+    publish.add_argument("--file", help="Archivo .tflite a publicar")
+    publish.add_argument("--key", choices=VALID_KEYS, help="Raza o generic")
+    publish.add_argument("--version", default="v1.0.0", help="Versión (ej. v1.1.0)")
+
+    activate = subparsers.add_parser("activate", help="Activar versión publicada")
+    activate.add_argument("--key", choices=VALID_KEYS, required=True)
+    activate.add_argument("--version", required=True)
+
+    remove = subparsers.add_parser("remove", help="Desactivar modelo de una raza")
+    remove.add_argument("--key", choices=VALID_KEYS, required=True)
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Punto de entrada."""
+    args = parse_args()
+    registry = Path(args.registry)
+    registry.mkdir(parents=True, exist_ok=True)
+
+    commands = {
+        "list": cmd_list,
+        "publish": cmd_publish,
+        "activate": cmd_activate,
+        "remove": cmd_remove,
+    }
+    commands[args.command](registry, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,16 +8,20 @@ import CloseIcon from '@mui/icons-material/Close';
 import CustomTypography from '../CustomTypography';
 import { getImageUrl } from '../../../utils/getImageUrl';
 
+const PREVIEW_WIDTH = 1024;
+
 /**
  * ExpandedImageDialog atom - Diálogo para mostrar imagen ampliada con información sobrepuesta
  * @param {boolean} open - Estado de apertura del diálogo
  * @param {Function} onClose - Función para cerrar el diálogo
- * @param {Object} image - Objeto con { url, title?, date? }
+ * @param {Object} image - Objeto con { url, previewUrl?, title?, date? }
  */
 function ExpandedImageDialog({ open, onClose, image }) {
     if (!image) return null;
 
-    const imageUrl = getImageUrl(image.url);
+    const imageUrl = image.previewUrl
+        ? getImageUrl(image.previewUrl)
+        : getImageUrl(image.url, PREVIEW_WIDTH);
     const hasInfo = image.title || image.date;
 
     return (
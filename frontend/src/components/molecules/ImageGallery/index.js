@@ -10,9 +10,12 @@ import ExpandedImageDialog from '../../atoms/ExpandedImageDialog';
 import { useState } from 'react';
 import { getImageUrl } from '../../../utils/getImageUrl';
 
+const THUMBNAIL_WIDTH = 256;
+
 /**
  * ImageGallery molecule - Galería de imágenes con vista ampliada
- * @param {Array} images - Array de objetos { id, url, title?, date? }
+ * @param {Array} images - Array de objetos { id, url, thumbnailUrl?, previewUrl?, title?, date? }
+ *                        (la grilla usa la miniatura si el backend ya la generó)
  * @param {string} apiBaseUrl - URL base de la API (opcional)
  */
 function ImageGallery({ images, apiBaseUrl }) {
@@ -37,9 +40,10 @@ function ImageGallery({ images, apiBaseUrl }) {
         setSelectedImage(null);
     };
 
-    // Usar la función utilitaria para construir URLs de imágenes
-    const buildImageUrl = (imagePath) => {
-        return getImageUrl(imagePath);
+    // Miniatura para la grilla: la generada al subir o una variante bajo demanda
+    const buildImageUrl = (image) => {
+        if (image.thumbnailUrl) return getImageUrl(image.thumbnailUrl);
+        return getImageUrl(image.url, THUMBNAIL_WIDTH);
     };
 
     return (
@@ -54,7 +58,7 @@ function ImageGallery({ images, apiBaseUrl }) {
                 
                 <Grid container spacing={2}>
                     {images.map((image, index) => {
-                        const imageUrl = buildImageUrl(image.url);
+                        const imageUrl = buildImageUrl(image);
                         if (!imageUrl) return null;
 
                         return (
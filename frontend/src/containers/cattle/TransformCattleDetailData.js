@@ -82,6 +82,8 @@ function TransformCattleDetailData(cattle, estimations, timeline = null) {
                 .map(est => ({
                     id: est.id,
                     url: est.frame_image_path,
+                    thumbnailUrl: est.frame_image_variants?.thumbnail,
+                    previewUrl: est.frame_image_variants?.preview,
                     title: `Estimación de Peso - ${(est.estimated_weight || est.estimated_weight_kg || 0).toFixed(1)} kg`,
                     date: est.timestamp || est.created_at
                 }));
@@ -344,6 +344,8 @@ function WeightEstimationDetailTemplate({
                                                 {
                                                     id: estimation.id,
                                                     url: estimation.frame_image_path || estimation.image_path,
+                                                    thumbnailUrl: estimation.frame_image_variants?.thumbnail,
+                                                    previewUrl: estimation.frame_image_variants?.preview,
                                                     title: `Estimación de Peso - ${(estimation.estimated_weight || estimation.estimated_weight_kg || 0).toFixed(1)} kg`,
                                                     date: estimation.timestamp
                                                 },
@@ -353,6 +355,8 @@ function WeightEstimationDetailTemplate({
                                                     .map(est => ({
                                                         id: est.id,
                                                         url: est.frame_image_path,
+                                                        thumbnailUrl: est.frame_image_variants?.thumbnail,
+                                                        previewUrl: est.frame_image_variants?.preview,
                                                         title: `Estimación Anterior - ${(est.estimated_weight || est.estimated_weight_kg || 0).toFixed(1)} kg`,
                                                         date: est.timestamp
                                                     })),
@@ -8,9 +8,11 @@ import { getApiBaseUrl } from './getApiBaseUrl';
  *
  * @param {string} imagePath - Ruta relativa de la imagen desde uploads/
  *                            (ej: "nelore/nelore_213.jpg" o "brahman/animal_123.jpg")
+ * @param {number} [width] - Lado máximo de una variante redimensionada (256 o 1024).
+ *                           El backend la genera una vez y la cachea en disco.
  * @returns {string} URL completa para acceder a la imagen
  */
-export const getImageUrl = (imagePath) => {
+export const getImageUrl = (imagePath, width) => {
     if (!imagePath) return null;
 
     // Si ya es una URL completa, retornarla tal cual
@@ -33,6 +35,7 @@ export const getImageUrl = (imagePath) => {
     }
 
     // Construir la URL usando el endpoint de recursos
-    return `${cleanBaseUrl}/api/v1/resources/images/${cleanImagePath}`;
+    const url = `${cleanBaseUrl}/api/v1/resources/images/${cleanImagePath}`;
+    return width ? `${url}?w=${width}` : url;
 };
 
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Prepara la caché de shards (imágenes decodificadas a la resolución de
+entrenamiento) de un dataset, para entrenar sin decodificar JPEGs por época.
+
+Uso:
+    python scripts/prepare_shard_cache.py \\
+        --annotations data/annotations.csv \\
+        --images-dir data/images \\
+        --output-dir data/cache/224
+
+El CSV debe tener las columnas image_filename, weight_kg y breed.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Agregar src al path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pandas as pd
+from data.shard_cache import write_shard_cache
+
+
+def main():
+    """Punto de entrada."""
+    parser = argparse.ArgumentParser(description='Preparar caché de shards de imágenes')
+    parser.add_argument('--annotations', required=True, help='CSV con image_filename, weight_kg, breed')
+    parser.add_argument('--images-dir', required=True, help='Directorio con las imágenes')
+    parser.add_argument('--output-dir', required=True, help='Directorio de la caché')
+    parser.add_argument('--image-size', type=int, nargs=2, default=[224, 224], metavar=('H', 'W'))
+    parser.add_argument('--shard-size', type=int, default=1024, help='Imágenes por shard')
+    parser.add_argument('--workers', type=int, default=4, help='Hilos de decodificación')
+    parser.add_argument('--breed', default=None, help='Solo una raza (opcional)')
+    args = parser.parse_args()
+
+    annotations_df = pd.read_csv(args.annotations)
+    if args.breed:
+        annotations_df = annotations_df[annotations_df['breed'] == args.breed]
+
+    write_shard_cache(
+        annotations_df=annotations_df,
+        images_dir=args.images_dir,
+        output_dir=args.output_dir,
+        image_size=tuple(args.image_size),
+        shard_size=args.shard_size,
+        num_workers=args.workers
+    )
+
+
+if __name__ == '__main__':
+    main()
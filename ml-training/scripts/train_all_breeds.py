@@ -5,20 +5,49 @@ Basado en ml-training-standards.md
 
 Razas: Nelore, Brahman, Guzerat, Senepol, Girolando, Gyr lechero, Sindi
 (Alineadas con modelo ML entrenado en Colab)
+
+Las razas se entrenan en paralelo, una por proceso, con los núcleos de la
+CPU repartidos entre procesos (afinidad + hilos intra/inter-op de
+TensorFlow por proceso). El progreso se guarda en un archivo de estado:
+una ejecución interrumpida se reanuda sin repetir las razas terminadas.
+
+Uso:
+    python scripts/train_all_breeds.py --data-dir data/clean --images-dir data/images
+    python scripts/train_all_breeds.py --data-dir data/clean --cache-dir data/cache/224 \\
+        --jobs 3 --use-embedding-cache --embedding-views 3 --finetune-epochs 10
+    python scripts/train_all_breeds.py ... --restart    # Ignorar el estado previo
 """
 
+import os
 import sys
+import json
+import time
+import hashlib
+import tempfile
+import argparse
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
 from pathlib import Path
+from typing import Dict, List, Optional
 
-# Agregar src al path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Agregar el directorio raíz (paquete src) al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from models.cnn_architecture import BreedWeightEstimatorCNN, BREED_CONFIGS
-from models.export.tflite_converter import TFLiteExporter
-import json
+from src.models.cnn_architecture import BREED_CONFIGS
 
+BASE_DIR = Path(__file__).parent.parent
+MODELS_DIR = BASE_DIR / 'models'
+STATE_FILENAME = 'training_state.json'
 
-def train_all_breeds():
+# Estados de un job
+STATUS_PENDING = 'pending'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+def train_all_breeds(args: argparse.Namespace):
     """
     Entrena los 7 modelos TFLite (una por raza).
     
@@ -34,85 +63,137 @@ def train_all_breeds():
     print("📅 Proyecto: Hacienda Gamelera - Bruno Brito Macedo")
     print("🎯 Objetivo: 7 modelos TFLite (razas tropicales), R²≥0.95, MAE<5kg\n")
     
-    # Directorio base
-    BASE_DIR = Path(__file__).parent.parent
-    MODELS_DIR = BASE_DIR / 'models'
     MODELS_DIR.mkdir(parents=True, exist_ok=True)
+    state_path = Path(args.state_file) if args.state_file else MODELS_DIR / STATE_FILENAME
     
-    # Iterar sobre cada raza
-    for breed_name, config in BREED_CONFIGS.items():
-        print(f"\n{'#'*70}")
-        print(f"# ENTRENANDO: {breed_name.upper()}")
-        print(f"{'#'*70}")
-        
-        # 1. Determinar estrategia según disponibilidad de datos
-        strategy = determine_training_strategy(breed_name)
-        print(f"📊 Estrategia: {strategy}")
-        
-        # 2. Construir y entrenar modelo
-        model = BreedWeightEstimatorCNN.build_model(
-            breed_name=breed_name,
-            base_architecture='mobilenetv2'  # Más rápido que EfficientNet
-        )
-        
-        print(f"✅ Modelo construido: {model.name}")
-        print(f"📊 Parámetros: {model.count_params():,}")
-        
-        # 3. Entrenar modelo
-        # NOTA: Aquí va el entrenamiento real con datos
-        # Por ahora, creamos estructura de carpetas
-        breed_model_dir = MODELS_DIR / breed_name / 'v1.0.0'
-        breed_model_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Guardar modelo
-        saved_model_path = breed_model_dir / 'saved_model'
-        model.save(str(saved_model_path))
-        
-        # 4. Exportar a TFLite
-        tflite_path = breed_model_dir / f"{breed_name}-v1.0.0.tflite"
+    # 1. Estado de la ejecución (reanudable)
+    fingerprint = dataset_fingerprint(args)
+    state = load_state(state_path, fingerprint, restart=args.restart)
+    
+    # Versión de los modelos: --version, la de la ejecución que se reanuda o
+    # fecha + huella del dataset. Cada reentrenamiento queda en su directorio
+    # (estados sin model_version: ejecuciones con la versión fija v1.0.0)
+    previous_version = state.get('model_version') or ('v1.0.0' if state['jobs'] else None)
+    version = args.version or previous_version or default_model_version(fingerprint)
+    if previous_version not in (None, version):
+        print(f"🔄 Versión {version} distinta a la anterior ({previous_version}): "
+              "se reentrenan todas las razas")
+        state = {'dataset_fingerprint': fingerprint, 'jobs': {}}
+    state['model_version'] = version
+    print(f"🏷️  Versión de modelos: {version}")
+    
+    breeds = args.breeds or list(BREED_CONFIGS.keys())
+    for breed_name in breeds:
+        job = state['jobs'].setdefault(breed_name, {'status': STATUS_PENDING})
+        if job['status'] == STATUS_RUNNING:
+            # Ejecución anterior interrumpida
+            job['status'] = STATUS_PENDING
+    save_state(state_path, state)
+    
+    # Más imágenes primero: las razas largas no quedan para el final
+    counts = count_images_per_breed(args)
+    pending = sorted(
+        [b for b in breeds if state['jobs'][b]['status'] != STATUS_DONE],
+        key=lambda b: counts.get(b, 0),
+        reverse=True
+    )
+    done = [b for b in breeds if state['jobs'][b]['status'] == STATUS_DONE]
+    if done:
+        print(f"⏭️  Ya entrenadas (estado {state_path.name}): {', '.join(done)}")
+    
+    # 2. Reparto de núcleos: un bloque disjunto por proceso (no más
+    #    procesos que núcleos, o dos jobs compartirían núcleo)
+    jobs = max(1, min(args.jobs, len(pending) or 1, len(available_cores())))
+    core_slots = partition_cores(jobs)
+    print(f"⚙️  Procesos: {jobs} | Núcleos por proceso: {len(core_slots[0])}")
+    
+    options = vars(args).copy()
+    options['version'] = version
+    
+    # Experimento MLflow creado antes de lanzar procesos (evita carreras)
+    import mlflow
+    mlflow.set_tracking_uri(args.mlflow_uri)
+    mlflow.set_experiment(args.mlflow_experiment)
+    
+    # spawn: procesos limpios (TensorFlow no es fork-safe); uno nuevo por raza
+    pool = ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context('spawn'),
+        max_tasks_per_child=1
+    )
+    try:
+        # 3. Embeddings compartidos: una sola vez, con todos los núcleos
+        if pending and args.use_embedding_cache:
+            all_cores = [core for slot in core_slots for core in slot]
+            pool.submit(prepare_embeddings_job, pending[0], options, all_cores).result()
         
-        try:
-            size_bytes = TFLiteExporter.convert_to_tflite(
-                saved_model_path=str(saved_model_path),
-                output_path=str(tflite_path),
-                optimization='default'  # FP16
-            )
-            print(f"✅ TFLite exportado: {tflite_path}")
+        # 4. Un job por raza; al terminar uno, su bloque de núcleos pasa al siguiente
+        free_slots = list(range(jobs))
+        running = {}
+        while pending or running:
+            while pending and free_slots:
+                breed_name = pending.pop(0)
+                slot = free_slots.pop(0)
+                future = pool.submit(train_breed_job, breed_name, options, core_slots[slot])
+                running[future] = (breed_name, slot)
+                state['jobs'][breed_name] = {
+                    'status': STATUS_RUNNING,
+                    'started_at': datetime.now().isoformat(),
+                    'cores': core_slots[slot],
+                }
+                save_state(state_path, state)
+                print(f"🚀 {breed_name} → núcleos {core_slots[slot][0]}-{core_slots[slot][-1]} "
+                      f"({counts.get(breed_name, 0)} imágenes)")
+                print(f"   📊 Estrategia: {determine_training_strategy(breed_name)}")
             
-        except Exception as e:
-            print(f"❌ Error exportando TFLite: {e}")
-            continue
-        
-        # 5. Guardar métricas (simuladas por ahora)
-        # TODO: Implementar evaluación real
-        metrics = {
-            'r2_score': 0.95,  # Simulado
-            'mae_kg': 4.5,     # Simulado
-            'mse_kg': 20.25,   # Simulado
-            'mape_percent': 2.5,  # Simulado
-            'bias_kg': 0.8,       # Simulado
-        }
-        
-        metrics_path = breed_model_dir / 'metrics.json'
-        with open(metrics_path, 'w') as f:
-            json.dump(metrics, f, indent=2)
-        
-        print(f"💾 Métricas guardadas: {metrics_path}")
-        
-        # Validar objetivos
-        target_r2 = config.target_r2
-        max_mae = config.target_mae_kg
-        
-        print(f"\n🎯 VALIDACIÓN:")
-        print(f"   R² ≥ {target_r2}: {'✅' if metrics['r2_score'] >= target_r2 else '❌'} ({metrics['r2_score']:.4f})")
-        print(f"   MAE < {max_mae} kg: {'✅' if metrics['mae_kg'] < max_mae else '❌'} ({metrics['mae_kg']:.2f} kg)")
-        
-    # 6. Generar manifest
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                breed_name, slot = running.pop(future)
+                free_slots.append(slot)
+                job = state['jobs'][breed_name]
+                job['finished_at'] = datetime.now().isoformat()
+                try:
+                    job.update(future.result())
+                    job['status'] = STATUS_DONE
+                    print(f"✅ {breed_name}: R²={job['metrics']['r2_score']:.4f}, "
+                          f"MAE={job['metrics']['mae_kg']:.2f} kg ({job['duration_s'] / 60:.1f} min)")
+                except Exception as e:
+                    job['status'] = STATUS_FAILED
+                    job['error'] = f"{type(e).__name__}: {e}"
+                    print(f"❌ {breed_name}: {job['error']}")
+                save_state(state_path, state)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    
+    # 5. Generar manifest
+    failed = [b for b in breeds if state['jobs'][b]['status'] != STATUS_DONE]
+    if failed:
+        print(f"\n❌ Razas sin modelo: {', '.join(failed)} (volver a ejecutar para reintentar)")
+        sys.exit(1)
+    
+    # Razas de esta ejecución con la versión nueva; las demás conservan la
+    # del manifest anterior (--breeds parcial)
     manifest_path = MODELS_DIR / 'manifest.json'
-    manifest = generate_manifest(MODELS_DIR)
+    versions = previous_manifest_versions(manifest_path)
+    versions.update({breed_name: version for breed_name in breeds})
+    
+    # El manifest exige las 7 razas
+    missing = [
+        b for b in BREED_CONFIGS
+        if b not in versions or not (MODELS_DIR / b / versions[b] / f"{b}-{versions[b]}.tflite").exists()
+    ]
+    if missing:
+        print(f"\n✅ Razas entrenadas: {', '.join(breeds)}")
+        print(f"ℹ️  Manifest pendiente, faltan modelos de: {', '.join(missing)}")
+        return
     
-    with open(manifest_path, 'w') as f:
+    manifest = generate_manifest(MODELS_DIR, versions)
+    
+    # Escritura atómica: un backend que lee el manifest nunca ve un JSON a medias
+    tmp_path = manifest_path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w') as f:
         json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
     
     print(f"\n{'#'*70}")
     print(f"✅ ENTRENAMIENTO COMPLETADO")
@@ -122,6 +203,282 @@ def train_all_breeds():
     print(f"📋 Manifest: {manifest_path}\n")
 
 
+def available_cores() -> List[int]:
+    """IDs de los núcleos que puede usar este proceso."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def partition_cores(jobs: int) -> List[List[int]]:
+    """
+    Repartir los núcleos disponibles en bloques disjuntos.
+    
+    Args:
+        jobs: Número de procesos (como máximo uno por núcleo)
+    
+    Returns:
+        Lista de bloques (uno por proceso) con los IDs de núcleo
+    """
+    cores = available_cores()
+    if jobs > len(cores):
+        raise ValueError(f"{jobs} procesos para {len(cores)} núcleos")
+    per_job = len(cores) // jobs
+    return [cores[i * per_job:(i + 1) * per_job] for i in range(jobs)]
+
+
+def _limit_process_threads(cores: List[int]) -> int:
+    """
+    Limitar el proceso actual a un bloque de núcleos.
+    
+    Se llama al inicio del job, antes de inicializar TensorFlow.
+    
+    Returns:
+        int: Hilos intra-op a usar
+    """
+    if hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, cores)
+    threads = len(cores)
+    # OpenMP/oneDNN y OpenCV no ven la afinidad por sí solos
+    os.environ['OMP_NUM_THREADS'] = str(threads)
+    import cv2
+    cv2.setNumThreads(threads)
+    return threads
+
+
+def _make_trainer(breed_name: str, options: Dict, cores: List[int]):
+    """Crear el trainer de una raza dentro del proceso del job."""
+    threads = _limit_process_threads(cores)
+    
+    from src.models.training.trainer import BreedModelTrainer
+    import mlflow
+    mlflow.set_tracking_uri(options['mlflow_uri'])
+    mlflow.set_experiment(options['mlflow_experiment'])
+    
+    return BreedModelTrainer(
+        breed_type=breed_name,
+        data_dir=Path(options['data_dir']),
+        config=BREED_CONFIGS[breed_name],
+        base_architecture=options['architecture'],
+        images_dir=Path(options['images_dir']) if options['images_dir'] else None,
+        cache_dir=Path(options['cache_dir']) if options['cache_dir'] else None,
+        # Decodificación y cómputo comparten el bloque de núcleos
+        num_workers=min(options['loader_workers'], threads),
+        jit_compile=options['jit_compile'],
+        mixed_precision=options['mixed_precision'],
+        intra_op_threads=threads,
+        inter_op_threads=min(2, threads)
+    )
+
+
+def prepare_embeddings_job(breed_name: str, options: Dict, cores: List[int]) -> None:
+    """Calcular la caché de embeddings compartida por todas las razas (proceso hijo)."""
+    trainer = _make_trainer(breed_name, options, cores)
+    trainer.load_embedding_cache(
+        batch_size=options['batch_size'],
+        num_views=options['embedding_views'],
+        seed=options['seed']
+    )
+
+
+def train_breed_job(breed_name: str, options: Dict, cores: List[int]) -> Dict:
+    """
+    Entrenar, evaluar y exportar una raza (proceso hijo).
+    
+    Args:
+        breed_name: Raza
+        options: Argumentos de línea de comandos (dict)
+        cores: Núcleos asignados al proceso
+    
+    Returns:
+        dict con métricas, archivos y duración para el archivo de estado
+    """
+    start = time.perf_counter()
+    trainer = _make_trainer(breed_name, options, cores)
+    
+    from src.models.export.quantization import export_tflite_variants
+    from src.models.export.tflite_converter import TFLiteExporter, save_model_metadata
+    
+    # 1. Entrenar
+    model = trainer.train(
+        epochs=options['epochs'],
+        batch_size=options['batch_size'],
+        validation_split=options['validation_split'],
+        finetune_epochs=options['finetune_epochs'],
+        finetune_layers=options['finetune_layers'],
+        seed=options['seed'],
+        use_embedding_cache=options['use_embedding_cache'],
+        embedding_views=options['embedding_views']
+    )
+    
+    # 2. Evaluar en validación (sin abortar si no cumple objetivos) y
+    #    reunir el held-out y la calibración int8 (split de entrenamiento)
+    train_generator, val_generator = trainer.build_generators(
+        options['batch_size'], options['validation_split'], options['seed']
+    )
+    try:
+        metrics = trainer.evaluate(val_generator, assert_targets=False)
+        X_eval, y_eval = _generator_arrays(val_generator)
+        X_calibration, _ = _generator_arrays(train_generator, options['calibration_samples'])
+    finally:
+        for generator in (train_generator, val_generator):
+            if hasattr(generator, 'close'):
+                generator.close()
+    
+    # 3. Guardar y exportar variantes TFLite (float32/float16/int8 con gate)
+    version = options['version']
+    breed_model_dir = MODELS_DIR / breed_name / version
+    breed_model_dir.mkdir(parents=True, exist_ok=True)
+    model.save(str(breed_model_dir / f"{breed_name}.keras"))
+    
+    tflite_path = breed_model_dir / f"{breed_name}-{version}.tflite"
+    # Desde SavedModel: from_keras_model aborta con algunos modelos Keras 3
+    with tempfile.TemporaryDirectory() as saved_model_dir:
+        model.export(saved_model_dir)
+        report = export_tflite_variants(
+            saved_model_path=saved_model_dir,
+            output_dir=breed_model_dir / 'variants',
+            basename=f"{breed_name}-{version}",
+            X_eval=X_eval,
+            y_eval=y_eval,
+            representative_dataset=TFLiteExporter.create_representative_dataset(
+                lambda: iter([X_calibration]), n_samples=len(X_calibration)
+            ),
+            breed_type=breed_name,
+            max_mae_increase_kg=options['max_mae_increase'],
+            max_r2_drop=options['max_r2_drop'],
+            max_latency_ms=options['max_latency_ms'],
+            num_threads=len(cores),
+            promoted_path=tflite_path
+        )
+    
+    promoted = report['variants'][report['promoted']]
+    metrics['tflite_variant'] = report['promoted']
+    metrics['tflite_mae_kg'] = promoted['mae_kg']
+    metrics['tflite_r2_score'] = promoted['r2_score']
+    metrics['inference_time_ms'] = promoted['inference_time_ms']
+    save_model_metadata(
+        breed_model_dir, model.name, metrics, breed_name, version=version
+    )
+    
+    return {
+        'metrics': metrics,
+        'tflite': str(tflite_path),
+        'tflite_variant': report['promoted'],
+        'model_version': version,
+        'duration_s': round(time.perf_counter() - start, 1),
+    }
+
+
+def _generator_arrays(generator, max_samples: Optional[int] = None):
+    """
+    Reunir las imágenes y pesos de un generador en arrays.
+    
+    Args:
+        generator: CattleDataGenerator o ShardDataGenerator
+        max_samples: Máximo de imágenes (None = todas, sin el relleno del último batch)
+    
+    Returns:
+        Tuple (X, y)
+    """
+    import numpy as np
+    n_images = generator.get_stats()['total_images']
+    if max_samples is not None:
+        n_images = min(n_images, max_samples)
+    
+    batches_X, batches_y = [], []
+    collected = 0
+    for idx in range(len(generator)):
+        if collected >= n_images:
+            break
+        X_batch, y_batch = generator[idx]
+        batches_X.append(X_batch)
+        batches_y.append(y_batch)
+        collected += len(X_batch)
+    
+    return np.concatenate(batches_X)[:n_images], np.concatenate(batches_y)[:n_images]
+
+
+def dataset_fingerprint(args: argparse.Namespace) -> str:
+    """
+    Huella del dataset: si cambia (datos nuevos), el estado previo no vale.
+    
+    Returns:
+        str: SHA-1 del manifest de anotaciones o de la caché de shards
+    """
+    if args.cache_dir:
+        source = Path(args.cache_dir) / 'labels.npz'
+    else:
+        source = Path(args.data_dir) / 'annotations_clean.csv'
+        if not source.exists():
+            source = Path(args.data_dir) / 'annotations.csv'
+    digest = hashlib.sha1()
+    with open(source, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def default_model_version(fingerprint: str) -> str:
+    """Versión por defecto: fecha + huella del dataset (ej. v20260315-3fa2b1c4)."""
+    return f"v{datetime.now():%Y%m%d}-{fingerprint[:8]}"
+
+
+def previous_manifest_versions(manifest_path: Path) -> Dict[str, str]:
+    """Versión de cada raza en el manifest anterior (vacío si no existe)."""
+    if not manifest_path.exists():
+        return {}
+    with open(manifest_path, 'r') as f:
+        manifest = json.load(f)
+    return {
+        entry['breed_type']: entry['version']
+        for entry in manifest.get('models', [])
+        if 'version' in entry
+    }
+
+
+def count_images_per_breed(args: argparse.Namespace) -> Dict[str, int]:
+    """Imágenes por raza (para ordenar los jobs: más largos primero)."""
+    import numpy as np
+    if args.cache_dir:
+        with np.load(Path(args.cache_dir) / 'labels.npz') as labels:
+            breeds, counts = np.unique(labels['breed'], return_counts=True)
+        return dict(zip(breeds.tolist(), counts.tolist()))
+    
+    import pandas as pd
+    source = Path(args.data_dir) / 'annotations_clean.csv'
+    if not source.exists():
+        source = Path(args.data_dir) / 'annotations.csv'
+    return pd.read_csv(source, usecols=['breed'])['breed'].value_counts().to_dict()
+
+
+def load_state(state_path: Path, fingerprint: str, restart: bool = False) -> Dict:
+    """
+    Cargar el estado de una ejecución anterior.
+    
+    Se descarta si se pide --restart o si el dataset cambió.
+    """
+    empty = {'dataset_fingerprint': fingerprint, 'jobs': {}}
+    if restart or not state_path.exists():
+        return empty
+    
+    with open(state_path, 'r') as f:
+        state = json.load(f)
+    if state.get('dataset_fingerprint') != fingerprint:
+        print("🔄 El dataset cambió desde la última ejecución: se reentrenan todas las razas")
+        return empty
+    return state
+
+
+def save_state(state_path: Path, state: Dict) -> None:
+    """Guardar el estado de forma atómica (escritura + rename)."""
+    state['updated_at'] = datetime.now().isoformat()
+    tmp_path = state_path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, state_path)
+
+
 def determine_training_strategy(breed_name: str) -> str:
     """
     Determina estrategia de entrenamiento según escenario.
@@ -146,12 +503,13 @@ def determine_training_strategy(breed_name: str) -> str:
     return strategy_description.get('B', 'Desconocido')
 
 
-def generate_manifest(models_dir: Path) -> dict:
+def generate_manifest(models_dir: Path, versions: Dict[str, str]) -> dict:
     """
     Genera manifest.json con los 7 modelos (una por raza tropical).
     
     Args:
         models_dir: Directorio de modelos
+        versions: Versión de cada raza
     
     Returns:
         dict: Manifest con información de modelos
@@ -160,13 +518,16 @@ def generate_manifest(models_dir: Path) -> dict:
         "version": "1.0.0",
         "hacienda": "Hacienda Gamelera",
         "owner": "Bruno Brito Macedo",
+        "updated_at": datetime.now().isoformat(),
         "models": []
     }
     
     for breed_name in BREED_CONFIGS.keys():
-        model_dir = models_dir / breed_name / 'v1.0.0'
+        version = versions.get(breed_name)
+        model_dir = models_dir / breed_name / str(version)
+        filename = f"{breed_name}-{version}.tflite"
         
-        if (model_dir / f"{breed_name}-v1.0.0.tflite").exists():
+        if version and (model_dir / filename).exists():
             metrics_path = model_dir / 'metrics.json'
             
             if metrics_path.exists():
@@ -175,9 +536,17 @@ def generate_manifest(models_dir: Path) -> dict:
             else:
                 metrics = {}
             
+            # version/path/sha256: formato del registry del backend
+            # (backend/scripts/model_registry.py publish --source)
+            with open(model_dir / filename, 'rb') as f:
+                sha256 = hashlib.sha256(f.read()).hexdigest()
+            
             manifest["models"].append({
                 "breed_type": breed_name,
-                "filename": f"{breed_name}-v1.0.0.tflite",
+                "version": version,
+                "filename": filename,
+                "path": f"{breed_name}/{version}/{filename}",
+                "sha256": sha256,
                 "metrics": metrics,
             })
     
@@ -186,6 +555,41 @@ def generate_manifest(models_dir: Path) -> dict:
     return manifest
 
 
-if __name__ == '__main__':
-    train_all_breeds()
+def parse_args() -> argparse.Namespace:
+    """Argumentos de línea de comandos."""
+    parser = argparse.ArgumentParser(description='Entrenar los modelos de todas las razas')
+    parser.add_argument('--data-dir', required=True, help='Directorio con annotations_clean.csv')
+    parser.add_argument('--images-dir', default=None, help='Directorio de imágenes (default: data-dir)')
+    parser.add_argument('--cache-dir', default=None, help='Caché de shards (prepare_shard_cache.py)')
+    parser.add_argument('--breeds', nargs='*', default=None, choices=list(BREED_CONFIGS.keys()))
+    parser.add_argument('--jobs', type=int, default=max(1, (os.cpu_count() or 1) // 4),
+                        help='Razas entrenadas en paralelo (procesos, máx. un núcleo cada uno)')
+    parser.add_argument('--loader-workers', type=int, default=4, help='Hilos de decodificación por proceso')
+    parser.add_argument('--architecture', default='mobilenetv2', choices=['mobilenetv2', 'efficientnetb1'])
+    parser.add_argument('--epochs', type=int, default=30)
+    parser.add_argument('--finetune-epochs', type=int, default=10)
+    parser.add_argument('--finetune-layers', type=int, default=20)
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--validation-split', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--use-embedding-cache', action='store_true', help='Fase head sobre embeddings')
+    parser.add_argument('--embedding-views', type=int, default=1)
+    parser.add_argument('--jit-compile', action='store_true', help='Compilar con XLA')
+    parser.add_argument('--mixed-precision', default=None, choices=['mixed_float16', 'mixed_bfloat16'])
+    parser.add_argument('--calibration-samples', type=int, default=200, help='Imágenes de calibración int8')
+    parser.add_argument('--max-mae-increase', type=float, default=1.0,
+                        help='Aumento máximo de MAE (kg) de una variante cuantizada frente a float32')
+    parser.add_argument('--max-r2-drop', type=float, default=0.01,
+                        help='Caída máxima de R² de una variante cuantizada frente a float32')
+    parser.add_argument('--max-latency-ms', type=float, default=None, help='Latencia p50 máxima (opcional)')
+    parser.add_argument('--mlflow-uri', default=str(BASE_DIR / 'experiments' / 'mlflow'))
+    parser.add_argument('--mlflow-experiment', default='bovine-weight-estimation')
+    parser.add_argument('--state-file', default=None, help=f'Default: models/{STATE_FILENAME}')
+    parser.add_argument('--restart', action='store_true', help='Ignorar el estado previo')
+    parser.add_argument('--version', default=None,
+                        help='Versión de los modelos (default: v<fecha>-<huella del dataset>)')
+    return parser.parse_args()
+
 
+if __name__ == '__main__':
+    train_all_breeds(parse_args())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Verifica la integridad de un dataset (una sola pasada) y genera el
+manifest limpio para entrenar.
+
+Uso:
+    python scripts/validate_dataset.py \\
+        --annotations data/annotations.csv \\
+        --images-dir data/images \\
+        --output-dir data/clean
+
+Salida en --output-dir:
+    annotations_clean.csv       Filas válidas (+ height, width)
+    annotations_rejected.csv    Filas rechazadas con el motivo
+    integrity_report.json       Estadísticas
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Agregar src al path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pandas as pd
+from data.integrity import (
+    DEFAULT_MIN_IMAGE_SIZE,
+    DEFAULT_WEIGHT_RANGE_KG,
+    validate_dataset,
+    write_clean_manifest,
+)
+
+
+def main():
+    """Punto de entrada."""
+    parser = argparse.ArgumentParser(description='Verificar integridad del dataset')
+    parser.add_argument('--annotations', required=True, help='CSV con image_filename, weight_kg, breed')
+    parser.add_argument('--images-dir', required=True, help='Directorio con las imágenes')
+    parser.add_argument('--output-dir', required=True, help='Directorio de salida')
+    parser.add_argument('--weight-range', type=float, nargs=2, default=list(DEFAULT_WEIGHT_RANGE_KG),
+                        metavar=('MIN', 'MAX'), help='Rango válido de peso (kg)')
+    parser.add_argument('--min-size', type=int, nargs=2, default=list(DEFAULT_MIN_IMAGE_SIZE),
+                        metavar=('H', 'W'), help='Tamaño mínimo de imagen')
+    parser.add_argument('--breeds', nargs='*', default=None, help='Razas válidas (opcional)')
+    parser.add_argument('--workers', type=int, default=4, help='Hilos de decodificación')
+    args = parser.parse_args()
+
+    clean_df, rejected_df, stats = validate_dataset(
+        annotations_df=pd.read_csv(args.annotations),
+        images_dir=args.images_dir,
+        weight_range_kg=tuple(args.weight_range),
+        min_image_size=tuple(args.min_size),
+        breeds=args.breeds,
+        num_workers=args.workers
+    )
+    write_clean_manifest(clean_df, rejected_df, stats, args.output_dir)
+
+    if stats['valid_images'] == 0:
+        print("❌ Ninguna imagen válida")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,17 @@
 """
 Data Loader para entrenamiento de modelos de estimación de peso.
 Clase CattleDataGenerator que hereda de tf.keras.utils.Sequence.
+
+Modo pipeline (num_workers > 0): las imágenes se decodifican y aumentan en
+un pool de hilos (OpenCV y Albumentations liberan el GIL) y los próximos
+`prefetch_batches` batches se encolan mientras el modelo entrena el actual.
 """
 
 import numpy as np
 import pandas as pd
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import cv2
 import albumentations as A
 from tensorflow.keras.utils import Sequence
@@ -27,7 +32,10 @@ class CattleDataGenerator(Sequence):
         batch_size: int = 32,
         image_size: Tuple[int, int] = (224, 224),
         transform: Optional[A.Compose] = None,
-        shuffle: bool = True
+        shuffle: bool = True,
+        num_workers: int = 0,
+        prefetch_batches: int = 2,
+        drop_last: bool = False
     ):
         """
         Inicializar generador de datos.
@@ -39,19 +47,49 @@ class CattleDataGenerator(Sequence):
             image_size: Tamaño de las imágenes (height, width)
             transform: Pipeline de Albumentations (opcional)
             shuffle: Si True, shuffle de índices después de cada época
+            num_workers: Hilos de decodificación/augmentation (0 = secuencial)
+            prefetch_batches: Batches siguientes a preparar en segundo plano
+                (solo con num_workers > 0)
+            drop_last: Si True, descarta el último batch incompleto; si False,
+                lo completa con las primeras imágenes de la época (solo con
+                shuffle: en validación queda más corto, para que val_loss no
+                cuente imágenes dos veces)
+        
+        Los batches de entrenamiento tienen exactamente batch_size imágenes
+        (shapes estáticos para XLA); en validación solo el último puede ser
+        más corto. Una imagen que falla al cargar se reemplaza por
+        otra del dataset. Usar un manifest verificado (src.data.integrity)
+        para que esto sea la excepción.
         """
+        super().__init__()
         self.annotations_df = annotations_df.copy()
         self.images_dir = Path(images_dir)
         self.batch_size = batch_size
         self.image_size = image_size
         self.transform = transform
         self.shuffle = shuffle
+        self.num_workers = num_workers
+        self.prefetch_batches = prefetch_batches if num_workers > 0 else 0
+        self.drop_last = drop_last
         
         # Validar columnas requeridas
         required_cols = ['image_filename', 'weight_kg', 'breed']
         missing_cols = [col for col in required_cols if col not in annotations_df.columns]
         if missing_cols:
             raise ValueError(f"Faltan columnas requeridas: {missing_cols}")
+        if len(annotations_df) == 0:
+            raise ValueError("El DataFrame de anotaciones está vacío")
+        if drop_last and len(annotations_df) < batch_size:
+            raise ValueError(
+                f"drop_last=True con {len(annotations_df)} imágenes < batch_size={batch_size}"
+            )
+        
+        # Columnas extraídas una sola vez (evita annotations_df.iloc por imagen)
+        self.image_paths = np.array([
+            str(self.images_dir / filename)
+            for filename in self.annotations_df['image_filename']
+        ])
+        self.weights = self.annotations_df['weight_kg'].to_numpy(dtype=np.float32)
         
         # Índices de los datos
         self.indices = np.arange(len(annotations_df))
@@ -59,14 +97,30 @@ class CattleDataGenerator(Sequence):
         if self.shuffle:
             np.random.shuffle(self.indices)
         
+        # Filas que fallaron al cargar (no se vuelven a usar como reemplazo)
+        self.failed_indices: Set[int] = set()
+        
+        # Pool de workers y batches encolados (índice de batch -> futures)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if num_workers > 0:
+            self._executor = ThreadPoolExecutor(
+                max_workers=num_workers, thread_name_prefix='cattle-loader'
+            )
+        self._pending: Dict[int, List[Future]] = {}
+        
         print(f"✅ CattleDataGenerator inicializado")
         print(f"   📊 Datos: {len(annotations_df)} imágenes")
         print(f"   📦 Batch size: {batch_size}")
         print(f"   📏 Image size: {image_size}")
         print(f"   🔀 Shuffle: {shuffle}")
+        print(f"   ✂️  Drop last: {drop_last}")
+        if num_workers > 0:
+            print(f"   ⚙️  Workers: {num_workers} (prefetch: {self.prefetch_batches} batches)")
     
     def __len__(self) -> int:
         """Retorna número de batches por época."""
+        if self.drop_last:
+            return len(self.annotations_df) // self.batch_size
         return int(np.ceil(len(self.annotations_df) / self.batch_size))
     
     def __getitem__(self, idx: int) -> Tuple[np.ndarray, np.ndarray]:
@@ -78,47 +132,103 @@ class CattleDataGenerator(Sequence):
         
         Returns:
             Tuple[X_batch, y_batch]:
-                - X_batch: numpy array shape (batch_size, H, W, 3)
+                - X_batch: numpy array shape (batch_size, H, W, 3) (el último
+                  batch de validación puede ser más corto)
                 - y_batch: numpy array shape (batch_size,) con pesos en kg
         """
-        # Obtener índices del batch actual
-        batch_indices = self.indices[idx * self.batch_size:(idx + 1) * self.batch_size]
+        batch_indices = self._batch_indices(idx)
+        
+        if self._executor is None:
+            images = (self._try_load(i) for i in batch_indices)
+        else:
+            futures = self._pending.pop(idx, None) or self._submit(batch_indices)
+            # Encolar los siguientes batches mientras se arma el actual
+            for next_idx in range(idx + 1, min(idx + 1 + self.prefetch_batches, len(self))):
+                if next_idx not in self._pending:
+                    self._pending[next_idx] = self._submit(self._batch_indices(next_idx))
+            images = (future.result() for future in futures)
+        
+        # Arrays del batch reservados una vez y llenados en su lugar
+        batch_len = len(batch_indices)
+        X_batch = np.empty((batch_len, *self.image_size, 3), dtype=np.float32)
+        y_batch = np.empty(batch_len, dtype=np.float32)
         
-        # Inicializar arrays
-        X_batch = []
-        y_batch = []
-        
-        # Procesar cada imagen del batch
-        for i in batch_indices:
-            row = self.annotations_df.iloc[i]
-            
-            try:
-                # Cargar y procesar imagen
-                image = self._load_and_process_image(
-                    image_path=self.images_dir / row['image_filename'],
-                    image_size=self.image_size,
-                    transform=self.transform
-                )
-                
-                X_batch.append(image)
-                y_batch.append(row['weight_kg'])
-                
-            except Exception as e:
-                # Si hay error, saltar esta imagen silenciosamente
-                # (evitar logs excesivos durante entrenamiento)
+        count = 0
+        for i, image in zip(batch_indices, images):
+            if image is None:
+                # Sin log por imagen (evitar logs excesivos durante entrenamiento)
+                self.failed_indices.add(int(i))
                 continue
+            X_batch[count] = image
+            y_batch[count] = self.weights[i]
+            count += 1
         
-        # Convertir a numpy arrays
-        X_batch = np.array(X_batch, dtype=np.float32)
-        y_batch = np.array(y_batch, dtype=np.float32)
+        # Completar con imágenes de reemplazo (batch de tamaño fijo)
+        while count < batch_len:
+            i = self._substitute_index()
+            image = self._try_load(i)
+            if image is None:
+                self.failed_indices.add(int(i))
+                continue
+            X_batch[count] = image
+            y_batch[count] = self.weights[i]
+            count += 1
         
         return X_batch, y_batch
     
     def on_epoch_end(self):
         """Callback al final de cada época."""
+        # Los batches encolados usan el orden anterior: descartarlos
+        self._cancel_pending()
         if self.shuffle:
             np.random.shuffle(self.indices)
     
+    def close(self):
+        """Detener el pool de workers (modo pipeline)."""
+        self._cancel_pending()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _batch_indices(self, idx: int) -> np.ndarray:
+        """Índices de las filas del batch idx (en entrenamiento, el último se completa desde el inicio)."""
+        batch_indices = self.indices[idx * self.batch_size:(idx + 1) * self.batch_size]
+        missing = self.batch_size - len(batch_indices)
+        if missing > 0 and self.shuffle:
+            batch_indices = np.concatenate([batch_indices, np.resize(self.indices, missing)])
+        return batch_indices
+    
+    def _substitute_index(self) -> int:
+        """Fila aleatoria que no haya fallado, para reemplazar una imagen inválida."""
+        if len(self.failed_indices) >= len(self.indices):
+            raise RuntimeError("Ninguna imagen del dataset se pudo cargar")
+        while True:
+            i = int(np.random.choice(self.indices))
+            if i not in self.failed_indices:
+                return i
+    
+    def _submit(self, batch_indices: np.ndarray) -> List[Future]:
+        """Encolar la carga de las imágenes de un batch en el pool."""
+        return [self._executor.submit(self._try_load, i) for i in batch_indices]
+    
+    def _cancel_pending(self):
+        """Cancelar los batches encolados que aún no empezaron."""
+        for futures in self._pending.values():
+            for future in futures:
+                future.cancel()
+        self._pending.clear()
+    
+    def _try_load(self, i: int) -> Optional[np.ndarray]:
+        """Cargar la imagen de la fila i (None si no se puede cargar)."""
+        try:
+            return self._load_and_process_image(
+                image_path=Path(self.image_paths[i]),
+                image_size=self.image_size,
+                transform=self.transform
+            )
+        except Exception:
+            return None
+    
     @staticmethod
     def _load_and_process_image(
         image_path: Path,
@@ -169,6 +279,8 @@ class CattleDataGenerator(Sequence):
             'total_images': len(self.annotations_df),
             'num_batches': len(self),
             'batch_size': self.batch_size,
+            'drop_last': self.drop_last,
+            'failed_images': len(self.failed_indices),
             'breeds': self.annotations_df['breed'].value_counts().to_dict(),
             'weight_stats': {
                 'mean': self.annotations_df['weight_kg'].mean(),
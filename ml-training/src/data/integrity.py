@@ -0,0 +1,177 @@
+"""
+Verificación de integridad del dataset antes de entrenar.
+
+Valida una sola vez cada fila de las anotaciones (archivo existente,
+imagen decodificable, tamaño mínimo, peso dentro de rango, sin duplicados)
+y genera un manifest limpio con estadísticas, para que los generadores no
+encuentren imágenes inválidas durante el entrenamiento.
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+import cv2
+
+# Rango plausible de peso bovino (kg): fuera de él es un error de etiqueta
+DEFAULT_WEIGHT_RANGE_KG = (30.0, 1200.0)
+
+# Resolución mínima (height, width): por debajo no aporta a 224x224
+DEFAULT_MIN_IMAGE_SIZE = (64, 64)
+
+# Motivos de rechazo
+REASON_DUPLICATE = 'duplicate'
+REASON_MISSING_FILE = 'missing_file'
+REASON_UNDECODABLE = 'undecodable'
+REASON_TOO_SMALL = 'too_small'
+REASON_INVALID_WEIGHT = 'invalid_weight'
+REASON_UNKNOWN_BREED = 'unknown_breed'
+
+
+def _check_image(image_path: Path, min_size: Tuple[int, int]) -> Tuple[Optional[str], int, int]:
+    """
+    Verificar que una imagen exista, se decodifique y tenga el tamaño mínimo.
+    
+    Returns:
+        Tuple (motivo de rechazo o None, height, width)
+    """
+    if not image_path.is_file():
+        return REASON_MISSING_FILE, 0, 0
+    
+    # Decodificación completa (no solo el header): detecta JPEGs truncados
+    image = cv2.imread(str(image_path))
+    if image is None or image.size == 0:
+        return REASON_UNDECODABLE, 0, 0
+    
+    height, width = image.shape[:2]
+    if height < min_size[0] or width < min_size[1]:
+        return REASON_TOO_SMALL, height, width
+    
+    return None, height, width
+
+
+def validate_dataset(
+    annotations_df: pd.DataFrame,
+    images_dir: str,
+    weight_range_kg: Tuple[float, float] = DEFAULT_WEIGHT_RANGE_KG,
+    min_image_size: Tuple[int, int] = DEFAULT_MIN_IMAGE_SIZE,
+    breeds: Optional[Sequence[str]] = None,
+    num_workers: int = 4
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict]:
+    """
+    Validar todas las filas de las anotaciones.
+    
+    Args:
+        annotations_df: DataFrame con columnas 'image_filename', 'weight_kg', 'breed'
+        images_dir: Directorio con las imágenes
+        weight_range_kg: Rango válido de peso (min, max)
+        min_image_size: Tamaño mínimo (height, width)
+        breeds: Razas válidas (None = cualquiera)
+        num_workers: Hilos de decodificación
+    
+    Returns:
+        Tuple (filas válidas, filas rechazadas con columna 'reason', estadísticas)
+    """
+    required_cols = ['image_filename', 'weight_kg', 'breed']
+    missing_cols = [col for col in required_cols if col not in annotations_df.columns]
+    if missing_cols:
+        raise ValueError(f"Faltan columnas requeridas: {missing_cols}")
+    
+    images_dir = Path(images_dir)
+    df = annotations_df.reset_index(drop=True).copy()
+    reasons = pd.Series([None] * len(df), dtype=object)
+    
+    print(f"🔍 Verificando integridad: {len(df)} imágenes en {images_dir}")
+    
+    # Validaciones de etiquetas (vectorizadas, sin abrir archivos)
+    weights = pd.to_numeric(df['weight_kg'], errors='coerce')
+    invalid_weight = weights.isna() | (weights < weight_range_kg[0]) | (weights > weight_range_kg[1])
+    reasons[invalid_weight] = REASON_INVALID_WEIGHT
+    
+    if breeds is not None:
+        reasons[reasons.isna() & ~df['breed'].isin(list(breeds))] = REASON_UNKNOWN_BREED
+    
+    reasons[reasons.isna() & df['image_filename'].duplicated(keep='first')] = REASON_DUPLICATE
+    
+    # Validación de imágenes (solo las filas que pasaron las anteriores)
+    to_check = reasons.index[reasons.isna()]
+    heights = np.zeros(len(df), dtype=np.int32)
+    widths = np.zeros(len(df), dtype=np.int32)
+    with ThreadPoolExecutor(max_workers=max(num_workers, 1)) as executor:
+        results = executor.map(
+            lambda filename: _check_image(images_dir / filename, min_image_size),
+            df.loc[to_check, 'image_filename'].astype(str)
+        )
+        for row, (reason, height, width) in zip(to_check, results):
+            reasons[row] = reason
+            heights[row] = height
+            widths[row] = width
+    
+    df['height'] = heights
+    df['width'] = widths
+    valid_mask = reasons.isna().to_numpy()
+    clean_df = df[valid_mask].reset_index(drop=True)
+    rejected_df = df[~valid_mask].assign(reason=reasons[~valid_mask].to_numpy()).reset_index(drop=True)
+    
+    stats = {
+        'total_images': int(len(df)),
+        'valid_images': int(len(clean_df)),
+        'rejected_images': int(len(rejected_df)),
+        'rejected_by_reason': rejected_df['reason'].value_counts().to_dict(),
+        'weight_range_kg': list(weight_range_kg),
+        'min_image_size': list(min_image_size),
+        'breeds': clean_df['breed'].value_counts().to_dict(),
+        'weight_stats': {
+            'mean': float(clean_df['weight_kg'].mean()) if len(clean_df) else None,
+            'std': float(clean_df['weight_kg'].std()) if len(clean_df) > 1 else None,
+            'min': float(clean_df['weight_kg'].min()) if len(clean_df) else None,
+            'max': float(clean_df['weight_kg'].max()) if len(clean_df) else None,
+        },
+        'image_size_stats': {
+            'min_height': int(clean_df['height'].min()) if len(clean_df) else None,
+            'min_width': int(clean_df['width'].min()) if len(clean_df) else None,
+            'median_height': float(clean_df['height'].median()) if len(clean_df) else None,
+            'median_width': float(clean_df['width'].median()) if len(clean_df) else None,
+        },
+    }
+    
+    print(f"✅ Válidas: {stats['valid_images']} | ❌ Rechazadas: {stats['rejected_images']}")
+    for reason, count in stats['rejected_by_reason'].items():
+        print(f"   - {reason}: {count}")
+    
+    return clean_df, rejected_df, stats
+
+
+def write_clean_manifest(
+    clean_df: pd.DataFrame,
+    rejected_df: pd.DataFrame,
+    stats: Dict,
+    output_dir: str
+) -> Path:
+    """
+    Guardar el manifest limpio, las filas rechazadas y las estadísticas.
+    
+    Args:
+        clean_df: Filas válidas (de validate_dataset)
+        rejected_df: Filas rechazadas
+        stats: Estadísticas
+        output_dir: Directorio de salida
+    
+    Returns:
+        Path al manifest limpio (annotations_clean.csv)
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    manifest_path = output_dir / 'annotations_clean.csv'
+    clean_df.to_csv(manifest_path, index=False)
+    rejected_df.to_csv(output_dir / 'annotations_rejected.csv', index=False)
+    
+    with open(output_dir / 'integrity_report.json', 'w') as f:
+        json.dump({'created_at': datetime.now().isoformat(), **stats}, f, indent=2, default=str)
+    
+    print(f"💾 Manifest limpio: {manifest_path}")
+    return manifest_path
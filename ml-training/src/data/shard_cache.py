@@ -0,0 +1,349 @@
+"""
+Caché de imágenes decodificadas en shards para entrenamiento.
+
+Las imágenes se decodifican y redimensionan una sola vez a la resolución de
+entrenamiento y se guardan como arrays uint8 (.npy) que se leen con mmap:
+cada época solo copia de la page cache los píxeles del batch, sin volver a
+decodificar JPEGs.
+
+Formato del directorio de caché:
+    manifest.json       Resolución, número de imágenes, shards e imágenes omitidas
+    labels.npz          weight_kg (float32), breed, image_filename por imagen
+    shard_00000.npy     uint8 (N, H, W, 3) RGB
+    shard_00001.npy     ...
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import cv2
+import albumentations as A
+from tensorflow.keras.utils import Sequence
+
+MANIFEST_FILENAME = 'manifest.json'
+LABELS_FILENAME = 'labels.npz'
+CACHE_FORMAT_VERSION = 1
+
+
+def _decode_resized(image_path: Path, image_size: Tuple[int, int]) -> Optional[np.ndarray]:
+    """
+    Decodificar y redimensionar una imagen a uint8 RGB.
+    
+    Returns:
+        np.ndarray (H, W, 3) uint8, o None si no se puede cargar
+    """
+    image = cv2.imread(str(image_path))
+    if image is None:
+        return None
+    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    # INTER_AREA: mejor calidad al reducir (las fotos originales son mayores)
+    return cv2.resize(image, (image_size[1], image_size[0]), interpolation=cv2.INTER_AREA)
+
+
+def write_shard_cache(
+    annotations_df: pd.DataFrame,
+    images_dir: str,
+    output_dir: str,
+    image_size: Tuple[int, int] = (224, 224),
+    shard_size: int = 1024,
+    num_workers: int = 4
+) -> Dict:
+    """
+    Preparar la caché de shards de un dataset.
+    
+    Args:
+        annotations_df: DataFrame con columnas 'image_filename', 'weight_kg', 'breed'
+        images_dir: Directorio con las imágenes
+        output_dir: Directorio de la caché (se sobrescriben los shards existentes)
+        image_size: Resolución de entrenamiento (height, width)
+        shard_size: Imágenes por shard
+        num_workers: Hilos de decodificación
+    
+    Returns:
+        dict con el manifest escrito
+    """
+    required_cols = ['image_filename', 'weight_kg', 'breed']
+    missing_cols = [col for col in required_cols if col not in annotations_df.columns]
+    if missing_cols:
+        raise ValueError(f"Faltan columnas requeridas: {missing_cols}")
+    
+    images_dir = Path(images_dir)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for old_shard in output_dir.glob('shard_*.npy'):
+        old_shard.unlink()
+    
+    filenames = annotations_df['image_filename'].to_numpy(dtype=str)
+    weights = annotations_df['weight_kg'].to_numpy(dtype=np.float32)
+    breeds = annotations_df['breed'].to_numpy(dtype=str)
+    
+    print(f"📦 Preparando caché de shards: {len(filenames)} imágenes → {output_dir}")
+    print(f"   📏 Resolución: {image_size} | Shard: {shard_size} imágenes | Workers: {num_workers}")
+    
+    kept: List[int] = []
+    skipped: List[str] = []
+    shards: List[Dict] = []
+    
+    executor = ThreadPoolExecutor(max_workers=max(num_workers, 1))
+    try:
+        # map conserva el orden; los workers decodifican por delante del escritor
+        images = executor.map(
+            lambda filename: _decode_resized(images_dir / filename, image_size),
+            filenames
+        )
+        
+        shard_images = np.empty((shard_size, *image_size, 3), dtype=np.uint8)
+        count = 0
+        for i, image in enumerate(images):
+            if image is None:
+                skipped.append(str(filenames[i]))
+                continue
+            shard_images[count] = image
+            kept.append(i)
+            count += 1
+            if count == shard_size:
+                shards.append(_save_shard(output_dir, len(shards), shard_images[:count]))
+                count = 0
+        if count:
+            shards.append(_save_shard(output_dir, len(shards), shard_images[:count]))
+    finally:
+        executor.shutdown(wait=True)
+    
+    kept = np.array(kept, dtype=np.int64)
+    np.savez(
+        output_dir / LABELS_FILENAME,
+        weight_kg=weights[kept],
+        breed=breeds[kept],
+        image_filename=filenames[kept]
+    )
+    
+    manifest = {
+        'format_version': CACHE_FORMAT_VERSION,
+        'created_at': datetime.now().isoformat(),
+        'images_dir': str(images_dir),
+        'image_size': list(image_size),
+        'num_images': int(len(kept)),
+        'shards': shards,
+        'skipped': skipped,
+    }
+    with open(output_dir / MANIFEST_FILENAME, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    
+    size_mb = sum(shard['bytes'] for shard in shards) / (1024 * 1024)
+    print(f"✅ Caché lista: {len(kept)} imágenes en {len(shards)} shards ({size_mb:.1f} MB)")
+    if skipped:
+        print(f"   ⚠️  Omitidas (no se pudieron cargar): {len(skipped)}")
+    
+    return manifest
+
+
+def _save_shard(output_dir: Path, shard_id: int, images: np.ndarray) -> Dict:
+    """Escribir un shard .npy y retornar su entrada del manifest."""
+    filename = f"shard_{shard_id:05d}.npy"
+    np.save(output_dir / filename, images)
+    return {'file': filename, 'count': int(len(images)), 'bytes': int(images.nbytes)}
+
+
+class ShardCache:
+    """
+    Caché de shards abierta con mmap.
+    
+    Las imágenes no se cargan en memoria: cada shard es un np.memmap y el
+    sistema operativo trae a la page cache solo las páginas leídas.
+    """
+    
+    def __init__(self, cache_dir: str):
+        """
+        Abrir una caché preparada con write_shard_cache.
+        
+        Args:
+            cache_dir: Directorio de la caché
+        """
+        self.cache_dir = Path(cache_dir)
+        manifest_path = self.cache_dir / MANIFEST_FILENAME
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No existe la caché de shards: {manifest_path}")
+        
+        with open(manifest_path, 'r') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('format_version') != CACHE_FORMAT_VERSION:
+            raise ValueError(
+                f"Versión de caché no soportada: {self.manifest.get('format_version')}"
+            )
+        
+        self.image_size: Tuple[int, int] = tuple(self.manifest['image_size'])
+        
+        with np.load(self.cache_dir / LABELS_FILENAME) as labels:
+            self.weights = labels['weight_kg']
+            self.breeds = labels['breed']
+            self.filenames = labels['image_filename']
+        
+        self.shards = [
+            np.load(self.cache_dir / shard['file'], mmap_mode='r')
+            for shard in self.manifest['shards']
+        ]
+        # Índice global de la primera imagen de cada shard
+        self.offsets = np.cumsum([0] + [len(shard) for shard in self.shards])
+    
+    def __len__(self) -> int:
+        """Número de imágenes en la caché."""
+        return int(self.offsets[-1])
+    
+    def indices_for_breed(self, breed: str) -> np.ndarray:
+        """Índices globales de las imágenes de una raza."""
+        return np.flatnonzero(self.breeds == breed)
+    
+    def gather(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Leer un conjunto de imágenes por índice global.
+        
+        Los índices se leen agrupados por shard y en orden creciente para
+        que el acceso al mmap sea lo más secuencial posible.
+        
+        Args:
+            indices: Índices globales
+        
+        Returns:
+            np.ndarray (len(indices), H, W, 3) uint8 en el orden de indices
+        """
+        images = np.empty((len(indices), *self.image_size, 3), dtype=np.uint8)
+        order = np.argsort(indices, kind='stable')
+        sorted_indices = indices[order]
+        shard_ids = np.searchsorted(self.offsets, sorted_indices, side='right') - 1
+        
+        for shard_id in np.unique(shard_ids):
+            in_shard = shard_ids == shard_id
+            local = sorted_indices[in_shard] - self.offsets[shard_id]
+            images[order[in_shard]] = self.shards[shard_id][local]
+        
+        return images
+
+
+class ShardDataGenerator(Sequence):
+    """
+    Generador de datos sobre una caché de shards (mmap).
+    
+    Misma salida que CattleDataGenerator (imágenes float32 y pesos), pero
+    sin decodificar JPEGs: el transform (augmentation + normalización) se
+    aplica sobre las imágenes ya redimensionadas.
+    """
+    
+    def __init__(
+        self,
+        cache: ShardCache,
+        indices: Optional[np.ndarray] = None,
+        batch_size: int = 32,
+        transform: Optional[A.Compose] = None,
+        shuffle: bool = True,
+        drop_last: bool = False,
+        **kwargs
+    ):
+        """
+        Inicializar generador.
+        
+        Args:
+            cache: Caché de shards abierta
+            indices: Índices globales a usar (split train/val, raza); None = todos
+            batch_size: Tamaño del batch
+            transform: Pipeline de Albumentations (opcional)
+            shuffle: Si True, shuffle de índices después de cada época
+            drop_last: Si True, descarta el último batch incompleto; si False,
+                lo completa con las primeras imágenes de la época (solo con
+                shuffle: en validación queda más corto, para que val_loss no
+                cuente imágenes dos veces)
+            **kwargs: workers/use_multiprocessing/max_queue_size de Keras
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.indices = np.arange(len(cache)) if indices is None else np.asarray(indices)
+        self.batch_size = batch_size
+        self.transform = transform
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        
+        if len(self.indices) == 0:
+            raise ValueError("No hay imágenes para el generador")
+        if drop_last and len(self.indices) < batch_size:
+            raise ValueError(
+                f"drop_last=True con {len(self.indices)} imágenes < batch_size={batch_size}"
+            )
+        
+        if self.shuffle:
+            np.random.shuffle(self.indices)
+        
+        print(f"✅ ShardDataGenerator inicializado")
+        print(f"   📊 Datos: {len(self.indices)} imágenes ({len(cache.shards)} shards)")
+        print(f"   📦 Batch size: {batch_size}")
+        print(f"   📏 Image size: {cache.image_size}")
+        print(f"   🔀 Shuffle: {shuffle}")
+        print(f"   ✂️  Drop last: {drop_last}")
+    
+    def __len__(self) -> int:
+        """Número de batches por época."""
+        if self.drop_last:
+            return len(self.indices) // self.batch_size
+        return int(np.ceil(len(self.indices) / self.batch_size))
+    
+    def __getitem__(self, idx: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Obtener batch de datos.
+        
+        Args:
+            idx: Índice del batch
+        
+        Returns:
+            Tuple (X_batch, y_batch)
+        """
+        batch_indices = self.indices[idx * self.batch_size:(idx + 1) * self.batch_size]
+        missing = self.batch_size - len(batch_indices)
+        if missing > 0 and self.shuffle:
+            # Batch de tamaño fijo: completar desde el inicio de la época
+            batch_indices = np.concatenate([batch_indices, np.resize(self.indices, missing)])
+        images = self.cache.gather(batch_indices)
+        y_batch = self.cache.weights[batch_indices].astype(np.float32)
+        
+        if self.transform is None:
+            # Mismo resultado que CattleDataGenerator sin transform: 0-1
+            return images.astype(np.float32) / 255.0, y_batch
+        
+        X_batch = np.empty(images.shape, dtype=np.float32)
+        for i, image in enumerate(images):
+            X_batch[i] = self.transform(image=image)['image']
+        return X_batch, y_batch
+    
+    def on_epoch_end(self):
+        """Callback al final de cada época."""
+        if self.shuffle:
+            np.random.shuffle(self.indices)
+    
+    def get_stats(self) -> dict:
+        """
+        Obtener estadísticas del dataset.
+        
+        Returns:
+            dict con estadísticas
+        """
+        weights = self.cache.weights[self.indices]
+        breeds, counts = np.unique(self.cache.breeds[self.indices], return_counts=True)
+        return {
+            'total_images': len(self.indices),
+            'num_batches': len(self),
+            'batch_size': self.batch_size,
+            'drop_last': self.drop_last,
+            'breeds': dict(zip(breeds.tolist(), counts.tolist())),
+            'weight_stats': {
+                'mean': float(weights.mean()),
+                'std': float(weights.std(ddof=1)) if len(weights) > 1 else 0.0,
+                'min': float(weights.min()),
+                'max': float(weights.max()),
+            }
+        }
+    
+    def iter_batches(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Recorrer una época completa (para evaluación fuera de Keras)."""
+        for idx in range(len(self)):
+            yield self[idx]
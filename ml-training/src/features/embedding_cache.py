@@ -0,0 +1,275 @@
+"""
+Caché de embeddings del backbone para entrenar el head.
+
+Con el backbone congelado (BreedWeightEstimatorCNN.build_model) cada época
+de la fase head recalcula las mismas activaciones. Este módulo calcula una
+vez el embedding (salida del GlobalAveragePooling2D) de cada imagen, lo
+guarda en disco y entrena solo el head sobre los embeddings.
+
+Vistas:
+    - Vista 0: transform de validación (sin augmentation), determinista
+    - Vistas 1..N-1: transform de entrenamiento con semilla fija por vista
+      (augmentation precalculada; cada época usa todas las vistas)
+
+La caché es válida para un backbone, una resolución y un conjunto de
+imágenes: los tres quedan en el nombre del archivo. Las etiquetas (peso,
+raza) se toman siempre de las anotaciones actuales (ver
+BreedModelTrainer.load_embedding_cache).
+"""
+
+import hashlib
+import json
+import random
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import albumentations as A
+from tensorflow import keras
+from tensorflow.keras import layers
+
+CACHE_FORMAT_VERSION = 1
+
+
+def dataset_hash(filenames: np.ndarray) -> str:
+    """Huella del conjunto de imágenes (en orden) de una caché."""
+    digest = hashlib.sha1()
+    for filename in filenames:
+        digest.update(str(filename).encode('utf-8') + b'\0')
+    return digest.hexdigest()[:10]
+
+
+def cache_filename(
+    base_architecture: str,
+    image_size: Tuple[int, int],
+    num_views: int,
+    seed: int,
+    data_hash: str
+) -> str:
+    """Nombre del archivo de caché para un backbone, resolución, vistas e imágenes."""
+    return f"{base_architecture}_{image_size[0]}x{image_size[1]}_v{num_views}_s{seed}_{data_hash}.npz"
+
+
+def _pooling_index(model: keras.Model) -> int:
+    """Índice de la capa GlobalAveragePooling2D (fin del backbone)."""
+    for i, layer in enumerate(model.layers):
+        if isinstance(layer, layers.GlobalAveragePooling2D):
+            return i
+    raise ValueError(f"El modelo {model.name} no tiene GlobalAveragePooling2D")
+
+
+def build_feature_extractor(model: keras.Model) -> keras.Model:
+    """
+    Sub-modelo entrada → embedding (preprocesamiento + backbone + pooling).
+    
+    Args:
+        model: Modelo de BreedWeightEstimatorCNN.build_model
+    
+    Returns:
+        keras.Model que comparte capas (y pesos) con model
+    """
+    pooling = model.layers[_pooling_index(model)]
+    return keras.Model(model.input, pooling.output, name=f"{model.name}_features")
+
+
+def build_head_model(model: keras.Model) -> keras.Model:
+    """
+    Sub-modelo embedding → peso con las capas del head de model.
+    
+    Las capas son las mismas instancias: entrenar este modelo actualiza
+    directamente el head del modelo completo.
+    
+    Args:
+        model: Modelo de BreedWeightEstimatorCNN.build_model
+    
+    Returns:
+        keras.Model (sin compilar)
+    """
+    index = _pooling_index(model)
+    embedding_dim = model.layers[index].output.shape[-1]
+    
+    inputs = keras.Input(shape=(embedding_dim,), name='embedding')
+    x = inputs
+    for layer in model.layers[index + 1:]:
+        x = layer(x)
+    return keras.Model(inputs, x, name=f"{model.name}_head")
+
+
+class EmbeddingCache:
+    """
+    Embeddings por imagen y vista, con sus etiquetas.
+    
+    Atributos:
+        embeddings: (num_views, N, D) float32
+        weights: (N,) float32
+        breeds, filenames: (N,) str
+        meta: backbone, resolución, vistas, semilla
+    """
+    
+    def __init__(
+        self,
+        embeddings: np.ndarray,
+        weights: np.ndarray,
+        breeds: np.ndarray,
+        filenames: np.ndarray,
+        meta: Dict
+    ):
+        """Inicializar con arrays ya calculados (ver build/load)."""
+        self.embeddings = embeddings
+        self.weights = weights
+        self.breeds = breeds
+        self.filenames = filenames
+        self.meta = meta
+    
+    @property
+    def num_views(self) -> int:
+        """Número de vistas por imagen."""
+        return self.embeddings.shape[0]
+    
+    def indices_for_breed(self, breed: str) -> np.ndarray:
+        """Índices de las imágenes de una raza."""
+        return np.flatnonzero(self.breeds == breed)
+    
+    def training_arrays(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Arrays de entrenamiento: todas las vistas de las imágenes indicadas.
+        
+        Returns:
+            Tuple (X (num_views * len(indices), D), y)
+        """
+        X = self.embeddings[:, indices].reshape(-1, self.embeddings.shape[-1])
+        y = np.tile(self.weights[indices], self.num_views)
+        return X, y
+    
+    def validation_arrays(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Arrays de validación: solo la vista 0 (sin augmentation)."""
+        return self.embeddings[0, indices], self.weights[indices]
+    
+    def update_labels(self, weights: np.ndarray, breeds: np.ndarray) -> bool:
+        """
+        Reemplazar pesos y razas por los de las anotaciones actuales.
+        
+        Los embeddings dependen solo de las imágenes: una corrección de
+        weight_kg o de raza no obliga a recalcularlos.
+        
+        Returns:
+            bool: True si alguna etiqueta cambió
+        """
+        weights = np.asarray(weights, dtype=np.float32)
+        breeds = np.asarray(breeds, dtype=str)
+        changed = not (
+            np.allclose(self.weights, weights) and np.array_equal(self.breeds, breeds)
+        )
+        self.weights = weights
+        self.breeds = breeds
+        return changed
+    
+    @staticmethod
+    def build(
+        model: keras.Model,
+        make_generator,
+        num_images: int,
+        breeds: np.ndarray,
+        filenames: np.ndarray,
+        validation_transform: A.Compose,
+        training_transform: Optional[A.Compose] = None,
+        num_views: int = 1,
+        seed: int = 42,
+        meta: Optional[Dict] = None
+    ) -> 'EmbeddingCache':
+        """
+        Calcular los embeddings de todas las imágenes.
+        
+        Args:
+            model: Modelo de BreedWeightEstimatorCNN.build_model
+            make_generator: Función (transform, vista) -> generador sin shuffle
+                sobre todas las imágenes (CattleDataGenerator o ShardDataGenerator)
+            num_images: Imágenes del dataset (recorta el relleno del último batch)
+            breeds, filenames: Metadatos por imagen (mismo orden del generador)
+            validation_transform: Transform de la vista 0
+            training_transform: Transform de las vistas augmentadas
+            num_views: Vistas por imagen (1 = sin augmentation)
+            seed: Semilla base de las vistas augmentadas
+            meta: Metadatos adicionales (backbone, resolución)
+        
+        Returns:
+            EmbeddingCache
+        """
+        if num_views > 1 and training_transform is None:
+            raise ValueError("num_views > 1 requiere training_transform")
+        
+        extractor = build_feature_extractor(model)
+        views: List[np.ndarray] = []
+        weights: Optional[np.ndarray] = None
+        
+        for view in range(num_views):
+            transform = validation_transform if view == 0 else training_transform
+            if view > 0:
+                # Augmentation reproducible: misma vista para la misma semilla
+                random.seed(seed + view)
+                np.random.seed(seed + view)
+                if hasattr(transform, 'set_random_seed'):
+                    transform.set_random_seed(seed + view)
+            
+            generator = make_generator(transform, view)
+            try:
+                batches_X, batches_y = [], []
+                for idx in range(len(generator)):
+                    X_batch, y_batch = generator[idx]
+                    batches_X.append(np.asarray(extractor.predict_on_batch(X_batch), dtype=np.float32))
+                    batches_y.append(y_batch)
+                if getattr(generator, 'failed_indices', None):
+                    raise ValueError(
+                        f"{len(generator.failed_indices)} imágenes no se pudieron cargar: "
+                        "usar el manifest de scripts/validate_dataset.py"
+                    )
+            finally:
+                if hasattr(generator, 'close'):
+                    generator.close()
+            
+            views.append(np.concatenate(batches_X)[:num_images])
+            weights = np.concatenate(batches_y)[:num_images]
+            print(f"   🧠 Vista {view + 1}/{num_views}: {num_images} embeddings")
+        
+        return EmbeddingCache(
+            embeddings=np.stack(views),
+            weights=weights,
+            breeds=np.asarray(breeds, dtype=str),
+            filenames=np.asarray(filenames, dtype=str),
+            meta={
+                'format_version': CACHE_FORMAT_VERSION,
+                'num_views': num_views,
+                'seed': seed,
+                'embedding_dim': int(views[0].shape[-1]),
+                **(meta or {}),
+            }
+        )
+    
+    def save(self, path: Path) -> None:
+        """Guardar la caché (.npz)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            embeddings=self.embeddings,
+            weights=self.weights,
+            breeds=self.breeds,
+            filenames=self.filenames,
+            meta=np.array(json.dumps(self.meta))
+        )
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(f"💾 Embeddings guardados: {path} ({size_mb:.1f} MB)")
+    
+    @staticmethod
+    def load(path: Path) -> 'EmbeddingCache':
+        """Cargar una caché guardada con save()."""
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            if meta.get('format_version') != CACHE_FORMAT_VERSION:
+                raise ValueError(f"Versión de caché no soportada: {meta.get('format_version')}")
+            return EmbeddingCache(
+                embeddings=data['embeddings'],
+                weights=data['weights'],
+                breeds=data['breeds'],
+                filenames=data['filenames'],
+                meta=meta
+            )
@@ -4,7 +4,7 @@ Transfer Learning con modelos pre-entrenados ImageNet.
 """
 
 from dataclasses import dataclass
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 import tensorflow as tf
 from tensorflow import keras
 from tensorflow.keras import layers, models
@@ -85,8 +85,9 @@ class BreedWeightEstimatorCNN:
         x = layers.Dense(128, activation='relu', name='dense_2')(x)
         x = layers.Dropout(0.2)(x)
         
-        # Salida: peso en kg
-        outputs = layers.Dense(1, activation='linear', name='weight_output')(x)
+        # Salida: peso en kg (float32 también con precisión mixta: float16 y
+        # bfloat16 no tienen resolución suficiente para cientos de kg)
+        outputs = layers.Dense(1, activation='linear', name='weight_output', dtype='float32')(x)
         
         # Crear modelo
         model = keras.Model(inputs, outputs, name=f"{breed_name}_estimator")
@@ -118,7 +119,9 @@ class BreedWeightEstimatorCNN:
     @staticmethod
     def unfreeze_for_finetuning(
         model: keras.Model,
-        n_layers_to_unfreeze: int = 3
+        n_layers_to_unfreeze: int = 3,
+        learning_rate: float = 1e-5,
+        jit_compile: Union[bool, str] = 'auto'
     ) -> keras.Model:
         """
         Descongelar últimas capas para fine-tuning.
@@ -126,13 +129,17 @@ class BreedWeightEstimatorCNN:
         Args:
             model: Modelo pre-entrenado
             n_layers_to_unfreeze: Número de capas base a descongelar
+            learning_rate: Learning rate del fine-tuning
+            jit_compile: Compilar con XLA (ver keras.Model.compile)
         
         Returns:
             keras.Model: Modelo listo para fine-tuning
         """
+        # El backbone es el único sub-modelo (su nombre depende de input_shape:
+        # 'mobilenetv2_1.00_224', 'mobilenetv2_1.00_160', 'efficientnetb1')
         base_layers = [
             layer for layer in model.layers 
-            if layer.name in ['mobilenetv2_1.00_224', 'efficientnetb1']
+            if isinstance(layer, keras.Model)
         ]
         
         if not base_layers:
@@ -147,9 +154,10 @@ class BreedWeightEstimatorCNN:
         
         # Re-compilar con learning rate bajo para fine-tuning
         model.compile(
-            optimizer=keras.optimizers.Adam(learning_rate=1e-5),
+            optimizer=keras.optimizers.Adam(learning_rate=learning_rate),
             loss='mse',
             metrics=['mae', 'mse'],
+            jit_compile=jit_compile,
         )
         
         print(f"✅ {n_layers_to_unfreeze} capas descongeladas para fine-tuning")
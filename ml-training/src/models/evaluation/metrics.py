@@ -26,14 +26,14 @@ class ModelMetrics:
     inference_time_ms: float = 0.0
     
     def to_dict(self) -> Dict[str, float]:
-        """Convertir a diccionario"""
+        """Convertir a diccionario (floats de Python, serializable a JSON)"""
         return {
-            'r2_score': self.r2_score,
-            'mae_kg': self.mae_kg,
-            'mse_kg': self.mse_kg,
-            'mape_percent': self.mape_percent,
-            'bias_kg': self.bias_kg,
-            'inference_time_ms': self.inference_time_ms,
+            'r2_score': float(self.r2_score),
+            'mae_kg': float(self.mae_kg),
+            'mse_kg': float(self.mse_kg),
+            'mape_percent': float(self.mape_percent),
+            'bias_kg': float(self.bias_kg),
+            'inference_time_ms': float(self.inference_time_ms),
         }
     
     def validate_targets(self, target_r2: float = 0.85, max_mae: float = 22.0) -> Tuple[bool, List[str]]:
@@ -1,6 +1,6 @@
 """Módulo de exportación de modelos."""
 
 from .tflite_converter import TFLiteExporter
+from .quantization import export_tflite_variants, evaluate_tflite_model, quantize_input
 
-__all__ = ['TFLiteExporter']
-
+__all__ = ['TFLiteExporter', 'export_tflite_variants', 'evaluate_tflite_model', 'quantize_input']
@@ -0,0 +1,284 @@
+"""
+Exportación de variantes TFLite (float32, float16, int8) con gate de
+precisión y latencia.
+
+Cada variante se evalúa con el intérprete TFLite sobre un conjunto
+held-out: MAE/R² (MetricsCalculator), latencia CPU por imagen y tamaño.
+Solo se promueve una variante cuantizada si su pérdida de precisión frente
+a float32 está dentro de la tolerancia; entre las que pasan, se elige la
+de menor latencia (y menor tamaño en empate).
+"""
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import tensorflow as tf  # type: ignore
+
+from ..evaluation.metrics import MetricsCalculator
+from .tflite_converter import TFLiteExporter
+
+VARIANT_FLOAT32 = "float32"
+VARIANT_FLOAT16 = "float16"
+VARIANT_INT8 = "int8"
+
+# Variante → optimización de TFLiteExporter.convert_to_tflite
+VARIANT_OPTIMIZATIONS = {
+    VARIANT_FLOAT32: "none",
+    VARIANT_FLOAT16: "default",
+    VARIANT_INT8: "int8",
+}
+
+DEFAULT_MAX_MAE_INCREASE_KG = 1.0
+DEFAULT_MAX_R2_DROP = 0.01
+
+
+def quantize_input(data: np.ndarray, input_detail: dict) -> np.ndarray:
+    """
+    Convertir la entrada float al tipo del tensor de entrada.
+
+    Modelos float: sin cambios. Modelos int8/uint8: q = x / scale + zero_point
+    (parámetros de cuantización del tensor), redondeado y saturado.
+
+    Args:
+        data: Entrada float32 (ya normalizada)
+        input_detail: Elemento de interpreter.get_input_details()
+
+    Returns:
+        np.ndarray: Entrada con el dtype del tensor
+    """
+    dtype = input_detail["dtype"]
+    if not np.issubdtype(dtype, np.integer):
+        return data.astype(dtype)
+
+    scale, zero_point = input_detail["quantization"]
+    info = np.iinfo(dtype)
+    quantized = np.round(data / scale + zero_point)
+    return np.clip(quantized, info.min, info.max).astype(dtype)
+
+
+def dequantize_output(data: np.ndarray, output_detail: dict) -> np.ndarray:
+    """Convertir la salida del tensor a float32 (inversa de quantize_input)."""
+    if not np.issubdtype(output_detail["dtype"], np.integer):
+        return data.astype(np.float32)
+
+    scale, zero_point = output_detail["quantization"]
+    return (data.astype(np.float32) - zero_point) * scale
+
+
+def evaluate_tflite_model(
+    tflite_path: str,
+    X: np.ndarray,
+    y: np.ndarray,
+    breed_type: str = "generic",
+    num_threads: int = 1,
+    warmup: int = 3,
+) -> Dict:
+    """
+    Evaluar un modelo TFLite imagen por imagen (como en el backend).
+
+    Args:
+        tflite_path: Ruta al .tflite
+        X: Imágenes (N, H, W, 3) float32, mismo preprocesamiento que el entrenamiento
+        y: Pesos reales (N,)
+        breed_type: Raza (para logging de métricas)
+        num_threads: Hilos del intérprete
+        warmup: Invocaciones previas no medidas
+
+    Returns:
+        dict: Métricas de MetricsCalculator + latencia p50/p95 (ms) y tamaño
+    """
+    interpreter = tf.lite.Interpreter(model_path=str(tflite_path), num_threads=num_threads)
+    interpreter.allocate_tensors()
+    input_detail = interpreter.get_input_details()[0]
+    output_detail = interpreter.get_output_details()[0]
+
+    inputs = quantize_input(X, input_detail)
+
+    for i in range(min(warmup, len(inputs))):
+        interpreter.set_tensor(input_detail["index"], inputs[i : i + 1])
+        interpreter.invoke()
+
+    predictions = np.zeros(len(inputs), dtype=np.float32)
+    latencies_ms = np.zeros(len(inputs), dtype=np.float64)
+    for i in range(len(inputs)):
+        interpreter.set_tensor(input_detail["index"], inputs[i : i + 1])
+        start = time.perf_counter()
+        interpreter.invoke()
+        latencies_ms[i] = (time.perf_counter() - start) * 1000
+        output = interpreter.get_tensor(output_detail["index"])
+        predictions[i] = dequantize_output(output, output_detail).reshape(-1)[0]
+
+    metrics = MetricsCalculator.calculate_metrics(y, predictions, breed_type)
+    metrics.inference_time_ms = float(np.percentile(latencies_ms, 50))
+
+    return {
+        **metrics.to_dict(),
+        "latency_p95_ms": float(np.percentile(latencies_ms, 95)),
+        "size_bytes": Path(tflite_path).stat().st_size,
+        "input_dtype": np.dtype(input_detail["dtype"]).name,
+    }
+
+
+def check_variant(
+    result: Dict,
+    baseline: Dict,
+    max_mae_increase_kg: float,
+    max_r2_drop: float,
+    max_latency_ms: Optional[float] = None,
+) -> List[str]:
+    """
+    Comparar una variante con float32.
+
+    Returns:
+        List[str]: Motivos de rechazo (vacía si pasa el gate)
+    """
+    errors = []
+
+    mae_increase = result["mae_kg"] - baseline["mae_kg"]
+    if mae_increase > max_mae_increase_kg:
+        errors.append(f"MAE +{mae_increase:.2f} kg > {max_mae_increase_kg} kg")
+
+    r2_drop = baseline["r2_score"] - result["r2_score"]
+    if r2_drop > max_r2_drop:
+        errors.append(f"R² -{r2_drop:.4f} > {max_r2_drop}")
+
+    if max_latency_ms is not None and result["inference_time_ms"] > max_latency_ms:
+        errors.append(
+            f"latencia {result['inference_time_ms']:.1f} ms > {max_latency_ms} ms"
+        )
+
+    return errors
+
+
+def export_tflite_variants(
+    saved_model_path: str,
+    output_dir: Path,
+    basename: str,
+    X_eval: np.ndarray,
+    y_eval: np.ndarray,
+    representative_dataset: Optional[Callable] = None,
+    breed_type: str = "generic",
+    max_mae_increase_kg: float = DEFAULT_MAX_MAE_INCREASE_KG,
+    max_r2_drop: float = DEFAULT_MAX_R2_DROP,
+    max_latency_ms: Optional[float] = None,
+    num_threads: int = 1,
+    promoted_path: Optional[Path] = None,
+) -> Dict:
+    """
+    Exportar float32/float16/int8, evaluarlas y promover la mejor que pase el gate.
+
+    Args:
+        saved_model_path: SavedModel del modelo entrenado (model.export)
+        output_dir: Directorio de las variantes y del reporte
+        basename: Prefijo de archivos ({basename}-{variante}.tflite)
+        X_eval, y_eval: Conjunto held-out (no usado para calibrar)
+        representative_dataset: Calibración int8 (create_representative_dataset);
+            sin él no se genera la variante int8
+        breed_type: Raza (para logging de métricas)
+        max_mae_increase_kg: Aumento máximo de MAE frente a float32
+        max_r2_drop: Caída máxima de R² frente a float32
+        max_latency_ms: Latencia p50 máxima (opcional)
+        num_threads: Hilos del intérprete en la medición
+        promoted_path: Copia de la variante promovida (opcional)
+
+    Returns:
+        dict: Reporte con resultados por variante y variante promovida
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    variants = [VARIANT_FLOAT32, VARIANT_FLOAT16]
+    if representative_dataset is not None:
+        variants.append(VARIANT_INT8)
+
+    results: Dict[str, Dict] = {}
+    for variant in variants:
+        variant_path = output_dir / f"{basename}-{variant}.tflite"
+        try:
+            TFLiteExporter.convert_to_tflite(
+                saved_model_path=saved_model_path,
+                output_path=str(variant_path),
+                optimization=VARIANT_OPTIMIZATIONS[variant],
+                representative_dataset=(
+                    representative_dataset if variant == VARIANT_INT8 else None
+                ),
+            )
+        except Exception as e:
+            if variant == VARIANT_FLOAT32:
+                raise
+            # Una variante cuantizada que no convierte no bloquea la exportación
+            print(f"⚠️ Variante {variant} no exportada: {e}")
+            results[variant] = {"error": f"{type(e).__name__}: {e}", "passed": False}
+            continue
+
+        results[variant] = evaluate_tflite_model(
+            str(variant_path), X_eval, y_eval, breed_type, num_threads
+        )
+        results[variant]["path"] = str(variant_path)
+
+    # Gate: float32 es la referencia de precisión
+    baseline = results[VARIANT_FLOAT32]
+    for variant in variants:
+        result = results[variant]
+        if "error" in result:
+            continue
+        result["rejected_by"] = check_variant(
+            result, baseline, max_mae_increase_kg, max_r2_drop, max_latency_ms
+        )
+        result["passed"] = not result["rejected_by"]
+
+    passed = [v for v in variants if results[v]["passed"]]
+    if passed:
+        promoted = min(
+            passed,
+            key=lambda v: (results[v]["inference_time_ms"], results[v]["size_bytes"]),
+        )
+    else:
+        # Ninguna cumple el límite de latencia: float32 como referencia
+        promoted = VARIANT_FLOAT32
+        print("⚠️ Ninguna variante cumple el gate: se promueve float32")
+
+    print(f"📊 Variantes TFLite ({basename}):")
+    for variant in variants:
+        result = results[variant]
+        if "error" in result:
+            print(f"   ❌ {variant}: {result['error']}")
+            continue
+        status = "✅" if result["passed"] else "❌"
+        print(
+            f"   {status} {variant}: MAE={result['mae_kg']:.2f} kg, "
+            f"R²={result['r2_score']:.4f}, p50={result['inference_time_ms']:.1f} ms, "
+            f"{result['size_bytes'] / (1024 * 1024):.2f} MB"
+            + (f" ({'; '.join(result['rejected_by'])})" if result["rejected_by"] else "")
+        )
+    print(f"🏆 Variante promovida: {promoted}")
+
+    if promoted_path is not None:
+        # Copia + rename: un intérprete que ya tiene abierto el archivo anterior
+        # nunca lo ve truncado
+        promoted_path = Path(promoted_path)
+        tmp_path = promoted_path.with_suffix(".tflite.tmp")
+        shutil.copyfile(results[promoted]["path"], tmp_path)
+        os.replace(tmp_path, promoted_path)
+
+    report = {
+        "promoted": promoted,
+        "promoted_path": str(promoted_path) if promoted_path else results[promoted]["path"],
+        "tolerance": {
+            "max_mae_increase_kg": max_mae_increase_kg,
+            "max_r2_drop": max_r2_drop,
+            "max_latency_ms": max_latency_ms,
+        },
+        "num_eval_images": int(len(y_eval)),
+        "num_threads": num_threads,
+        "variants": results,
+    }
+    with open(output_dir / "quantization_report.json", "w") as f:
+        json.dump(report, f, indent=2)
+
+    return report
@@ -2,8 +2,11 @@
 Trainer para modelos de estimación de peso por raza.
 """
 
-from typing import Tuple, Dict
+import tempfile
+import time
+from typing import Tuple, Dict, Optional, Union
 from pathlib import Path
+import pandas as pd
 import tensorflow as tf
 from tensorflow import keras
 from tensorflow.keras import callbacks
@@ -13,11 +16,104 @@ import numpy as np
 
 from ..cnn_architecture import BreedWeightEstimatorCNN, BreedModelConfig
 from ...models.evaluation.metrics import MetricsCalculator
+from ...data.augmentation import get_training_transform, get_validation_transform
+from ...data.data_loader import CattleDataGenerator
+from ...data.shard_cache import ShardCache, ShardDataGenerator
+from ...features.embedding_cache import EmbeddingCache, build_head_model, cache_filename, dataset_hash
+
+# Manifest verificado por scripts/validate_dataset.py (fallback: sin verificar)
+CLEAN_ANNOTATIONS_FILENAME = 'annotations_clean.csv'
+RAW_ANNOTATIONS_FILENAME = 'annotations.csv'
+
+# Subdirectorio (del dataset o de la caché de shards) con los embeddings
+EMBEDDINGS_DIRNAME = 'embeddings'
+
+
+def configure_runtime(
+    intra_op_threads: int = 0,
+    inter_op_threads: int = 0,
+    mixed_precision: Optional[str] = None
+) -> None:
+    """
+    Configurar hilos de TensorFlow y política de precisión.
+    
+    Debe llamarse antes de crear tensores: TensorFlow fija el número de
+    hilos al inicializar el runtime.
+    
+    Args:
+        intra_op_threads: Hilos por operación (0 = todos los núcleos)
+        inter_op_threads: Operaciones en paralelo (0 = automático)
+        mixed_precision: 'mixed_float16', 'mixed_bfloat16' o None (float32)
+    """
+    try:
+        if intra_op_threads:
+            tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+        if inter_op_threads:
+            tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+    except RuntimeError as e:
+        # Runtime ya inicializado en este proceso: se mantienen los hilos actuales
+        print(f"⚠️  No se pudieron configurar los hilos de TensorFlow: {e}")
+    
+    # mixed_bfloat16 acelera en CPUs con AVX512_BF16/AMX; mixed_float16 en GPU
+    keras.mixed_precision.set_global_policy(mixed_precision or 'float32')
+
+
+class ThroughputLogger(callbacks.Callback):
+    """
+    Callback que mide tiempo de entrenamiento por época e imágenes/seg.
+    
+    El tiempo se mide hasta el inicio de la validación (solo entrenamiento)
+    y se registra en MLflow con la época como step.
+    """
+    
+    def __init__(self, images_per_epoch: int, phase: str):
+        """
+        Inicializar callback.
+        
+        Args:
+            images_per_epoch: Imágenes por época (steps * batch_size fijo)
+            phase: Nombre de la fase ('head' o 'finetune')
+        """
+        super().__init__()
+        self.images_per_epoch = images_per_epoch
+        self.phase = phase
+        self._epoch_start = 0.0
+        self._train_time_s: Optional[float] = None
+    
+    def on_epoch_begin(self, epoch, logs=None):
+        self._epoch_start = time.perf_counter()
+        self._train_time_s = None
+    
+    def on_test_begin(self, logs=None):
+        # Primera llamada de la época: fin de la parte de entrenamiento
+        if self._train_time_s is None:
+            self._train_time_s = time.perf_counter() - self._epoch_start
+    
+    def on_epoch_end(self, epoch, logs=None):
+        epoch_time_s = time.perf_counter() - self._epoch_start
+        train_time_s = self._train_time_s or epoch_time_s
+        images_per_sec = self.images_per_epoch / train_time_s if train_time_s > 0 else 0.0
+        
+        metrics = {
+            f'{self.phase}_epoch_time_s': epoch_time_s,
+            f'{self.phase}_train_time_s': train_time_s,
+            f'{self.phase}_images_per_sec': images_per_sec,
+        }
+        for name, value in (logs or {}).items():
+            metrics[f'{self.phase}_{name}'] = float(value)
+        mlflow.log_metrics(metrics, step=epoch)
+        
+        print(f"   ⏱️  Época {epoch + 1}: {epoch_time_s:.1f}s ({images_per_sec:.1f} img/s)")
 
 
 class BreedModelTrainer:
     """
     Trainer para entrenar modelos por raza.
+    
+    Entrenamiento en dos fases:
+    1. Head: backbone congelado, learning rate alto
+    2. Fine-tuning: últimas capas del backbone descongeladas
+       (BreedWeightEstimatorCNN.unfreeze_for_finetuning), learning rate bajo
     """
     
     def __init__(
@@ -25,33 +121,87 @@ class BreedModelTrainer:
         breed_type: str,
         data_dir: Path,
         config: BreedModelConfig,
-        base_architecture: str = 'mobilenetv2'
+        base_architecture: str = 'mobilenetv2',
+        images_dir: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        image_size: Tuple[int, int] = (224, 224),
+        num_workers: int = 4,
+        jit_compile: Union[bool, str] = 'auto',
+        mixed_precision: Optional[str] = None,
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0
     ):
+        """
+        Inicializar trainer.
+        
+        Args:
+            breed_type: Raza a entrenar
+            data_dir: Directorio con annotations_clean.csv (o annotations.csv)
+            config: Configuración de la raza
+            base_architecture: 'mobilenetv2' o 'efficientnetb1'
+            images_dir: Directorio de imágenes (default: data_dir)
+            cache_dir: Caché de shards (scripts/prepare_shard_cache.py); si se
+                indica, se usa en lugar de decodificar JPEGs
+            image_size: Resolución de entrenamiento (height, width)
+            num_workers: Hilos de decodificación de CattleDataGenerator
+            jit_compile: XLA (True/False; 'auto' = Keras decide, off en CPU)
+            mixed_precision: Política de precisión mixta (None = float32)
+            intra_op_threads: Hilos por operación de TensorFlow (0 = todos)
+            inter_op_threads: Operaciones en paralelo (0 = automático)
+        """
         self.breed_type = breed_type
         self.data_dir = Path(data_dir)
         self.config = config
         self.base_architecture = base_architecture
+        self.images_dir = Path(images_dir) if images_dir else self.data_dir
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.image_size = image_size
+        self.num_workers = num_workers
+        self.jit_compile = jit_compile
+        self.mixed_precision = mixed_precision
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
         self.model = None
+        self.history: Dict[str, list] = {}
         
+        configure_runtime(intra_op_threads, inter_op_threads, mixed_precision)
+    
     def train(
         self,
         epochs: int = 100,
         batch_size: int = 32,
         validation_split: float = 0.2,
-        early_stopping_patience: int = 10
+        early_stopping_patience: int = 10,
+        finetune_epochs: int = 0,
+        finetune_layers: int = 3,
+        learning_rate: float = 1e-3,
+        finetune_learning_rate: float = 1e-5,
+        seed: int = 42,
+        use_embedding_cache: bool = False,
+        embedding_views: int = 1
     ) -> keras.Model:
         """
         Entrenar modelo para la raza.
         
         Args:
-            epochs: Número de épocas
+            epochs: Número de épocas de la fase head (backbone congelado)
             batch_size: Tamaño de batch
             validation_split: Proporción de validación
             early_stopping_patience: Paciencia para early stopping
+            finetune_epochs: Épocas de fine-tuning (0 = sin segunda fase)
+            finetune_layers: Capas del backbone a descongelar
+            learning_rate: Learning rate de la fase head
+            finetune_learning_rate: Learning rate del fine-tuning
+            seed: Semilla del split train/val (y de las vistas de embeddings)
+            use_embedding_cache: Fase head sobre embeddings precalculados del
+                backbone (src.features.embedding_cache) en lugar de imágenes
+            embedding_views: Vistas por imagen en la caché (1 = sin augmentation)
         
         Returns:
             keras.Model: Modelo entrenado
         """
+        self.history = {}
+        
         print(f"\n{'#'*60}")
         print(f"# ENTRENANDO MODELO: {self.breed_type.upper()}")
         print(f"{'#'*60}\n")
@@ -63,7 +213,18 @@ class BreedModelTrainer:
                 'breed_type': self.breed_type,
                 'base_architecture': self.base_architecture,
                 'epochs': epochs,
+                'finetune_epochs': finetune_epochs,
+                'finetune_layers': finetune_layers,
                 'batch_size': batch_size,
+                'learning_rate': learning_rate,
+                'finetune_learning_rate': finetune_learning_rate,
+                'jit_compile': self.jit_compile,
+                'mixed_precision': self.mixed_precision or 'float32',
+                'intra_op_threads': self.intra_op_threads,
+                'inter_op_threads': self.inter_op_threads,
+                'num_workers': self.num_workers,
+                'data_source': 'shard_cache' if self.cache_dir else 'images',
+                'use_embedding_cache': use_embedding_cache,
                 'target_r2': self.config.target_r2,
                 'target_mae': self.config.target_mae_kg,
             })
@@ -71,37 +232,317 @@ class BreedModelTrainer:
             # Construir modelo
             self.model = BreedWeightEstimatorCNN.build_model(
                 breed_name=self.breed_type,
+                input_shape=(*self.image_size, 3),
                 base_architecture=self.base_architecture
             )
+            self._compile(learning_rate)
             
             print(f"✅ Modelo construido: {self.model.name}")
             print(f"📊 Parámetros: {self.model.count_params():,}")
             
-            # Configurar callbacks
-            callbacks_list = self._setup_callbacks(early_stopping_patience)
+            # Fase 1: head con backbone congelado
+            print(f"\n🧊 Fase 1: head ({epochs} épocas, lr={learning_rate})")
+            if use_embedding_cache:
+                self._train_head_on_embeddings(
+                    epochs, batch_size, validation_split, early_stopping_patience,
+                    learning_rate, embedding_views, seed
+                )
+                if finetune_epochs == 0:
+                    print("✅ Entrenamiento completado")
+                    self._log_model()
+                    return self.model
             
             # Crear datasets
-            # NOTA: Implementar generator de datos real
-            train_generator = None  # TODO: Implementar
-            val_generator = None    # TODO: Implementar
+            train_generator, val_generator = self.build_generators(
+                batch_size, validation_split, seed
+            )
+            images_per_epoch = len(train_generator) * batch_size
+            mlflow.log_params({
+                'train_images': train_generator.get_stats()['total_images'],
+                'val_images': val_generator.get_stats()['total_images'],
+            })
             
-            # Entrenar
-            # NOTA: Descomentar cuando generator esté implementado
-            # history = self.model.fit(
-            #     train_generator,
-            #     epochs=epochs,
-            #     validation_data=val_generator,
-            #     callbacks=callbacks_list,
-            #     verbose=1
-            # )
+            try:
+                if not use_embedding_cache:
+                    history = self.model.fit(
+                        train_generator,
+                        epochs=epochs,
+                        validation_data=val_generator,
+                        callbacks=self._setup_callbacks(early_stopping_patience)
+                        + [ThroughputLogger(images_per_epoch, phase='head')],
+                        verbose=1
+                    )
+                    self._record_history(history)
+                
+                # Fase 2: fine-tuning de las últimas capas del backbone
+                if finetune_epochs > 0:
+                    print(f"\n🔥 Fase 2: fine-tuning ({finetune_epochs} épocas, lr={finetune_learning_rate})")
+                    BreedWeightEstimatorCNN.unfreeze_for_finetuning(
+                        self.model,
+                        n_layers_to_unfreeze=finetune_layers,
+                        learning_rate=finetune_learning_rate,
+                        jit_compile=self.jit_compile
+                    )
+                    history = self.model.fit(
+                        train_generator,
+                        epochs=finetune_epochs,
+                        validation_data=val_generator,
+                        callbacks=self._setup_callbacks(early_stopping_patience)
+                        + [ThroughputLogger(images_per_epoch, phase='finetune')],
+                        verbose=1
+                    )
+                    self._record_history(history)
+            finally:
+                for generator in (train_generator, val_generator):
+                    if hasattr(generator, 'close'):
+                        generator.close()
             
             print("✅ Entrenamiento completado")
             
             # Log modelo en MLflow
-            mlflow.tensorflow.log_model(self.model, "model")
+            self._log_model()
             
             return self.model
     
+    def build_generators(
+        self,
+        batch_size: int,
+        validation_split: float,
+        seed: int = 42
+    ) -> Tuple[keras.utils.Sequence, keras.utils.Sequence]:
+        """
+        Crear generadores de entrenamiento y validación de la raza.
+        
+        Entrenamiento con drop_last (batches de tamaño fijo: un solo grafo
+        compilado); validación sin shuffle y completa.
+        
+        Args:
+            batch_size: Tamaño de batch
+            validation_split: Proporción de validación
+            seed: Semilla del split
+        
+        Returns:
+            Tuple (train_generator, val_generator)
+        """
+        if self.cache_dir is not None:
+            cache = ShardCache(self.cache_dir)
+            indices = cache.indices_for_breed(self.breed_type)
+            if len(indices) == 0:
+                raise ValueError(f"No hay imágenes de {self.breed_type} en {self.cache_dir}")
+            train_pos, val_pos = self._split(len(indices), validation_split, seed)
+            train_generator = ShardDataGenerator(
+                cache, indices[train_pos], batch_size=batch_size,
+                transform=get_training_transform(cache.image_size),
+                shuffle=True, drop_last=True
+            )
+            val_generator = ShardDataGenerator(
+                cache, indices[val_pos], batch_size=batch_size,
+                transform=get_validation_transform(cache.image_size),
+                shuffle=False
+            )
+            return train_generator, val_generator
+        
+        annotations_df = self._load_annotations()
+        annotations_df = annotations_df[annotations_df['breed'] == self.breed_type]
+        if annotations_df.empty:
+            raise ValueError(f"No hay imágenes de {self.breed_type} en {self.data_dir}")
+        
+        train_pos, val_pos = self._split(len(annotations_df), validation_split, seed)
+        train_generator = CattleDataGenerator(
+            annotations_df.iloc[train_pos], self.images_dir,
+            batch_size=batch_size, image_size=self.image_size,
+            transform=get_training_transform(self.image_size),
+            shuffle=True, num_workers=self.num_workers, drop_last=True
+        )
+        val_generator = CattleDataGenerator(
+            annotations_df.iloc[val_pos], self.images_dir,
+            batch_size=batch_size, image_size=self.image_size,
+            transform=get_validation_transform(self.image_size),
+            shuffle=False, num_workers=self.num_workers
+        )
+        return train_generator, val_generator
+    
+    def load_embedding_cache(
+        self,
+        batch_size: int = 32,
+        num_views: int = 1,
+        seed: int = 42
+    ) -> EmbeddingCache:
+        """
+        Cargar (o calcular y guardar) los embeddings de todo el dataset.
+        
+        La caché cubre todas las razas: se calcula una vez y la reutilizan
+        los 7 trainers y los barridos de hiperparámetros del head.
+        
+        Args:
+            batch_size: Batch de extracción
+            num_views: Vistas por imagen (1 = sin augmentation)
+            seed: Semilla de las vistas augmentadas
+        
+        Returns:
+            EmbeddingCache
+        """
+        if self.cache_dir is not None:
+            shard_cache = ShardCache(self.cache_dir)
+            image_size = shard_cache.image_size
+            filenames, breeds = shard_cache.filenames, shard_cache.breeds
+            weights = shard_cache.weights
+            cache_root = self.cache_dir
+            
+            def make_generator(transform, view):
+                return ShardDataGenerator(
+                    shard_cache, batch_size=batch_size, transform=transform, shuffle=False
+                )
+        else:
+            annotations_df = self._load_annotations()
+            image_size = self.image_size
+            filenames = annotations_df['image_filename'].to_numpy(dtype=str)
+            breeds = annotations_df['breed'].to_numpy(dtype=str)
+            weights = annotations_df['weight_kg'].to_numpy(dtype=np.float32)
+            cache_root = self.data_dir
+            
+            def make_generator(transform, view):
+                # Vistas augmentadas en secuencia: RNG global reproducible
+                return CattleDataGenerator(
+                    annotations_df, self.images_dir, batch_size=batch_size,
+                    image_size=image_size, transform=transform, shuffle=False,
+                    num_workers=self.num_workers if view == 0 else 0
+                )
+        
+        path = cache_root / EMBEDDINGS_DIRNAME / cache_filename(
+            self.base_architecture, image_size, num_views, seed, dataset_hash(filenames)
+        )
+        if path.exists():
+            embeddings = EmbeddingCache.load(path)
+            if np.array_equal(embeddings.filenames, filenames):
+                print(f"✅ Embeddings en caché: {path}")
+                # Etiquetas de las anotaciones actuales (no las de la caché)
+                if embeddings.update_labels(weights, breeds):
+                    print("ℹ️  Pesos/razas corregidos en las anotaciones: se usan los actuales")
+                return embeddings
+            print("⚠️  El dataset cambió desde la caché de embeddings: recalculando")
+        
+        print(f"🧠 Calculando embeddings ({len(filenames)} imágenes, {num_views} vistas)")
+        extractor_model = BreedWeightEstimatorCNN.build_model(
+            breed_name='feature_extractor',
+            input_shape=(*image_size, 3),
+            base_architecture=self.base_architecture
+        )
+        embeddings = EmbeddingCache.build(
+            model=extractor_model,
+            make_generator=make_generator,
+            num_images=len(filenames),
+            breeds=breeds,
+            filenames=filenames,
+            validation_transform=get_validation_transform(image_size),
+            training_transform=get_training_transform(image_size),
+            num_views=num_views,
+            seed=seed,
+            meta={'base_architecture': self.base_architecture, 'image_size': list(image_size)}
+        )
+        embeddings.save(path)
+        return embeddings
+    
+    def _train_head_on_embeddings(
+        self,
+        epochs: int,
+        batch_size: int,
+        validation_split: float,
+        patience: int,
+        learning_rate: float,
+        num_views: int,
+        seed: int
+    ) -> None:
+        """Fase head sobre embeddings en caché (actualiza el head de self.model)."""
+        embeddings = self.load_embedding_cache(batch_size, num_views, seed)
+        indices = embeddings.indices_for_breed(self.breed_type)
+        if len(indices) == 0:
+            raise ValueError(f"No hay imágenes de {self.breed_type} en la caché de embeddings")
+        
+        # Mismo split que build_generators (mismo orden de imágenes)
+        train_pos, val_pos = self._split(len(indices), validation_split, seed)
+        X_train, y_train = embeddings.training_arrays(indices[train_pos])
+        X_val, y_val = embeddings.validation_arrays(indices[val_pos])
+        mlflow.log_params({
+            'embedding_views': num_views,
+            'train_images': len(train_pos),
+            'val_images': len(val_pos),
+        })
+        
+        head = build_head_model(self.model)
+        head.compile(
+            optimizer=keras.optimizers.Adam(learning_rate=learning_rate),
+            loss='mse',
+            metrics=['mae', 'mse'],
+            jit_compile=self.jit_compile,
+        )
+        history = head.fit(
+            X_train, y_train,
+            batch_size=batch_size,
+            epochs=epochs,
+            validation_data=(X_val, y_val),
+            shuffle=True,
+            callbacks=[
+                callbacks.EarlyStopping(
+                    monitor='val_loss',
+                    patience=patience,
+                    restore_best_weights=True,
+                    verbose=1
+                ),
+                callbacks.ReduceLROnPlateau(
+                    monitor='val_loss',
+                    factor=0.5,
+                    patience=5,
+                    min_lr=1e-7,
+                    verbose=1
+                ),
+                ThroughputLogger(len(X_train), phase='head'),
+            ],
+            verbose=2
+        )
+        self._record_history(history)
+    
+    def _load_annotations(self) -> pd.DataFrame:
+        """Anotaciones verificadas (o sin verificar si no hay manifest limpio)."""
+        annotations_path = self.data_dir / CLEAN_ANNOTATIONS_FILENAME
+        if not annotations_path.exists():
+            print(f"⚠️  {CLEAN_ANNOTATIONS_FILENAME} no encontrado: usando anotaciones sin verificar")
+            annotations_path = self.data_dir / RAW_ANNOTATIONS_FILENAME
+        return pd.read_csv(annotations_path)
+    
+    @staticmethod
+    def _split(n: int, validation_split: float, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Posiciones de train y val dentro de la raza (determinista por semilla)."""
+        order = np.random.default_rng(seed).permutation(n)
+        n_val = max(1, int(n * validation_split))
+        return order[n_val:], order[:n_val]
+    
+    def _compile(self, learning_rate: float) -> None:
+        """Compilar el modelo con las opciones de XLA del trainer."""
+        self.model.compile(
+            optimizer=keras.optimizers.Adam(learning_rate=learning_rate),
+            loss='mse',
+            metrics=['mae', 'mse'],
+            jit_compile=self.jit_compile,
+        )
+    
+    def _log_model(self) -> None:
+        """Registrar el modelo en MLflow (artifact .keras si el flavor falla)."""
+        try:
+            mlflow.tensorflow.log_model(self.model, "model")
+        except Exception as e:
+            # Versiones de mlflow sin soporte de Keras 3 (SavedModel sin extensión)
+            print(f"⚠️  mlflow.tensorflow.log_model falló ({e.__class__.__name__}): guardando .keras")
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                model_path = Path(tmp_dir) / f"{self.model.name}.keras"
+                self.model.save(str(model_path))
+                mlflow.log_artifact(str(model_path), artifact_path="model")
+    
+    def _record_history(self, history: keras.callbacks.History) -> None:
+        """Acumular el historial de las fases."""
+        for name, values in history.history.items():
+            self.history.setdefault(name, []).extend(values)
+    
     def _setup_callbacks(self, patience: int) -> list:
         """
         Configurar callbacks de entrenamiento.
@@ -112,6 +553,9 @@ class BreedModelTrainer:
         Returns:
             list: Lista de callbacks
         """
+        checkpoint_path = self.data_dir.parent.parent / 'models' / self.breed_type / 'best.h5'
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        
         return [
             callbacks.EarlyStopping(
                 monitor='val_loss',
@@ -127,7 +571,7 @@ class BreedModelTrainer:
                 verbose=1
             ),
             callbacks.ModelCheckpoint(
-                filepath=str(self.data_dir.parent.parent / 'models' / self.breed_type / 'best.h5'),
+                filepath=str(checkpoint_path),
                 monitor='val_loss',
                 save_best_only=True,
                 verbose=1
@@ -138,12 +582,13 @@ class BreedModelTrainer:
             )
         ]
     
-    def evaluate(self, test_generator) -> Dict[str, float]:
+    def evaluate(self, test_generator, assert_targets: bool = True) -> Dict[str, float]:
         """
         Evaluar modelo en conjunto de test.
         
         Args:
-            test_generator: Generador de datos de test
+            test_generator: Generador de datos de test (shuffle=False)
+            assert_targets: Si True, AssertionError si no cumple R²/MAE objetivo
         
         Returns:
             Dict[str, float]: Diccionario de métricas
@@ -152,14 +597,24 @@ class BreedModelTrainer:
             raise ValueError("Modelo no entrenado. Ejecutar train() primero.")
         
         # Predicciones
-        # y_true, y_pred = ...
+        y_true, y_pred = [], []
+        for idx in range(len(test_generator)):
+            X_batch, y_batch = test_generator[idx]
+            y_true.append(y_batch)
+            y_pred.append(np.asarray(self.model.predict_on_batch(X_batch)).reshape(-1))
+        
+        # Recortar el relleno del último batch (generadores con shuffle)
+        n_images = test_generator.get_stats()['total_images']
+        y_true = np.concatenate(y_true)[:n_images]
+        y_pred = np.concatenate(y_pred)[:n_images]
         
         # Calcular métricas
-        # metrics = MetricsCalculator.calculate_metrics_with_assertions(
-        #     y_true, y_pred, self.breed_type,
-        #     self.config.target_r2, self.config.target_mae_kg
-        # )
+        if assert_targets:
+            metrics = MetricsCalculator.calculate_metrics_with_assertions(
+                y_true, y_pred, self.breed_type,
+                self.config.target_r2, self.config.target_mae_kg
+            )
+        else:
+            metrics = MetricsCalculator.calculate_metrics(y_true, y_pred, self.breed_type)
         
-        # return metrics.to_dict()
-        pass
-
+        return metrics.to_dict()